@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Load test for A2A JSON-RPC batch execution.
+
+Fires concurrent batch requests at the A2A router (in-process, over an httpx
+ASGI transport) with a tool that blocks for ``--tool-ms`` milliseconds, and
+reports batch latency percentiles and throughput for:
+
+- ``before``: items dispatched one after another on the event loop (the
+  previous behaviour, reproduced by swapping in an inline executor);
+- ``after``: the concurrent, thread-offloaded executor in ``server.a2a_batch``.
+
+Usage:
+    python benchmarks/a2a_batch_load_test.py
+    python benchmarks/a2a_batch_load_test.py --clients 16 --batches 64 --batch-size 10 --tool-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from server import a2a_batch, a2a_router  # noqa: E402
+from ultimate_discord_intelligence_bot.step_result import StepResult  # noqa: E402
+
+
+@dataclass
+class LoadStats:
+    """Latency and throughput for one mode."""
+
+    mode: str
+    batches: int
+    batch_size: int
+    p50_ms: float
+    p95_ms: float
+    batches_per_second: float
+    items_per_second: float
+
+
+def _blocking_tool(ms: float) -> StepResult:
+    time.sleep(ms / 1000.0)
+    return StepResult.ok(data={"slept_ms": ms})
+
+
+async def _inline_batch(
+    calls: Sequence[Callable[[], Any]], on_timeout: Callable[[int, float], Any], settings: Any = None
+) -> list[Any]:
+    return [call() for call in calls]
+
+
+async def _inline_call(call: Callable[[], Any], on_timeout: Callable[[float], Any], timeout: float | None) -> Any:
+    return call()
+
+
+async def _drive(args: argparse.Namespace) -> tuple[list[float], float]:
+    app = FastAPI()
+    app.include_router(a2a_router.router)
+    batch = [
+        {"jsonrpc": "2.0", "id": i, "method": "tools.block", "params": {"ms": args.tool_ms}}
+        for i in range(args.batch_size)
+    ]
+    latencies: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(args.batches):
+        queue.put_nowait(i)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://a2a") as client:
+
+        async def worker() -> None:
+            while True:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                t0 = time.perf_counter()
+                response = await client.post("/a2a/jsonrpc", json=batch)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - t0)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.clients)))
+        return latencies, time.perf_counter() - started
+
+
+def run_mode(mode: str, args: argparse.Namespace) -> LoadStats:
+    original = a2a_router._get_tools, a2a_batch.run_batch, a2a_batch.run_call
+    a2a_router._get_tools = lambda: {"tools.block": _blocking_tool}  # type: ignore[assignment]
+    if mode == "before":
+        a2a_batch.run_batch, a2a_batch.run_call = _inline_batch, _inline_call  # type: ignore[assignment]
+    try:
+        latencies, elapsed = asyncio.run(_drive(args))
+    finally:
+        a2a_router._get_tools, a2a_batch.run_batch, a2a_batch.run_call = original  # type: ignore[assignment]
+    latencies.sort()
+    return LoadStats(
+        mode=mode,
+        batches=len(latencies),
+        batch_size=args.batch_size,
+        p50_ms=statistics.median(latencies) * 1000,
+        p95_ms=latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+        batches_per_second=len(latencies) / elapsed,
+        items_per_second=len(latencies) * args.batch_size / elapsed,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--batches", type=int, default=32, help="Total batch requests")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--tool-ms", type=float, default=10.0, help="Blocking time per tool call")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = [run_mode("before", args), run_mode("after", args)]
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+        return 0
+    print(f"{'mode':<8} {'p50 ms':>9} {'p95 ms':>9} {'batches/s':>10} {'items/s':>9}")
+    for r in results:
+        print(f"{r.mode:<8} {r.p50_ms:>9.1f} {r.p95_ms:>9.1f} {r.batches_per_second:>10.1f} {r.items_per_second:>9.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Samples spent on losing arms and status-query cost of the A/B framework.
+
+Simulated experiments draw Bernoulli successes from ``--rates`` (one per
+arm; the first is best) with an even traffic split. Two policies:
+
+- "fixed": every arm runs to ``--horizon`` samples (the previous behaviour);
+- "sequential": ``SequentialExperiment`` tests after every sample and
+  eliminates arms as soon as an always-valid mSPRT rejects them.
+
+Reported over ``--trials`` experiments: mean samples in total and on losing
+arms, how often the best arm won, and (from A/A runs with equal rates) the
+false-stop rate, which stays below ``--alpha`` despite checking after every
+sample.
+
+It also times one status query after ``--status-samples`` samples per arm,
+for the previous per-sample list summary and the running statistics.
+
+Usage:
+    python benchmarks/ab_sequential_testing_benchmark.py
+    python benchmarks/ab_sequential_testing_benchmark.py --rates 0.80 0.75 0.70 --horizon 2000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from platform.experimentation.ab_testing_framework import ExperimentMetrics, TestStrategy  # noqa: E402
+from platform.experimentation.sequential_testing import SequentialExperiment  # noqa: E402
+
+
+def run_sequential(rates: list[float], args: argparse.Namespace, seed: int) -> tuple[dict[str, int], str | None]:
+    rng = random.Random(seed)
+    arms = [f"arm{i}" for i in range(len(rates))]
+    experiment = SequentialExperiment(arms, alpha=args.alpha)
+    for _ in range(args.horizon * len(arms)):
+        if experiment.concluded:
+            break
+        arm = rng.choice(experiment.active)
+        experiment.record(arm, 0.0, 0.0, 0.0, rng.random() < rates[arms.index(arm)])
+    return {arm: stats.count for arm, stats in experiment.arms.items()}, experiment.winner
+
+
+def run_fixed(rates: list[float], args: argparse.Namespace, seed: int) -> tuple[dict[str, int], str]:
+    rng = random.Random(seed)
+    successes = [sum(rng.random() < rate for _ in range(args.horizon)) for rate in rates]
+    winner = max(range(len(rates)), key=successes.__getitem__)
+    return {f"arm{i}": args.horizon for i in range(len(rates))}, f"arm{winner}"
+
+
+def simulate(policy: str, args: argparse.Namespace) -> dict[str, float]:
+    runner = run_sequential if policy == "sequential" else run_fixed
+    totals, losing, correct = [], [], 0
+    for trial in range(args.trials):
+        counts, winner = runner(args.rates, args, seed=args.seed + trial)
+        totals.append(sum(counts.values()))
+        losing.append(sum(n for arm, n in counts.items() if arm != "arm0"))
+        correct += winner == "arm0"
+    return {
+        "mean_samples": statistics.fmean(totals),
+        "mean_losing_arm_samples": statistics.fmean(losing),
+        "best_arm_won": correct / args.trials,
+    }
+
+
+def false_stop_rate(args: argparse.Namespace) -> float:
+    rates = [args.rates[0]] * 2
+    stops = sum(run_sequential(rates, args, seed=10_000 + trial)[1] is not None for trial in range(args.trials))
+    return stops / args.trials
+
+
+class LegacyMetrics:
+    """The previous ExperimentMetrics: a sample dict per request, summarized from scratch."""
+
+    def __init__(self) -> None:
+        self.samples: list[dict[str, Any]] = []
+
+    def add_sample(self, latency_ms: float, cost: float, quality: float, success: bool) -> None:
+        self.samples.append(
+            {"timestamp": time.time(), "latency_ms": latency_ms, "cost": cost, "quality": quality, "success": success}
+        )
+
+    def get_summary_stats(self) -> dict[str, float]:
+        successes = [s["success"] for s in self.samples]
+        latencies = [s["latency_ms"] for s in self.samples]
+        costs = [s["cost"] for s in self.samples]
+        qualities = [s["quality"] for s in self.samples]
+        return {
+            "sample_count": len(self.samples),
+            "success_rate": sum(successes) / len(successes),
+            "avg_latency_ms": sum(latencies) / len(latencies),
+            "avg_cost": sum(costs) / len(costs),
+            "avg_quality": sum(qualities) / len(qualities),
+        }
+
+
+def time_status(samples: int, repeats: int) -> dict[str, float]:
+    result = {}
+    for name, metrics in (
+        ("legacy", LegacyMetrics()),
+        ("running", ExperimentMetrics(TestStrategy.PERFORMANCE_BASED)),
+    ):
+        for i in range(samples):
+            metrics.add_sample(100.0 + i % 7, 0.001, 0.5, i % 3 != 0)
+        started = time.perf_counter()
+        for _ in range(repeats):
+            metrics.get_summary_stats()
+        result[name] = (time.perf_counter() - started) / repeats * 1e6
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rates", type=float, nargs="+", default=[0.90, 0.80, 0.75])
+    parser.add_argument("--horizon", type=int, default=1000, help="fixed-horizon samples per arm")
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--trials", type=int, default=100)
+    parser.add_argument("--status-samples", type=int, default=100_000)
+    parser.add_argument("--status-repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+
+    results: dict[str, Any] = {policy: simulate(policy, args) for policy in ("fixed", "sequential")}
+    results["aa_false_stop_rate"] = false_stop_rate(args)
+    results["status_query_us"] = time_status(args.status_samples, args.status_repeats)
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+        return 0
+    print(f"arms {args.rates}, horizon {args.horizon}/arm, alpha {args.alpha}, {args.trials} trials")
+    for policy in ("fixed", "sequential"):
+        row = results[policy]
+        print(
+            f"  {policy:<10} samples {row['mean_samples']:>8,.0f}  "
+            f"on losing arms {row['mean_losing_arm_samples']:>8,.0f}  best arm won {row['best_arm_won']:.0%}"
+        )
+    print(f"  A/A false stops {results['aa_false_stop_rate']:.1%}")
+    status = results["status_query_us"]
+    print(
+        f"  status query after {args.status_samples:,} samples: legacy {status['legacy']:,.0f} us, "
+        f"running stats {status['running']:,.1f} us"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Throughput and end-to-end latency of the agent message bus transports.
+
+``--messages`` targeted messages are published to one agent in batches of
+``--publish-batch`` while ``--consumers`` instances of that agent consume
+them. Reported per transport: publish and delivery throughput (messages/s)
+and end-to-end latency (publish call to callback) percentiles.
+
+- "pubsub": ``AgentMessageBus`` (one pipelined publish per message,
+  at-most-once, every subscribed instance receives every message);
+- "streams": ``AgentStreamBus`` (``XADD MAXLEN ~`` batches, one consumer
+  group shared by the instances, batched ``XREADGROUP`` + ``XACK``).
+
+Runs against an in-process fakeredis server by default, which measures
+client-side cost and round trips but not network latency; pass
+``--redis-url`` to use a real Redis (the benchmark uses DB 15 and flushes
+it).
+
+Usage:
+    python benchmarks/agent_stream_bus_benchmark.py
+    python benchmarks/agent_stream_bus_benchmark.py --redis-url redis://localhost:6379 --messages 20000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from platform.rl.agent_messaging import AgentMessage, AgentMessageBus, AgentStreamBus, MessageType  # noqa: E402
+
+
+def make_client(args: argparse.Namespace, server: Any) -> Any:
+    if args.redis_url:
+        import redis.asyncio as redis
+
+        return redis.from_url(args.redis_url, db=15, decode_responses=True)
+    import fakeredis
+
+    return fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def make_messages(args: argparse.Namespace) -> list[AgentMessage]:
+    return [
+        AgentMessage(type=MessageType.NOTE, content="x" * args.payload, target_agent_id="worker", metadata={"seq": i})
+        for i in range(args.messages)
+    ]
+
+
+async def run_streams(args: argparse.Namespace, server: Any) -> dict[str, Any]:
+    sent: dict[int, float] = {}
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def handle(message: AgentMessage) -> None:
+        latencies.append(time.perf_counter() - sent[message.metadata["seq"]])
+        if len(latencies) >= args.messages:
+            done.set()
+
+    buses = [
+        AgentStreamBus(
+            client=make_client(args, server),
+            consumer_name=f"c{i}",
+            batch_size=args.read_batch,
+            block_ms=100,
+            max_stream_length=max(args.messages, 1000),
+            max_lag=args.max_lag,
+            enable_global_broadcast=False,
+        )
+        for i in range(args.consumers)
+    ]
+    for bus in buses:
+        await bus.subscribe("worker", handle, subscribe_to_broadcast=False)
+    messages = make_messages(args)
+    started = time.perf_counter()
+    for offset in range(0, len(messages), args.publish_batch):
+        chunk = messages[offset : offset + args.publish_batch]
+        now = time.perf_counter()
+        for message in chunk:
+            sent[message.metadata["seq"]] = now
+        await buses[0].publish_many(chunk)
+    published = time.perf_counter() - started
+    await asyncio.wait_for(done.wait(), timeout=args.timeout)
+    delivered = time.perf_counter() - started
+    for bus in buses:
+        await bus.disconnect()
+    return summarize(args, published, delivered, latencies)
+
+
+async def run_pubsub(args: argparse.Namespace, server: Any) -> dict[str, Any]:
+    sent: dict[int, float] = {}
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def handle(message: AgentMessage) -> None:
+        latencies.append(time.perf_counter() - sent[message.metadata["seq"]])
+        if len(latencies) >= args.messages:
+            done.set()
+
+    bus = AgentMessageBus(redis_url="redis://unused", enable_global_broadcast=False)
+    bus._redis_client = make_client(args, server)
+    bus._pubsub = bus._redis_client.pubsub()
+    await bus.subscribe("worker", handle, subscribe_to_broadcast=False)
+    await asyncio.sleep(0.05)
+    messages = make_messages(args)
+    started = time.perf_counter()
+    for message in messages:
+        sent[message.metadata["seq"]] = time.perf_counter()
+        await bus.publish(message)
+    published = time.perf_counter() - started
+    await asyncio.wait_for(done.wait(), timeout=args.timeout)
+    delivered = time.perf_counter() - started
+    await bus.disconnect()
+    return summarize(args, published, delivered, latencies)
+
+
+def summarize(args: argparse.Namespace, published: float, delivered: float, latencies: list[float]) -> dict[str, Any]:
+    return {
+        "messages": args.messages,
+        "publish_msgs_per_s": args.messages / published,
+        "delivered_msgs_per_s": len(latencies) / delivered,
+        "latency_ms": {
+            "p50": percentile(latencies, 0.5) * 1e3,
+            "p99": percentile(latencies, 0.99) * 1e3,
+            "mean": statistics.fmean(latencies) * 1e3 if latencies else 0.0,
+        },
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for transport in args.transports:
+        server = None
+        if args.redis_url:
+            client = make_client(args, None)
+            await client.flushdb()
+            await client.aclose()
+        else:
+            import fakeredis
+
+            server = fakeredis.FakeServer()
+        runner = run_streams if transport == "streams" else run_pubsub
+        results[transport] = await runner(args, server)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=5_000)
+    parser.add_argument("--payload", type=int, default=256, help="message content bytes")
+    parser.add_argument("--consumers", type=int, default=2, help="instances of the consuming agent (streams)")
+    parser.add_argument("--publish-batch", type=int, default=50)
+    parser.add_argument("--read-batch", type=int, default=64)
+    parser.add_argument("--max-lag", type=int, default=5_000)
+    parser.add_argument("--transports", nargs="+", default=["pubsub", "streams"], choices=["pubsub", "streams"])
+    parser.add_argument("--redis-url", default=None, help="real Redis instead of fakeredis (DB 15 is flushed)")
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+
+    results = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+        return 0
+    backend = args.redis_url or "fakeredis"
+    print(f"{args.messages:,} messages of {args.payload} B on {backend}")
+    for transport, row in results.items():
+        latency = row["latency_ms"]
+        print(
+            f"  {transport:<8} publish {row['publish_msgs_per_s']:>9,.0f} msg/s  "
+            f"delivered {row['delivered_msgs_per_s']:>9,.0f} msg/s  "
+            f"latency p50 {latency['p50']:>8.2f} ms  p99 {latency['p99']:>8.2f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
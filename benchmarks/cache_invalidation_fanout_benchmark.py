@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Tag invalidation latency and cross-worker L1 fan-out latency.
+
+``--workers`` simulated workers each get their own Redis client,
+``MultiLevelCache`` and ``RedisInvalidationBus`` listener thread, all on one
+Redis (an in-process fakeredis server by default, or ``--redis-url``). For
+each ``--batch`` size, the first worker writes that many keys under one
+tag, every other worker reads them so they sit in its L1, and then the first
+worker calls ``InvalidationEngine.invalidate_tags``. Two latencies are
+reported per round:
+
+- "local": until ``invalidate_tags`` returns (L1 + Redis deletes and the
+  publish);
+- "fan-out": until the last worker has evicted every key from its L1.
+
+Usage:
+    python benchmarks/cache_invalidation_fanout_benchmark.py
+    python benchmarks/cache_invalidation_fanout_benchmark.py --workers 8 --batch 1 100 1000 --json
+    python benchmarks/cache_invalidation_fanout_benchmark.py --redis-url redis://localhost:6379/15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from platform.cache.dependency_tracker import DependencyTracker  # noqa: E402
+from platform.cache.invalidation_bus import RedisInvalidationBus  # noqa: E402
+from platform.cache.invalidation_engine import InvalidationEngine, TagIndex  # noqa: E402
+from platform.cache.multi_level_cache import MultiLevelCache  # noqa: E402
+
+
+class Worker:
+    """One simulated process: L1 + Redis cache, engine and bus listener."""
+
+    def __init__(self, client: Any, batch_size: int) -> None:
+        self.cache = MultiLevelCache(redis_client=client, max_memory_size=1_000_000)
+        self.engine = InvalidationEngine(
+            dependency_tracker=DependencyTracker(),
+            max_batch_size=batch_size,
+            backends=[self.cache],
+            bus=RedisInvalidationBus(client),
+            tag_index=TagIndex(client),
+        )
+        self.expected = 0
+        self.received = 0
+        self.done = threading.Event()
+        self.finished_at = 0.0
+        self.engine.bus.add_handler(self._count)
+
+    def _count(self, keys: list[str]) -> None:
+        self.received += len(keys)
+        if self.expected and self.received >= self.expected:
+            self.finished_at = time.perf_counter()
+            self.done.set()
+
+    def expect(self, count: int) -> None:
+        self.received = 0
+        self.expected = count
+        self.done.clear()
+
+
+def make_client_factory(redis_url: str | None):
+    if redis_url:
+        import redis
+
+        return lambda: redis.from_url(redis_url)
+    import fakeredis
+
+    server = fakeredis.FakeServer()
+    return lambda: fakeredis.FakeRedis(server=server)
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_round(workers: list[Worker], batch: int, round_no: int) -> tuple[float, float]:
+    writer, readers = workers[0], workers[1:]
+    tag = f"bench:{batch}:{round_no}"
+    for i in range(batch):
+        writer.cache.set("bench", {"batch": batch, "round": round_no, "i": i}, i)
+        await writer.engine.tag(writer.cache.cache_key("bench", {"batch": batch, "round": round_no, "i": i}), {tag})
+    for reader in readers:
+        for i in range(batch):
+            reader.cache.get("bench", {"batch": batch, "round": round_no, "i": i})
+        reader.expect(batch)
+    started = time.perf_counter()
+    result = await writer.engine.invalidate_tags({tag}, cascade=False)
+    local = time.perf_counter() - started
+    assert len(result.invalidated_keys) == batch, result.errors
+    for reader in readers:
+        if not await asyncio.to_thread(reader.done.wait, 30):
+            raise RuntimeError(f"worker received {reader.received}/{batch} keys")
+    fanout = max((reader.finished_at for reader in readers), default=started + local) - started
+    return local, fanout
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    new_client = make_client_factory(args.redis_url)
+    results: dict[str, Any] = {}
+    for batch in args.batch:
+        workers = [Worker(new_client(), args.max_batch_size) for _ in range(args.workers)]
+        for worker in workers:
+            await worker.engine.start()
+        try:
+            local, fanout = [], []
+            for round_no in range(args.rounds):
+                got_local, got_fanout = await run_round(workers, batch, round_no)
+                local.append(got_local * 1000)
+                fanout.append(got_fanout * 1000)
+        finally:
+            for worker in workers:
+                await worker.engine.stop()
+        results[str(batch)] = {
+            "local_p50_ms": statistics.median(local),
+            "local_p99_ms": percentile(local, 0.99),
+            "fanout_p50_ms": statistics.median(fanout),
+            "fanout_p99_ms": percentile(fanout, 0.99),
+            "fanout_us_per_key": statistics.median(fanout) * 1000 / batch,
+        }
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--max-batch-size", type=int, default=100, help="keys per backend delete call")
+    parser.add_argument("--redis-url", default=None, help="real Redis to use instead of fakeredis")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    logging.disable(logging.INFO)
+
+    results = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+        return 0
+    backend = args.redis_url or "fakeredis"
+    print(f"{args.workers} workers on {backend}, {args.rounds} rounds per batch size")
+    for batch, stats in results.items():
+        print(
+            f"  {int(batch):>6} keys  local p50 {stats['local_p50_ms']:>8.2f} ms  p99 {stats['local_p99_ms']:>8.2f} ms  "
+            f"fan-out p50 {stats['fanout_p50_ms']:>8.2f} ms  p99 {stats['fanout_p99_ms']:>8.2f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Hit-rate gain, warming cost and tracking overhead of ``CacheWarmer``.
+
+A Zipf-distributed read workload (``--keys`` distinct keys, ``--requests``
+reads at ``--rate`` per simulated second) runs against a TTL cache on a
+simulated clock, so hours of traffic replay in seconds. A miss loads the
+value from the "origin" and caches it for ``--ttl`` seconds. Two modes:
+
+- "no-warming": reads only;
+- "warming": reads go through ``CacheWarmer.get`` and every
+  ``--check-interval`` simulated seconds ``warm_hot_keys`` re-populates hot
+  keys that expire within ``--refresh-ahead`` seconds.
+
+Reported per mode: hit rate, origin loads on the request path (misses),
+origin loads made by the warmer, and for "warming" the hit-rate gain the
+warmer attributes to itself plus real seconds spent warming.
+
+The access tracker is also measured on its own: ns per recorded access and
+traced memory after ``--tracker-accesses`` accesses, for the previous
+per-key timestamp lists ("legacy") and the count-min/top-k tracker. The
+legacy tracker recomputes every interval on each access, so it is capped at
+``--legacy-accesses``.
+
+Usage:
+    python benchmarks/cache_warming_benchmark.py
+    python benchmarks/cache_warming_benchmark.py --keys 200000 --requests 500000 --ttl 120 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from platform.cache.cache_warmer import AccessPatternTracker, CacheWarmer  # noqa: E402
+
+
+class SimClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SimulatedCache:
+    """TTL cache on a simulated clock exposing the EnhancedRedisCache calls the warmer uses."""
+
+    def __init__(self, clock: SimClock, ttl: int) -> None:
+        self.namespace = "bench"
+        self.ttl = ttl
+        self._clock = clock
+        self._data: dict[str, tuple[dict[str, Any], float]] = {}
+
+    def get(self, key: str, track_access: bool = True) -> dict[str, Any] | None:
+        entry = self._data.get(key)
+        if entry is None or entry[1] <= self._clock():
+            return None
+        return entry[0]
+
+    def set(self, key: str, value: dict[str, Any], ttl: int | None = None) -> bool:
+        self._data[key] = (value, self._clock() + (ttl or self.ttl))
+        return True
+
+    def mset(self, data: dict[str, dict[str, Any]], ttl: int | None = None) -> int:
+        for key, value in data.items():
+            self.set(key, value, ttl)
+        return len(data)
+
+    def ttl_many(self, keys: list[str]) -> dict[str, int]:
+        now = self._clock()
+        result = {}
+        for key in keys:
+            entry = self._data.get(key)
+            result[key] = int(entry[1] - now) if entry is not None and entry[1] > now else -2
+        return result
+
+    def get_frequent_keys(self, limit: int = 100) -> list[tuple[str, int]]:
+        return []
+
+    def get_cache_efficiency_score(self) -> float:
+        return 1.0
+
+    def get_stats(self) -> dict[str, Any]:
+        return {"entries": len(self._data)}
+
+
+class LegacyTracker:
+    """The previous AccessPatternTracker bookkeeping: a growing timestamp list per key."""
+
+    def __init__(self) -> None:
+        self.patterns: dict[str, dict[str, Any]] = {}
+
+    def record(self, cache_name: str, key: str, timestamp: float) -> None:
+        pattern = self.patterns.setdefault(f"{cache_name}:{key}", {"count": 0, "times": [], "interval": 0.0})
+        pattern["count"] += 1
+        times = pattern["times"]
+        times.append(timestamp)
+        if len(times) > 1:
+            intervals = [times[i] - times[i - 1] for i in range(1, len(times))]
+            pattern["interval"] = sum(intervals) / len(intervals)
+
+
+def zipf_keys(n: int, keys: int, exponent: float, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) ** exponent for rank in range(keys)]
+    return [f"doc:{i}" for i in rng.choices(range(keys), weights=weights, k=n)]
+
+
+async def simulate(mode: str, workload: list[str], args: argparse.Namespace) -> dict[str, float]:
+    clock = SimClock()
+    cache = SimulatedCache(clock, args.ttl)
+    warm_loads = 0
+
+    def loader(key: str) -> dict[str, Any]:
+        nonlocal warm_loads
+        warm_loads += 1
+        return {"value": key}
+
+    warmer = CacheWarmer(
+        cache,  # type: ignore[arg-type]
+        tracker=AccessPatternTracker(top_k=args.hot * 2),
+        refresh_ahead_seconds=args.refresh_ahead,
+        max_warm_rate=1e9,
+        warm_burst=10**9,
+        hot_key_limit=args.hot,
+        clock=clock,
+    )
+    warmer.register_loader(loader)
+    misses = 0
+    next_check = args.check_interval
+    warming_seconds = 0.0
+    for i, key in enumerate(workload):
+        clock.now = i / args.rate
+        if mode == "warming" and clock.now >= next_check:
+            started = time.perf_counter()
+            await warmer.warm_hot_keys()
+            warming_seconds += time.perf_counter() - started
+            next_check += args.check_interval
+        value = warmer.get(key) if mode == "warming" else cache.get(key)
+        if value is None:
+            misses += 1
+            cache.set(key, {"value": key})
+    result = {
+        "hit_rate": 1 - misses / len(workload),
+        "request_path_loads": misses,
+        "warming_loads": warm_loads,
+        "origin_loads": misses + warm_loads,
+    }
+    if mode == "warming":
+        result["attributed_gain"] = warmer.hit_rates()["hit_rate_gain"]
+        result["warming_seconds"] = warming_seconds
+    return result
+
+
+def measure_tracker(kind: str, workload: list[str]) -> dict[str, float]:
+    def fill() -> Any:
+        tracker: Any = LegacyTracker() if kind == "legacy" else AccessPatternTracker()
+        for i, key in enumerate(workload):
+            tracker.record("bench", key, float(i))
+        return tracker
+
+    started = time.perf_counter()
+    fill()
+    elapsed = time.perf_counter() - started
+    # Memory is traced in a separate run; tracemalloc slows allocation down a lot.
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracker = fill()
+    memory = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del tracker
+    return {"accesses": len(workload), "ns_per_access": elapsed * 1e9 / len(workload), "memory_mb": memory / 1e6}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=300_000)
+    parser.add_argument("--rate", type=float, default=200.0, help="requests per simulated second")
+    parser.add_argument("--zipf", type=float, default=1.0)
+    parser.add_argument("--ttl", type=int, default=60)
+    parser.add_argument("--check-interval", type=float, default=10.0)
+    parser.add_argument("--refresh-ahead", type=float, default=15.0)
+    parser.add_argument("--hot", type=int, default=500, help="hot keys considered per warming cycle")
+    parser.add_argument("--tracker-accesses", type=int, default=200_000)
+    parser.add_argument("--legacy-accesses", type=int, default=30_000)
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+
+    workload = zipf_keys(args.requests, args.keys, args.zipf, args.seed)
+    results: dict[str, Any] = {
+        mode: asyncio.run(simulate(mode, workload, args)) for mode in ("no-warming", "warming")
+    }
+    tracker_workload = zipf_keys(args.tracker_accesses, args.keys, args.zipf, args.seed + 1)
+    results["tracker"] = {
+        "legacy": measure_tracker("legacy", tracker_workload[: args.legacy_accesses]),
+        "sketch": measure_tracker("sketch", tracker_workload),
+    }
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+        return 0
+    hours = args.requests / args.rate / 3600
+    print(
+        f"{args.requests:,} reads over {hours:.1f} simulated hours, "
+        f"{args.keys:,} keys, zipf {args.zipf}, ttl {args.ttl}s"
+    )
+    for mode in ("no-warming", "warming"):
+        row = results[mode]
+        line = (
+            f"  {mode:<11} hit rate {row['hit_rate']:.3f}  request-path loads {row['request_path_loads']:>7,}  "
+            f"warming loads {row['warming_loads']:>7,}"
+        )
+        if mode == "warming":
+            line += f"  attributed gain {row['attributed_gain']:.3f}  warming {row['warming_seconds']:.2f} s"
+        print(line)
+    for kind, row in results["tracker"].items():
+        print(
+            f"  tracker {kind:<7} {row['accesses']:>8,} accesses  {row['ns_per_access']:>9.0f} ns/access  "
+            f"{row['memory_mb']:>7.2f} MB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
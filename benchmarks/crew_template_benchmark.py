@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Per-request crew setup cost with and without crew templates.
+
+Before crew templates, the autonomous orchestrator built every agent for each
+``/autointel`` request, along with its tool wrappers and LLM client. With
+:class:`platform.cache.crew_templates.CrewTemplateCache`, a request leases a
+pre-built agent set and creates only its own tasks and crew. This benchmark
+times both paths over ``--requests`` requests. ``tracemalloc`` counts the
+allocations each request makes:
+
+- "rebuild": build the agents and stamp the crew on every request;
+- "template": lease agents from the template cache and stamp the crew.
+
+By default the real ``UltimateDiscordIntelligenceBotCrew`` agents and
+``build_intelligence_crew`` are used; this needs crewai and the bot's config.
+``--synthetic`` uses stand-in agents instead. Each stand-in has
+``--tools`` tool wrappers and a client object of ``--client-kb`` KiB, so the
+benchmark also runs on checkouts without crewai.
+
+Usage:
+    python benchmarks/crew_template_benchmark.py
+    python benchmarks/crew_template_benchmark.py --synthetic --requests 200 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from platform.cache.crew_templates import CrewTemplateCache  # noqa: E402
+
+
+AGENT_NAMES = (
+    "acquisition_specialist",
+    "transcription_engineer",
+    "analysis_cartographer",
+    "verification_director",
+    "knowledge_integrator",
+)
+
+
+@dataclass
+class SetupStats:
+    """Per-request setup cost for one mode."""
+
+    mode: str
+    requests: int
+    setup_ms_mean: float
+    setup_ms_p95: float
+    allocations_per_request: float
+    kib_per_request: float
+
+
+class _SyntheticTool:
+    def __init__(self, index: int) -> None:
+        self.name = f"tool_{index}"
+        self.schema = {f"field_{i}": {"type": "string", "description": "x" * 32} for i in range(16)}
+        self._shared_context: dict[str, Any] = {}
+
+
+class _SyntheticAgent:
+    def __init__(self, role: str, tools: int, client_kb: int) -> None:
+        self.role = role
+        self.tools = [_SyntheticTool(i) for i in range(tools)]
+        self.llm = bytearray(client_kb * 1024)
+
+
+class _SyntheticTask:
+    def __init__(self, agent: Any, description: str) -> None:
+        self.agent = agent
+        self.description = description
+
+
+class _SyntheticCrew:
+    def __init__(self, agents: list[Any], tasks: list[Any]) -> None:
+        self.agents = agents
+        self.tasks = tasks
+
+
+def _synthetic_factories(tools: int, client_kb: int):
+    def build_agents() -> dict[str, Any]:
+        return {name: _SyntheticAgent(name, tools, client_kb) for name in AGENT_NAMES}
+
+    def stamp(url: str, depth: str, agents: dict[str, Any]) -> Any:
+        tasks = [_SyntheticTask(agent, f"{name} for {url} ({depth})") for name, agent in agents.items()]
+        return _SyntheticCrew(list(agents.values()), tasks)
+
+    return build_agents, stamp
+
+
+def _real_factories():
+    from ultimate_discord_intelligence_bot.crew_core import UltimateDiscordIntelligenceBotCrew
+    from ultimate_discord_intelligence_bot.orchestrator.crew_builders import (
+        INTELLIGENCE_CREW_AGENTS,
+        build_intelligence_crew,
+    )
+
+    crew_instance = UltimateDiscordIntelligenceBotCrew()
+
+    def build_agents() -> dict[str, Any]:
+        return {name: getattr(crew_instance, name)() for name in INTELLIGENCE_CREW_AGENTS}
+
+    def stamp(url: str, depth: str, agents: dict[str, Any]) -> Any:
+        return build_intelligence_crew(url, depth, agents=agents)
+
+    return build_agents, stamp
+
+
+def _summarize(mode: str, durations: list[float], allocations: list[int], sizes: list[int]) -> SetupStats:
+    ordered = sorted(durations)
+    p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+    n = len(durations)
+    return SetupStats(
+        mode=mode,
+        requests=n,
+        setup_ms_mean=1000 * sum(durations) / n,
+        setup_ms_p95=1000 * p95,
+        allocations_per_request=sum(allocations) / n,
+        kib_per_request=sum(sizes) / n / 1024,
+    )
+
+
+async def _run(mode: str, requests: int, depth: str, build_agents, stamp) -> SetupStats:
+    cache = CrewTemplateCache()
+    durations: list[float] = []
+    allocations: list[int] = []
+    sizes: list[int] = []
+    tracemalloc.start()
+    for i in range(requests):
+        url = f"https://example.com/watch?v={i}"
+        before = tracemalloc.take_snapshot()
+        started = time.perf_counter()
+        if mode == "rebuild":
+            crew = stamp(url, depth, build_agents())
+        else:
+            async with cache.lease(depth, {"bench": True}, build_agents) as agents:
+                crew = stamp(url, depth, agents)
+        durations.append(time.perf_counter() - started)
+        diff = tracemalloc.take_snapshot().compare_to(before, "filename")
+        allocations.append(sum(max(0, stat.count_diff) for stat in diff))
+        sizes.append(sum(max(0, stat.size_diff) for stat in diff))
+        del crew
+    tracemalloc.stop()
+    return _summarize(mode, durations, allocations, sizes)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--depth", default="deep")
+    parser.add_argument("--synthetic", action="store_true", help="use stand-in agents instead of crewai")
+    parser.add_argument("--tools", type=int, default=8, help="tool wrappers per synthetic agent")
+    parser.add_argument("--client-kb", type=int, default=64, help="size of each synthetic LLM client")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        build_agents, stamp = _synthetic_factories(args.tools, args.client_kb)
+    else:
+        try:
+            build_agents, stamp = _real_factories()
+        except ImportError as exc:
+            print(f"crewai crew unavailable ({exc}); rerun with --synthetic", file=sys.stderr)
+            return 2
+
+    results = [asyncio.run(_run(mode, args.requests, args.depth, build_agents, stamp)) for mode in ("rebuild", "template")]
+    rebuild, template = results
+    saved = {
+        "setup_ms_saved_per_request": rebuild.setup_ms_mean - template.setup_ms_mean,
+        "allocations_saved_per_request": rebuild.allocations_per_request - template.allocations_per_request,
+        "kib_saved_per_request": rebuild.kib_per_request - template.kib_per_request,
+    }
+    if args.json:
+        print(json.dumps({"modes": [asdict(r) for r in results], "saved": saved}, indent=2))
+        return 0
+    print(f"{'mode':<10} {'mean ms':>9} {'p95 ms':>9} {'allocs/req':>11} {'KiB/req':>9}")
+    for r in results:
+        print(
+            f"{r.mode:<10} {r.setup_ms_mean:>9.3f} {r.setup_ms_p95:>9.3f} "
+            f"{r.allocations_per_request:>11.0f} {r.kib_per_request:>9.1f}"
+        )
+    print(
+        f"saved per request: {saved['setup_ms_saved_per_request']:.3f} ms, "
+        f"{saved['allocations_saved_per_request']:.0f} allocations, {saved['kib_saved_per_request']:.1f} KiB"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
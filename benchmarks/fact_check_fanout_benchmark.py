@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Fact-check throughput with concurrent evidence fan-out.
+
+The five ``FactCheckTool`` backends are replaced by local stubs that sleep
+for an injected latency (``--latency-ms`` plus up to ``--jitter-ms`` of random
+jitter, with ``--slow-backend`` taking ``--slow-ms`` instead) and return
+``--items`` evidence items each. A batch of ``--claims`` claims, of which
+``--repeat-ratio`` are repeats of earlier ones, is checked in four modes:
+
+- "sequential": backends queried one after another, claims one after another
+  (the previous ``FactCheckTool.run`` behaviour);
+- "fanout": ``FactCheckTool.run`` per claim, backends queried concurrently
+  under the deadline, budgets and quorum of ``FanOutPolicy``;
+- "batch": ``FactCheckTool.run_many`` with ``--max-concurrency`` claims in
+  flight on top of the fan-out;
+- "cached": the same batch again against a warm evidence cache.
+
+For each mode it reports claims/s, p50/p95 per-claim latency and the number
+of backend calls made.
+
+Usage:
+    python benchmarks/fact_check_fanout_benchmark.py
+    python benchmarks/fact_check_fanout_benchmark.py --claims 100 --slow-ms 3000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from domains.intelligence.verification.evidence_fanout import EvidenceCache, FanOutPolicy  # noqa: E402
+from domains.intelligence.verification.fact_check_tool import FactCheckTool  # noqa: E402
+
+
+BACKENDS = ("duckduckgo", "serply", "exa", "perplexity", "wolfram")
+
+
+class StubBackends:
+    """Latency-injecting replacements for the ``_search_*`` methods."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(args.seed)
+
+    def search(self, name: str):
+        def search(query: str) -> list[dict]:
+            with self._lock:
+                self.calls += 1
+                jitter = self._rng.uniform(0, self.args.jitter_ms)
+            latency = self.args.slow_ms if name == self.args.slow_backend else self.args.latency_ms + jitter
+            time.sleep(latency / 1000.0)
+            return [
+                {"title": f"{name} {i}", "url": f"https://{name}.test/{i}", "snippet": query}
+                for i in range(self.args.items)
+            ]
+
+        return search
+
+    def install(self, tool: FactCheckTool) -> FactCheckTool:
+        for name in BACKENDS:
+            setattr(tool, f"_search_{name}", self.search(name))
+        return tool
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))] if ordered else 0.0
+
+
+def make_claims(count: int, repeat_ratio: float, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    claims: list[str] = []
+    for i in range(count):
+        if claims and rng.random() < repeat_ratio:
+            claims.append(rng.choice(claims).upper())
+        else:
+            claims.append(f"Claim number {i} about the economy.")
+    return claims
+
+
+def timed(fn, claim: str, latencies: list[float]) -> Any:
+    started = time.perf_counter()
+    result = fn(claim)
+    latencies.append((time.perf_counter() - started) * 1000)
+    return result
+
+
+def run_sequential(stubs: StubBackends, claims: list[str], latencies: list[float]) -> None:
+    def check(claim: str) -> list[dict]:
+        return [item for name in BACKENDS for item in stubs.search(name)(claim)]
+
+    for claim in claims:
+        timed(check, claim, latencies)
+
+
+def run_batch(tool: FactCheckTool, claims: list[str], max_concurrency: int, latencies: list[float]) -> None:
+    run = tool.run
+
+    def timed_run(claim: str, **kwargs: Any) -> Any:
+        return timed(lambda c: run(c, **kwargs), claim, latencies)
+
+    tool.run = timed_run  # type: ignore[method-assign]
+    try:
+        tool.run_many(claims, max_concurrency=max_concurrency)
+    finally:
+        del tool.run
+
+
+def measure(mode: str, args: argparse.Namespace, claims: list[str]) -> dict[str, float]:
+    stubs = StubBackends(args)
+    policy = FanOutPolicy(
+        deadline_seconds=args.deadline_ms / 1000.0,
+        default_budget_seconds=args.budget_ms / 1000.0,
+        quorum=args.quorum,
+    )
+    executor = ThreadPoolExecutor(max_workers=args.max_inflight, thread_name_prefix="bench-backend")
+    tool = stubs.install(FactCheckTool(policy=policy, cache=EvidenceCache(), executor=executor))
+    latencies: list[float] = []
+    try:
+        if mode == "cached":
+            tool.run_many(claims, max_concurrency=args.max_concurrency)
+            stubs.calls = 0
+        started = time.perf_counter()
+        if mode == "sequential":
+            run_sequential(stubs, claims, latencies)
+        elif mode == "fanout":
+            for claim in claims:
+                timed(tool.run, claim, latencies)
+        else:
+            run_batch(tool, claims, args.max_concurrency, latencies)
+        elapsed = time.perf_counter() - started
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return {
+        "claims_per_second": len(claims) / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": percentile(latencies, 95),
+        "backend_calls": stubs.calls,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--claims", type=int, default=20)
+    parser.add_argument("--repeat-ratio", type=float, default=0.25)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--jitter-ms", type=float, default=100.0)
+    parser.add_argument("--slow-backend", default="wolfram")
+    parser.add_argument("--slow-ms", type=float, default=1500.0)
+    parser.add_argument("--items", type=int, default=3)
+    parser.add_argument("--deadline-ms", type=float, default=1000.0)
+    parser.add_argument("--budget-ms", type=float, default=800.0)
+    parser.add_argument("--quorum", type=int, default=8, help="evidence items that end a claim early; 0 disables")
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--max-inflight", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--modes", nargs="+", default=["sequential", "fanout", "batch", "cached"])
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)  # budget overruns are expected here
+
+    claims = make_claims(args.claims, args.repeat_ratio, args.seed)
+    results = {mode: measure(mode, args, claims) for mode in args.modes}
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+        return 0
+    print(
+        f"{args.claims} claims, {args.latency_ms:.0f}+{args.jitter_ms:.0f} ms backends, "
+        f"{args.slow_backend} at {args.slow_ms:.0f} ms, budget {args.budget_ms:.0f} ms"
+    )
+    for mode, stats in results.items():
+        print(
+            f"  {mode:<10} {stats['claims_per_second']:>8.2f} claims/s  p50 {stats['p50_ms']:>7.1f} ms  "
+            f"p95 {stats['p95_ms']:>7.1f} ms  {stats['backend_calls']:>4} backend calls"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
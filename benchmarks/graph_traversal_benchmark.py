@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Round trips and latency of UnifiedGraphStore subgraph queries on Qdrant versus depth.
+
+A random "creator graph" (``--nodes`` nodes, ``--degree`` out-edges each) is
+loaded into an in-memory Qdrant (``qdrant-client`` local mode). For each
+depth in ``--depths`` the benchmark runs ``--queries`` traversals from
+random start nodes and reports Qdrant calls per query and p50/p99 latency
+for:
+
+- "per-node": the previous traversal, one ``scroll`` per visited node;
+- "batched": the frontier traversal with a cold adjacency cache;
+- "cached": the frontier traversal with adjacency cached from earlier queries.
+
+In-memory Qdrant has no network, so ``--rtt-ms`` adds a simulated round-trip
+time to every call; with a remote Qdrant the round trips dominate.
+
+Usage:
+    python benchmarks/graph_traversal_benchmark.py
+    python benchmarks/graph_traversal_benchmark.py --nodes 5000 --degree 10 --depths 1 2 3 --rtt-ms 1 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from domains.memory.unified_graph_store import GraphBackend, UnifiedGraphStore  # noqa: E402
+
+
+class CountingClient:
+    """Forwards to a Qdrant client, counting calls and adding a simulated round-trip time."""
+
+    def __init__(self, client: Any, rtt_ms: float) -> None:
+        self._client = client
+        self.rtt = rtt_ms / 1000
+        self.calls = 0
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._client, name)
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            self.calls += 1
+            if self.rtt:
+                time.sleep(self.rtt)
+            return method(*args, **kwargs)
+
+        return call
+
+
+def legacy_query(client: Any, start_node: str, max_depth: int, namespace: str) -> int:
+    """The previous per-node traversal; returns the number of nodes fetched."""
+    from qdrant_client.models import FieldCondition, Filter, MatchValue
+
+    visited = {start_node}
+    queue = deque([(start_node, 0)])
+    fetched = 0
+    while queue:
+        current_id, depth = queue.popleft()
+        if depth >= max_depth:
+            continue
+        result = client.scroll(
+            collection_name=f"graph_memory_{namespace}",
+            scroll_filter=Filter(must=[FieldCondition(key="_node_id", match=MatchValue(value=current_id))]),
+            limit=1,
+        )
+        if not result[0]:
+            continue
+        fetched += 1
+        for edge in result[0][0].payload.get("_edges", []):
+            if edge["target"] not in visited:
+                visited.add(edge["target"])
+                queue.append((edge["target"], depth + 1))
+    return fetched
+
+
+def load_graph(args: argparse.Namespace) -> tuple[Any, list[str]]:
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import Distance, PointStruct, VectorParams
+
+    client = QdrantClient(":memory:")
+    collection = "graph_memory_bench"
+    client.create_collection(
+        collection_name=collection, vectors_config=VectorParams(size=384, distance=Distance.COSINE)
+    )
+    rng = random.Random(args.seed)
+    node_ids = [f"creator:{i}" for i in range(args.nodes)]
+    points = []
+    for i, node_id in enumerate(node_ids):
+        edges = [
+            {"target": target, "relation": rng.choice(["MENTIONS", "COLLABORATES", "REPLIES"])}
+            for target in rng.sample(node_ids, args.degree)
+        ]
+        payload = {"_graph_type": "node", "_node_id": node_id, "_namespace": "bench", "_labels": ["Creator"]}
+        payload.update({"_edges": edges, "bio": "x" * args.payload})
+        points.append(PointStruct(id=i, vector=[0.0] * 384, payload=payload))
+    for offset in range(0, len(points), 500):
+        client.upsert(collection_name=collection, points=points[offset : offset + 500])
+    return client, node_ids
+
+
+def measure(run: Any, client: CountingClient, starts: list[str]) -> dict[str, float]:
+    latencies, calls = [], []
+    for start in starts:
+        before = client.calls
+        started = time.perf_counter()
+        run(start)
+        latencies.append(time.perf_counter() - started)
+        calls.append(client.calls - before)
+    ordered = sorted(latencies)
+    return {
+        "calls_per_query": statistics.fmean(calls),
+        "p50_ms": ordered[len(ordered) // 2] * 1e3,
+        "p99_ms": ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] * 1e3,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=2_000)
+    parser.add_argument("--degree", type=int, default=6)
+    parser.add_argument("--payload", type=int, default=500, help="bytes of non-edge payload per node")
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+    try:
+        raw_client, node_ids = load_graph(args)
+    except ImportError:
+        print("qdrant-client is required: pip install qdrant-client", file=sys.stderr)
+        return 1
+
+    client = CountingClient(raw_client, args.rtt_ms)
+    rng = random.Random(args.seed + 1)
+    results: dict[str, Any] = {}
+    for depth in args.depths:
+        starts = rng.sample(node_ids, args.queries)
+        options: dict[str, Any] = {"default_backend": GraphBackend.QDRANT, "enable_multi_backend": False}
+        cold = UnifiedGraphStore(qdrant_client=client, adjacency_cache_size=0, **options)
+        store = UnifiedGraphStore(qdrant_client=client, **options)
+
+        def query(start: str, store: UnifiedGraphStore, depth: int = depth) -> None:
+            store.query_subgraph(start_node=start, max_depth=depth, namespace="bench")
+
+        row: dict[str, Any] = {
+            "per-node": measure(lambda start, depth=depth: legacy_query(client, start, depth, "bench"), client, starts),
+            "batched": measure(lambda start: query(start, cold), client, starts),
+        }
+        measure(lambda start: query(start, store), client, starts)  # warm the adjacency cache
+        row["cached"] = measure(lambda start: query(start, store), client, starts)
+        reached = store.query_subgraph(start_node=starts[0], max_depth=depth, namespace="bench").data
+        row["nodes_reached"] = reached["node_count"]
+        results[f"depth_{depth}"] = row
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+        return 0
+    print(
+        f"{args.nodes:,} nodes, out-degree {args.degree}, simulated rtt {args.rtt_ms} ms, "
+        f"{args.queries} queries/depth"
+    )
+    for depth in args.depths:
+        row = results[f"depth_{depth}"]
+        print(f"  depth {depth} (~{row['nodes_reached']:,} nodes)")
+        for mode in ("per-node", "batched", "cached"):
+            m = row[mode]
+            print(
+                f"    {mode:<9} {m['calls_per_query']:>8,.1f} calls/query  "
+                f"p50 {m['p50_ms']:>9.1f} ms  p99 {m['p99_ms']:>9.1f} ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Per-character cost of entity/claim extraction on long transcripts.
+
+Synthetic Whisper-style transcripts (``--wpm`` words per minute, punctuation
+only every ``--punct-every`` words on average, ``--copula-rate`` of words
+being is/are/was/were, occasional names) are generated for each of
+``--hours``. Each transcript is processed three ways:
+
+- "legacy-regex": the previous ``kg.extract``, ``CLAIM_RE`` over the whole
+  text (lazy-then-greedy, backtracks on long unpunctuated stretches);
+- "legacy-windows": the previous ``ClaimExtractorTool`` strategy, the same
+  regex over overlapping 300-character windows;
+- "stream": ``kg.extract.extract_stream`` over the transcript's segments.
+
+For each it reports total seconds and nanoseconds per character; a flat
+ns/char column across durations means linear cost.
+
+Usage:
+    python benchmarks/kg_extract_benchmark.py
+    python benchmarks/kg_extract_benchmark.py --hours 1 2 3 --punct-every 400 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kg.extract import extract_stream  # noqa: E402
+
+
+LEGACY_ENTITY_RE = re.compile(r"\b([A-Z][a-z]+(?:\s[A-Z][a-z]+)*)\b")
+LEGACY_CLAIM_RE = re.compile(r"([^.!?]+?(?:is|are|was|were)[^.!?]+)")
+WORDS = (
+    "the a we they it that think know really like just going about market people money right "
+    "thing because but and so okay um yeah then there when what actually kind of said did "
+    "would could numbers growth rate policy government country time year today point"
+).split()
+NAMES = ["Joe Biden", "New York", "Federal Reserve", "Alice", "Elon Musk", "China"]
+COPULAS = ["is", "are", "was", "were"]
+
+
+def make_transcript(hours: float, wpm: int, punct_every: int, copula_rate: float, seed: int) -> list[str]:
+    """Whisper-like segments of 8-16 words, each starting with a space."""
+    rng = random.Random(seed)
+    total = int(hours * 60 * wpm)
+    segments: list[str] = []
+    words: list[str] = []
+    for _ in range(total):
+        roll = rng.random()
+        if roll < 0.02:
+            word = rng.choice(NAMES)
+        elif roll < 0.02 + copula_rate:
+            word = rng.choice(COPULAS)
+        else:
+            word = rng.choice(WORDS)
+        if rng.random() < 1 / punct_every:
+            word += rng.choice(".?!")
+        words.append(word)
+        if len(words) >= rng.randint(8, 16):
+            segments.append(" " + " ".join(words))
+            words = []
+    if words:
+        segments.append(" " + " ".join(words))
+    return segments
+
+
+def legacy_regex(text: str) -> int:
+    entities = list(LEGACY_ENTITY_RE.finditer(text))
+    claims = list(LEGACY_CLAIM_RE.finditer(text))
+    return len(entities) + len(claims)
+
+
+def legacy_windows(text: str) -> int:
+    found = 0
+    for i in range(0, len(text), 250):
+        found += legacy_regex(text[i : i + 300])
+    return found
+
+
+def stream(segments: list[str]) -> int:
+    return sum(len(entities) + len(claims) for entities, claims in extract_stream(segments))
+
+
+def measure(mode: str, segments: list[str], text: str, repeat: int) -> dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        if mode == "stream":
+            items = stream(segments)
+        else:
+            items = (legacy_regex if mode == "legacy-regex" else legacy_windows)(text)
+        timings.append(time.perf_counter() - started)
+    elapsed = min(timings)
+    return {"seconds": elapsed, "ns_per_char": elapsed * 1e9 / len(text), "items": items}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=float, nargs="+", default=[1.0, 2.0, 3.0])
+    parser.add_argument("--wpm", type=int, default=150)
+    parser.add_argument("--punct-every", type=int, default=200, help="mean words between terminators")
+    parser.add_argument("--copula-rate", type=float, default=0.04, help="share of words that are is/are/was/were")
+    parser.add_argument("--repeat", type=int, default=3, help="best-of runs per measurement")
+    parser.add_argument("--modes", nargs="+", default=["legacy-regex", "legacy-windows", "stream"])
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for hours in args.hours:
+        segments = make_transcript(hours, args.wpm, args.punct_every, args.copula_rate, args.seed)
+        text = "".join(segments)
+        results[f"{hours:g}h"] = {
+            mode: measure(mode, segments, text, args.repeat) | {"chars": len(text)} for mode in args.modes
+        }
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+        return 0
+    print(f"{args.wpm} wpm, one terminator per ~{args.punct_every} words, copula rate {args.copula_rate:g}")
+    for label, by_mode in results.items():
+        chars = next(iter(by_mode.values()))["chars"]
+        print(f"  {label} ({chars:,} chars)")
+        for mode, stats in by_mode.items():
+            print(f"    {mode:<15} {stats['seconds']:>8.3f} s  {stats['ns_per_char']:>9.1f} ns/char")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
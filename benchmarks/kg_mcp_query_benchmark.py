@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Queries per second for the MCP KG server under parallel clients.
+
+Seeds a tenant graph on disk, then has ``--clients`` threads call
+``kg_query`` and ``kg_timeline`` for random entities for ``--seconds``
+seconds. Two modes are measured:
+
+- "per-call": every tool call opens its own ``KGStore`` on the database file.
+  This is the connection setup and schema check the server used to pay on
+  every call;
+- "pooled": the server's long-lived per-tenant ``PooledKGStore`` with its
+  read connection pool.
+
+Usage:
+    python benchmarks/kg_mcp_query_benchmark.py
+    python benchmarks/kg_mcp_query_benchmark.py --entities 5000 --clients 16 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kg import KGStore, PooledKGStore  # noqa: E402
+from mcp_server import kg_server  # noqa: E402
+
+
+TENANT = "bench"
+
+
+def seed(path: Path, entities: int, episodes_per_entity: int, rng: random.Random) -> None:
+    store = PooledKGStore(path, read_connections=1)
+    try:
+        entity_ids = [store.add_node(TENANT, "entity", f"entity-{i}") for i in range(entities)]
+        for i, entity_id in enumerate(entity_ids):
+            for j in range(episodes_per_entity):
+                episode = store.add_node(TENANT, "episode", f"episode-{i}-{j}")
+                store.add_edge(entity_id, episode, "mentions", created_at=str(rng.random() * 1e6))
+                store.add_edge(episode, rng.choice(entity_ids), "features")
+    finally:
+        store.close()
+
+
+def run_clients(clients: int, seconds: float, entities: int, seed_value: int) -> dict[str, float]:
+    deadline = time.perf_counter() + seconds
+    counts = [0] * clients
+    errors = [0] * clients
+
+    def client(index: int) -> None:
+        rng = random.Random(seed_value + index)
+        while time.perf_counter() < deadline:
+            name = f"entity-{rng.randrange(entities)}"
+            if rng.random() < 0.5:
+                result = kg_server.kg_query(TENANT, name, depth=2)
+            else:
+                result = kg_server.kg_timeline(TENANT, name)
+            counts[index] += 1
+            errors[index] += 1 if "error" in result else 0
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    return {"queries": sum(counts), "errors": sum(errors), "qps": sum(counts) / elapsed}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=1000)
+    parser.add_argument("--episodes-per-entity", type=int, default=5)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--read-connections", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["MCP_KG_STORE_DIR"] = tmp
+        os.environ["MCP_KG_READ_CONNECTIONS"] = str(args.read_connections)
+        db_path = kg_server._tenant_db_path(TENANT)
+        seed(db_path, args.entities, args.episodes_per_entity, random.Random(args.seed))
+
+        results: dict[str, dict[str, float]] = {}
+        original_open = kg_server._open_store
+        kg_server._open_store = lambda tenant: KGStore(str(kg_server._tenant_db_path(tenant)))
+        try:
+            results["per-call"] = run_clients(args.clients, args.seconds, args.entities, args.seed)
+        finally:
+            kg_server._open_store = original_open
+        results["pooled"] = run_clients(args.clients, args.seconds, args.entities, args.seed)
+        kg_server.close_stores()
+
+    speedup = results["pooled"]["qps"] / results["per-call"]["qps"] if results["per-call"]["qps"] else 0.0
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results, "speedup": speedup}, indent=2))
+        return 0
+    print(f"{args.clients} clients, {args.entities} entities, {args.seconds:.1f}s per mode")
+    for mode, stats in results.items():
+        print(f"  {mode:<9} {stats['qps']:>9.1f} qps  ({int(stats['queries'])} queries, {int(stats['errors'])} errors)")
+    print(f"  speedup   {speedup:>9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Replay benchmark for Live Clip Radar chat signal processing.
+
+Replays synthetic chat for several concurrent streams and reports messages
+per second per stream for the legacy list-scanning checks ("before") and the
+windowed signal engine ("after"). Each message runs the velocity, baseline,
+sentiment-flip and laughter checks, as ``_check_viral_moments`` does.
+
+By default the replay goes through ``LiveClipRadar._process_chat_batch`` for
+the "after" mode. When the radar cannot be constructed (its media stack needs
+optional ASR dependencies), ``--engine-only`` replays the same checks against
+``clip_radar_signals`` directly.
+
+Usage:
+    python benchmarks/live_clip_radar_replay_benchmark.py
+    python benchmarks/live_clip_radar_replay_benchmark.py --streams 8 --messages 20000 --rate 50
+    python benchmarks/live_clip_radar_replay_benchmark.py --engine-only
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ultimate_discord_intelligence_bot.creator_ops.features.clip_radar_models import (  # noqa: E402
+    ChatMessage,
+    MonitoringConfig,
+    PlatformType,
+)
+from ultimate_discord_intelligence_bot.creator_ops.features.clip_radar_signals import (  # noqa: E402
+    ChatWindow,
+    RollingSum,
+    SentimentWindow,
+    count_laughter,
+    score_sentiment_batch,
+)
+
+
+WORDS = ["nice", "great", "lol", "haha", "bad", "gg", "wow", "awful", "love", "pog", "😂", "clip it"]
+LAUGHTER = ["lol", "haha", "😂"]
+
+
+@dataclass
+class ReplayStats:
+    """Throughput for one benchmark mode."""
+
+    mode: str
+    streams: int
+    messages_per_stream: int
+    seconds: float
+    messages_per_second_per_stream: float
+
+
+def _chat(stream: int, count: int, rate: float, seed: int) -> list[ChatMessage]:
+    rng = random.Random(seed + stream)
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    offset = 0.0
+    messages = []
+    for i in range(count):
+        offset += rng.expovariate(rate)
+        messages.append(
+            ChatMessage(
+                message_id=f"{stream}-{i}",
+                user_id=f"u{rng.randrange(500)}",
+                username="viewer",
+                message=" ".join(rng.choices(WORDS, k=rng.randint(1, 6))),
+                timestamp=start + timedelta(seconds=offset),
+                platform=PlatformType.TWITCH,
+                channel_id=f"channel-{stream}",
+                stream_id=f"stream-{stream}",
+            )
+        )
+    return messages
+
+
+def _legacy_sentiment(text: str) -> float:
+    positive = ["good", "great", "awesome", "amazing", "love", "best", "excellent"]
+    negative = ["bad", "terrible", "awful", "hate", "worst", "horrible", "disgusting"]
+    lowered = text.lower()
+    pos = sum(1 for word in positive if word in lowered)
+    neg = sum(1 for word in negative if word in lowered)
+    if pos > neg:
+        return min(1.0, pos / 5.0)
+    if neg > pos:
+        return max(-1.0, -neg / 5.0)
+    return 0.0
+
+
+def _replay_legacy(streams: list[list[ChatMessage]]) -> None:
+    """The per-message checks as they were: full scans and list copies."""
+    for messages in streams:
+        queue: deque[ChatMessage] = deque(maxlen=1000)
+        history: deque[dict[str, Any]] = deque(maxlen=100)
+        for message in messages:
+            queue.append(message)
+            history.append({"sentiment": _legacy_sentiment(message.message)})
+            since = message.timestamp - timedelta(minutes=1)
+            recent = [m for m in queue if m.timestamp >= since]
+            ten_minutes = message.timestamp - timedelta(minutes=10)
+            _ = len(recent), [m for m in queue if m.timestamp >= ten_minutes], recent[-10:]
+            if len(history) >= 10:
+                _ = [e["sentiment"] for e in list(history)[-10:]], [e["sentiment"] for e in list(history)[-20:-10]]
+            lowered = message.message.lower()
+            count = sum(lowered.count(k) for k in LAUGHTER)
+            count += len(re.findall("(.)\\1{2,}", lowered)) + len(re.findall("[😂🤣😆😄😃😀]", message.message))
+            if count:
+                _ = sum(m.message.lower().count(k) for m in list(queue)[-20:] for k in LAUGHTER)
+
+
+def _replay_engine(streams: list[list[ChatMessage]], batch_size: int = 256) -> None:
+    """The same checks against the windowed signal engine."""
+    for messages in streams:
+        chat, history, laughter = ChatWindow(), SentimentWindow(), RollingSum(20)
+        for start in range(0, len(messages), batch_size):
+            chunk = messages[start : start + batch_size]
+            scores = score_sentiment_batch([m.message for m in chunk])
+            for message, score in zip(chunk, scores, strict=True):
+                chat.append(message)
+                history.append({"timestamp": message.timestamp, "sentiment": score.score, "message": message.message})
+                since = message.timestamp - timedelta(minutes=1)
+                _ = chat.count_since(since), chat.rate_per_minute(), chat.tail(10)
+                _ = history.averages()
+                hits, _count = count_laughter(message.message, LAUGHTER)
+                laughter.push(hits)
+
+
+def _replay_radar(streams: list[list[ChatMessage]]) -> None:
+    from unittest.mock import Mock
+
+    from ultimate_discord_intelligence_bot.creator_ops.config import CreatorOpsConfig
+    from ultimate_discord_intelligence_bot.creator_ops.features.live_clip_radar import LiveClipRadar
+
+    radar = LiveClipRadar(Mock(spec=CreatorOpsConfig))
+
+    async def _noop(*args: Any, **kwargs: Any) -> None:
+        return None
+
+    radar._handle_viral_moment = _noop  # type: ignore[method-assign]
+    for index, messages in enumerate(streams):
+        config = MonitoringConfig(
+            platform=PlatformType.TWITCH, channel_id=f"channel-{index}", laughter_keywords=LAUGHTER
+        )
+        asyncio.run(radar._process_chat_batch(f"twitch_{index}", messages, config))
+
+
+def _time(mode: str, replay: Any, streams: list[list[ChatMessage]]) -> ReplayStats:
+    started = time.perf_counter()
+    replay(streams)
+    elapsed = time.perf_counter() - started
+    total = sum(len(messages) for messages in streams)
+    return ReplayStats(mode, len(streams), len(streams[0]), elapsed, total / elapsed / len(streams))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--streams", type=int, default=4)
+    parser.add_argument("--messages", type=int, default=5000, help="Messages per stream")
+    parser.add_argument("--rate", type=float, default=20.0, help="Average chat messages per second")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--engine-only", action="store_true", help="Replay against the signal engine directly")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    streams = [_chat(i, args.messages, args.rate, args.seed) for i in range(args.streams)]
+    after = _replay_engine
+    if not args.engine_only:
+        try:
+            _replay_radar(streams[:1])
+            after = _replay_radar
+        except Exception as exc:  # optional media dependencies missing
+            print(f"LiveClipRadar unavailable ({exc}); replaying the signal engine only", file=sys.stderr)
+    results = [_time("before", _replay_legacy, streams), _time("after", after, streams)]
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+        return 0
+    print(f"{'mode':<8} {'streams':>8} {'msgs/stream':>12} {'seconds':>9} {'msgs/s/stream':>14}")
+    for r in results:
+        print(
+            f"{r.mode:<8} {r.streams:>8} {r.messages_per_stream:>12} {r.seconds:>9.2f} "
+            f"{r.messages_per_second_per_stream:>14.0f}"
+        )
+    before, after_stats = results
+    print(f"speedup: {after_stats.messages_per_second_per_stream / before.messages_per_second_per_stream:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Cost of TTL compaction: payload scan (previous MemoryCompactionTool) vs index-driven TTLCompactor.
+
+An in-memory Qdrant (``qdrant-client`` local mode) collection is filled with
+``--points`` points. ``--ttl-fraction`` of them carry ``created_at``/``_ttl``
+and ``expires_at`` spread over the last ``--spread-hours``, and
+``--expired-fraction`` of all points have already expired. Each approach
+compacts its own copy of the collection twice:
+
+- "first": the initial run, deleting everything that has expired;
+- "incremental": a run ``--step-s`` seconds later, when only the points
+  expiring in between are due.
+
+Reported per run: wall time, client calls, points read back into Python and
+points deleted. "scan" pages through every payload and rescans the collection
+to count what is left; "indexed" counts and deletes by range filter on
+``expires_at`` and reads the point count from the collection info.
+
+Local mode keeps no payload indexes, so there the range filter is still an
+in-process scan; against a Qdrant server it is an index lookup and the gap
+widens further.
+
+Usage:
+    python benchmarks/memory_compaction_benchmark.py
+    python benchmarks/memory_compaction_benchmark.py --points 100000 --expired-fraction 0.02 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import sys
+import time
+import warnings
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from domains.memory.ttl_compaction import CompactionCheckpointStore, TTLCompactor, expires_at_for  # noqa: E402
+
+
+class CountingClient:
+    """Forwards to a Qdrant client, counting calls and points returned by ``scroll``."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        self.calls = 0
+        self.points_read = 0
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._client, name)
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            self.calls += 1
+            result = method(*args, **kwargs)
+            if name == "scroll":
+                self.points_read += len(result[0])
+            return result
+
+        return call
+
+
+def scan_compact(client: Any, collection: str, now: int, batch_size: int) -> int:
+    """The previous MemoryCompactionTool._run against qdrant-client; returns points deleted."""
+    from qdrant_client.http import models as qmodels
+
+    ids, offset = [], None
+    while True:
+        chunk, offset = client.scroll(collection_name=collection, limit=batch_size, with_payload=True, offset=offset)
+        ids.extend(p.id for p in chunk if (e := expires_at_for(p.payload or {})) is not None and e <= now)
+        if offset is None:
+            break
+    for i in range(0, len(ids), batch_size):
+        client.delete(collection_name=collection, points_selector=qmodels.PointIdsList(points=ids[i : i + batch_size]))
+    remaining, offset = 0, None
+    while True:
+        chunk, offset = client.scroll(collection_name=collection, limit=batch_size, with_payload=False, offset=offset)
+        remaining += len(chunk)
+        if offset is None:
+            break
+    return len(ids)
+
+
+def load(client: Any, name: str, args: argparse.Namespace, now: int) -> None:
+    from qdrant_client.http import models as qmodels
+
+    client.create_collection(name, vectors_config=qmodels.VectorParams(size=2, distance=qmodels.Distance.COSINE))
+    rng = random.Random(args.seed)
+    spread = int(args.spread_hours * 3600)
+    expiring = int(args.points * args.ttl_fraction)
+    expired_share = args.expired_fraction / args.ttl_fraction
+    batch = []
+    for i in range(args.points):
+        payload: dict[str, Any] = {"tenant_id": "bench", "text": "x" * args.payload}
+        if i < expiring:
+            # Expired points lie in the last spread seconds, the rest expire over the next spread seconds.
+            delta = -rng.randrange(1, spread) if rng.random() < expired_share else rng.randrange(1, spread)
+            created_at = now - 2 * spread
+            payload.update({"created_at": created_at, "_ttl": now + delta - created_at, "expires_at": now + delta})
+        batch.append(qmodels.PointStruct(id=i, vector=[1.0, 0.0], payload=payload))
+        if len(batch) == 5_000:
+            client.upsert(name, points=batch, wait=True)
+            batch = []
+    if batch:
+        client.upsert(name, points=batch, wait=True)
+
+
+def measure(client: CountingClient, run: Any) -> dict[str, float]:
+    calls, read = client.calls, client.points_read
+    started = time.perf_counter()
+    deleted = run()
+    return {
+        "seconds": time.perf_counter() - started,
+        "calls": client.calls - calls,
+        "points_read": client.points_read - read,
+        "deleted": deleted,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--ttl-fraction", type=float, default=0.5, help="share of points with a TTL")
+    parser.add_argument("--expired-fraction", type=float, default=0.01, help="share of points already expired")
+    parser.add_argument("--spread-hours", type=float, default=24 * 7)
+    parser.add_argument("--step-s", type=int, default=600, help="time between the first and incremental run")
+    parser.add_argument("--payload", type=int, default=200, help="bytes of text per point")
+    parser.add_argument("--batch-size", type=int, default=200, help="scan page size (MEMORY_COMPACTION_BATCH_SIZE)")
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+    try:
+        from qdrant_client import QdrantClient
+    except ImportError:
+        print("qdrant-client is required: pip install qdrant-client", file=sys.stderr)
+        return 1
+
+    now = 1_700_000_000
+    results: dict[str, Any] = {}
+    for approach in ("scan", "indexed"):
+        client = CountingClient(QdrantClient(":memory:"))
+        load(client._client, approach, args, now)
+        compactor = TTLCompactor(client, CompactionCheckpointStore())
+        runs = {}
+        for label, at in (("first", now), ("incremental", now + args.step_s)):
+            if approach == "scan":
+                runs[label] = measure(client, lambda at=at: scan_compact(client, "scan", at, args.batch_size))
+            else:
+                runs[label] = measure(client, lambda at=at: compactor.compact("indexed", now=at).deleted)
+        results[approach] = runs
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+        return 0
+    print(
+        f"{args.points:,} points, {args.ttl_fraction:.0%} with TTL, {args.expired_fraction:.1%} expired, "
+        f"incremental run {args.step_s} s later"
+    )
+    for label in ("first", "incremental"):
+        for approach in ("scan", "indexed"):
+            row = results[approach][label]
+            print(
+                f"  {label:<11} {approach:<8} {row['seconds']:>8.2f} s  {row['calls']:>6,} calls  "
+                f"{row['points_read']:>10,} points read  {row['deleted']:>8,} deleted"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Histogram memory, observe cost and quantile cost at millions of samples.
+
+Latency-like samples (log-normal) are fed through ``MetricsCollector``
+``observe_histogram`` in two modes:
+
+- "list": the previous histogram storage, one Python list per series with
+  quantiles computed by sorting it;
+- "sketch": the current ``WindowedQuantileSketch`` storage.
+
+At every ``--checkpoint`` samples the benchmark reports the series' traced
+memory (``tracemalloc``), the mean observe cost since the previous
+checkpoint, the time to compute p50/p95/p99 and the p99 relative error
+against the exact value. A bare ``QuantileSketch.add`` loop and a bare
+``list.append`` loop are timed as well to calibrate for the machine.
+
+Usage:
+    python benchmarks/metrics_quantile_benchmark.py
+    python benchmarks/metrics_quantile_benchmark.py --samples 5000000 --checkpoint 1000000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from platform.observability.metrics import MetricsCollector  # noqa: E402
+from platform.observability.quantile_sketch import QuantileSketch  # noqa: E402
+
+
+QUANTILES = (0.5, 0.95, 0.99)
+LABELS = {"endpoint": "/autointel", "status": "200"}
+
+
+class ListCollector(MetricsCollector):
+    """MetricsCollector with the previous list-backed histograms."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.histograms = defaultdict(list)  # type: ignore[assignment]
+
+    def observe_histogram(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        self.histograms[self._make_key(name, labels)].append(value)  # type: ignore[attr-defined]
+
+    def get_histogram_quantile(self, name: str, quantile: float, labels: dict[str, str] | None = None, **_: Any):
+        values = sorted(self.histograms.get(self._make_key(name, labels), []))
+        return values[int(quantile * (len(values) - 1))] if values else 0.0
+
+
+def samples(count: int, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    return [rng.lognormvariate(-2.5, 1.0) for _ in range(count)]
+
+
+def calibrate(values: list[float]) -> dict[str, float]:
+    sketch, plain = QuantileSketch(), []
+    started = time.perf_counter()
+    for value in values:
+        plain.append(value)
+    append_ns = (time.perf_counter() - started) * 1e9 / len(values)
+    started = time.perf_counter()
+    for value in values:
+        sketch.add(value)
+    add_ns = (time.perf_counter() - started) * 1e9 / len(values)
+    return {"list_append_ns": append_ns, "sketch_add_ns": add_ns}
+
+
+def run(mode: str, values: list[float], checkpoint: int, trace: bool) -> list[dict[str, float]]:
+    collector = ListCollector() if mode == "list" else MetricsCollector()
+    rows: list[dict[str, float]] = []
+    if trace:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0] if trace else 0
+    observed: list[float] = []
+    for begin in range(0, len(values), checkpoint):
+        chunk = values[begin : begin + checkpoint]
+        started = time.perf_counter()
+        for value in chunk:
+            collector.observe_histogram("request_duration_seconds", value, LABELS)
+        observe_ns = (time.perf_counter() - started) * 1e9 / len(chunk)
+        if not trace:
+            observed.extend(chunk)
+        del chunk  # keep the slice itself out of the traced memory
+        started = time.perf_counter()
+        got = {q: collector.get_histogram_quantile("request_duration_seconds", q, LABELS) for q in QUANTILES}
+        query_ms = (time.perf_counter() - started) * 1000
+        row = {"samples": min(begin + checkpoint, len(values)), "observe_ns": observe_ns, "quantiles_ms": query_ms}
+        if trace:
+            row["memory_mb"] = (tracemalloc.get_traced_memory()[0] - baseline) / 1e6
+        else:
+            truth = sorted(observed)[int(0.99 * (len(observed) - 1))]
+            row["p99_rel_error"] = abs(got[0.99] - truth) / truth
+        rows.append(row)
+    if trace:
+        tracemalloc.stop()
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=2_000_000)
+    parser.add_argument("--checkpoint", type=int, default=500_000)
+    parser.add_argument("--modes", nargs="+", default=["list", "sketch"])
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    values = samples(args.samples, args.seed)
+    results: dict[str, Any] = {"calibration": calibrate(values[: min(len(values), 1_000_000)])}
+    for mode in args.modes:
+        timed = run(mode, values, args.checkpoint, trace=False)
+        traced = run(mode, values, args.checkpoint, trace=True)
+        results[mode] = [row | {"memory_mb": mem["memory_mb"]} for row, mem in zip(timed, traced, strict=True)]
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+        return 0
+    calibration = results["calibration"]
+    print(
+        f"calibration: list.append {calibration['list_append_ns']:.0f} ns, "
+        f"QuantileSketch.add {calibration['sketch_add_ns']:.0f} ns"
+    )
+    for mode in args.modes:
+        print(f"  {mode}")
+        for row in results[mode]:
+            print(
+                f"    {row['samples']:>9,} samples  {row['memory_mb']:>8.2f} MB  observe {row['observe_ns']:>6.0f} ns  "
+                f"p50/p95/p99 {row['quantiles_ms']:>8.2f} ms  p99 err {row['p99_rel_error']:.4f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Chat completion calls per second with many requests in flight.
+
+A local stub server answers ``/v1/chat/completions`` after ``--latency-ms``
+(streaming responses spread the delay over ``--tokens`` SSE chunks). The
+benchmark keeps ``--inflight`` requests outstanding until ``--requests``
+calls have completed, in three modes:
+
+- "threads": the sync ``OpenRouterService.route`` transport, one
+  ``resilient_post`` per call on a pool of ``--inflight`` threads;
+- "async": ``AsyncChatTransport``, the transport behind
+  ``OpenRouterService.aroute``, with every call a task on one event loop;
+- "async-stream": the same with ``stream=True``, reading every token;
+- "aroute": ``OpenRouterService.aroute`` end to end (prompt preparation,
+  budget and cache checks, the shared transport and result bookkeeping).
+
+For each mode it reports calls/s, p50/p95 latency, the number of TCP
+connections the server accepted and the peak number of threads.
+
+Usage:
+    python benchmarks/openrouter_async_benchmark.py
+    python benchmarks/openrouter_async_benchmark.py --inflight 200 --requests 2000 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from aiohttp import web  # noqa: E402
+
+from platform.http.http_utils import resilient_post  # noqa: E402
+from platform.llm.providers.openrouter.openrouter_service import execution  # noqa: E402
+from platform.llm.providers.openrouter.openrouter_service.async_transport import (  # noqa: E402
+    AsyncChatTransport,
+    aclose_async_transport,
+)
+
+
+class StubCompletionsServer:
+    """OpenAI-compatible completions endpoint on its own event loop thread."""
+
+    def __init__(self, latency_ms: float, tokens: int) -> None:
+        self.latency = latency_ms / 1000.0
+        self.tokens = max(1, tokens)
+        self.connections: set[int] = set()
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, name="stub-completions", daemon=True)
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def _completions(self, request: web.Request) -> web.StreamResponse:
+        self.connections.add(id(request.transport))
+        payload = await request.json()
+        if not payload.get("stream"):
+            await asyncio.sleep(self.latency)
+            content = " ".join(f"tok{i}" for i in range(self.tokens))
+            return web.json_response({"choices": [{"message": {"role": "assistant", "content": content}}]})
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for i in range(self.tokens):
+            await asyncio.sleep(self.latency / self.tokens)
+            chunk = {"choices": [{"delta": {"content": f"tok{i} "}}]}
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        return response
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._completions)
+        self._runner = web.AppRunner(app, access_log=None)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", 0, backlog=1024)
+        self._loop.run_until_complete(site.start())
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/v1/chat/completions"
+        self._ready.set()
+        self._loop.run_forever()
+
+    def __enter__(self) -> StubCompletionsServer:
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        if self._runner is not None:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))] if ordered else 0.0
+
+
+def _payload(i: int) -> dict[str, Any]:
+    return {"model": "stub/model", "messages": [{"role": "user", "content": f"question {i}"}]}
+
+
+def run_threads(url: str, requests: int, inflight: int) -> tuple[list[float], int, int]:
+    latencies: list[float] = []
+    errors = 0
+    peak_threads = threading.active_count()
+
+    def call(i: int) -> None:
+        nonlocal errors, peak_threads
+        started = time.perf_counter()
+        resp = resilient_post(url, json_payload=_payload(i), timeout_seconds=30)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if resp is None or resp.status_code >= 400 or not resp.json().get("choices"):
+            errors += 1
+        peak_threads = max(peak_threads, threading.active_count())
+
+    with ThreadPoolExecutor(max_workers=inflight) as pool:
+        list(pool.map(call, range(requests)))
+    return latencies, errors, peak_threads
+
+
+async def run_async(url: str, requests: int, inflight: int, *, stream: bool) -> tuple[list[float], int, int]:
+    latencies: list[float] = []
+    errors = 0
+    gate = asyncio.Semaphore(inflight)
+    transport = AsyncChatTransport(max_connections=inflight, max_keepalive_connections=inflight)
+
+    async def call(i: int) -> None:
+        nonlocal errors
+        async with gate:
+            started = time.perf_counter()
+            resp = await transport.send(url, _payload(i), stream=stream)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if not resp.ok or not resp.content:
+                errors += 1
+
+    try:
+        await asyncio.gather(*(call(i) for i in range(requests)))
+    finally:
+        await transport.aclose()
+    return latencies, errors, threading.active_count()
+
+
+async def run_aroute(url: str, requests: int, inflight: int) -> tuple[list[float], int, int]:
+    from platform.llm.providers.openrouter.openrouter_service.service import OpenRouterService
+
+    latencies: list[float] = []
+    errors = 0
+    gate = asyncio.Semaphore(inflight)
+    execution.OPENROUTER_CHAT_URL = url
+    service = OpenRouterService(api_key="benchmark")
+
+    async def call(i: int) -> None:
+        nonlocal errors
+        async with gate:
+            started = time.perf_counter()
+            result = await service.aroute(f"question {i}", compress=False)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if result.get("status") != "success" or not result.get("response"):
+                errors += 1
+
+    try:
+        await asyncio.gather(*(call(i) for i in range(requests)))
+    finally:
+        await aclose_async_transport()
+    return latencies, errors, threading.active_count()
+
+
+def measure(server: StubCompletionsServer, mode: str, requests: int, inflight: int) -> dict[str, float]:
+    server.connections.clear()
+    started = time.perf_counter()
+    if mode == "threads":
+        latencies, errors, peak_threads = run_threads(server.url, requests, inflight)
+    elif mode == "aroute":
+        latencies, errors, peak_threads = asyncio.run(run_aroute(server.url, requests, inflight))
+    else:
+        latencies, errors, peak_threads = asyncio.run(
+            run_async(server.url, requests, inflight, stream=mode == "async-stream")
+        )
+    elapsed = time.perf_counter() - started
+    return {
+        "calls_per_second": requests / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": percentile(latencies, 95),
+        "errors": errors,
+        "connections": len(server.connections),
+        "peak_threads": peak_threads,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--inflight", type=int, default=128)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--tokens", type=int, default=16)
+    parser.add_argument("--modes", nargs="+", default=["threads", "async", "async-stream", "aroute"])
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    with StubCompletionsServer(args.latency_ms, args.tokens) as server:
+        results = {mode: measure(server, mode, args.requests, args.inflight) for mode in args.modes}
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "results": results}, indent=2))
+        return 0
+    print(f"{args.requests} calls, {args.inflight} in flight, {args.latency_ms:.0f} ms server latency")
+    for mode, stats in results.items():
+        print(
+            f"  {mode:<13} {stats['calls_per_second']:>8.1f} calls/s  p50 {stats['p50_ms']:>7.1f} ms  "
+            f"p95 {stats['p95_ms']:>7.1f} ms  {stats['connections']:>5} conns  "
+            f"{stats['peak_threads']:>4} threads  {stats['errors']} errors"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""Offline end-to-end benchmark for ``ContentPipeline.process_video``.
+
+Runs the real pipeline (download → transcription → analysis → memory writes →
+Discord post) with deterministic local stand-ins for everything that would
+touch the network or a GPU:
+
+- ``LocalFakeDownloader`` writes a small media file to a temp dir;
+- ``FakeWhisperTranscriber`` returns a seeded transcript after ``--whisper-ms``;
+- ``StubOpenRouterServer`` is a local HTTP server answering
+  ``/v1/chat/completions``; the OpenRouter service reaches it through its
+  ``local_llm_url`` setting;
+- memory tools write to the in-process Qdrant stand-in (``QDRANT_URL=:memory:``)
+  with a hashed embedding;
+- ``RecordingDiscordPoster`` collects posts instead of calling a webhook.
+
+Analysis, fallacy detection, perspective synthesis and memory storage are the
+production tools. Early exit and quality filtering are disabled so every URL
+takes the full path. Per-stage timings come from a step middleware, so the
+stage names match the pipeline's own ``_execute_step`` names. ``llm_requests``
+in the report counts calls that reached the stub; it is 0 when the OpenRouter
+service cannot be imported and the tools use their offline fallbacks.
+
+The report contains per-stage p50/p95 latency, end-to-end latency, throughput
+for ``--urls`` URLs at ``--concurrency`` and peak RSS. It is compared with the
+``pipeline_e2e`` entry in ``benchmarks/baselines.yaml``. The exit code is 1
+when a URL fails or an end-to-end metric is worse than its baseline by more
+than ``tolerance_pct``.
+
+Usage:
+    python benchmarks/pipeline_e2e_benchmark.py
+    python benchmarks/pipeline_e2e_benchmark.py --urls 64 --concurrency 8 --json
+    python benchmarks/pipeline_e2e_benchmark.py --update-baseline --baseline-runs 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+BASELINE_PATH = ROOT / "benchmarks" / "baselines.yaml"
+BASELINE_KEY = "pipeline_e2e"
+DEFAULT_TOLERANCE_PCT = 25.0
+
+_WORDS = (
+    "claims evidence policy debate source study data market growth climate "
+    "energy health vaccine economy report analysis argument because therefore"
+).split()
+
+
+# --------------------------------------------------------------------------- stand-ins
+
+
+def _seeded_transcript(video_id: str, words: int) -> str:
+    rng = random.Random(video_id)
+    sentences = []
+    for _ in range(max(1, words // 12)):
+        sentences.append(" ".join(rng.choice(_WORDS) for _ in range(12)).capitalize() + ".")
+    return " ".join(sentences)
+
+
+def _hash_embedding(text: str, dims: int = 64) -> list[float]:
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    return [((digest[i % len(digest)] / 255.0) - 0.5) for i in range(dims)]
+
+
+class LocalFakeDownloader:
+    """Download stand-in writing ``size_kb`` of bytes per URL after ``latency_ms``."""
+
+    name = "LocalFakeDownloader"
+
+    def __init__(self, root: Path, latency_ms: float, size_kb: int = 256) -> None:
+        self.root = root
+        self.latency_ms = latency_ms
+        self.payload = os.urandom(size_kb * 1024)
+
+    def run(self, url: str, quality: str = "1080p", **_: Any) -> Any:
+        from ultimate_discord_intelligence_bot.step_result import StepResult
+
+        time.sleep(self.latency_ms / 1000.0)
+        video_id = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+        path = self.root / f"{video_id}.mp4"
+        path.write_bytes(self.payload)
+        return StepResult.ok(
+            platform="Local",
+            video_id=video_id,
+            title=f"Benchmark video {video_id}",
+            uploader="bench",
+            duration="60",
+            file_size=str(len(self.payload)),
+            local_path=str(path),
+            url=url,
+        )
+
+
+class FakeWhisperTranscriber:
+    """Transcription stand-in returning a transcript seeded by the file name."""
+
+    name = "FakeWhisperTranscriber"
+    model_name = "fake-whisper"
+
+    def __init__(self, latency_ms: float, words: int) -> None:
+        self.latency_ms = latency_ms
+        self.words = words
+
+    def run(self, video_path: str, *_: Any, **__: Any) -> Any:
+        from ultimate_discord_intelligence_bot.step_result import StepResult
+
+        time.sleep(self.latency_ms / 1000.0)
+        transcript = _seeded_transcript(Path(video_path).stem, self.words)
+        segments = [
+            {"start": float(i * 5), "end": float(i * 5 + 5), "text": sentence}
+            for i, sentence in enumerate(transcript.split(". "))
+        ]
+        return StepResult.ok(transcript=transcript, segments=segments)
+
+
+class RecordingDiscordPoster:
+    """Discord stand-in that keeps posted payloads in memory."""
+
+    name = "RecordingDiscordPoster"
+
+    def __init__(self) -> None:
+        self.posts: list[Any] = []
+
+    def run(self, content_data: Any, drive_links: Any = None, **_: Any) -> Any:
+        from ultimate_discord_intelligence_bot.step_result import StepResult
+
+        self.posts.append(content_data)
+        return StepResult.ok(posted=True)
+
+
+class StubOpenRouterServer:
+    """Local OpenAI-compatible chat completions endpoint with fixed latency."""
+
+    def __init__(self, latency_ms: float) -> None:
+        latency = latency_ms / 1000.0
+        counter = {"requests": 0}
+        lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802 - http.server API
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with lock:
+                    counter["requests"] += 1
+                time.sleep(latency)
+                prompt = json.dumps(payload.get("messages", []), sort_keys=True)
+                digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:8]
+                body = json.dumps(
+                    {
+                        "id": f"bench-{digest}",
+                        "model": payload.get("model", "stub"),
+                        "choices": [{"message": {"role": "assistant", "content": f"Stub synthesis {digest}."}}],
+                        "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": 4},
+                    }
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_: Any) -> None:
+                return None
+
+        self.counter = counter
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-openrouter", daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> StubOpenRouterServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+# --------------------------------------------------------------------------- measurement
+
+
+def _base_middleware() -> type:
+    from ultimate_discord_intelligence_bot.pipeline_components.middleware import BasePipelineStepMiddleware
+
+    return BasePipelineStepMiddleware
+
+
+def make_timing_middleware(samples: dict[str, list[float]]) -> Any:
+    """Step middleware appending each step's wall time (ms) to ``samples``."""
+
+    class StageTimingMiddleware(_base_middleware()):
+        async def after_step(self, context: Any) -> None:
+            samples[context.step].append((time.monotonic() - context.start_time) * 1000)
+
+        async def on_error(self, context: Any) -> None:
+            samples[f"{context.step}.error"].append((time.monotonic() - context.start_time) * 1000)
+
+    return StageTimingMiddleware()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+def peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+@dataclass
+class StageStats:
+    count: int
+    p50_ms: float
+    p95_ms: float
+
+
+@dataclass
+class PipelineReport:
+    urls: int
+    concurrency: int
+    succeeded: int
+    wall_seconds: float
+    throughput_urls_per_s: float
+    e2e_p50_ms: float
+    e2e_p95_ms: float
+    peak_rss_mb: float
+    llm_requests: int
+    discord_posts: int
+    stages: dict[str, StageStats] = field(default_factory=dict)
+
+
+def _stage_stats(samples: dict[str, list[float]]) -> dict[str, StageStats]:
+    return {
+        name: StageStats(count=len(values), p50_ms=statistics.median(values), p95_ms=percentile(values, 95))
+        for name, values in sorted(samples.items())
+        if values
+    }
+
+
+def _configure_environment(stub_url: str) -> None:
+    # Everything below must be set before the pipeline modules read settings.
+    os.environ.setdefault("QDRANT_URL", ":memory:")
+    os.environ.setdefault("OPENROUTER_API_KEY", "bench-key")
+    os.environ.setdefault("ENABLE_GRAPH_MEMORY", "0")
+    os.environ.setdefault("ENABLE_HIPPORAG_MEMORY", "0")
+    # Measure the full path: early exit and quality filtering would skip analysis, memory and Discord.
+    os.environ.setdefault("ENABLE_EARLY_EXIT", "0")
+    os.environ.setdefault("ENABLE_QUALITY_FILTERING", "0")
+    # Settings falls back to same-named environment variables for attributes
+    # it does not define, which is how the OpenRouter service finds this URL.
+    os.environ["local_llm_url"] = stub_url
+
+
+def _build_pipeline(args: argparse.Namespace, workdir: Path, samples: dict[str, list[float]]) -> tuple[Any, Any]:
+    from domains.memory.vector.memory_storage_tool import MemoryStorageTool
+    from ultimate_discord_intelligence_bot.cache import TranscriptCache
+    from ultimate_discord_intelligence_bot.pipeline_components.orchestrator import ContentPipeline
+
+    discord = RecordingDiscordPoster()
+    pipeline = ContentPipeline(
+        webhook_url=None,
+        downloader=LocalFakeDownloader(workdir, args.download_ms),
+        transcriber=FakeWhisperTranscriber(args.whisper_ms, args.transcript_words),
+        discord=discord,
+        memory=MemoryStorageTool(embedding_fn=_hash_embedding),
+        transcript_cache=TranscriptCache(enabled=False),
+        pipeline_rate_limit=1e6,
+        tool_rate_limit=1e6,
+        step_middlewares=[make_timing_middleware(samples)],
+    )
+    return pipeline, discord
+
+
+async def _drive(pipeline: Any, urls: list[str], concurrency: int) -> tuple[list[float], int]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    succeeded = 0
+
+    async def one(url: str) -> None:
+        nonlocal succeeded
+        async with semaphore:
+            started = time.perf_counter()
+            result = await pipeline.process_video(url)
+            latencies.append((time.perf_counter() - started) * 1000)
+            status = result.get("status") if isinstance(result, dict) else getattr(result, "status", None)
+            if status == "success" or getattr(result, "success", False):
+                succeeded += 1
+
+    await asyncio.gather(*(one(url) for url in urls))
+    return latencies, succeeded
+
+
+def run_benchmark(args: argparse.Namespace) -> PipelineReport:
+    samples: dict[str, list[float]] = defaultdict(list)
+    urls = [f"https://bench.local/video/{i:05d}" for i in range(args.urls)]
+    with StubOpenRouterServer(args.llm_ms) as stub, tempfile.TemporaryDirectory(prefix="pipeline-bench-") as tmp:
+        _configure_environment(stub.url)
+        pipeline, discord = _build_pipeline(args, Path(tmp), samples)
+        if args.warmup:
+            asyncio.run(_drive(pipeline, [f"https://bench.local/warmup/{i}" for i in range(args.warmup)], 1))
+            samples.clear()
+            discord.posts.clear()
+            stub.counter["requests"] = 0
+        started = time.perf_counter()
+        latencies, succeeded = asyncio.run(_drive(pipeline, urls, args.concurrency))
+        wall = time.perf_counter() - started
+        return PipelineReport(
+            urls=len(urls),
+            concurrency=args.concurrency,
+            succeeded=succeeded,
+            wall_seconds=wall,
+            throughput_urls_per_s=len(urls) / wall if wall else 0.0,
+            e2e_p50_ms=statistics.median(latencies) if latencies else 0.0,
+            e2e_p95_ms=percentile(latencies, 95),
+            peak_rss_mb=peak_rss_mb(),
+            llm_requests=stub.counter["requests"],
+            discord_posts=len(discord.posts),
+            stages=_stage_stats(samples),
+        )
+
+
+# --------------------------------------------------------------------------- baselines
+
+
+def report_metrics(report: PipelineReport) -> dict[str, float]:
+    """Flatten a report into the metric names stored in ``baselines.yaml``."""
+    metrics = {
+        "throughput_urls_per_s": report.throughput_urls_per_s,
+        "e2e_p50_ms": report.e2e_p50_ms,
+        "e2e_p95_ms": report.e2e_p95_ms,
+        "peak_rss_mb": report.peak_rss_mb,
+    }
+    for name, stats in report.stages.items():
+        metrics[f"stage.{name}.p50_ms"] = stats.p50_ms
+        metrics[f"stage.{name}.p95_ms"] = stats.p95_ms
+    return metrics
+
+
+def find_regressions(report: PipelineReport, baseline: dict[str, Any]) -> list[str]:
+    """Return human-readable regressions beyond the baseline tolerance.
+
+    Any URL that did not succeed is a regression on its own: failing runs
+    end early, which would otherwise read as lower latency and higher
+    throughput. Throughput regresses when it drops; every other metric
+    (latency, RSS) regresses when it grows. Metrics missing on either side
+    are ignored. Per-stage timings include time spent queued behind other
+    URLs on the shared event loop and vary several-fold between identical
+    runs, so they are stored for reference but not gated.
+    """
+    current = report_metrics(report)
+    tolerance = float(baseline.get("tolerance_pct", DEFAULT_TOLERANCE_PCT)) / 100.0
+    expected: dict[str, float] = baseline.get("metrics", {}) or {}
+    regressions = []
+    if report.succeeded < report.urls:
+        regressions.append(f"succeeded: {report.succeeded}/{report.urls} URLs")
+    for name, base in expected.items():
+        if name.startswith("stage.") or name not in current or not base:
+            continue
+        value = current[name]
+        higher_is_better = name.startswith("throughput")
+        limit = base * (1 - tolerance) if higher_is_better else base * (1 + tolerance)
+        if (value < limit) if higher_is_better else (value > limit):
+            change = (value - base) / base * 100
+            regressions.append(f"{name}: {value:.2f} vs baseline {base:.2f} ({change:+.1f}%)")
+    return regressions
+
+
+def worst_metrics(runs: list[dict[str, float]]) -> dict[str, float]:
+    """Per-metric worst value across runs: lowest throughput, highest everything else."""
+    names = set().union(*runs)
+    return {
+        name: (min if name.startswith("throughput") else max)(run[name] for run in runs if name in run)
+        for name in names
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return (yaml.safe_load(f) or {}).get(BASELINE_KEY, {})
+
+
+def update_baseline(current: dict[str, float], args: argparse.Namespace, path: Path = BASELINE_PATH) -> None:
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    previous = data.get(BASELINE_KEY, {})
+    data[BASELINE_KEY] = {
+        "tolerance_pct": previous.get("tolerance_pct", DEFAULT_TOLERANCE_PCT),
+        "config": {"urls": args.urls, "concurrency": args.concurrency},
+        "metrics": {name: round(value, 2) for name, value in sorted(current.items())},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f, sort_keys=False)
+
+
+# --------------------------------------------------------------------------- CLI
+
+
+def _print_report(report: PipelineReport) -> None:
+    print(f"{report.succeeded}/{report.urls} URLs at concurrency {report.concurrency} in {report.wall_seconds:.2f}s")
+    print(f"throughput {report.throughput_urls_per_s:.2f} URLs/s, peak RSS {report.peak_rss_mb:.0f} MiB")
+    print(f"end-to-end p50 {report.e2e_p50_ms:.1f} ms, p95 {report.e2e_p95_ms:.1f} ms")
+    print(f"stub LLM requests {report.llm_requests}, Discord posts {report.discord_posts}")
+    print(f"{'stage':<22} {'n':>5} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, stats in report.stages.items():
+        print(f"{name:<22} {stats.count:>5} {stats.p50_ms:>9.1f} {stats.p95_ms:>9.1f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=32, help="URLs to process")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent process_video calls")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed URLs processed first")
+    parser.add_argument("--download-ms", type=float, default=20.0)
+    parser.add_argument("--whisper-ms", type=float, default=60.0)
+    parser.add_argument("--llm-ms", type=float, default=15.0, help="Stub OpenRouter response latency")
+    parser.add_argument("--transcript-words", type=int, default=600)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--no-compare", action="store_true", help="Skip the baseline comparison")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run to baselines.yaml")
+    parser.add_argument(
+        "--baseline-runs",
+        type=int,
+        default=3,
+        help="Runs recorded by --update-baseline; each metric keeps its worst value so run-to-run noise is absorbed",
+    )
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args)
+    if args.json:
+        print(json.dumps(asdict(report), indent=2))
+    else:
+        _print_report(report)
+    if args.update_baseline:
+        reports = [report] + [run_benchmark(args) for _ in range(args.baseline_runs - 1)]
+        failed = [r for r in reports if r.succeeded < r.urls]
+        if failed:
+            worst = failed[0]
+            print(f"not updating the baseline: only {worst.succeeded}/{worst.urls} URLs succeeded", file=sys.stderr)
+            return 1
+        update_baseline(worst_metrics([report_metrics(r) for r in reports]), args)
+        print(f"baseline '{BASELINE_KEY}' updated in {BASELINE_PATH}")
+        return 0
+    if args.no_compare:
+        return 0
+    regressions = find_regressions(report, load_baseline())
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
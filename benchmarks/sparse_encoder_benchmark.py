@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Recall@k and latency of the sparse leg of EnhancedVectorStore: legacy hash encoder vs BM25.
+
+The corpus is the repository's own markdown (``docs/`` by default), split into
+paragraphs of at least ``--min-tokens`` tokens. Each query is ``--query-terms``
+words drawn from one paragraph, and that paragraph is the single relevant
+document. Both encoders index the corpus as the "text" sparse vector of an
+in-memory Qdrant collection and are queried through it:
+
+- "legacy": the previous ``hash(word) % 10000`` ids with ``log(1 + tf)`` weights;
+- "legacy-restart": legacy documents queried by a process with another
+  ``PYTHONHASHSEED``, i.e. after a restart (Python salts ``str`` hashes);
+- "bm25": ``BM25SparseEncoder`` (stable ids, BM25 weights, IDF at query time).
+
+Reported: recall@k, MRR, document encode throughput and p50/p99 query latency
+(encode + Qdrant search).
+
+Usage:
+    python benchmarks/sparse_encoder_benchmark.py
+    python benchmarks/sparse_encoder_benchmark.py --corpus docs --docs 5000 --queries 500 --k 5 10 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from domains.memory.sparse_encoder import BM25SparseEncoder, tokenize  # noqa: E402
+
+
+def legacy_vector(text: str) -> tuple[list[int], list[float]]:
+    """The previous ``_text_to_sparse_vector``; colliding words are merged, since Qdrant rejects duplicate ids."""
+    merged: Counter[int] = Counter()
+    for word, count in Counter(text.lower().split()).items():
+        merged[hash(word) % 10000] += math.log(1 + count)
+    indices = sorted(merged)
+    return indices, [merged[i] for i in indices]
+
+
+RESTART_SCRIPT = """
+import json, math, sys
+from collections import Counter
+out = []
+for text in json.load(sys.stdin):
+    merged = Counter()
+    for word, count in Counter(text.lower().split()).items():
+        merged[hash(word) % 10000] += math.log(1 + count)
+    indices = sorted(merged)
+    out.append([indices, [merged[i] for i in indices]])
+print(json.dumps(out))
+"""
+
+
+def legacy_vectors_after_restart(texts: list[str]) -> list[tuple[list[int], list[float]]]:
+    env = {**os.environ, "PYTHONHASHSEED": str(random.randrange(1, 2**31))}
+    proc = subprocess.run(
+        [sys.executable, "-c", RESTART_SCRIPT],
+        input=json.dumps(texts),
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return [(indices, values) for indices, values in json.loads(proc.stdout)]
+
+
+def load_corpus(args: argparse.Namespace) -> list[str]:
+    paragraphs: dict[str, None] = {}
+    for path in sorted(Path(args.corpus).rglob("*.md")):
+        for block in re.split(r"\n\s*\n", path.read_text(encoding="utf-8", errors="ignore")):
+            text = " ".join(block.split())
+            if len(tokenize(text)) >= args.min_tokens:
+                paragraphs[text] = None
+    corpus = list(paragraphs)
+    random.Random(args.seed).shuffle(corpus)
+    return corpus[: args.docs]
+
+
+def make_queries(corpus: list[str], args: argparse.Namespace) -> list[tuple[int, str]]:
+    rng = random.Random(args.seed + 1)
+    queries = []
+    for doc in rng.sample(range(len(corpus)), min(args.queries, len(corpus))):
+        words = list(dict.fromkeys(tokenize(corpus[doc])))
+        queries.append((doc, " ".join(rng.sample(words, min(args.query_terms, len(words))))))
+    return queries
+
+
+def index(client: Any, name: str, vectors: list[tuple[list[int], list[float]]]) -> None:
+    from qdrant_client.http import models as qmodels
+
+    client.create_collection(name, vectors_config={}, sparse_vectors_config={"text": qmodels.SparseVectorParams()})
+    points = [
+        qmodels.PointStruct(id=i, vector={"text": qmodels.SparseVector(indices=idx, values=val)})
+        for i, (idx, val) in enumerate(vectors)
+    ]
+    for offset in range(0, len(points), 500):
+        client.upsert(name, points=points[offset : offset + 500])
+
+
+def evaluate(
+    client: Any, name: str, queries: list[tuple[int, str]], encode: Any, args: argparse.Namespace
+) -> dict[str, Any]:
+    from qdrant_client.http import models as qmodels
+
+    ranks, latencies = [], []
+    depth = max(args.k)
+    for relevant, text in queries:
+        started = time.perf_counter()
+        indices, values = encode(text)
+        hits = []
+        if indices:
+            hits = client.query_points(
+                name, query=qmodels.SparseVector(indices=indices, values=values), using="text", limit=depth
+            ).points
+        latencies.append(time.perf_counter() - started)
+        ids = [hit.id for hit in hits]
+        ranks.append(ids.index(relevant) + 1 if relevant in ids else None)
+    ordered = sorted(latencies)
+    result: dict[str, Any] = {f"recall@{k}": sum(r is not None and r <= k for r in ranks) / len(ranks) for k in args.k}
+    result["mrr"] = sum(1 / r for r in ranks if r) / len(ranks)
+    result["p50_ms"] = ordered[len(ordered) // 2] * 1e3
+    result["p99_ms"] = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] * 1e3
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=str(Path(__file__).parent.parent / "docs"))
+    parser.add_argument("--docs", type=int, default=3_000)
+    parser.add_argument("--min-tokens", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--query-terms", type=int, default=4)
+    parser.add_argument("--k", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--seed", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+    try:
+        from qdrant_client import QdrantClient
+    except ImportError:
+        print("qdrant-client is required: pip install qdrant-client", file=sys.stderr)
+        return 1
+
+    corpus = load_corpus(args)
+    queries = make_queries(corpus, args)
+    client = QdrantClient(":memory:")
+    results: dict[str, Any] = {}
+
+    started = time.perf_counter()
+    legacy_docs = [legacy_vector(doc) for doc in corpus]
+    legacy_rate = len(corpus) / (time.perf_counter() - started)
+    index(client, "legacy", legacy_docs)
+    results["legacy"] = evaluate(client, "legacy", queries, legacy_vector, args)
+    results["legacy"]["encode_docs_per_s"] = legacy_rate
+    texts = [text for _, text in queries]
+    restarted = dict(zip(texts, legacy_vectors_after_restart(texts), strict=True))
+    results["legacy-restart"] = evaluate(client, "legacy", queries, restarted.__getitem__, args)
+
+    encoder = BM25SparseEncoder()
+    started = time.perf_counter()
+    bm25_docs = []
+    for offset in range(0, len(corpus), 500):
+        batch = corpus[offset : offset + 500]
+        ids = [str(i) for i in range(offset, offset + len(batch))]
+        bm25_docs.extend(encoder.encode_documents("bm25", batch, doc_ids=ids))
+    bm25_rate = len(corpus) / (time.perf_counter() - started)
+    index(client, "bm25", [(v.indices, v.values) for v in bm25_docs])
+
+    def bm25_query(text: str) -> tuple[list[int], list[float]]:
+        vector = encoder.encode_query("bm25", text)
+        return vector.indices, vector.values
+
+    results["bm25"] = evaluate(client, "bm25", queries, bm25_query, args)
+    results["bm25"]["encode_docs_per_s"] = bm25_rate
+
+    if args.json:
+        print(json.dumps({"config": vars(args), "corpus_docs": len(corpus), "results": results}, indent=2))
+        return 0
+    print(f"{len(corpus):,} paragraphs from {args.corpus}, {len(queries)} queries of {args.query_terms} terms")
+    for name, row in results.items():
+        recall = "  ".join(f"recall@{k} {row[f'recall@{k}']:.3f}" for k in args.k)
+        encode = f"  encode {row['encode_docs_per_s']:>9,.0f} docs/s" if "encode_docs_per_s" in row else ""
+        print(
+            f"  {name:<15} {recall}  MRR {row['mrr']:.3f}  "
+            f"query p50 {row['p50_ms']:.2f} ms  p99 {row['p99_ms']:.2f} ms{encode}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Allocation benchmark for StepResult serialization on the pipeline path.
+
+Runs ``ContentPipeline.process_video`` end to end with in-memory stub tools
+and a recording Langfuse service, once with the legacy
+``to_dict()``-then-walk payload preparation ("before") and once with the
+per-run ``PayloadSanitizer`` the pipeline uses ("after"), which converts each
+result once through ``to_dict_items()`` under the default trace payload
+budget. ``tracemalloc`` reports the allocations each run leaves referenced by
+the exporter and its peak memory.
+
+``--synthetic`` replays the same span/trace reporting pattern without
+importing the pipeline, which is useful on checkouts where optional pipeline
+dependencies are missing.
+
+Usage:
+    python benchmarks/step_result_allocation_benchmark.py
+    python benchmarks/step_result_allocation_benchmark.py --runs 20 --transcript-words 20000
+    python benchmarks/step_result_allocation_benchmark.py --synthetic
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from platform.observability.payload_sanitizer import PayloadSanitizer  # noqa: E402
+
+from ultimate_discord_intelligence_bot.step_result import StepResult  # noqa: E402
+
+
+@dataclass
+class AllocationStats:
+    """Allocation totals for one benchmark mode."""
+
+    mode: str
+    runs: int
+    allocations_per_run: float
+    bytes_per_run: float
+    peak_bytes: int
+
+
+def _legacy_prepare_payload(self: Any, value: Any, ctx: Any = None) -> Any:
+    """Payload preparation as it was before the sanitizer (copy, then walk)."""
+    if isinstance(value, StepResult):
+        return _legacy_prepare_payload(self, value.to_dict())
+    if isinstance(value, dict):
+        return {str(k): _legacy_prepare_payload(self, v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_legacy_prepare_payload(self, v) for v in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+class _StubTool:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    async def run(self, *args: Any, **kwargs: Any) -> StepResult:
+        return StepResult.ok(**self._payload)
+
+    def _run(self, *args: Any, **kwargs: Any) -> StepResult:
+        return StepResult.ok(**self._payload)
+
+
+class _RecordingLangfuse:
+    """Minimal Langfuse service that keeps payloads alive like a real exporter."""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.payloads: list[Any] = []
+
+    def create_trace(self, **kwargs: Any) -> StepResult:
+        return StepResult.ok(trace=object())
+
+    def create_span(self, trace: Any, name: str, input_data: Any, **kwargs: Any) -> StepResult:
+        self.payloads.append(input_data)
+        return StepResult.ok(span=object())
+
+    def update_span(self, span: Any, output: Any, error: str | None = None, **kwargs: Any) -> StepResult:
+        self.payloads.append(output)
+        return StepResult.ok()
+
+    def finalize_trace(self, trace: Any, output: Any, error: str | None = None, **kwargs: Any) -> StepResult:
+        self.payloads.append(output)
+        return StepResult.ok()
+
+
+def _transcript(words: int) -> str:
+    return " ".join(f"word{i % 97}" for i in range(words))
+
+
+def _build_pipeline(transcript_words: int) -> Any:
+    from ultimate_discord_intelligence_bot.pipeline_components.orchestrator import ContentPipeline
+
+    segments = [{"start": float(i), "end": float(i + 1), "text": f"segment {i}"} for i in range(transcript_words // 20)]
+    pipeline = ContentPipeline(
+        webhook_url="https://discord.invalid/webhook",
+        downloader=_StubTool(
+            {
+                "local_path": "/tmp/benchmark.mp4",
+                "video_id": "bench",
+                "title": "Benchmark",
+                "platform": "youtube",
+                "source_url": "https://example.com/bench",
+                "duration": 600,
+            }
+        ),
+        transcriber=_StubTool({"transcript": _transcript(transcript_words), "segments": segments}),
+        analyzer=_StubTool({"sentiment": "neutral", "keywords": [f"k{i}" for i in range(50)], "summary": "summary"}),
+        drive=_StubTool({"drive_url": "https://drive.invalid/bench", "shared": True}),
+        discord=_StubTool({"message_id": "m1"}),
+        fallacy_detector=_StubTool({"fallacies": []}),
+        perspective=_StubTool({"summary": "perspective"}),
+        memory=_StubTool({"stored": True}),
+    )
+    pipeline.langfuse_service = _RecordingLangfuse()
+    return pipeline
+
+
+def _measure(mode: str, runs: int, run_once: Any, reset: Any) -> AllocationStats:
+    """Count blocks/bytes allocated by each run and still referenced afterwards
+    (payloads held by the exporter), plus the peak traced memory of a run."""
+    run_once()  # warm imports and caches outside the measured window
+    reset()
+    allocations = size = peak = 0
+    tracemalloc.start()
+    for _ in range(runs):
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        run_once()
+        _, run_peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        diff = after.compare_to(before, "filename")
+        allocations += sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+        size += sum(stat.size_diff for stat in diff if stat.size_diff > 0)
+        peak = max(peak, run_peak - base)
+        reset()
+    tracemalloc.stop()
+    return AllocationStats(mode, runs, allocations / runs, size / runs, peak)
+
+
+def benchmark_pipeline(runs: int, transcript_words: int) -> list[AllocationStats]:
+    from ultimate_discord_intelligence_bot.pipeline_components.orchestrator import ContentPipeline
+
+    current = ContentPipeline._langfuse_prepare_payload
+    results = []
+    for mode, implementation in (("before", _legacy_prepare_payload), ("after", current)):
+        ContentPipeline._langfuse_prepare_payload = implementation  # type: ignore[method-assign]
+        try:
+            pipeline = _build_pipeline(transcript_words)
+            results.append(
+                _measure(
+                    mode,
+                    runs,
+                    lambda p=pipeline: asyncio.run(p.process_video("https://example.com/bench")),
+                    pipeline.langfuse_service.payloads.clear,
+                )
+            )
+        finally:
+            ContentPipeline._langfuse_prepare_payload = current  # type: ignore[method-assign]
+    return results
+
+
+def benchmark_synthetic(runs: int, transcript_words: int) -> list[AllocationStats]:
+    """Replay the pipeline's span reporting: each stage result is reported by
+    its own span and again in the final trace payload."""
+    transcript = _transcript(transcript_words)
+    segments = [{"start": float(i), "end": float(i + 1), "text": f"segment {i}"} for i in range(transcript_words // 20)]
+    stages = {
+        "download": StepResult.ok(local_path="/tmp/benchmark.mp4", video_id="bench", title="Benchmark"),
+        "transcription": StepResult.ok(transcript=transcript, segments=segments),
+        "analysis": StepResult.ok(sentiment="neutral", keywords=[f"k{i}" for i in range(50)], summary="summary"),
+        "fallacy": StepResult.ok(fallacies=[]),
+        "perspective": StepResult.ok(summary="perspective"),
+        "memory": StepResult.ok(stored=True),
+    }
+    sink = _RecordingLangfuse()
+
+    def legacy() -> None:
+        for name, result in stages.items():
+            sink.update_span(None, _legacy_prepare_payload(None, {name: result}))
+        sink.finalize_trace(None, _legacy_prepare_payload(None, dict(stages)))
+
+    def sanitizer() -> None:
+        prepared = PayloadSanitizer()
+        for name, result in stages.items():
+            sink.update_span(None, prepared.prepare({name: result}))
+        sink.finalize_trace(None, prepared.prepare(dict(stages)))
+
+    return [
+        _measure("before", runs, legacy, sink.payloads.clear),
+        _measure("after", runs, sanitizer, sink.payloads.clear),
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--transcript-words", type=int, default=5000)
+    parser.add_argument("--synthetic", action="store_true", help="Skip the pipeline and replay span reporting only")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    bench = benchmark_synthetic if args.synthetic else benchmark_pipeline
+    results = bench(args.runs, args.transcript_words)
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+        return 0
+    print(f"{'mode':<8} {'allocs/run':>12} {'bytes/run':>12} {'peak bytes':>12}")
+    for r in results:
+        print(f"{r.mode:<8} {r.allocations_per_run:>12.0f} {r.bytes_per_run:>12.0f} {r.peak_bytes:>12}")
+    before, after = results
+    if before.allocations_per_run:
+        saved = 1 - after.allocations_per_run / before.allocations_per_run
+        print(f"allocation reduction: {saved:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
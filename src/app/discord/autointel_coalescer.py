@@ -0,0 +1,383 @@
+"""In-flight coalescing and result caching for /autointel runs.
+
+When several users in a guild analyse the same URL, each request used to start
+its own download, transcription and analysis pipeline. Requests are now keyed
+on ``(tenant, canonical URL, depth)``:
+
+- the first request (the *leader*) runs the pipeline;
+- requests arriving while it runs *join* it and receive the same result;
+- successful results are cached for ``AUTOINTEL_CACHE_TTL_SECONDS`` so later
+  repeats are answered immediately.
+
+The pipeline reports to Discord through the interaction instead of returning
+a value, so the leader's interaction is wrapped in a :class:`RecordingInteraction`.
+Every message is forwarded to the leader, but only those sent inside
+:func:`final_result` are recorded: progress updates, acknowledgements and
+error reports are not part of the shared result. The recorded messages are
+replayed to joiners and cache hits; file attachments are kept as bytes and
+rebuilt for every send, since a ``discord.File`` stream can only be sent once.
+A run is cached only if the pipeline returns ``True`` (it delivered the final
+result) and recorded at least one non-ephemeral message; pipelines must return
+``False`` whenever they report an error, whether or not the error message is
+ephemeral. Runs handed to the background worker only acknowledge the request
+and post the result to the requester's channel later, so callers must not
+route them through the coalescer at all.
+
+Outcomes are exported as ``autointel_coalesce_requests_total{outcome}`` and
+``autointel_pipeline_runs_saved_total``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import io
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+logger = logging.getLogger(__name__)
+
+_TRACKING_PARAMS = frozenset({"dclid", "fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "msclkid", "twclid", "yclid"})
+_YOUTUBE_HOSTS = frozenset({"youtube.com", "m.youtube.com", "music.youtube.com", "youtu.be"})
+# Share-sheet parameters that only mean "tracking" on these platforms; elsewhere ``s`` or ``ref`` can select content.
+_SOCIAL_HOSTS = _YOUTUBE_HOSTS | frozenset(
+    {"twitter.com", "mobile.twitter.com", "x.com", "mobile.x.com", "instagram.com", "m.instagram.com"}
+)
+_SOCIAL_TRACKING_PARAMS = frozenset({"feature", "ref", "ref_src", "ref_url", "s", "si", "t_source"})
+
+
+def _is_tracking_param(host: str, key: str) -> bool:
+    if key.startswith("utm_") or key in _TRACKING_PARAMS:
+        return True
+    return host in _SOCIAL_HOSTS and key in _SOCIAL_TRACKING_PARAMS
+
+
+def canonical_url(url: str) -> str:
+    """Normalise ``url`` so equivalent links share one key.
+
+    Lower-cases scheme and host, drops ``www.``, fragments, default ports,
+    trailing slashes and tracking parameters (share-sheet ones such as ``si``
+    only for YouTube, Twitter/X and Instagram), sorts the remaining query and
+    rewrites YouTube short/mobile/shorts links to ``youtube.com/watch?v=ID``.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    path = parts.path.rstrip("/") or ""
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_param(host, k)]
+    if host in _YOUTUBE_HOSTS:
+        video_id = None
+        if host == "youtu.be":
+            video_id = path.lstrip("/")
+        elif path.startswith(("/shorts/", "/live/", "/embed/")):
+            video_id = path.split("/")[2]
+        elif path == "/watch":
+            video_id = dict(query).get("v")
+        if video_id:
+            return f"https://youtube.com/watch?v={video_id}"
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    return urlunsplit(((parts.scheme or "https").lower(), host, path, urlencode(sorted(query)), ""))
+
+
+@dataclass(frozen=True)
+class AutointelKey:
+    """Identity of an autointel run: who asked, for what, and how deep."""
+
+    tenant: str
+    url: str
+    depth: str
+
+    @classmethod
+    def build(cls, tenant: str, url: str, depth: str) -> AutointelKey:
+        return cls(tenant=tenant, url=canonical_url(url), depth=depth)
+
+
+@dataclass(frozen=True)
+class _Attachment:
+    """Bytes and options of a ``discord.File``, rebuilt into a fresh file per send."""
+
+    factory: Callable[..., Any]
+    data: bytes
+    filename: str | None
+    description: str | None
+    spoiler: bool
+
+    @classmethod
+    def capture(cls, file: Any) -> _Attachment:
+        fp = file.fp
+        with contextlib.suppress(Exception):
+            fp.seek(0)
+        data = fp.read()
+        with contextlib.suppress(Exception):
+            file.close()
+        return cls(
+            factory=type(file),
+            data=data if isinstance(data, bytes) else str(data).encode(),
+            filename=getattr(file, "filename", None),
+            description=getattr(file, "description", None),
+            spoiler=bool(getattr(file, "spoiler", False)),
+        )
+
+    def build(self) -> Any:
+        return self.factory(
+            io.BytesIO(self.data), filename=self.filename, spoiler=self.spoiler, description=self.description
+        )
+
+
+def _is_file(value: Any) -> bool:
+    return hasattr(value, "fp") and hasattr(value, "filename")
+
+
+def _capture(kwargs: dict[str, Any]) -> dict[str, Any]:
+    captured = dict(kwargs)
+    if _is_file(captured.get("file")):
+        captured["file"] = _Attachment.capture(captured["file"])
+    if captured.get("files"):
+        captured["files"] = [_Attachment.capture(f) if _is_file(f) else f for f in captured["files"]]
+    return captured
+
+
+def _materialize(kwargs: dict[str, Any]) -> dict[str, Any]:
+    built = dict(kwargs)
+    if isinstance(built.get("file"), _Attachment):
+        built["file"] = built["file"].build()
+    if built.get("files"):
+        built["files"] = [f.build() if isinstance(f, _Attachment) else f for f in built["files"]]
+    return built
+
+
+@dataclass
+class RecordedRun:
+    """Messages one pipeline run sent to its requester.
+
+    Only messages sent while ``capturing`` (inside :func:`final_result`) are
+    kept. ``completed`` is set when the pipeline reports that it delivered its
+    final result rather than an acknowledgement or an error.
+    """
+
+    messages: list[tuple[tuple[Any, ...], dict[str, Any]]] = field(default_factory=list)
+    completed: bool = False
+    capturing: bool = False
+
+    @property
+    def cacheable(self) -> bool:
+        return (
+            self.completed
+            and bool(self.messages)
+            and not any(kwargs.get("ephemeral") for _, kwargs in self.messages)
+        )
+
+    def record(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Store one message and return kwargs with fresh attachments for the live send."""
+        captured = _capture(kwargs)
+        self.messages.append((args, captured))
+        return _materialize(captured)
+
+    async def replay(self, interaction: Any) -> None:
+        for args, kwargs in self.messages:
+            try:
+                await interaction.followup.send(*args, **_materialize(kwargs))
+            except Exception:
+                logger.warning("Failed to replay a shared autointel message", exc_info=True)
+
+
+class _RecordingSender:
+    def __init__(self, target: Any, run: RecordedRun) -> None:
+        self._target = target
+        self._run = run
+
+    async def send(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._target.send(*args, **self._forward(args, kwargs))
+
+    async def send_message(self, *args: Any, **kwargs: Any) -> Any:
+        return await self._target.send_message(*args, **self._forward(args, kwargs))
+
+    def _forward(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        return self._run.record(args, kwargs) if self._run.capturing else kwargs
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
+
+
+class RecordingInteraction:
+    """Proxy for an interaction that forwards ``followup.send`` and
+    ``response.send_message`` calls unchanged, recording those sent inside
+    :meth:`final_result`."""
+
+    def __init__(self, interaction: Any, run: RecordedRun) -> None:
+        self._interaction = interaction
+        self._run = run
+        self.followup = _RecordingSender(interaction.followup, run)
+        self.response = _RecordingSender(interaction.response, run)
+
+    @contextlib.contextmanager
+    def final_result(self) -> Iterator[None]:
+        previous, self._run.capturing = self._run.capturing, True
+        try:
+            yield
+        finally:
+            self._run.capturing = previous
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._interaction, name)
+
+
+def final_result(interaction: Any) -> contextlib.AbstractContextManager[None]:
+    """Mark the messages sent in this block as the shareable result of a run.
+
+    A no-op for plain interactions, so pipelines can use it unconditionally.
+    """
+    if isinstance(interaction, RecordingInteraction):
+        return interaction.final_result()
+    return contextlib.nullcontext()
+
+
+def _record_outcome(outcome: str) -> None:
+    try:
+        from platform.observability import metrics
+
+        metrics.AUTOINTEL_COALESCE_REQUESTS.labels(outcome=outcome).inc()
+        if outcome != "leader":
+            metrics.AUTOINTEL_RUNS_SAVED.inc()
+    except Exception:
+        logger.debug("autointel coalescing metric emit failed", exc_info=True)
+
+
+class AutointelCoalescer:
+    """Single-flight execution plus a TTL-bounded LRU cache of recorded runs."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 900.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._inflight: dict[AutointelKey, asyncio.Task[RecordedRun]] = {}
+        self._cache: OrderedDict[AutointelKey, tuple[float, RecordedRun]] = OrderedDict()
+        self.counts = {"leader": 0, "joined": 0, "cached": 0}
+
+    async def run(
+        self,
+        key: AutointelKey,
+        interaction: Any,
+        pipeline: Callable[[Any], Awaitable[bool]],
+    ) -> str:
+        """Answer ``interaction`` for ``key``; return ``leader``, ``joined`` or ``cached``.
+
+        ``pipeline`` receives the (recording) interaction to report through
+        and returns ``True`` when what it sent is the final result, the only
+        case that is cached. The shared run is a separate task, so a cancelled
+        requester does not cancel it for the others.
+        """
+        cached = self._cached(key)
+        if cached is not None:
+            self._count("cached")
+            await self._notify(interaction, "♻️ Returning a recent analysis of this URL.")
+            await cached.replay(interaction)
+            return "cached"
+        task = self._inflight.get(key)
+        if task is not None:
+            self._count("joined")
+            await self._notify(interaction, "♻️ This URL is already being analysed; you'll get the same result.")
+            recorded = await asyncio.shield(task)
+            await recorded.replay(interaction)
+            return "joined"
+        self._count("leader")
+        recorded = RecordedRun()
+        task = asyncio.ensure_future(self._lead(key, RecordingInteraction(interaction, recorded), recorded, pipeline))
+        self._inflight[key] = task
+        await asyncio.shield(task)
+        return "leader"
+
+    def stats(self) -> dict[str, Any]:
+        total = sum(self.counts.values())
+        saved = self.counts["joined"] + self.counts["cached"]
+        return {
+            **self.counts,
+            "runs_saved": saved,
+            "hit_rate": saved / total if total else 0.0,
+            "inflight": len(self._inflight),
+            "cached_entries": len(self._cache),
+        }
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    async def _lead(
+        self,
+        key: AutointelKey,
+        interaction: RecordingInteraction,
+        recorded: RecordedRun,
+        pipeline: Callable[[Any], Awaitable[bool]],
+    ) -> RecordedRun:
+        try:
+            recorded.completed = bool(await pipeline(interaction))
+        finally:
+            self._inflight.pop(key, None)
+        if recorded.cacheable and self.ttl_seconds > 0:
+            self._cache[key] = (self._clock() + self.ttl_seconds, recorded)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return recorded
+
+    def _cached(self, key: AutointelKey) -> RecordedRun | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, recorded = entry
+        if expires_at <= self._clock():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return recorded
+
+    def _count(self, outcome: str) -> None:
+        self.counts[outcome] += 1
+        _record_outcome(outcome)
+
+    @staticmethod
+    async def _notify(interaction: Any, text: str) -> None:
+        with contextlib.suppress(Exception):
+            response = getattr(interaction, "response", None)
+            is_done = getattr(response, "is_done", None)
+            if callable(is_done) and not is_done():
+                await response.defer()
+            await interaction.followup.send(text)
+
+
+_coalescer: AutointelCoalescer | None = None
+
+
+def get_autointel_coalescer() -> AutointelCoalescer:
+    """Process-wide coalescer configured from ``AUTOINTEL_CACHE_*`` env vars."""
+    global _coalescer
+    if _coalescer is None:
+        try:
+            ttl = float(os.getenv("AUTOINTEL_CACHE_TTL_SECONDS", "900"))
+            size = int(os.getenv("AUTOINTEL_CACHE_MAX_ENTRIES", "256"))
+        except ValueError:
+            ttl, size = 900.0, 256
+        _coalescer = AutointelCoalescer(ttl_seconds=ttl, max_entries=size)
+    return _coalescer
+
+
+__all__ = [
+    "AutointelCoalescer",
+    "AutointelKey",
+    "RecordedRun",
+    "RecordingInteraction",
+    "canonical_url",
+    "final_result",
+    "get_autointel_coalescer",
+]
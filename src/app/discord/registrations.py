@@ -16,6 +16,7 @@ except ImportError:
 
 import contextlib
 
+from .autointel_coalescer import AutointelKey, final_result, get_autointel_coalescer
 from .discord_env import LIGHTWEIGHT_IMPORT, app_commands, commands, discord
 
 
@@ -293,76 +294,66 @@ async def _execute_autointel(interaction: Any, url: str, depth: str = "standard"
             return "standard"
 
         depth = _normalize_depth(depth)
-        background_worker = getattr(interaction.client, "background_worker", None)
-        orchestrator = getattr(interaction.client, "orchestrator", None)
-        if background_worker and orchestrator:
-            print("🚀 Using background worker for unlimited analysis time")
-            try:
-                from ..background_autointel_handler import handle_autointel_background
-
-                await handle_autointel_background(
-                    interaction=interaction,
-                    orchestrator=orchestrator,
-                    background_worker=background_worker,
-                    url=url,
-                    depth=depth,
-                )
-                return
-            except Exception as bg_error:
-                print(f"⚠️ Background worker failed, falling back to Mission API sync path: {bg_error}")
-        try:
-            from ..mission_api import run_mission
-
-            default_quality = os.getenv("DEFAULT_DOWNLOAD_QUALITY", "1080p")
-            inputs = {"url": url, "quality": default_quality, "origin": "discord", "depth": depth}
-            tenant_ctx = None
-            try:
-                from ..tenancy import TenantContext
-
-                guild_id = getattr(interaction, "guild_id", None)
-                channel = getattr(interaction, "channel", None)
-                workspace_name = getattr(channel, "name", "direct_message") if channel else "direct_message"
-                tenant_ctx = TenantContext(tenant_id=f"guild_{guild_id or 'dm'}", workspace_id=workspace_name)
-                print(f"✅ Created tenant context: {tenant_ctx}")
-            except Exception as tenancy_error:
-                print(f"⚠️ Tenancy not available; proceeding without: {tenancy_error}")
-                tenant_ctx = None
-            result = await run_mission(inputs, tenant_ctx)
-            if result.success:
-                data = result.data or {}
-                summary = str(
-                    data.get("briefing") or data.get("summary") or data.get("analysis") or "✅ Mission completed."
-                )
-                chunks = [summary[i : i + 1900] for i in range(0, len(summary), 1900)] or [summary]
-                for chunk in chunks:
-                    with contextlib.suppress(Exception):
-                        await interaction.followup.send(chunk)
-            else:
-                err = result.error or "Unknown error"
-                with contextlib.suppress(Exception):
-                    await interaction.followup.send(f"❌ Mission failed: {err[:1000]}", ephemeral=True)
+        if all(_background_runner(interaction)):
+            # Queued runs only acknowledge here and post to this requester's channel later: never share them.
+            await _run_autointel(interaction, url, depth)
             return
-        except Exception as e:
-            print(f"⚠️ Mission API path unavailable: {e}; attempting legacy orchestrator path…")
-        print("🔄 Attempting to import autonomous orchestrator...")
-        orchestrator = None
-        orchestrator_type = "unknown"
-        last_error = None
-        try:
-            from ultimate_discord_intelligence_bot.autonomous_orchestrator import AutonomousIntelligenceOrchestrator
+        key = AutointelKey.build(_autointel_tenant(interaction), url, depth)
+        await get_autointel_coalescer().run(key, interaction, lambda shared: _run_autointel(shared, url, depth))
+    except Exception as e:
+        print(f"❌ Critical command failure: {e}")
+        import traceback
 
-            orchestrator = AutonomousIntelligenceOrchestrator()
-            orchestrator_type = "direct"
-            print("✅ Using AutonomousIntelligenceOrchestrator")
-        except Exception as e:
-            print(f"⚠️ Failed to load orchestrator: {e}")
-            last_error = e
+        traceback.print_exc()
+        with contextlib.suppress(Exception):
+            await interaction.followup.send(
+                f"❌ Critical system error: {e!s}\nThe /autointel command encountered an unexpected error. Please try again or contact support.",
+                ephemeral=True,
+            )
 
-        if orchestrator is None:
-            error_msg = f"❌ Orchestrator loading failed.\nError: {last_error}\n\nThis usually indicates:\n• Missing dependencies\n• Configuration issues\n• Import path problems\n\nPlease run 'python -m ultimate_discord_intelligence_bot.setup_cli doctor' to diagnose."
-            with contextlib.suppress(Exception):
-                await interaction.followup.send(error_msg, ephemeral=True)
-            return
+
+def _autointel_tenant(interaction: Any) -> str:
+    """Coalescing scope: the guild, or the channel for DMs so users never share results."""
+    guild_id = getattr(interaction, "guild_id", None)
+    if guild_id:
+        return f"guild_{guild_id}"
+    return f"dm_{getattr(getattr(interaction, 'channel', None), 'id', 'unknown')}"
+
+
+def _background_runner(interaction: Any) -> tuple[Any, Any]:
+    """The client's ``(background_worker, orchestrator)``; both set means runs are queued."""
+    client = getattr(interaction, "client", None)
+    return getattr(client, "background_worker", None), getattr(client, "orchestrator", None)
+
+
+async def _run_autointel(interaction: Any, url: str, depth: str) -> bool:
+    """Run the autointel pipeline for a validated URL, reporting through ``interaction``.
+
+    Returns ``True`` only when the final analysis was delivered, i.e. not for a
+    background-queue acknowledgement or an error report. The analysis itself is
+    sent inside :func:`final_result` so coalesced runs share nothing else.
+    """
+    background_worker, orchestrator = _background_runner(interaction)
+    if background_worker and orchestrator:
+        print("🚀 Using background worker for unlimited analysis time")
+        try:
+            from ..background_autointel_handler import handle_autointel_background
+
+            await handle_autointel_background(
+                interaction=interaction,
+                orchestrator=orchestrator,
+                background_worker=background_worker,
+                url=url,
+                depth=depth,
+            )
+            return False
+        except Exception as bg_error:
+            print(f"⚠️ Background worker failed, falling back to Mission API sync path: {bg_error}")
+    try:
+        from ..mission_api import run_mission
+
+        default_quality = os.getenv("DEFAULT_DOWNLOAD_QUALITY", "1080p")
+        inputs = {"url": url, "quality": default_quality, "origin": "discord", "depth": depth}
         tenant_ctx = None
         try:
             from ..tenancy import TenantContext
@@ -372,85 +363,128 @@ async def _execute_autointel(interaction: Any, url: str, depth: str = "standard"
             workspace_name = getattr(channel, "name", "direct_message") if channel else "direct_message"
             tenant_ctx = TenantContext(tenant_id=f"guild_{guild_id or 'dm'}", workspace_id=workspace_name)
             print(f"✅ Created tenant context: {tenant_ctx}")
-        except ImportError as tenancy_error:
-            print(f"⚠️ Tenancy system not available: {tenancy_error}. Proceeding without tenant context.")
-            TenantContext = None
-        except Exception as tenant_error:
-            print(f"❌ Tenant context creation failed: {tenant_error}")
-            with contextlib.suppress(Exception):
-                await interaction.followup.send(
-                    f"⚠️ Tenant context setup failed: {tenant_error}\nProceeding with basic execution.", ephemeral=True
-                )
+        except Exception as tenancy_error:
+            print(f"⚠️ Tenancy not available; proceeding without: {tenancy_error}")
             tenant_ctx = None
-        if orchestrator_type in ("fallback", "enhanced", "direct", "crew"):
-            print(f"🚀 Running {orchestrator_type} orchestrator...")
-            try:
-                import time
-
-                start_time = time.time()
-                await orchestrator.execute_autonomous_intelligence_workflow(interaction, url, depth, tenant_ctx)
-                execution_time = time.time() - start_time
-                print(f"✅ Orchestrator completed successfully in {execution_time:.2f}s")
-            except Exception as orchestrator_error:
-                execution_time = time.time() - start_time
-                error_context = {
-                    "orchestrator_type": orchestrator_type,
-                    "url": url,
-                    "depth": depth,
-                    "execution_time": execution_time,
-                    "error": str(orchestrator_error),
-                    "error_type": type(orchestrator_error).__name__,
-                }
-                print(f"❌ Orchestrator failed after {execution_time:.2f}s: {orchestrator_error}")
-                print(f"📊 Error context: {error_context}")
-                try:
-                    error_msg = f"❌ Orchestrator execution failed:\n**Type:** {orchestrator_type}\n**URL:** {url}\n**Depth:** {depth}\n**Error:** {str(orchestrator_error)[:500]}...\n**Duration:** {execution_time:.2f}s\n\nThis error has been logged for debugging."
-                    await interaction.followup.send(error_msg, ephemeral=True)
-                except Exception:
-                    pass
-                raise
-            return
-        try:
-            from ..tenancy import with_tenant
+        result = await run_mission(inputs, tenant_ctx)
+        if result.success:
+            data = result.data or {}
+            summary = str(
+                data.get("briefing") or data.get("summary") or data.get("analysis") or "✅ Mission completed."
+            )
+            chunks = [summary[i : i + 1900] for i in range(0, len(summary), 1900)] or [summary]
+            with final_result(interaction):
+                for chunk in chunks:
+                    with contextlib.suppress(Exception):
+                        await interaction.followup.send(chunk)
+            return True
+        err = result.error or "Unknown error"
+        with contextlib.suppress(Exception):
+            await interaction.followup.send(f"❌ Mission failed: {err[:1000]}", ephemeral=True)
+        return False
+    except Exception as e:
+        print(f"⚠️ Mission API path unavailable: {e}; attempting legacy orchestrator path…")
+    print("🔄 Attempting to import autonomous orchestrator...")
+    orchestrator = None
+    orchestrator_type = "unknown"
+    last_error = None
+    try:
+        from ultimate_discord_intelligence_bot.autonomous_orchestrator import AutonomousIntelligenceOrchestrator
 
-            print("✅ Successfully imported tenancy modules for 'with' statement")
-        except ImportError as tenancy_error:
-            print(f"❌ Import error for tenancy context manager: {tenancy_error}")
-            with contextlib.suppress(Exception):
-                await interaction.followup.send(
-                    f"⚠️ Tenancy system import failed: {tenancy_error}\nRunning without tenant isolation.",
-                    ephemeral=True,
-                )
-            with_tenant = None
-        print("🚀 Executing autonomous intelligence workflow...")
+        orchestrator = AutonomousIntelligenceOrchestrator()
+        orchestrator_type = "direct"
+        print("✅ Using AutonomousIntelligenceOrchestrator")
+    except Exception as e:
+        print(f"⚠️ Failed to load orchestrator: {e}")
+        last_error = e
+
+    if orchestrator is None:
+        error_msg = f"❌ Orchestrator loading failed.\nError: {last_error}\n\nThis usually indicates:\n• Missing dependencies\n• Configuration issues\n• Import path problems\n\nPlease run 'python -m ultimate_discord_intelligence_bot.setup_cli doctor' to diagnose."
+        with contextlib.suppress(Exception):
+            await interaction.followup.send(error_msg, ephemeral=True)
+        return False
+    tenant_ctx = None
+    try:
+        from ..tenancy import TenantContext
+
+        guild_id = getattr(interaction, "guild_id", None)
+        channel = getattr(interaction, "channel", None)
+        workspace_name = getattr(channel, "name", "direct_message") if channel else "direct_message"
+        tenant_ctx = TenantContext(tenant_id=f"guild_{guild_id or 'dm'}", workspace_id=workspace_name)
+        print(f"✅ Created tenant context: {tenant_ctx}")
+    except ImportError as tenancy_error:
+        print(f"⚠️ Tenancy system not available: {tenancy_error}. Proceeding without tenant context.")
+        TenantContext = None
+    except Exception as tenant_error:
+        print(f"❌ Tenant context creation failed: {tenant_error}")
+        with contextlib.suppress(Exception):
+            await interaction.followup.send(
+                f"⚠️ Tenant context setup failed: {tenant_error}\nProceeding with basic execution.", ephemeral=True
+            )
+        tenant_ctx = None
+    if orchestrator_type in ("fallback", "enhanced", "direct", "crew"):
+        print(f"🚀 Running {orchestrator_type} orchestrator...")
         try:
-            if tenant_ctx and orchestrator_type == "full" and (with_tenant is not None):
-                with with_tenant(tenant_ctx):
-                    print("✅ Orchestrator executing with full tenant context")
-                    await orchestrator.execute_autonomous_intelligence_workflow(interaction, url, depth, tenant_ctx)
-            else:
-                print(f"✅ Orchestrator executing in {orchestrator_type} mode without tenant context")
-                await orchestrator.execute_autonomous_intelligence_workflow(interaction, url, depth, None)
+            import time
+
+            start_time = time.time()
+            delivered = await orchestrator.execute_autonomous_intelligence_workflow(interaction, url, depth, tenant_ctx)
+            execution_time = time.time() - start_time
+            print(f"✅ Orchestrator finished in {execution_time:.2f}s (delivered={bool(delivered)})")
+            return bool(delivered)
         except Exception as orchestrator_error:
-            print(f"❌ Orchestrator execution failed: {orchestrator_error}")
-            import traceback
+            execution_time = time.time() - start_time
+            error_context = {
+                "orchestrator_type": orchestrator_type,
+                "url": url,
+                "depth": depth,
+                "execution_time": execution_time,
+                "error": str(orchestrator_error),
+                "error_type": type(orchestrator_error).__name__,
+            }
+            print(f"❌ Orchestrator failed after {execution_time:.2f}s: {orchestrator_error}")
+            print(f"📊 Error context: {error_context}")
+            try:
+                error_msg = f"❌ Orchestrator execution failed:\n**Type:** {orchestrator_type}\n**URL:** {url}\n**Depth:** {depth}\n**Error:** {str(orchestrator_error)[:500]}...\n**Duration:** {execution_time:.2f}s\n\nThis error has been logged for debugging."
+                await interaction.followup.send(error_msg, ephemeral=True)
+            except Exception:
+                pass
+            raise
+    try:
+        from ..tenancy import with_tenant
 
-            traceback.print_exc()
-            with contextlib.suppress(Exception):
-                await interaction.followup.send(
-                    f"❌ Autonomous intelligence workflow failed: {orchestrator_error!s}\n\n**Error Details:**\n- URL: {url}\n- Analysis Depth: {depth}\n- Error Type: {type(orchestrator_error).__name__}\n\nThe system encountered an error during autonomous processing. This may be due to:\n• Missing CrewAI dependencies\n• Network connectivity issues\n• Content access restrictions\n• System resource limitations\n\nPlease try again or contact support if the issue persists.",
-                    ephemeral=True,
+        print("✅ Successfully imported tenancy modules for 'with' statement")
+    except ImportError as tenancy_error:
+        print(f"❌ Import error for tenancy context manager: {tenancy_error}")
+        with contextlib.suppress(Exception):
+            await interaction.followup.send(
+                f"⚠️ Tenancy system import failed: {tenancy_error}\nRunning without tenant isolation.",
+                ephemeral=True,
+            )
+        with_tenant = None
+    print("🚀 Executing autonomous intelligence workflow...")
+    try:
+        if tenant_ctx and orchestrator_type == "full" and (with_tenant is not None):
+            with with_tenant(tenant_ctx):
+                print("✅ Orchestrator executing with full tenant context")
+                delivered = await orchestrator.execute_autonomous_intelligence_workflow(
+                    interaction, url, depth, tenant_ctx
                 )
-    except Exception as e:
-        print(f"❌ Critical command failure: {e}")
+        else:
+            print(f"✅ Orchestrator executing in {orchestrator_type} mode without tenant context")
+            delivered = await orchestrator.execute_autonomous_intelligence_workflow(interaction, url, depth, None)
+        return bool(delivered)
+    except Exception as orchestrator_error:
+        print(f"❌ Orchestrator execution failed: {orchestrator_error}")
         import traceback
 
         traceback.print_exc()
         with contextlib.suppress(Exception):
             await interaction.followup.send(
-                f"❌ Critical system error: {e!s}\nThe /autointel command encountered an unexpected error. Please try again or contact support.",
+                f"❌ Autonomous intelligence workflow failed: {orchestrator_error!s}\n\n**Error Details:**\n- URL: {url}\n- Analysis Depth: {depth}\n- Error Type: {type(orchestrator_error).__name__}\n\nThe system encountered an error during autonomous processing. This may be due to:\n• Missing CrewAI dependencies\n• Network connectivity issues\n• Content access restrictions\n• System resource limitations\n\nPlease try again or contact support if the issue persists.",
                 ephemeral=True,
             )
+        return False
 
 
 def _register_slash_commands(bot: Any) -> None:
@@ -65,6 +65,13 @@ async def main():
     print("DEBUG: About to enable autonomous defaults...", flush=True)
     enable_autonomous_defaults()
     print("DEBUG: Autonomous defaults enabled", flush=True)
+    try:
+        from ultimate_discord_intelligence_bot.services.maintenance import start_compaction_scheduler
+
+        if await start_compaction_scheduler() is not None:
+            print("🧹 Memory compaction scheduler started")
+    except Exception as e:
+        print(f"⚠️ Memory compaction scheduler not available: {e}")
 
     async def _run_headless_agent(user_on: bool, admin_on: bool) -> None:
         print(
@@ -90,11 +90,33 @@ def _normalize_published_at(value: Any) -> str:
         return ""
 
 
+def _index_knowledge_graph(job: IngestJob, episode_id: str, texts: list[str], published_at: str) -> None:
+    """Record the episode's entity mentions in the tenant's KG store (read by the MCP KG server)."""
+    from kg.pooled_store import tenant_store
+    from kg.writer import index_episode
+
+    try:
+        published = datetime.fromisoformat(published_at)
+        ts = (published if published.tzinfo else published.replace(tzinfo=UTC)).timestamp()
+    except ValueError:
+        ts = time.time()
+    index_episode(
+        tenant_store(job.tenant),
+        job.tenant,
+        episode_id,
+        texts,
+        created_at=str(ts),
+        attrs={"source_url": job.url, "source": job.source},
+    )
+
+
 def run(job: IngestJob, store: vector_store.VectorStore) -> dict:
     """Run an ingest job and upsert transcript chunks into *store*.
 
     If `ENABLE_INGEST_CONCURRENT` is set, metadata & transcript retrieval
-    execute concurrently (threaded) for supported sources.
+    execute concurrently (threaded) for supported sources. With
+    `ENABLE_KG_INGEST` on, entities mentioned in the transcript are also
+    linked to the episode in the tenant's knowledge graph.
     """
     provider_mod, creator_attr = _get_provider(job.source)
     strict = os.getenv("ENABLE_INGEST_STRICT", "").lower() in {"1", "true", "yes", "on"}
@@ -183,6 +205,7 @@ def run(job: IngestJob, store: vector_store.VectorStore) -> dict:
             if is_missing_id:
                 missing.append("episode_id")
             raise ValueError(f"ingest strict mode violation: missing {', '.join(missing)}")
+        published_at = _normalize_published_at(getattr(meta, "published_at", None))
         records = [
             vector_store.VectorRecord(
                 vector=v,
@@ -193,7 +216,7 @@ def run(job: IngestJob, store: vector_store.VectorStore) -> dict:
                     "text": c.text,
                     "tags": job.tags,
                     "episode_id": episode_id,
-                    "published_at": _normalize_published_at(getattr(meta, "published_at", None)),
+                    "published_at": published_at,
                 },
             )
             for v, c in zip(vectors, chunks, strict=False)
@@ -203,6 +226,11 @@ def run(job: IngestJob, store: vector_store.VectorStore) -> dict:
             lambda: metrics.PIPELINE_STEPS_COMPLETED.labels(**metrics.label_ctx(), step="upsert").inc(),
             error_message="Failed to record upsert completion metric",
         )
+        if os.getenv("ENABLE_KG_INGEST", "0").lower() in {"1", "true", "yes", "on"}:
+            handle_error_safely(
+                lambda: _index_knowledge_graph(job, episode_id, texts, published_at),
+                error_message=f"Failed to index episode {episode_id} in the knowledge graph",
+            )
         db_path = os.getenv("INGEST_DB_PATH")
         if db_path:
             conn = models.connect(db_path)
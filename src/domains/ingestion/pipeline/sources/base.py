@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from typing import Protocol
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass
 class Watch:
     """Configuration for a watched source."""
@@ -36,3 +40,31 @@ class SourceConnector(Protocol):
     """
 
     def discover(self, watch: Watch, state: dict[str, object]) -> list[DiscoveryItem]: ...
+
+
+def poll_feed(url: str, state: dict[str, object], *, timeout_seconds: int | None = None) -> tuple[bool, str | None]:
+    """Cheaply check whether the feed at ``url`` changed since the last poll.
+
+    Sends a conditional GET through :mod:`platform.http.revalidation` using the
+    ETag persisted in ``state["etag"]`` (the scheduler loads and saves it from
+    ``ingest_state.etag``). Returns ``(changed, etag)``; callers should store
+    ``etag`` in ``state`` only once the change has been processed. Any error is
+    reported as "changed" so discovery falls back to a full listing.
+    """
+    from platform.http.revalidation import conditional_get
+
+    previous = state.get("etag")
+    previous_etag = str(previous) if previous else None
+    try:
+        resp = conditional_get(url, etag=previous_etag, timeout_seconds=timeout_seconds)
+    except Exception:
+        logger.debug("feed poll failed for %s", url, exc_info=True)
+        return True, previous_etag
+    if getattr(resp, "not_modified", False):
+        return False, previous_etag
+    status = int(getattr(resp, "status_code", 0) or 0)
+    if not 200 <= status < 300:
+        return True, previous_etag
+    etag = (getattr(resp, "headers", None) or {}).get("ETag")
+    changed = not (etag and etag == previous_etag)
+    return changed, etag or previous_etag
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import re
 from datetime import timedelta
 from platform.time import default_utc_now
 
 import domains.ingestion.providers.yt_dlp_download_tool as ytdlp
 
-from .base import DiscoveryItem, SourceConnector, Watch
+from .base import DiscoveryItem, SourceConnector, Watch, poll_feed
+
+
+_CHANNEL_ID_RE = re.compile(r"/channel/(UC[\w-]{22})")
 
 
 class YouTubeChannelConnector(SourceConnector):
@@ -15,20 +19,38 @@ class YouTubeChannelConnector(SourceConnector):
     Uses yt-dlp in flat mode via centralized helper to list entries and filters to the
     last 12 months by upload_date when available.
     Cursor semantics: stores the latest processed video id (string) to avoid re-enqueueing.
+
+    For ``/channel/UC...`` handles the channel's Atom feed is polled first with a
+    conditional request; when it is unchanged since ``state["etag"]`` the
+    (much more expensive) yt-dlp listing is skipped.
     """
 
-    def __init__(self, months: int = 12) -> None:
+    def __init__(self, months: int = 12, *, feed_check: bool = True) -> None:
         self.months = months
+        self.feed_check = feed_check
 
     def _cutoff(self) -> str:
         dt = default_utc_now() - timedelta(days=30 * self.months)
         return dt.strftime("%Y%m%d")
 
+    @staticmethod
+    def feed_url(handle: str) -> str | None:
+        match = _CHANNEL_ID_RE.search(handle)
+        return f"https://www.youtube.com/feeds/videos.xml?channel_id={match.group(1)}" if match else None
+
     def discover(self, watch: Watch, state: dict[str, object]) -> list[DiscoveryItem]:
+        feed = self.feed_url(watch.handle) if self.feed_check else None
+        etag: str | None = None
+        if feed:
+            changed, etag = poll_feed(feed, state)
+            if not changed and state.get("cursor"):
+                return []
         try:
             entries = ytdlp.youtube_list_channel_videos(watch.handle)
         except Exception:
             return []
+        if etag:
+            state["etag"] = etag
         cutoff = self._cutoff()
         last_seen_id = state.get("cursor")
         items: list[DiscoveryItem] = []
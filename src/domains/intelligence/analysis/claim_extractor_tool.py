@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from platform.cache.tool_cache_decorator import cache_tool_result
 
-from kg.extract import extract
+from kg.extract import extract_stream
 from ultimate_discord_intelligence_bot.obs.metrics import get_metrics
 from ultimate_discord_intelligence_bot.step_result import StepResult
 
@@ -12,6 +12,7 @@ from ._base import BaseTool
 
 
 MIN_CLAIM_LEN = 5
+SCAN_BLOCK_CHARS = 4096
 
 
 class ClaimExtractorTool(BaseTool[StepResult]):
@@ -52,26 +53,13 @@ class ClaimExtractorTool(BaseTool[StepResult]):
             return StepResult.ok(claims=[], count=0)
         try:
             text_stripped = text.strip()
-            chunks = []
-            if len(text_stripped) > 500:
-                chunk_size = 300
-                overlap = 50
-                for i in range(0, len(text_stripped), chunk_size - overlap):
-                    chunk = text_stripped[i : i + chunk_size]
-                    if chunk.strip():
-                        chunks.append(chunk)
-            else:
-                chunks = [text_stripped]
+            # One pass over the whole text: sentences are never split by windows and
+            # the scan stops as soon as enough claims have been found.
+            blocks = (text_stripped[i : i + SCAN_BLOCK_CHARS] for i in range(0, len(text_stripped), SCAN_BLOCK_CHARS))
             all_claims = []
             seen_claims = set()
-            for chunk in chunks:
-                _, chunk_claims = extract(chunk)
-                if chunk_claims is None:
-                    self._metrics.counter(
-                        "tool_runs_total", labels={"tool": "claim_extractor", "outcome": "error"}
-                    ).inc()
-                    return StepResult.fail(error="KG extract returned None", claims=[])
-                for claim in chunk_claims:
+            for _, block_claims in extract_stream(blocks):
+                for claim in block_claims:
                     claim_text = claim.text.strip()
                     claim_lower = claim_text.lower()
                     if claim_text and len(claim_text) > MIN_CLAIM_LEN and (claim_lower not in seen_claims):
@@ -0,0 +1,297 @@
+"""Compact CSR graph engine for creator network analysis.
+
+Creator collaboration graphs reach tens of thousands of nodes, so the
+analysis tools share a single compact representation instead of re-walking
+``dict[str, list[str]]`` adjacency for every metric:
+
+- Nodes are mapped to dense integer ids once (:class:`CSRGraph`).
+- Adjacency is stored as CSR (``indptr``/``indices``) NumPy arrays.
+- Traversals expand whole BFS frontiers at a time with vectorized gathers.
+
+Algorithms provided:
+
+- :func:`betweenness_centrality` - Brandes' O(VE) algorithm, with optional
+  source sampling for approximate scores on very large graphs.
+- :func:`eigenvector_centrality` / :func:`pagerank` - sparse power iteration
+  with convergence checks.
+- :func:`label_propagation_communities` - near-linear community detection.
+- :func:`bfs_distances` / :func:`reachable_within` - depth-bounded reachability.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CSRGraph:
+    """Directed graph stored in compressed sparse row form.
+
+    ``indices[indptr[i]:indptr[i + 1]]`` are the out-neighbours of node ``i``.
+    Undirected graphs are represented by storing both edge directions.
+    """
+
+    node_ids: tuple[str, ...]
+    indptr: np.ndarray
+    indices: np.ndarray
+    index: dict[str, int] = field(repr=False, compare=False)
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Mapping[str, Iterable[str]], *, undirected: bool = False) -> CSRGraph:
+        """Build a graph from an adjacency mapping.
+
+        Nodes that only appear as neighbours are included. Duplicate edges and
+        self-loops are dropped.
+        """
+        index: dict[str, int] = {}
+        sources: list[int] = []
+        targets: list[int] = []
+        for node, neighbours in adjacency.items():
+            u = index.setdefault(node, len(index))
+            for neighbour in neighbours:
+                v = index.setdefault(neighbour, len(index))
+                if u != v:
+                    sources.append(u)
+                    targets.append(v)
+        return cls._from_edge_arrays(
+            tuple(index),
+            index,
+            np.asarray(sources, dtype=np.int64),
+            np.asarray(targets, dtype=np.int64),
+            undirected=undirected,
+        )
+
+    @classmethod
+    def _from_edge_arrays(
+        cls,
+        node_ids: tuple[str, ...],
+        index: dict[str, int],
+        sources: np.ndarray,
+        targets: np.ndarray,
+        *,
+        undirected: bool,
+    ) -> CSRGraph:
+        n = len(node_ids)
+        if undirected:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+        if sources.size:
+            # Deduplicate edges via a single combined key, which also sorts by source.
+            keys = np.unique(sources * max(n, 1) + targets)
+            sources, targets = keys // max(n, 1), keys % max(n, 1)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+        return cls(node_ids=node_ids, indptr=indptr, indices=targets.astype(np.int64), index=index)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return int(self.indices.size)
+
+    def out_degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def neighbours(self, node: int) -> np.ndarray:
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def to_undirected(self) -> CSRGraph:
+        """Return the graph with every edge present in both directions."""
+        return CSRGraph._from_edge_arrays(self.node_ids, self.index, self._edge_sources(), self.indices, undirected=True)
+
+    def _edge_sources(self) -> np.ndarray:
+        return np.repeat(np.arange(self.num_nodes, dtype=np.int64), self.out_degree())
+
+    def expand(self, frontier: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(src, dst)`` arrays for every out-edge of ``frontier``."""
+        starts = self.indptr[frontier]
+        counts = self.indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        # Offset of each edge within its node's slice, shifted to the slice start.
+        run_starts = np.cumsum(counts) - counts
+        positions = np.arange(total, dtype=np.int64) - np.repeat(run_starts, counts) + np.repeat(starts, counts)
+        return np.repeat(frontier, counts), self.indices[positions]
+
+
+def bfs_distances(graph: CSRGraph, source: int, max_depth: int | None = None) -> np.ndarray:
+    """Hop distance from ``source`` to every node (``-1`` when unreachable)."""
+    dist = np.full(graph.num_nodes, -1, dtype=np.int64)
+    dist[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    depth = 0
+    while frontier.size and (max_depth is None or depth < max_depth):
+        _, dst = graph.expand(frontier)
+        dst = np.unique(dst[dist[dst] < 0])
+        depth += 1
+        dist[dst] = depth
+        frontier = dst
+    return dist
+
+
+def reachable_within(graph: CSRGraph, source: int, max_depth: int) -> np.ndarray:
+    """Node ids reachable from ``source`` in at most ``max_depth`` hops, excluding it."""
+    dist = bfs_distances(graph, source, max_depth)
+    return np.flatnonzero(dist > 0)
+
+
+def betweenness_centrality(
+    graph: CSRGraph,
+    *,
+    normalized: bool = True,
+    sample_size: int | None = None,
+    seed: int | None = None,
+) -> np.ndarray:
+    """Brandes betweenness centrality for every node.
+
+    Each BFS level is expanded in one vectorized step, and the dependency
+    accumulation replays the recorded shortest-path edges in reverse.
+
+    Args:
+        graph: Graph to analyse.
+        normalized: Divide by the number of reachable ordered ``(s, t)`` pairs,
+            giving the fraction of shortest paths passing through each node.
+        sample_size: When smaller than the node count, only this many random
+            sources are used and scores are extrapolated (approximate mode).
+        seed: RNG seed for source sampling.
+    """
+    n = graph.num_nodes
+    scores = np.zeros(n, dtype=np.float64)
+    if n == 0:
+        return scores
+    sources: Iterable[int] = range(n)
+    scale = 1.0
+    if sample_size is not None and 0 < sample_size < n:
+        rng = np.random.default_rng(seed)
+        sources = rng.choice(n, size=sample_size, replace=False).tolist()
+        scale = n / sample_size
+
+    reachable_pairs = 0
+    for s in sources:
+        dist = np.full(n, -1, dtype=np.int64)
+        sigma = np.zeros(n, dtype=np.float64)
+        dist[s] = 0
+        sigma[s] = 1.0
+        frontier = np.array([s], dtype=np.int64)
+        level_edges: list[tuple[np.ndarray, np.ndarray]] = []
+        depth = 0
+        while frontier.size:
+            src, dst = graph.expand(frontier)
+            unseen = dist[dst] < 0
+            dist[dst[unseen]] = depth + 1
+            on_path = dist[dst] == depth + 1
+            src, dst = src[on_path], dst[on_path]
+            if not dst.size:
+                break
+            np.add.at(sigma, dst, sigma[src])
+            level_edges.append((src, dst))
+            frontier = np.unique(dst)
+            depth += 1
+        reachable_pairs += int(np.count_nonzero(dist > 0))
+
+        delta = np.zeros(n, dtype=np.float64)
+        for src, dst in reversed(level_edges):
+            np.add.at(delta, src, sigma[src] / sigma[dst] * (1.0 + delta[dst]))
+        delta[s] = 0.0
+        scores += delta
+
+    scores *= scale
+    if normalized and reachable_pairs:
+        scores /= reachable_pairs * scale
+    return scores
+
+
+def eigenvector_centrality(graph: CSRGraph, *, max_iter: int = 100, tol: float = 1e-6) -> np.ndarray:
+    """Eigenvector centrality via shifted sparse power iteration.
+
+    A node's score is proportional to the sum of its out-neighbours' scores.
+    Iterating ``(A + I)x`` keeps the same dominant eigenvector while avoiding
+    oscillation on bipartite graphs. Scores are L1-normalised to sum to 1.
+    """
+    n = graph.num_nodes
+    if n == 0:
+        return np.zeros(0, dtype=np.float64)
+    rows = graph._edge_sources()
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        nxt = x + np.bincount(rows, weights=x[graph.indices], minlength=n)
+        nxt /= nxt.sum()
+        if np.abs(nxt - x).sum() < n * tol:
+            return nxt
+        x = nxt
+    return x
+
+
+def pagerank(graph: CSRGraph, *, alpha: float = 0.85, max_iter: int = 100, tol: float = 1e-6) -> np.ndarray:
+    """PageRank via sparse power iteration with dangling-node redistribution."""
+    n = graph.num_nodes
+    if n == 0:
+        return np.zeros(0, dtype=np.float64)
+    rows = graph._edge_sources()
+    out_degree = graph.out_degree().astype(np.float64)
+    dangling = out_degree == 0
+    inv_degree = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+    x = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        share = x * inv_degree
+        nxt = alpha * np.bincount(graph.indices, weights=share[rows], minlength=n)
+        nxt += (alpha * x[dangling].sum() + 1.0 - alpha) / n
+        if np.abs(nxt - x).sum() < n * tol:
+            return nxt
+        x = nxt
+    return x
+
+
+def label_propagation_communities(graph: CSRGraph, *, max_iter: int = 20, seed: int | None = 0) -> list[list[int]]:
+    """Detect communities by asynchronous label propagation.
+
+    Edges are treated as undirected. Each node adopts the most frequent label
+    among its neighbours (keeping its own label on ties, otherwise the
+    smallest), visiting nodes in a random order per sweep until no label
+    changes. Communities are returned largest first.
+    """
+    undirected = graph.to_undirected()
+    n = undirected.num_nodes
+    indptr = undirected.indptr.tolist()
+    indices = undirected.indices.tolist()
+    labels = list(range(n))
+    rng = np.random.default_rng(seed)
+    for _ in range(max_iter):
+        changed = False
+        for node in rng.permutation(n).tolist():
+            start, end = indptr[node], indptr[node + 1]
+            if start == end:
+                continue
+            counts: dict[int, int] = {}
+            for neighbour in indices[start:end]:
+                label = labels[neighbour]
+                counts[label] = counts.get(label, 0) + 1
+            best = max(counts.values())
+            current = labels[node]
+            if counts.get(current) == best:
+                continue
+            labels[node] = min(label for label, count in counts.items() if count == best)
+            changed = True
+        if not changed:
+            break
+    groups: dict[int, list[int]] = {}
+    for node, label in enumerate(labels):
+        groups.setdefault(label, []).append(node)
+    return sorted(groups.values(), key=lambda members: (-len(members), members[0]))
+
+
+__all__ = [
+    "CSRGraph",
+    "betweenness_centrality",
+    "bfs_distances",
+    "eigenvector_centrality",
+    "label_propagation_communities",
+    "pagerank",
+    "reachable_within",
+]
@@ -8,6 +8,20 @@ from typing import Any, TypedDict
 from ultimate_discord_intelligence_bot.step_result import StepResult
 from ultimate_discord_intelligence_bot.tools._base import BaseTool
 
+from .graph_engine import (
+    CSRGraph,
+    betweenness_centrality,
+    bfs_distances,
+    eigenvector_centrality,
+    label_propagation_communities,
+    reachable_within,
+)
+
+
+# Above this size betweenness switches to sampled (approximate) Brandes.
+EXACT_BETWEENNESS_MAX_NODES = 5_000
+BETWEENNESS_SAMPLE_SIZE = 512
+
 
 class SocialGraphAnalysisResult(TypedDict, total=False):
     """Result of social graph analysis."""
@@ -55,6 +69,7 @@ class SocialGraphAnalysisTool(BaseTool[StepResult]):
     ) -> SocialGraphAnalysisResult:
         """Perform the actual social graph analysis."""
         mock_network_data = self._get_mock_network_data()
+        mock_network_data["graph"] = CSRGraph.from_adjacency(mock_network_data["edges"])
         if analysis_type == "centrality":
             return self._analyze_centrality(creator_id, mock_network_data)
         elif analysis_type == "influence":
@@ -99,16 +114,25 @@ class SocialGraphAnalysisTool(BaseTool[StepResult]):
             },
         }
 
+    @staticmethod
+    def _graph(network_data: dict[str, Any]) -> CSRGraph:
+        """Return the shared CSR graph for ``network_data``, building it once."""
+        graph = network_data.get("graph")
+        if graph is None:
+            graph = network_data["graph"] = CSRGraph.from_adjacency(network_data["edges"])
+        return graph
+
     def _analyze_centrality(self, creator_id: str, network_data: dict[str, Any]) -> SocialGraphAnalysisResult:
         """Analyze centrality metrics for a creator."""
         nodes = network_data["nodes"]
         edges = network_data["edges"]
+        graph = self._graph(network_data)
         degree_centrality = len(edges.get(creator_id, []))
         max_degree = max(len(connections) for connections in edges.values()) if edges else 1
         normalized_degree = degree_centrality / max_degree if max_degree > 0 else 0
-        betweenness = self._calculate_betweenness_centrality(creator_id, edges)
-        closeness = self._calculate_closeness_centrality(creator_id, edges)
-        eigenvector = self._calculate_eigenvector_centrality(creator_id, edges)
+        betweenness = self._calculate_betweenness_centrality(creator_id, graph)
+        closeness = self._calculate_closeness_centrality(creator_id, graph)
+        eigenvector = self._calculate_eigenvector_centrality(creator_id, graph)
         return SocialGraphAnalysisResult(
             creator_id=creator_id,
             analysis_type="centrality",
@@ -133,11 +157,10 @@ class SocialGraphAnalysisTool(BaseTool[StepResult]):
     def _analyze_influence(self, creator_id: str, network_data: dict[str, Any]) -> SocialGraphAnalysisResult:
         """Analyze influence metrics for a creator."""
         nodes = network_data["nodes"]
-        edges = network_data["edges"]
         collaborations = network_data["collaborations"]
         creator_data = nodes.get(creator_id, {})
         follower_count = creator_data.get("followers", 0)
-        reachable_nodes = self._get_reachable_nodes(creator_id, edges, max_depth=2)
+        reachable_nodes = self._get_reachable_nodes(creator_id, self._graph(network_data), max_depth=2)
         influence_reach = len(reachable_nodes)
         collaboration_influence = 0
         for (source, target), data in collaborations.items():
@@ -170,7 +193,7 @@ class SocialGraphAnalysisTool(BaseTool[StepResult]):
     def _analyze_clusters(self, creator_id: str, network_data: dict[str, Any]) -> SocialGraphAnalysisResult:
         """Analyze community clusters for a creator."""
         edges = network_data["edges"]
-        clusters = self._detect_communities(edges)
+        clusters = self._detect_communities(self._graph(network_data))
         creator_cluster = None
         for cluster_id, cluster_members in clusters.items():
             if creator_id in cluster_members:
@@ -267,77 +290,44 @@ class SocialGraphAnalysisTool(BaseTool[StepResult]):
             timestamp=time.time(),
         )
 
-    def _calculate_betweenness_centrality(self, creator_id: str, edges: dict[str, list[str]]) -> float:
-        """Calculate betweenness centrality for a creator."""
-        total_paths = 0
-        paths_through_creator = 0
-        all_nodes = set(edges.keys()) | {node for connections in edges.values() for node in connections}
-        for source in all_nodes:
-            for target in all_nodes:
-                if source != target:
-                    path = self._find_shortest_path(source, target, edges)
-                    if path:
-                        total_paths += 1
-                        if creator_id in path[1:-1]:
-                            paths_through_creator += 1
-        return paths_through_creator / total_paths if total_paths > 0 else 0
-
-    def _calculate_closeness_centrality(self, creator_id: str, edges: dict[str, list[str]]) -> float:
+    def _calculate_betweenness_centrality(self, creator_id: str, graph: CSRGraph) -> float:
+        """Calculate betweenness centrality for a creator (Brandes, sampled on large graphs)."""
+        node = graph.index.get(creator_id)
+        if node is None:
+            return 0
+        sample_size = BETWEENNESS_SAMPLE_SIZE if graph.num_nodes > EXACT_BETWEENNESS_MAX_NODES else None
+        return float(betweenness_centrality(graph, sample_size=sample_size, seed=0)[node])
+
+    def _calculate_closeness_centrality(self, creator_id: str, graph: CSRGraph) -> float:
         """Calculate closeness centrality for a creator."""
-        distances = self._calculate_distances(creator_id, edges)
-        total_distance = sum(distances.values())
-        return (len(distances) - 1) / total_distance if total_distance > 0 else 0
+        node = graph.index.get(creator_id)
+        if node is None:
+            return 0
+        distances = bfs_distances(graph, node)
+        reached = distances[distances >= 0]
+        total_distance = int(reached.sum())
+        return (reached.size - 1) / total_distance if total_distance > 0 else 0
 
-    def _calculate_eigenvector_centrality(self, creator_id: str, edges: dict[str, list[str]]) -> float:
+    def _calculate_eigenvector_centrality(self, creator_id: str, graph: CSRGraph) -> float:
         """Calculate eigenvector centrality for a creator."""
-        nodes = list(set(edges.keys()) | {node for connections in edges.values() for node in connections})
-        n = len(nodes)
-        if n == 0:
+        node = graph.index.get(creator_id)
+        if node is None:
             return 0
-        centrality = dict.fromkeys(nodes, 1.0)
-        for _ in range(10):
-            new_centrality = {}
-            for node in nodes:
-                score = sum(centrality[neighbor] for neighbor in edges.get(node, []))
-                new_centrality[node] = score
-            total = sum(new_centrality.values())
-            if total > 0:
-                centrality = {node: score / total for node, score in new_centrality.items()}
-        return centrality.get(creator_id, 0)
-
-    def _get_reachable_nodes(self, creator_id: str, edges: dict[str, list[str]], max_depth: int = 2) -> set[str]:
+        return float(eigenvector_centrality(graph)[node])
+
+    def _get_reachable_nodes(self, creator_id: str, graph: CSRGraph, max_depth: int = 2) -> set[str]:
         """Get all nodes reachable within max_depth from creator."""
-        visited = set()
-        queue = [(creator_id, 0)]
-        while queue:
-            node, depth = queue.pop(0)
-            if node in visited or depth > max_depth:
-                continue
-            visited.add(node)
-            for neighbor in edges.get(node, []):
-                if neighbor not in visited:
-                    queue.append((neighbor, depth + 1))
-        return visited - {creator_id}
-
-    def _detect_communities(self, edges: dict[str, list[str]]) -> dict[str, list[str]]:
-        """Detect communities using connected components."""
-        visited = set()
-        communities = {}
-        community_id = 0
-        for node in edges:
-            if node not in visited:
-                community = []
-                stack = [node]
-                while stack:
-                    current = stack.pop()
-                    if current not in visited:
-                        visited.add(current)
-                        community.append(current)
-                        stack.extend(edges.get(current, []))
-                if community:
-                    communities[f"community_{community_id}"] = community
-                    community_id += 1
-        return communities
+        node = graph.index.get(creator_id)
+        if node is None:
+            return set()
+        return {graph.node_ids[i] for i in reachable_within(graph, node, max_depth).tolist()}
+
+    def _detect_communities(self, graph: CSRGraph) -> dict[str, list[str]]:
+        """Detect communities using label propagation."""
+        return {
+            f"community_{community_id}": [graph.node_ids[i] for i in members]
+            for community_id, members in enumerate(label_propagation_communities(graph))
+        }
 
     def _calculate_bridge_score(
         self, creator_id: str, communities: dict[str, list[str]], edges: dict[str, list[str]]
@@ -359,34 +349,6 @@ class SocialGraphAnalysisTool(BaseTool[StepResult]):
                 cross_community_connections += 1
         return cross_community_connections / len(edges.get(creator_id, [])) if edges.get(creator_id) else 0
 
-    def _find_shortest_path(self, source: str, target: str, edges: dict[str, list[str]]) -> list[str] | None:
-        """Find shortest path between two nodes using BFS."""
-        if source == target:
-            return [source]
-        queue = [(source, [source])]
-        visited = {source}
-        while queue:
-            node, path = queue.pop(0)
-            for neighbor in edges.get(node, []):
-                if neighbor == target:
-                    return [*path, neighbor]
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, [*path, neighbor]))
-        return None
-
-    def _calculate_distances(self, creator_id: str, edges: dict[str, list[str]]) -> dict[str, int]:
-        """Calculate distances from creator to all other nodes."""
-        distances = {creator_id: 0}
-        queue = [creator_id]
-        while queue:
-            current = queue.pop(0)
-            for neighbor in edges.get(current, []):
-                if neighbor not in distances:
-                    distances[neighbor] = distances[current] + 1
-                    queue.append(neighbor)
-        return distances
-
     def _determine_network_tier(self, overall_score: float) -> int:
         """Determine network tier based on overall score."""
         if overall_score >= 0.8:
@@ -0,0 +1,339 @@
+"""Columnar time-series store and vectorized statistics for trend forecasting.
+
+``TrendForecastingTool`` used to regroup and re-scan lists of
+``TrendDataPoint`` dicts for every metric. :class:`TrendSeriesStore` keeps the
+same data as NumPy columns instead:
+
+- ``timestamp``, ``engagement`` and ``reach`` as ``float64`` arrays.
+- ``platform``, ``content_group``, ``similarity_group`` and ``daypart`` as
+  small integer codes backed by per-store vocabularies.
+- Group indices (row ids per group) maintained incrementally on append, so
+  adding new points never regroups the full history.
+
+The module-level helpers (:func:`rolling_mean_std`, :func:`seasonal_decompose`,
+:func:`dominant_period`, :func:`lag_cross_correlation`, :func:`linear_trend`)
+operate on plain arrays and are shared by the tool's forecasting stages.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+DAYPARTS: tuple[str, ...] = ("morning", "afternoon", "evening", "night")
+
+# Group kinds maintained by the store.
+CHARACTERISTICS = "characteristics"
+TIME_PATTERN = "time_pattern"
+SIMILARITY = "similarity"
+
+_NUMERIC_COLUMNS = ("timestamp", "engagement", "reach")
+_CODE_COLUMNS = ("platform", "content_group", "similarity_group", "daypart")
+
+
+def _daypart(timestamp: float) -> int:
+    hour = time.localtime(timestamp).tm_hour
+    if 6 <= hour < 12:
+        return 0
+    if 12 <= hour < 18:
+        return 1
+    if 18 <= hour < 22:
+        return 2
+    return 3
+
+
+class _Vocabulary:
+    """Bidirectional string <-> integer code mapping."""
+
+    __slots__ = ("codes", "names")
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def encode(self, name: str) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+@dataclass(frozen=True, slots=True)
+class TrendGroup:
+    """Time-ordered column view over one group of rows."""
+
+    key: str
+    timestamp: np.ndarray
+    engagement: np.ndarray
+    reach: np.ndarray
+    platform: np.ndarray
+    content_type: str
+
+    def __len__(self) -> int:
+        return int(self.timestamp.size)
+
+
+class TrendSeriesStore:
+    """Append-only columnar store for trend data points.
+
+    Args:
+        capacity: Initial row capacity; columns grow geometrically.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._size = 0
+        self._capacity = max(16, capacity)
+        self._columns: dict[str, np.ndarray] = {name: np.empty(self._capacity, dtype=np.float64) for name in _NUMERIC_COLUMNS}
+        self._columns.update({name: np.empty(self._capacity, dtype=np.int32) for name in _CODE_COLUMNS})
+        self.platforms = _Vocabulary()
+        self.content_groups = _Vocabulary()
+        self.similarity_groups = _Vocabulary()
+        self._content_types: list[str] = []
+        self._group_rows: dict[str, dict[int, list[int]]] = {CHARACTERISTICS: {}, TIME_PATTERN: {}, SIMILARITY: {}}
+        self._views: dict[tuple[str, int], tuple[int, TrendGroup]] = {}
+        self._memo: dict[tuple[str, str], tuple[int, Any]] = {}
+        self.version = 0
+
+    @classmethod
+    def from_points(cls, points: Iterable[Mapping[str, Any]]) -> TrendSeriesStore:
+        points = list(points)
+        store = cls(capacity=len(points))
+        store.append(points)
+        return store
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a read-only view of column ``name`` for the stored rows."""
+        view = self._columns[name][: self._size]
+        view.flags.writeable = False
+        return view
+
+    def append(self, points: Iterable[Mapping[str, Any]]) -> int:
+        """Append data points and update group indices; returns rows added."""
+        added = 0
+        for point in points:
+            if self._size == self._capacity:
+                self._grow()
+            row = self._size
+            metrics = point.get("engagement_metrics") or {}
+            metadata = point.get("content_metadata") or {}
+            timestamp = float(point.get("timestamp", 0) or 0)
+            platform = point.get("platform") or "unknown"
+            content_type = metadata.get("content_type", "unknown")
+            keywords = metadata.get("keywords") or []
+            similarity = "_".join(sorted(keywords[:3])) if keywords else f"unknown_{point.get('content_id', '')}"
+
+            content_code = self.content_groups.encode(f"{platform}_{content_type}")
+            if content_code == len(self._content_types):
+                self._content_types.append(content_type)
+            codes = {
+                "platform": self.platforms.encode(platform),
+                "content_group": content_code,
+                "similarity_group": self.similarity_groups.encode(similarity),
+                "daypart": _daypart(timestamp),
+            }
+            self._columns["timestamp"][row] = timestamp
+            self._columns["engagement"][row] = float(metrics.get("total_engagement", 0) or 0)
+            self._columns["reach"][row] = float(metrics.get("reach", 0) or 0)
+            for name, code in codes.items():
+                self._columns[name][row] = code
+            self._group_rows[CHARACTERISTICS].setdefault(codes["content_group"], []).append(row)
+            self._group_rows[TIME_PATTERN].setdefault(codes["daypart"], []).append(row)
+            self._group_rows[SIMILARITY].setdefault(codes["similarity_group"], []).append(row)
+            self._size += 1
+            added += 1
+        if added:
+            self.version += 1
+        return added
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty(self._capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+
+    def _group_name(self, kind: str, code: int) -> str:
+        if kind == CHARACTERISTICS:
+            return self.content_groups.names[code]
+        if kind == TIME_PATTERN:
+            return DAYPARTS[code]
+        return self.similarity_groups.names[code]
+
+    def groups(self, kind: str) -> dict[str, TrendGroup]:
+        """Return time-ordered views for every group of ``kind``.
+
+        Views are cached and only rebuilt for groups that gained rows.
+        """
+        result: dict[str, TrendGroup] = {}
+        for code, rows in self._group_rows[kind].items():
+            cached = self._views.get((kind, code))
+            if cached is None or cached[0] != len(rows):
+                cached = (len(rows), self._build_view(kind, code, np.asarray(rows, dtype=np.int64)))
+                self._views[(kind, code)] = cached
+            view = cached[1]
+            result[view.key] = view
+        return result
+
+    def _build_view(self, kind: str, code: int, rows: np.ndarray) -> TrendGroup:
+        order = np.argsort(self._columns["timestamp"][rows], kind="stable")
+        rows = rows[order]
+        content_type = self._content_types[code] if kind == CHARACTERISTICS else "unknown"
+        return TrendGroup(
+            key=self._group_name(kind, code),
+            timestamp=self._columns["timestamp"][rows],
+            engagement=self._columns["engagement"][rows],
+            reach=self._columns["reach"][rows],
+            platform=self._columns["platform"][rows],
+            content_type=content_type,
+        )
+
+    def memoize(self, namespace: str, group: TrendGroup, compute: Callable[[TrendGroup], Any]) -> Any:
+        """Return ``compute(group)``, reusing the last result while the group is unchanged.
+
+        Callers get a deep copy, so mutating a returned forecast never alters the memo.
+        """
+        key = (namespace, group.key)
+        cached = self._memo.get(key)
+        if cached is None or cached[0] != len(group):
+            cached = self._memo[key] = (len(group), compute(group))
+        return copy.deepcopy(cached[1])
+
+
+def rolling_mean_std(values: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Trailing rolling mean and population std via cumulative sums.
+
+    Returns arrays of length ``len(values) - window + 1`` (empty when shorter).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if window <= 0 or values.size < window:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    csum_sq = np.concatenate(([0.0], np.cumsum(values * values)))
+    sums = csum[window:] - csum[:-window]
+    sums_sq = csum_sq[window:] - csum_sq[:-window]
+    mean = sums / window
+    var = np.maximum(sums_sq / window - mean * mean, 0.0)
+    return mean, np.sqrt(var)
+
+
+def bin_series(timestamps: np.ndarray, values: np.ndarray, bin_seconds: float, start: float, bins: int) -> np.ndarray:
+    """Sum ``values`` into ``bins`` fixed-width buckets starting at ``start``."""
+    idx = ((np.asarray(timestamps) - start) // bin_seconds).astype(np.int64)
+    mask = (idx >= 0) & (idx < bins)
+    return np.bincount(idx[mask], weights=np.asarray(values)[mask], minlength=bins)
+
+
+def seasonal_decompose(values: np.ndarray, period: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Classical additive decomposition into ``(trend, seasonal, residual)``.
+
+    The trend is a centred moving average over one period (edges padded with
+    the nearest valid value); the seasonal component is the mean detrended
+    value per phase, centred to sum to zero.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = values.size
+    if period < 2 or n < 2 * period:
+        zeros = np.zeros(n)
+        return values.copy(), zeros, zeros.copy()
+    mean, _ = rolling_mean_std(values, period)
+    trend = np.empty(n)
+    offset = (period - 1) // 2
+    trend[offset : offset + mean.size] = mean
+    trend[:offset] = mean[0]
+    trend[offset + mean.size :] = mean[-1]
+    detrended = values - trend
+    phase_means = np.bincount(np.arange(n) % period, weights=detrended, minlength=period) / np.bincount(
+        np.arange(n) % period, minlength=period
+    )
+    phase_means -= phase_means.mean()
+    seasonal = phase_means[np.arange(n) % period]
+    return trend, seasonal, values - trend - seasonal
+
+
+def _autocorrelation(values: np.ndarray, max_lag: int) -> np.ndarray:
+    centred = values - values.mean()
+    denom = float(centred @ centred)
+    if denom == 0.0:
+        return np.zeros(max_lag + 1)
+    full = np.correlate(centred, centred, mode="full")[values.size - 1 :]
+    return full[: max_lag + 1] / denom
+
+
+def dominant_period(values: np.ndarray, min_period: int = 2, max_period: int | None = None) -> tuple[int, float]:
+    """Return ``(period, autocorrelation)`` of the strongest repeating cycle.
+
+    Returns ``(0, 0.0)`` when the series is too short to contain two cycles.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    max_period = min(max_period or values.size // 2, values.size // 2)
+    if max_period < min_period:
+        return 0, 0.0
+    acf = _autocorrelation(values, max_period)
+    lag = int(np.argmax(acf[min_period : max_period + 1])) + min_period
+    return lag, float(acf[lag])
+
+
+def lag_cross_correlation(source: np.ndarray, target: np.ndarray, max_lag: int) -> tuple[int, float]:
+    """Return ``(lag, correlation)`` where ``target`` best follows ``source``.
+
+    Only non-negative lags are considered: a lag of ``k`` bins means activity
+    on the target trails the source by ``k`` bins.
+    """
+    source = np.asarray(source, dtype=np.float64)
+    target = np.asarray(target, dtype=np.float64)
+    n = min(source.size, target.size)
+    if n < 2:
+        return 0, 0.0
+    a = source[:n] - source[:n].mean()
+    b = target[:n] - target[:n].mean()
+    denom = float(np.sqrt((a @ a) * (b @ b)))
+    if denom == 0.0:
+        return 0, 0.0
+    # full[n - 1 + k] = sum_t a[t] * b[t + k]
+    full = np.correlate(b, a, mode="full")
+    max_lag = min(max_lag, n - 1)
+    window = full[n - 1 : n + max_lag] / denom
+    lag = int(np.argmax(window))
+    return lag, float(window[lag])
+
+
+def linear_trend(values: np.ndarray) -> tuple[float, float]:
+    """Least-squares ``(slope, intercept)`` of ``values`` against their index."""
+    values = np.asarray(values, dtype=np.float64)
+    n = values.size
+    if n == 0:
+        return 0.0, 0.0
+    if n == 1:
+        return 0.0, float(values[0])
+    x = np.arange(n, dtype=np.float64)
+    x_mean = x.mean()
+    y_mean = values.mean()
+    slope = float(((x - x_mean) @ (values - y_mean)) / ((x - x_mean) @ (x - x_mean)))
+    return slope, y_mean - slope * x_mean
+
+
+__all__ = [
+    "CHARACTERISTICS",
+    "DAYPARTS",
+    "SIMILARITY",
+    "TIME_PATTERN",
+    "TrendGroup",
+    "TrendSeriesStore",
+    "bin_series",
+    "dominant_period",
+    "lag_cross_correlation",
+    "linear_trend",
+    "rolling_mean_std",
+    "seasonal_decompose",
+]
@@ -0,0 +1,255 @@
+"""Concurrent evidence fan-out for :class:`FactCheckTool`.
+
+Evidence backends are blocking HTTP calls, so :func:`fan_out` submits all of
+them for one claim to a shared, bounded thread pool and collects results as
+they finish instead of paying the sum of their round-trips:
+
+- ``deadline_seconds`` caps the wall time of one claim. Backends still
+  running at the deadline are reported as ``timeout`` and their late results
+  are dropped;
+- each backend also has its own budget (``backend_budgets``, falling back to
+  ``default_budget_seconds``), counted from when a pool worker starts it, so
+  one slow provider cannot hold the claim until the deadline and queueing
+  on a saturated pool does not eat into a backend's budget;
+- once ``quorum`` evidence items have arrived the claim returns early; the
+  remaining backends are reported as ``skipped``.
+
+:class:`EvidenceCache` keeps finished results per tenant and workspace, keyed
+on :func:`normalize_claim`, so a claim repeated in a debate (or across
+debates) is answered without any network call.
+
+Defaults come from ``FACT_CHECK_DEADLINE_SECONDS``,
+``FACT_CHECK_BACKEND_BUDGET_SECONDS``, ``FACT_CHECK_EVIDENCE_QUORUM`` and
+``FACT_CHECK_MAX_INFLIGHT`` (size of the shared backend pool, i.e. the
+global cap on concurrent backend requests).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+import time
+import unicodedata
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from platform.cache.bounded_cache import BoundedLRUCache
+from typing import TYPE_CHECKING, Any
+
+from requests import RequestException
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    Backend = tuple[str, Callable[[str], list[dict]]]
+
+_WS_RE = re.compile(r"\s+")
+_EDGE_PUNCT = " \t\n\"'`“”‘’.,;:!?()[]{}"
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, "") or default)
+    except ValueError:
+        return default
+
+
+def normalize_claim(text: str) -> str:
+    """Canonical form of a claim for cache keys: NFKC, casefolded, single-spaced, no edge punctuation."""
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return _WS_RE.sub(" ", text).strip(_EDGE_PUNCT)
+
+
+@dataclass(frozen=True)
+class FanOutPolicy:
+    """Time limits and early-return threshold for one claim."""
+
+    deadline_seconds: float = 12.0
+    default_budget_seconds: float = 10.0
+    backend_budgets: Mapping[str, float] = field(default_factory=dict)
+    quorum: int = 8
+
+    @classmethod
+    def from_env(cls) -> FanOutPolicy:
+        return cls(
+            deadline_seconds=_env_float("FACT_CHECK_DEADLINE_SECONDS", cls.deadline_seconds),
+            default_budget_seconds=_env_float("FACT_CHECK_BACKEND_BUDGET_SECONDS", cls.default_budget_seconds),
+            quorum=int(_env_float("FACT_CHECK_EVIDENCE_QUORUM", cls.quorum)),
+        )
+
+    def budget_for(self, backend: str) -> float:
+        return min(self.backend_budgets.get(backend, self.default_budget_seconds), self.deadline_seconds)
+
+
+@dataclass
+class BackendOutcome:
+    """What one backend contributed to a claim.
+
+    ``status`` is ``ok``, ``empty``, ``failed`` (``RequestException``),
+    ``error`` (any other exception), ``timeout`` or ``skipped`` (not needed
+    after quorum).
+    """
+
+    name: str
+    status: str
+    evidence: list[dict] = field(default_factory=list)
+    seconds: float = 0.0
+    error: BaseException | None = None
+
+
+@dataclass
+class FanOutResult:
+    outcomes: list[BackendOutcome]
+    elapsed_seconds: float
+    quorum_reached: bool = False
+
+    @property
+    def evidence(self) -> list[dict]:
+        """Evidence in backend order, independent of completion order."""
+        return [item for outcome in self.outcomes for item in outcome.evidence]
+
+    def backends(self, *statuses: str) -> list[str]:
+        return [outcome.name for outcome in self.outcomes if outcome.status in statuses]
+
+    @property
+    def partial(self) -> bool:
+        """True when a backend was cut off by its budget or the deadline."""
+        return any(outcome.status == "timeout" for outcome in self.outcomes)
+
+
+def _timed_call(fn: Callable[[str], list[dict]], claim: str) -> tuple[list[dict], float]:
+    started = time.perf_counter()
+    return list(fn(claim) or []), time.perf_counter() - started
+
+
+def fan_out(
+    claim: str,
+    backends: Sequence[Backend],
+    policy: FanOutPolicy,
+    executor: ThreadPoolExecutor,
+) -> FanOutResult:
+    """Query all ``backends`` for ``claim`` concurrently under ``policy``.
+
+    A backend's budget starts when a pool worker picks it up, not when it is
+    submitted, so time spent queued behind other claims on a saturated pool
+    only counts against the claim deadline.
+    """
+    started = time.monotonic()
+    deadline = started + policy.deadline_seconds
+    changed = threading.Condition()
+    running_since: dict[int, float] = {}
+
+    def notify(_future: Future | None = None) -> None:
+        with changed:
+            changed.notify_all()
+
+    def call(index: int, fn: Callable[[str], list[dict]]) -> tuple[list[dict], float]:
+        with changed:
+            running_since[index] = time.monotonic()
+            changed.notify_all()
+        return _timed_call(fn, claim)
+
+    pending: dict[Future, tuple[int, str]] = {}
+    for index, (name, fn) in enumerate(backends):
+        future = executor.submit(call, index, fn)
+        pending[future] = (index, name)
+        future.add_done_callback(notify)
+    outcomes: dict[int, BackendOutcome] = {}
+    evidence_count = 0
+    quorum_reached = False
+    while pending:
+        with changed:
+            while True:
+                done = [future for future in pending if future.done()]
+                expiry = min(
+                    [deadline]
+                    + [running_since[i] + policy.budget_for(name) for i, name in pending.values() if i in running_since]
+                )
+                remaining = expiry - time.monotonic()
+                if done or remaining <= 0:
+                    break
+                changed.wait(remaining)
+        for future in done:
+            index, name = pending.pop(future)
+            error = future.exception()
+            if error is None:
+                evidence, seconds = future.result()
+                outcomes[index] = BackendOutcome(name, "ok" if evidence else "empty", evidence, seconds)
+                evidence_count += len(evidence)
+            else:
+                seconds = time.monotonic() - running_since.get(index, started)
+                status = "failed" if isinstance(error, RequestException) else "error"
+                outcomes[index] = BackendOutcome(name, status, error=error, seconds=seconds)
+        if policy.quorum > 0 and evidence_count >= policy.quorum:
+            quorum_reached = True
+            break
+        now = time.monotonic()
+        with changed:
+            for future, (index, name) in list(pending.items()):
+                since = running_since.get(index)
+                over_budget = since is not None and now - since >= policy.budget_for(name)
+                if now >= deadline or over_budget:
+                    future.cancel()
+                    pending.pop(future)
+                    outcomes[index] = BackendOutcome(name, "timeout", seconds=now - since if since is not None else 0.0)
+    for future, (index, name) in pending.items():
+        # Only reached after quorum: queued calls are cancelled, running ones finish in the background.
+        future.cancel()
+        outcomes[index] = BackendOutcome(name, "skipped")
+    return FanOutResult(
+        outcomes=[outcomes[i] for i in range(len(backends))],
+        elapsed_seconds=time.monotonic() - started,
+        quorum_reached=quorum_reached,
+    )
+
+
+class EvidenceCache:
+    """Tenant-scoped cache of fact-check results keyed on the normalized claim."""
+
+    def __init__(self, max_size: int = 2048, ttl: int = 6 * 3600) -> None:
+        self._cache = BoundedLRUCache(max_size=max_size, ttl=ttl, name="fact_check_evidence")
+
+    @staticmethod
+    def key(claim: str, tenant: str, workspace: str) -> str:
+        digest = hashlib.sha1(normalize_claim(claim).encode("utf-8"), usedforsecurity=False).hexdigest()
+        return f"{tenant}:{workspace}:{digest}"
+
+    def get(self, claim: str, tenant: str, workspace: str) -> dict[str, Any] | None:
+        return self._cache.get(self.key(claim, tenant, workspace))
+
+    def set(self, claim: str, tenant: str, workspace: str, data: dict[str, Any]) -> None:
+        self._cache.set(self.key(claim, tenant, workspace), data)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return self._cache.get_stats()
+
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_backend_executor() -> ThreadPoolExecutor:
+    """Shared pool for backend calls; its size caps concurrent backend requests process-wide."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            workers = max(1, int(_env_float("FACT_CHECK_MAX_INFLIGHT", 32)))
+            _EXECUTOR = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fact-check")
+        return _EXECUTOR
+
+
+__all__ = [
+    "BackendOutcome",
+    "EvidenceCache",
+    "FanOutPolicy",
+    "FanOutResult",
+    "fan_out",
+    "get_backend_executor",
+    "normalize_claim",
+]
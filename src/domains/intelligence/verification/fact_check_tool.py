@@ -14,15 +14,26 @@ Behavior requirements inferred from tests:
             ``StepResult.skip`` so the pipeline records a "skipped" outcome while
             preserving the contract for downstream callers.
 
+Backends are queried concurrently under a per-claim deadline, per-backend
+budgets and an early-return evidence quorum (see ``evidence_fanout``).
+Results are cached per tenant/workspace on the normalized claim text when
+every backend answered and some evidence came back, and identical claims in
+flight at the same time share one fan-out.
+
 Instrumentation (Copilot migration spec):
     * tool_runs_total{tool="fact_check", outcome=success|error|skipped}
+    * fact_check_cache_total{outcome=hit|miss}
+    * fact_check_backend_outcomes_total{backend, status}
 """
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from platform.http.http_utils import resilient_get, resilient_post
+from platform.http.revalidation import SingleFlight
 from typing import TYPE_CHECKING
 
 from requests import RequestException
@@ -30,10 +41,16 @@ from requests import RequestException
 from ultimate_discord_intelligence_bot.obs.metrics import get_metrics
 from ultimate_discord_intelligence_bot.step_result import StepResult
 
+from .evidence_fanout import EvidenceCache, FanOutPolicy, fan_out, get_backend_executor
+
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
+
+    from ultimate_discord_intelligence_bot.step_result import ErrorContext
 _logger = logging.getLogger(__name__)
+_SHARED_CACHE = EvidenceCache()
+_IN_FLIGHT = SingleFlight()
 
 
 class FactCheckTool:
@@ -66,8 +83,16 @@ class FactCheckTool:
         >>> print(f"Found {result.data['evidence_count']} evidence items")
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        policy: FanOutPolicy | None = None,
+        cache: EvidenceCache | None = None,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
         self._metrics = get_metrics()
+        self.policy = policy or FanOutPolicy.from_env()
+        self.cache = cache if cache is not None else _SHARED_CACHE
+        self._executor = executor
 
     def run(self, claim: str, tenant: str = "global", workspace: str = "global") -> StepResult:
         """Aggregate evidence across all enabled backends with comprehensive error handling.
@@ -86,51 +111,89 @@ class FactCheckTool:
         if not claim or not claim.strip():
             self._metrics.counter("tool_runs_total", labels={"tool": "fact_check", "outcome": "skipped"}).inc()
             return StepResult.skip(reason="No claim provided", evidence=[], claim=claim, context=context)
-        _logger.info(f"FactCheckTool: Checking claim: {claim[:100]}...")
-        evidence: list[dict] = []
-        successful_backends: list[str] = []
-        failed_backends: list[str] = []
-        backends: list[tuple[str, Callable[[str], list[dict]]]] = [
+        cached = self.cache.get(claim, tenant, workspace)
+        if cached is None:
+            self._metrics.counter("fact_check_cache_total", labels={"outcome": "miss"}).inc()
+            result, _shared = _IN_FLIGHT.do(
+                self.cache.key(claim, tenant, workspace), lambda: self._check(claim, tenant, workspace, context)
+            )
+            if not result.success:
+                return result
+            # Callers sharing an in-flight check must not see each other's edits.
+            data = copy.deepcopy(dict(result.data))
+        else:
+            self._metrics.counter("fact_check_cache_total", labels={"outcome": "hit"}).inc()
+            data = {**copy.deepcopy(cached), "cached": True}
+        self._metrics.counter("tool_runs_total", labels={"tool": "fact_check", "outcome": "success"}).inc()
+        return StepResult.ok(**{**data, "claim": claim})
+
+    def run_many(
+        self,
+        claims: Sequence[str],
+        tenant: str = "global",
+        workspace: str = "global",
+        max_concurrency: int = 8,
+    ) -> list[StepResult]:
+        """Fact-check ``claims`` with at most ``max_concurrency`` claims in flight.
+
+        Results are returned in input order. Repeated claims are checked once
+        (cache plus in-flight de-duplication), and backend requests from all
+        claims share the process-wide pool, which caps total concurrency.
+        """
+        if not claims:
+            return []
+        workers = max(1, min(max_concurrency, len(claims)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fact-check-claim") as pool:
+            return list(pool.map(lambda claim: self.run(claim, tenant=tenant, workspace=workspace), claims))
+
+    def _backends(self) -> list[tuple[str, Callable[[str], list[dict]]]]:
+        return [
             ("duckduckgo", self._search_duckduckgo),
             ("serply", self._search_serply),
             ("exa", self._search_exa),
             ("perplexity", self._search_perplexity),
             ("wolfram", self._search_wolfram),
         ]
-        for name, fn in backends:
-            try:
-                _logger.debug(f"FactCheckTool: Calling backend '{name}'...")
-                results = fn(claim) or []
-                if results:
-                    successful_backends.append(name)
-                    evidence.extend(results)
-                    _logger.info(f"FactCheckTool: Backend '{name}' returned {len(results)} evidence items")
-                else:
-                    _logger.debug(f"FactCheckTool: Backend '{name}' returned no results (likely no API key or no data)")
-            except RequestException as e:
-                failed_backends.append(name)
+
+    def _check(self, claim: str, tenant: str, workspace: str, context: ErrorContext) -> StepResult:
+        _logger.info(f"FactCheckTool: Checking claim: {claim[:100]}...")
+        outcome = fan_out(claim, self._backends(), self.policy, self._executor or get_backend_executor())
+        for backend in outcome.outcomes:
+            self._metrics.counter(
+                "fact_check_backend_outcomes_total", labels={"backend": backend.name, "status": backend.status}
+            ).inc()
+            if backend.status == "failed":
                 _logger.warning(
-                    f"FactCheckTool: Backend '{name}' failed (RequestException): {e} - possibly rate limited or unavailable"
+                    f"FactCheckTool: Backend '{backend.name}' failed (RequestException): {backend.error} - possibly rate limited or unavailable"
                 )
-                continue
-            except Exception as e:
-                failed_backends.append(name)
-                _logger.error(f"FactCheckTool: Backend '{name}' encountered unexpected error: {e}")
+            elif backend.status == "timeout":
+                _logger.warning(f"FactCheckTool: Backend '{backend.name}' exceeded its time budget")
+            elif backend.status == "error":
+                _logger.error(f"FactCheckTool: Backend '{backend.name}' encountered unexpected error: {backend.error}")
                 self._metrics.counter("tool_runs_total", labels={"tool": "fact_check", "outcome": "error"}).inc()
                 return StepResult.network_error(
-                    error=f"Backend '{name}' failed: {e!s}", context=context, claim=claim, failed_backend=name
+                    error=f"Backend '{backend.name}' failed: {backend.error!s}",
+                    context=context,
+                    claim=claim,
+                    failed_backend=backend.name,
                 )
+        evidence = outcome.evidence
+        data = {
+            "evidence": evidence,
+            "backends_used": outcome.backends("ok"),
+            "backends_failed": outcome.backends("failed"),
+            "backends_timed_out": outcome.backends("timeout"),
+            "evidence_count": len(evidence),
+            "elapsed_ms": round(outcome.elapsed_seconds * 1000, 1),
+            "partial": outcome.partial,
+        }
         _logger.info(
-            f"FactCheckTool: Completed - {len(evidence)} total evidence items from {len(successful_backends)} backends. Successful: {successful_backends}, Failed: {failed_backends or 'None'}"
-        )
-        self._metrics.counter("tool_runs_total", labels={"tool": "fact_check", "outcome": "success"}).inc()
-        return StepResult.ok(
-            claim=claim,
-            evidence=evidence,
-            backends_used=successful_backends,
-            backends_failed=failed_backends,
-            evidence_count=len(evidence),
+            f"FactCheckTool: Completed - {len(evidence)} total evidence items from {len(data['backends_used'])} backends in {data['elapsed_ms']} ms. Successful: {data['backends_used']}, Failed: {data['backends_failed'] or 'None'}"
         )
+        # Only complete answers are cached: a timed-out, failed or empty fan-out is retried on the next call.
+        if evidence and not outcome.partial and not data["backends_failed"]:
+            self.cache.set(claim, tenant, workspace, copy.deepcopy(data))
+        return StepResult.ok(claim=claim, **data)
 
     def _search_duckduckgo(self, query: str) -> list[dict]:
         """Search DuckDuckGo for evidence (no API key required)."""
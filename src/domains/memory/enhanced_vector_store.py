@@ -2,20 +2,31 @@
 
 This module provides advanced Qdrant features for the Ultimate Discord Intelligence Bot,
 including sparse vector support, SIMD acceleration, and query planning optimization.
+
+Sparse vectors are BM25 weights from :class:`~domains.memory.sparse_encoder.BM25SparseEncoder`,
+whose per-collection document frequencies are updated by :meth:`EnhancedVectorStore.upsert`.
+Dense and sparse results are merged with reciprocal rank fusion (or min-max normalized
+score fusion), since cosine similarities and BM25 scores are not on the same scale.
 """
 
 from __future__ import annotations
 
 import logging
-import math
+import os
+import uuid
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from domains.memory.sparse_encoder import BM25SparseEncoder, SparseStatsStore
 from domains.memory.vector_store import VectorStore
 
 
 logger = logging.getLogger(__name__)
+DEFAULT_SPARSE_STATS_DB_PATH = "./data/sparse_stats.db"
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from domains.memory.vector_store import VectorRecord
     from qdrant_client import QdrantClient as _QdrantClient
     from qdrant_client.http import models as _qmodels
 else:
@@ -39,6 +50,8 @@ class HybridSearchConfig:
     enable_query_planning: bool = True
     max_results: int = 100
     score_threshold: float = 0.0
+    fusion: str = "rrf"  # "rrf" or "normalized"
+    rrf_k: int = 60
 
 
 @dataclass
@@ -56,12 +69,17 @@ class SearchResult:
 class EnhancedVectorStore(VectorStore):
     """Enhanced vector store with hybrid search and optimization features."""
 
-    def __init__(self, url: str | None = None, api_key: str | None = None):
+    def __init__(
+        self, url: str | None = None, api_key: str | None = None, sparse_encoder: BM25SparseEncoder | None = None
+    ):
         """Initialize enhanced vector store with Qdrant backend.
 
         Args:
             url: Qdrant server URL (or ":memory:" for in-memory instance)
             api_key: Optional API key for authentication
+            sparse_encoder: BM25 encoder for the sparse leg; by default one whose statistics
+                live in ``SPARSE_STATS_DB_PATH`` (``./data/sparse_stats.db`` when unset, in
+                memory for an in-memory Qdrant)
         """
         # Initialize parent class (takes no arguments)
         super().__init__()
@@ -75,6 +93,9 @@ class EnhancedVectorStore(VectorStore):
         # Initialize Qdrant client if available
         self.client: _QdrantClient | None = None
         self._sparse_vectors_supported: bool = False
+        self.sparse_encoder = sparse_encoder or BM25SparseEncoder(SparseStatsStore(self._sparse_stats_path(url)))
+        # Physical collection name -> whether it has the "text" sparse vector
+        self._sparse_collections: dict[str, bool] = {}
 
         if QDRANT_AVAILABLE:
             try:
@@ -96,6 +117,19 @@ class EnhancedVectorStore(VectorStore):
         else:
             logger.warning("Qdrant not available - enhanced features disabled")
 
+    @staticmethod
+    def _sparse_stats_path(url: str | None) -> str:
+        """Where the BM25 statistics live; they must survive as long as the Qdrant collections."""
+        if url == ":memory:":
+            return os.getenv("SPARSE_STATS_DB_PATH", ":memory:")
+        path = os.getenv("SPARSE_STATS_DB_PATH") or DEFAULT_SPARSE_STATS_DB_PATH
+        if path == ":memory:":
+            logger.warning(
+                "SPARSE_STATS_DB_PATH=:memory: with a persistent Qdrant: BM25 statistics are lost on restart "
+                "and sparse (keyword) scores will be wrong until every collection is re-indexed"
+            )
+        return path
+
     def _check_qdrant_capabilities(self) -> None:
         """Check available Qdrant features and log capabilities."""
         if not QDRANT_AVAILABLE:
@@ -172,12 +206,66 @@ class EnhancedVectorStore(VectorStore):
             )
             # Store namespace-to-physical-name mapping for future lookups
             self._physical_names[namespace] = collection_name
+            self._sparse_collections[collection_name] = sparse_vectors_config is not None
             logger.info(f"Created enhanced collection with hybrid search: {collection_name}")
             return True
         except Exception as e:
             logger.error(f"Failed to create enhanced collection {collection_name}: {e}")
             return False
 
+    def upsert(self, namespace: str, records: Sequence[VectorRecord]) -> None:
+        """Upsert records with their dense vector and, when enabled, a BM25 vector of ``content``.
+
+        Without a Qdrant client this falls back to the in-memory store. Each
+        record's ``metadata`` becomes the point payload, plus ``content`` and
+        the original ``record_id``.
+        """
+        if not QDRANT_AVAILABLE or self.client is None:
+            super().upsert(namespace, records)
+            return
+        if any(record.vector is None for record in records):
+            raise ValueError("EnhancedVectorStore.upsert requires a dense vector on every record")
+        collection_name = self._physical_names.get(namespace, namespace.replace(":", "__"))
+        from qdrant_client.http import models as qmodels
+
+        point_ids = [self._point_id(record.id) for record in records]
+        sparse = None
+        if self._sparse_vectors_supported and self._has_sparse(collection_name):
+            sparse = self.sparse_encoder.encode_documents(
+                collection_name, [record.content for record in records], doc_ids=[str(p) for p in point_ids]
+            )
+        points = []
+        for i, record in enumerate(records):
+            vector: dict[str, Any] = {"": list(record.vector or [])}
+            if sparse is not None:
+                vector["text"] = sparse[i].to_qdrant()
+            payload = {**record.metadata, "content": record.content, "record_id": record.id}
+            points.append(qmodels.PointStruct(id=point_ids[i], vector=vector, payload=payload))
+        self.client.upsert(collection_name=collection_name, points=points)
+
+    @staticmethod
+    def _point_id(record_id: str | None) -> int | str:
+        """Qdrant point id (unsigned int or UUID) for a record id; other strings map to a stable UUID."""
+        if record_id is None:
+            return str(uuid.uuid4())
+        if record_id.isdigit():
+            return int(record_id)
+        try:
+            return str(uuid.UUID(record_id))
+        except ValueError:
+            return str(uuid.uuid5(uuid.NAMESPACE_URL, record_id))
+
+    def _has_sparse(self, collection_name: str) -> bool:
+        """Whether the collection was created with the "text" sparse vector (cached)."""
+        if collection_name not in self._sparse_collections:
+            try:
+                info = self.client.get_collection(collection_name)  # type: ignore[union-attr]
+                params = getattr(getattr(info, "config", None), "params", None)
+                self._sparse_collections[collection_name] = "text" in (getattr(params, "sparse_vectors", None) or {})
+            except Exception:
+                return False
+        return self._sparse_collections[collection_name]
+
     def hybrid_search(
         self,
         namespace: str,
@@ -187,7 +275,11 @@ class EnhancedVectorStore(VectorStore):
         score_threshold: float = 0.7,
         filter_conditions: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
-        """Perform hybrid search combining dense and sparse vectors."""
+        """Perform hybrid search combining dense and sparse vectors.
+
+        ``score_threshold`` applies to the dense (cosine) leg only; BM25 scores
+        are unbounded and the fusion step ranks them against the dense results.
+        """
         if not QDRANT_AVAILABLE or self.client is None:
             logger.warning("Qdrant not available or client not initialized")
             return []
@@ -198,37 +290,21 @@ class EnhancedVectorStore(VectorStore):
             logger.warning(f"Collection {collection_name} does not exist for hybrid search")
             return []
         try:
-            search_requests = []
-            from qdrant_client.http import models as qmodels
-
-            dense_request = qmodels.SearchRequest(
-                vector=qmodels.NamedVector(name="", vector=query_vector),
-                limit=limit * 2,
-                score_threshold=score_threshold * 0.8,
-                with_payload=True,
-                with_vector=False,
-            )
-            if filter_conditions:
-                dense_request.filter = self._build_filter(filter_conditions)
-            search_requests.append(dense_request)
+            query_filter = self._build_filter(filter_conditions) if filter_conditions else None
             sparse_results: list[Any] = []
-            if self._sparse_vectors_supported and query_text.strip():
+            if self._sparse_vectors_supported and query_text.strip() and self._has_sparse(collection_name):
                 try:
-                    sparse_vector = self._text_to_sparse_vector(query_text)
-                    sparse_request = qmodels.SearchRequest(
-                        vector=qmodels.NamedSparseVector(name="text", vector=sparse_vector),
-                        limit=limit * 2,
-                        score_threshold=score_threshold * 0.6,
-                        with_payload=True,
-                        with_vector=False,
-                    )
-                    if filter_conditions:
-                        sparse_request.filter = self._build_filter(filter_conditions)
-                    sparse_results = self.client.search(collection_name=collection_name, **sparse_request.dict())
+                    sparse_vector = self.sparse_encoder.encode_query(collection_name, query_text)
+                    if sparse_vector.indices:
+                        sparse_results = self._search(
+                            collection_name, sparse_vector.to_qdrant(), "text", limit * 2, None, query_filter
+                        )
                 except Exception as e:
                     logger.warning(f"Sparse search failed: {e}")
                     sparse_results = []
-            dense_results = self.client.search(collection_name=collection_name, **dense_request.dict())
+            dense_results = self._search(
+                collection_name, query_vector, "", limit * 2, score_threshold * 0.8, query_filter
+            )
             hybrid_results = self._combine_search_results(
                 dense_results=dense_results, sparse_results=sparse_results, limit=limit
             )
@@ -237,22 +313,45 @@ class EnhancedVectorStore(VectorStore):
             logger.error(f"Hybrid search failed for {collection_name}: {e}")
             return []
 
-    def _text_to_sparse_vector(self, text: str) -> Any:
-        """Convert text to sparse vector using simple TF-IDF approximation."""
+    def _search(
+        self,
+        collection_name: str,
+        query: Any,
+        using: str,
+        limit: int,
+        score_threshold: float | None,
+        query_filter: Any,
+    ) -> list[Any]:
+        """One leg of the hybrid search; ``using`` is "" for the dense vector, "text" for the sparse one."""
         from qdrant_client.http import models as qmodels
 
-        words = text.lower().split()
-        word_counts: dict[str, int] = {}
-        for word in words:
-            word_counts[word] = word_counts.get(word, 0) + 1
-        indices = []
-        values = []
-        for word, count in word_counts.items():
-            term_id = hash(word) % 10000
-            weight = math.log(1 + count)
-            indices.append(term_id)
-            values.append(weight)
-        return qmodels.SparseVector(indices=indices, values=values)
+        query_points = getattr(self.client, "query_points", None)
+        if callable(query_points):
+            response = query_points(
+                collection_name=collection_name,
+                query=query,
+                using=using or None,
+                query_filter=query_filter,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=True,
+                with_vectors=False,
+            )
+            return list(response.points)
+        # qdrant-client < 1.10
+        if isinstance(query, qmodels.SparseVector):
+            named: Any = qmodels.NamedSparseVector(name=using, vector=query)
+        else:
+            named = qmodels.NamedVector(name=using, vector=query)
+        return self.client.search(  # type: ignore[union-attr]
+            collection_name=collection_name,
+            query_vector=named,
+            query_filter=query_filter,
+            limit=limit,
+            score_threshold=score_threshold,
+            with_payload=True,
+            with_vectors=False,
+        )
 
     def _build_filter(self, conditions: dict[str, Any]) -> Any:
         """Build Qdrant filter from conditions."""
@@ -272,33 +371,35 @@ class EnhancedVectorStore(VectorStore):
     def _combine_search_results(
         self, dense_results: list[Any], sparse_results: list[Any], limit: int
     ) -> list[SearchResult]:
-        """Combine and re-rank dense and sparse search results."""
-        results_map = {}
-        for result in dense_results:
-            result_id = str(result.id)
-            results_map[result_id] = SearchResult(
-                id=result_id,
-                payload=result.payload or {},
-                dense_score=result.score,
-                sparse_score=None,
-                hybrid_score=result.score * self.hybrid_config.dense_weight,
-            )
-        for result in sparse_results:
-            result_id = str(result.id)
-            if result_id in results_map:
-                results_map[result_id].sparse_score = result.score
-                results_map[result_id].hybrid_score = (
-                    results_map[result_id].dense_score * self.hybrid_config.dense_weight
-                    + result.score * self.hybrid_config.sparse_weight
-                )
+        """Fuse dense and sparse results by rank (RRF) or by min-max normalized score.
+
+        ``hybrid_score`` is the fused score, weighted per leg by ``dense_weight``
+        and ``sparse_weight``; ``dense_score``/``sparse_score`` keep the raw scores.
+        """
+        config = self.hybrid_config
+        results_map: dict[str, SearchResult] = {}
+        legs = (
+            (dense_results, config.dense_weight, "dense_score"),
+            (sparse_results, config.sparse_weight, "sparse_score"),
+        )
+        for results, weight, score_field in legs:
+            if not results:
+                continue
+            if config.fusion == "normalized":
+                scores = [result.score for result in results]
+                low, span = min(scores), max(scores) - min(scores)
+                contributions = [weight * ((s - low) / span if span else 1.0) for s in scores]
             else:
-                results_map[result_id] = SearchResult(
-                    id=result_id,
-                    payload=result.payload or {},
-                    dense_score=0.0,
-                    sparse_score=result.score,
-                    hybrid_score=result.score * self.hybrid_config.sparse_weight,
-                )
+                contributions = [weight / (config.rrf_k + rank) for rank in range(1, len(results) + 1)]
+            for result, contribution in zip(results, contributions, strict=True):
+                result_id = str(result.id)
+                entry = results_map.get(result_id)
+                if entry is None:
+                    entry = results_map[result_id] = SearchResult(
+                        id=result_id, payload=result.payload or {}, dense_score=0.0, hybrid_score=0.0
+                    )
+                setattr(entry, score_field, result.score)
+                entry.hybrid_score = (entry.hybrid_score or 0.0) + contribution
         sorted_results = sorted(results_map.values(), key=lambda x: x.hybrid_score or 0.0, reverse=True)
         return sorted_results[:limit]
 
@@ -325,6 +426,7 @@ class EnhancedVectorStore(VectorStore):
                 },
                 "quantization_enabled": getattr(cfg, "quantization_config", None) is not None,
                 "sparse_vectors_enabled": bool(getattr(cfg, "sparse_vectors_config", None)),
+                "sparse_encoder": self.sparse_encoder.get_stats(collection_name),
             }
             try:
                 get_ci = getattr(self.client, "get_cluster_info", None)
@@ -0,0 +1,153 @@
+"""Level-synchronous BFS shared by the UnifiedGraphStore backends.
+
+The traversal expands a whole BFS frontier per call to the backend's
+``fetch`` function (``node ids -> {node_id: edges}``), so a depth-``d``
+traversal costs about ``d`` queries instead of one per visited node.
+Adjacency lists already fetched are kept in a per-namespace LRU
+(:class:`AdjacencyCache`) and only missing ones are fetched. A node and edge
+budget cuts the traversal off early on dense graphs; the result records
+whether that happened.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from platform.cache.bounded_cache import BoundedLRUCache
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+    AdjacencyFetcher = Callable[[Sequence[str]], Mapping[str, Sequence[dict[str, Any]]]]
+
+DEFAULT_MAX_NODES = 5_000
+DEFAULT_MAX_EDGES = 50_000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_ADJACENCY_CACHE_SIZE = 10_000
+DEFAULT_ADJACENCY_CACHE_TTL = 600
+
+
+@dataclass
+class TraversalResult:
+    """Nodes reached (BFS order, with depth), edges followed and traversal cost."""
+
+    depths: dict[str, int] = field(default_factory=dict)
+    edges: list[dict[str, Any]] = field(default_factory=list)
+    depth_reached: int = 0
+    truncated: bool = False
+    round_trips: int = 0
+    cache_hits: int = 0
+
+    @property
+    def nodes(self) -> list[str]:
+        return list(self.depths)
+
+
+class AdjacencyCache:
+    """Per-namespace LRU of node id -> outgoing edges."""
+
+    def __init__(
+        self, max_entries: int = DEFAULT_ADJACENCY_CACHE_SIZE, ttl: int = DEFAULT_ADJACENCY_CACHE_TTL
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._namespaces: dict[str, BoundedLRUCache] = {}
+
+    def _cache(self, namespace: str) -> BoundedLRUCache:
+        cache = self._namespaces.get(namespace)
+        if cache is None:
+            cache = BoundedLRUCache(max_size=self.max_entries, ttl=self.ttl, name=f"graph_adjacency_{namespace}")
+            self._namespaces[namespace] = cache
+        return cache
+
+    def get_many(self, namespace: str, node_ids: Iterable[str]) -> dict[str, tuple[dict[str, Any], ...]]:
+        cache = self._cache(namespace)
+        found = {}
+        for node_id in node_ids:
+            edges = cache.get(node_id)
+            if edges is not None:
+                found[node_id] = edges
+        return found
+
+    def put_many(self, namespace: str, adjacency: Mapping[str, Sequence[dict[str, Any]]]) -> None:
+        cache = self._cache(namespace)
+        for node_id, edges in adjacency.items():
+            cache.set(node_id, tuple(edges))
+
+    def invalidate(self, namespace: str, node_ids: Iterable[str] | None = None) -> None:
+        """Drop cached adjacency for ``node_ids`` (the whole namespace when None)."""
+        cache = self._namespaces.get(namespace)
+        if cache is None:
+            return
+        if node_ids is None:
+            cache.clear()
+            return
+        for node_id in node_ids:
+            cache.delete(node_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {namespace: cache.get_stats() for namespace, cache in self._namespaces.items()}
+
+
+def traverse_frontier(
+    start_node: str,
+    fetch: AdjacencyFetcher,
+    *,
+    max_depth: int,
+    relation_filter: Iterable[str] | None = None,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    max_edges: int = DEFAULT_MAX_EDGES,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cache: AdjacencyCache | None = None,
+    namespace: str = "default",
+) -> TraversalResult:
+    """BFS from ``start_node`` up to ``max_depth`` hops, one ``fetch`` per frontier batch.
+
+    ``fetch`` returns the outgoing edges (dicts with at least ``target`` and
+    ``relation``) of the ids it knows; ids it omits are treated as nodes
+    without edges. Nodes at ``max_depth`` are reached but not expanded.
+    """
+    relations = set(relation_filter) if relation_filter else None
+    result = TraversalResult(depths={start_node: 0})
+    frontier = [start_node]
+    depth = 0
+    while frontier and depth < max_depth and not result.truncated:
+        adjacency: dict[str, Sequence[dict[str, Any]]] = {}
+        missing = frontier
+        if cache is not None:
+            adjacency.update(cache.get_many(namespace, frontier))
+            result.cache_hits += len(adjacency)
+            missing = [node_id for node_id in frontier if node_id not in adjacency]
+        for offset in range(0, len(missing), batch_size):
+            chunk = missing[offset : offset + batch_size]
+            fetched = dict(fetch(chunk))
+            result.round_trips += 1
+            fetched.update({node_id: () for node_id in chunk if node_id not in fetched})
+            if cache is not None:
+                cache.put_many(namespace, fetched)
+            adjacency.update(fetched)
+
+        next_frontier: list[str] = []
+        for source in frontier:
+            for edge in adjacency.get(source, ()):
+                if relations is not None and edge.get("relation") not in relations:
+                    continue
+                if len(result.edges) >= max_edges:
+                    result.truncated = True
+                    break
+                target = edge["target"]
+                if target not in result.depths:
+                    if len(result.depths) >= max_nodes:
+                        result.truncated = True
+                        continue
+                    result.depths[target] = depth + 1
+                    next_frontier.append(target)
+                result.edges.append({"source": source, **edge})
+        depth += 1
+        frontier = next_frontier
+    result.depth_reached = max(result.depths.values())
+    return result
+
+
+__all__ = ["AdjacencyCache", "TraversalResult", "traverse_frontier"]
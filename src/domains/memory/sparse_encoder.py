@@ -0,0 +1,306 @@
+"""BM25 sparse vectors with a stable hashed vocabulary and per-collection statistics.
+
+Term ids are the first four bytes of the token's BLAKE2b digest, so a token
+maps to the same id in every process and after restarts (Python's ``hash``
+is salted per process), and collisions are rare in the uint32 space Qdrant
+uses for sparse indices.
+
+The BM25 score is split between the two vectors so that the dot product
+Qdrant computes is the score itself:
+
+- documents carry the saturated, length-normalized term frequency
+  ``tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl))``;
+- queries carry each term's IDF, ``log(1 + (N - df + 0.5) / (df + 0.5))``.
+
+IDF is therefore read from the collection's current document frequencies at
+query time, and stored vectors never need re-encoding as the corpus grows;
+only ``avgdl`` is fixed when a document is upserted. Document counts,
+lengths and frequencies live in SQLite (:class:`SparseStatsStore`) and are
+updated with deltas, so several processes can share one file. Documents
+upserted with an id are remembered, so re-upserting or removing them keeps
+the statistics exact.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have he her his i if in into is it its of on or our she so "
+    "than that the their them then there these they this to was we were what when which who will with you".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased word tokens of ``text`` (Unicode letters and digits), without stopwords."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+@lru_cache(maxsize=100_000)
+def term_id(token: str) -> int:
+    """Stable uint32 id of ``token``."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+@dataclass
+class SparseEmbedding:
+    """Sparse vector as parallel ``indices``/``values`` lists, as Qdrant expects."""
+
+    indices: list[int] = field(default_factory=list)
+    values: list[float] = field(default_factory=list)
+
+    def to_qdrant(self) -> Any:
+        from qdrant_client.http import models as qmodels
+
+        return qmodels.SparseVector(indices=self.indices, values=self.values)
+
+
+@dataclass
+class CollectionStats:
+    """Corpus size and total token count of one collection."""
+
+    doc_count: int = 0
+    total_length: int = 0
+
+    @property
+    def avgdl(self) -> float:
+        return self.total_length / self.doc_count if self.doc_count else 0.0
+
+
+class SparseStatsStore:
+    """SQLite-backed document frequencies and corpus statistics per collection."""
+
+    def __init__(self, path: str = ":memory:") -> None:
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sparse_collections (
+                collection TEXT PRIMARY KEY,
+                doc_count INTEGER NOT NULL,
+                total_length INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sparse_df (
+                collection TEXT NOT NULL,
+                term_id INTEGER NOT NULL,
+                df INTEGER NOT NULL,
+                PRIMARY KEY (collection, term_id)
+            );
+            CREATE TABLE IF NOT EXISTS sparse_documents (
+                collection TEXT NOT NULL,
+                doc_id TEXT NOT NULL,
+                length INTEGER NOT NULL,
+                terms_json TEXT NOT NULL,
+                PRIMARY KEY (collection, doc_id)
+            );
+            """
+        )
+        self.conn.commit()
+
+    def collection_stats(self, collection: str) -> CollectionStats:
+        row = self.conn.execute(
+            "SELECT doc_count, total_length FROM sparse_collections WHERE collection = ?", (collection,)
+        ).fetchone()
+        return CollectionStats(row["doc_count"], row["total_length"]) if row else CollectionStats()
+
+    def document_frequencies(self, collection: str, term_ids: Sequence[int]) -> dict[int, int]:
+        found: dict[int, int] = {}
+        for offset in range(0, len(term_ids), 500):
+            chunk = list(term_ids[offset : offset + 500])
+            rows = self.conn.execute(
+                f"SELECT term_id, df FROM sparse_df WHERE collection = ? AND term_id IN ({','.join('?' * len(chunk))})",
+                (collection, *chunk),
+            ).fetchall()
+            found.update({row["term_id"]: row["df"] for row in rows})
+        return found
+
+    def documents(self, collection: str, doc_ids: Sequence[str]) -> dict[str, tuple[int, list[int]]]:
+        """``{doc_id: (length, term ids)}`` for the ``doc_ids`` already recorded."""
+        found: dict[str, tuple[int, list[int]]] = {}
+        for offset in range(0, len(doc_ids), 500):
+            chunk = list(doc_ids[offset : offset + 500])
+            rows = self.conn.execute(
+                "SELECT doc_id, length, terms_json FROM sparse_documents "
+                f"WHERE collection = ? AND doc_id IN ({','.join('?' * len(chunk))})",
+                (collection, *chunk),
+            ).fetchall()
+            found.update({row["doc_id"]: (row["length"], json.loads(row["terms_json"])) for row in rows})
+        return found
+
+    def apply(
+        self,
+        collection: str,
+        *,
+        doc_delta: int,
+        length_delta: int,
+        df_delta: dict[int, int],
+        put_documents: Sequence[tuple[str, int, list[int]]] = (),
+        delete_documents: Sequence[str] = (),
+    ) -> CollectionStats:
+        """Apply one batch of changes in a single transaction and return the new totals."""
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO sparse_collections (collection, doc_count, total_length) VALUES (?, ?, ?)
+                ON CONFLICT(collection) DO UPDATE SET
+                    doc_count = doc_count + excluded.doc_count,
+                    total_length = total_length + excluded.total_length
+                """,
+                (collection, doc_delta, length_delta),
+            )
+            changed = [(collection, term, delta) for term, delta in df_delta.items() if delta]
+            self.conn.executemany(
+                """
+                INSERT INTO sparse_df (collection, term_id, df) VALUES (?, ?, ?)
+                ON CONFLICT(collection, term_id) DO UPDATE SET df = df + excluded.df
+                """,
+                changed,
+            )
+            self.conn.executemany(
+                "DELETE FROM sparse_df WHERE collection = ? AND term_id = ? AND df <= 0",
+                [(collection, term) for _, term, delta in changed if delta < 0],
+            )
+            self.conn.executemany(
+                "DELETE FROM sparse_documents WHERE collection = ? AND doc_id = ?",
+                [(collection, doc_id) for doc_id in delete_documents],
+            )
+            self.conn.executemany(
+                """
+                INSERT INTO sparse_documents (collection, doc_id, length, terms_json) VALUES (?, ?, ?, ?)
+                ON CONFLICT(collection, doc_id) DO UPDATE SET
+                    length = excluded.length, terms_json = excluded.terms_json
+                """,
+                [(collection, doc_id, length, json.dumps(terms)) for doc_id, length, terms in put_documents],
+            )
+        return self.collection_stats(collection)
+
+    def drop_collection(self, collection: str) -> None:
+        with self.conn:
+            for table in ("sparse_collections", "sparse_df", "sparse_documents"):
+                self.conn.execute(f"DELETE FROM {table} WHERE collection = ?", (collection,))
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class BM25SparseEncoder:
+    """Batch BM25 encoder for documents and queries, keyed by collection."""
+
+    def __init__(self, store: SparseStatsStore | None = None, *, k1: float = 1.2, b: float = 0.75) -> None:
+        self.store = store or SparseStatsStore()
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+
+    def encode_documents(
+        self, collection: str, texts: Sequence[str], doc_ids: Sequence[str] | None = None
+    ) -> list[SparseEmbedding]:
+        """Add ``texts`` to the collection's statistics and return their document vectors.
+
+        With ``doc_ids``, documents already recorded under the same id are
+        replaced rather than counted twice, and can later be removed with
+        :meth:`remove_documents`.
+        """
+        if doc_ids is not None and len(doc_ids) != len(texts):
+            raise ValueError("doc_ids must have one id per text")
+        counts = [Counter(term_id(token) for token in tokenize(text)) for text in texts]
+        lengths = [sum(c.values()) for c in counts]
+        df_delta: Counter[int] = Counter()
+        for c in counts:
+            df_delta.update(c.keys())
+        doc_delta, length_delta = len(texts), sum(lengths)
+        with self._lock:
+            put: list[tuple[str, int, list[int]]] = []
+            if doc_ids is not None:
+                latest = {doc_id: i for i, doc_id in enumerate(doc_ids)}
+                for doc_id, i in latest.items():
+                    put.append((doc_id, lengths[i], sorted(counts[i])))
+                # Earlier copies of an id in this batch and ids seen in earlier batches are replaced.
+                for i, doc_id in enumerate(doc_ids):
+                    if latest[doc_id] != i:
+                        doc_delta, length_delta = doc_delta - 1, length_delta - lengths[i]
+                        df_delta.subtract(counts[i].keys())
+                for old_length, old_terms in self.store.documents(collection, list(latest)).values():
+                    doc_delta, length_delta = doc_delta - 1, length_delta - old_length
+                    df_delta.subtract(old_terms)
+            stats = self.store.apply(
+                collection, doc_delta=doc_delta, length_delta=length_delta, df_delta=dict(df_delta), put_documents=put
+            )
+        return [self._document_vector(c, length, stats.avgdl) for c, length in zip(counts, lengths, strict=True)]
+
+    def _document_vector(self, counts: Counter[int], length: int, avgdl: float) -> SparseEmbedding:
+        norm = self.k1 * (1 - self.b + self.b * length / avgdl) if avgdl else self.k1
+        indices = sorted(counts)
+        return SparseEmbedding(indices, [counts[i] * (self.k1 + 1) / (counts[i] + norm) for i in indices])
+
+    def remove_documents(self, collection: str, doc_ids: Sequence[str]) -> None:
+        """Remove previously encoded documents from the collection's statistics."""
+        with self._lock:
+            known = self.store.documents(collection, list(dict.fromkeys(doc_ids)))
+            if not known:
+                return
+            df_delta: Counter[int] = Counter()
+            for _, terms in known.values():
+                df_delta.subtract(terms)
+            self.store.apply(
+                collection,
+                doc_delta=-len(known),
+                length_delta=-sum(length for length, _ in known.values()),
+                df_delta=dict(df_delta),
+                delete_documents=list(known),
+            )
+
+    def encode_queries(self, collection: str, texts: Iterable[str]) -> list[SparseEmbedding]:
+        """IDF-weighted query vectors; terms no document in the collection contains are dropped."""
+        counts = [Counter(term_id(token) for token in tokenize(text)) for text in texts]
+        vocabulary = sorted(set().union(*counts)) if counts else []
+        with self._lock:
+            stats = self.store.collection_stats(collection)
+            df = self.store.document_frequencies(collection, vocabulary)
+        embeddings = []
+        for c in counts:
+            indices = sorted(term for term in c if df.get(term))
+            values = [c[term] * self.idf(df[term], stats.doc_count) for term in indices]
+            embeddings.append(SparseEmbedding(indices, values))
+        return embeddings
+
+    def encode_query(self, collection: str, text: str) -> SparseEmbedding:
+        return self.encode_queries(collection, [text])[0]
+
+    @staticmethod
+    def idf(df: int, doc_count: int) -> float:
+        return math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+
+    def get_stats(self, collection: str) -> dict[str, Any]:
+        stats = self.store.collection_stats(collection)
+        return {"doc_count": stats.doc_count, "avgdl": stats.avgdl, "k1": self.k1, "b": self.b}
+
+
+__all__ = [
+    "BM25SparseEncoder",
+    "CollectionStats",
+    "SparseEmbedding",
+    "SparseStatsStore",
+    "term_id",
+    "tokenize",
+]
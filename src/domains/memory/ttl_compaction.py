@@ -0,0 +1,451 @@
+"""Index-driven TTL compaction for Qdrant memory collections.
+
+Points that expire carry an integer ``expires_at`` payload field (unix
+seconds), written at upsert time from ``created_at + _ttl`` and covered by a
+payload index. Compaction never reads payloads: each step counts the points
+with ``expires_at <= upper`` and deletes them with the same range filter, so
+Qdrant resolves both from the index and the cost follows the expired volume,
+not the collection size. What remains is read from the collection's point
+count rather than a rescan.
+
+Work is cut into steps of at most ``max_batch`` points by moving ``upper``
+through expiry time with an adaptive window: it starts out covering
+everything up to now, is halved while a step would be too large and doubled
+after small steps, so a run that has caught up costs one count and one
+delete. After each step the collection's checkpoint (the ``upper`` reached
+and the window) is saved, so a run that stops on its time budget or
+``max_delete`` resumes where it left off. The filter has no lower bound, so
+points that arrive later with an already passed ``expires_at`` are still
+collected.
+
+Points written before ``expires_at`` existed are backfilled once per
+collection from ``created_at``/``_ttl``, also resumably.
+
+:class:`CompactionScheduler` runs the compactor for every tenant's
+collections on its own interval; with ``discover=True`` it schedules every
+tenant that has a memory collection in Qdrant. The bot starts it through
+``services.maintenance.start_compaction_scheduler`` when
+``ENABLE_MEMORY_COMPACTION`` is on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ultimate_discord_intelligence_bot.obs.metrics import get_metrics
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from ultimate_discord_intelligence_bot.tenancy.context import TenantContext
+
+logger = logging.getLogger(__name__)
+
+EXPIRES_AT_FIELD = "expires_at"
+DEFAULT_MAX_BATCH = 10_000
+
+
+def expires_at_for(payload: dict[str, Any]) -> int | None:
+    """``created_at + _ttl`` for payloads with both set and positive, else None."""
+    try:
+        created = int(payload.get("created_at", 0))
+        ttl = int(payload.get("_ttl", 0))
+    except (TypeError, ValueError):
+        return None
+    if created <= 0 or ttl <= 0:
+        return None
+    return created + ttl
+
+
+def supports_filtered_compaction(client: Any) -> bool:
+    """Whether ``client`` has the qdrant-client ``count``/``delete`` API the compactor needs."""
+    return callable(getattr(client, "count", None)) and callable(getattr(client, "delete", None))
+
+
+def ensure_expiry_index(client: Any, collection: str) -> bool:
+    """Create the integer payload index on ``expires_at`` (idempotent, best effort)."""
+    try:
+        from qdrant_client.http import models as qmodels
+
+        client.create_payload_index(
+            collection_name=collection, field_name=EXPIRES_AT_FIELD, field_schema=qmodels.PayloadSchemaType.INTEGER
+        )
+        return True
+    except Exception as exc:
+        logger.debug("Could not create %s index on %s: %s", EXPIRES_AT_FIELD, collection, exc)
+        return False
+
+
+@dataclass
+class CompactionCheckpoint:
+    """Progress of one collection: expired points up to ``watermark`` are gone."""
+
+    watermark: int = 0
+    window: int = 0
+    backfilled: bool = False
+    backfill_offset: Any = None
+
+
+class CompactionCheckpointStore:
+    """SQLite-backed compaction checkpoints, one row per physical collection."""
+
+    def __init__(self, path: str = ":memory:") -> None:
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS memory_compaction_checkpoints (
+                collection TEXT PRIMARY KEY,
+                state_json TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def load(self, collection: str) -> CompactionCheckpoint:
+        row = self.conn.execute(
+            "SELECT state_json FROM memory_compaction_checkpoints WHERE collection = ?", (collection,)
+        ).fetchone()
+        return CompactionCheckpoint(**json.loads(row["state_json"])) if row else CompactionCheckpoint()
+
+    def save(self, collection: str, checkpoint: CompactionCheckpoint) -> None:
+        self.conn.execute(
+            """
+            INSERT INTO memory_compaction_checkpoints (collection, state_json, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT(collection) DO UPDATE SET
+                state_json = excluded.state_json, updated_at = excluded.updated_at
+            """,
+            (collection, json.dumps(asdict(checkpoint)), time.time()),
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+@lru_cache(maxsize=1)
+def default_checkpoint_store() -> CompactionCheckpointStore:
+    """Process-wide store at ``MEMORY_COMPACTION_CHECKPOINT_PATH`` (default ``./data/memory_compaction.db``)."""
+    return CompactionCheckpointStore(os.getenv("MEMORY_COMPACTION_CHECKPOINT_PATH", "./data/memory_compaction.db"))
+
+
+@dataclass
+class CompactionReport:
+    collection: str
+    deleted: int = 0
+    backfilled: int = 0
+    remaining: int = -1
+    watermark: int = 0
+    complete: bool = False
+    round_trips: int = 0
+    duration_s: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class TTLCompactor:
+    """Delete expired points with index-driven range filters, incrementally and resumably."""
+
+    def __init__(
+        self,
+        client: Any,
+        checkpoints: CompactionCheckpointStore | None = None,
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        backfill_batch: int = 1_000,
+    ) -> None:
+        self.client = client
+        self.checkpoints = checkpoints or default_checkpoint_store()
+        self.max_batch = max_batch
+        self.backfill_batch = backfill_batch
+        self._indexed: set[str] = set()
+
+    @staticmethod
+    def _expired_filter(upper: int) -> Any:
+        from qdrant_client.http import models as qmodels
+
+        return qmodels.Filter(must=[qmodels.FieldCondition(key=EXPIRES_AT_FIELD, range=qmodels.Range(lte=upper))])
+
+    def compact(
+        self,
+        collection: str,
+        *,
+        now: int | None = None,
+        time_budget_s: float | None = None,
+        max_delete: int | None = None,
+    ) -> CompactionReport:
+        """Delete points of ``collection`` (physical name) that expired by ``now``.
+
+        Stops early when ``time_budget_s`` elapses or ``max_delete`` points are
+        deleted; ``complete`` in the report says whether it caught up with ``now``.
+        """
+        from qdrant_client.http import models as qmodels
+
+        started = time.monotonic()
+        deadline = started + time_budget_s if time_budget_s is not None else None
+        now = int(time.time()) if now is None else int(now)
+        report = CompactionReport(collection=collection)
+        if collection not in self._indexed and ensure_expiry_index(self.client, collection):
+            self._indexed.add(collection)
+        checkpoint = self.checkpoints.load(collection)
+        if not checkpoint.backfilled:
+            report.backfilled = self._backfill(collection, checkpoint, report, deadline)
+
+        window = checkpoint.window or max(1, now - checkpoint.watermark)
+        while checkpoint.backfilled and checkpoint.watermark < now:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            upper = min(now, checkpoint.watermark + window)
+            expired = self._expired_filter(upper)
+            pending = self.client.count(collection_name=collection, count_filter=expired, exact=True).count
+            report.round_trips += 1
+            if pending > self.max_batch and window > 1:
+                window //= 2
+                continue
+            if max_delete is not None and report.deleted + pending > max_delete:
+                # Partial step: delete just enough ids and leave the watermark where it is.
+                budget = max_delete - report.deleted
+                if budget > 0:
+                    points, _ = self.client.scroll(
+                        collection_name=collection, scroll_filter=expired, limit=budget, with_payload=False
+                    )
+                    ids = [point.id for point in points]
+                    self.client.delete(collection_name=collection, points_selector=qmodels.PointIdsList(points=ids))
+                    report.round_trips += 2
+                    report.deleted += len(ids)
+                break
+            if pending:
+                self.client.delete(collection_name=collection, points_selector=qmodels.FilterSelector(filter=expired))
+                report.round_trips += 1
+                report.deleted += pending
+            checkpoint.watermark = upper
+            if pending < self.max_batch // 2:
+                window *= 2
+            checkpoint.window = window
+            self.checkpoints.save(collection, checkpoint)
+
+        report.watermark = checkpoint.watermark
+        report.complete = checkpoint.backfilled and checkpoint.watermark >= now
+        report.remaining = self._point_count(collection)
+        report.round_trips += 1
+        report.duration_s = time.monotonic() - started
+        get_metrics().counter("memory_compaction_deleted_total", labels={"mode": "indexed"}).inc(report.deleted)
+        return report
+
+    def _backfill(
+        self, collection: str, checkpoint: CompactionCheckpoint, report: CompactionReport, deadline: float | None
+    ) -> int:
+        """Set ``expires_at`` on points that only have ``created_at``/``_ttl``; returns points updated."""
+        from qdrant_client.http import models as qmodels
+
+        legacy = qmodels.Filter(
+            must=[qmodels.IsEmptyCondition(is_empty=qmodels.PayloadField(key=EXPIRES_AT_FIELD))],
+            must_not=[qmodels.IsEmptyCondition(is_empty=qmodels.PayloadField(key="_ttl"))],
+        )
+        updated = 0
+        while deadline is None or time.monotonic() < deadline:
+            points, next_offset = self.client.scroll(
+                collection_name=collection,
+                scroll_filter=legacy,
+                limit=self.backfill_batch,
+                offset=checkpoint.backfill_offset,
+                with_payload=["created_at", "_ttl"],
+            )
+            report.round_trips += 1
+            by_expiry: dict[int, list[Any]] = {}
+            for point in points:
+                expires_at = expires_at_for(point.payload or {})
+                if expires_at is not None:
+                    by_expiry.setdefault(expires_at, []).append(point.id)
+            if by_expiry:
+                operations = [
+                    qmodels.SetPayloadOperation(
+                        set_payload=qmodels.SetPayload(payload={EXPIRES_AT_FIELD: expires_at}, points=ids)
+                    )
+                    for expires_at, ids in by_expiry.items()
+                ]
+                self.client.batch_update_points(collection_name=collection, update_operations=operations)
+                report.round_trips += 1
+                updated += sum(len(ids) for ids in by_expiry.values())
+            checkpoint.backfill_offset = next_offset
+            checkpoint.backfilled = next_offset is None
+            self.checkpoints.save(collection, checkpoint)
+            if checkpoint.backfilled:
+                break
+        return updated
+
+    def _point_count(self, collection: str) -> int:
+        try:
+            info = self.client.get_collection(collection)
+            count = getattr(info, "points_count", None)
+            if count is None:
+                count = getattr(info, "vectors_count", None)
+            return int(count) if count is not None else -1
+        except Exception:
+            return -1
+
+
+@dataclass
+class _TenantSchedule:
+    tenant: TenantContext
+    interval_s: float
+    next_run: float = 0.0
+    last_reports: list[dict[str, Any]] = field(default_factory=list)
+
+
+class CompactionScheduler:
+    """Run TTL compaction for each tenant's collections on a per-tenant interval.
+
+    Each due tenant gets ``time_budget_s`` per collection per run; collections
+    that do not finish resume from their checkpoint on the tenant's next run.
+    With ``discover`` set, every run first schedules tenants found through
+    their physical collection names (``<tenant>__<workspace>__<collection>``).
+    """
+
+    def __init__(
+        self,
+        compactor: TTLCompactor,
+        collections: Iterable[str] = ("content", "transcripts", "analysis"),
+        *,
+        interval_s: float = 3_600,
+        time_budget_s: float | None = 30.0,
+        discover: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.compactor = compactor
+        self.collections = list(collections)
+        self.interval_s = interval_s
+        self.time_budget_s = time_budget_s
+        self.discover = discover
+        self._clock = clock
+        self._tenants: dict[str, _TenantSchedule] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._shutdown_event = asyncio.Event()
+
+    @staticmethod
+    def _key(tenant: TenantContext) -> str:
+        return f"{tenant.tenant_id}:{tenant.workspace_id}"
+
+    def add_tenant(self, tenant: TenantContext, interval_s: float | None = None) -> None:
+        """Schedule ``tenant`` (due immediately) every ``interval_s`` seconds (default: the scheduler's)."""
+        self._tenants[self._key(tenant)] = _TenantSchedule(tenant, interval_s or self.interval_s)
+
+    def remove_tenant(self, tenant: TenantContext) -> None:
+        self._tenants.pop(self._key(tenant), None)
+
+    def discover_tenants(self) -> int:
+        """Schedule tenants that own one of ``collections`` but are not scheduled yet; returns how many."""
+        from ultimate_discord_intelligence_bot.tenancy.context import TenantContext
+
+        try:
+            names = [c.name for c in self.compactor.client.get_collections().collections]
+        except Exception as exc:
+            logger.debug("Could not list collections for compaction: %s", exc)
+            return 0
+        added = 0
+        for physical in names:
+            parts = physical.rsplit("__", 2)
+            if len(parts) != 3 or parts[2] not in self.collections:
+                continue
+            tenant = TenantContext(tenant_id=parts[0], workspace_id=parts[1])
+            if self._key(tenant) not in self._tenants:
+                self.add_tenant(tenant)
+                added += 1
+        return added
+
+    def run_tenant(self, tenant: TenantContext) -> list[CompactionReport]:
+        from ultimate_discord_intelligence_bot.tenancy.context import mem_ns
+
+        reports = []
+        for name in self.collections:
+            physical = mem_ns(tenant, name).replace(":", "__")
+            try:
+                self.compactor.client.get_collection(physical)
+            except Exception:
+                continue
+            reports.append(self.compactor.compact(physical, time_budget_s=self.time_budget_s))
+        return reports
+
+    def run_due(self) -> dict[str, list[CompactionReport]]:
+        """Compact every tenant whose next run is due; returns reports by tenant key."""
+        if self.discover:
+            self.discover_tenants()
+        results = {}
+        for key, schedule in list(self._tenants.items()):
+            if schedule.next_run > self._clock():
+                continue
+            try:
+                reports = self.run_tenant(schedule.tenant)
+            except Exception as exc:
+                logger.error("Memory compaction failed for %s: %s", key, exc)
+                reports = []
+            schedule.last_reports = [report.to_dict() for report in reports]
+            schedule.next_run = self._clock() + schedule.interval_s
+            results[key] = reports
+        return results
+
+    def seconds_until_due(self) -> float:
+        if not self._tenants:
+            return self.interval_s
+        return max(0.0, min(s.next_run for s in self._tenants.values()) - self._clock())
+
+    async def start(self) -> None:
+        if self._task is not None:
+            logger.warning("Memory compaction scheduler already running")
+            return
+        self._shutdown_event.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._shutdown_event.set()
+        await self._task
+        self._task = None
+
+    async def _loop(self) -> None:
+        while not self._shutdown_event.is_set():
+            try:
+                await asyncio.to_thread(self.run_due)
+            except Exception as exc:
+                logger.error(f"Memory compaction cycle error: {exc}")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._shutdown_event.wait(), timeout=self.seconds_until_due())
+
+    def get_status(self) -> dict[str, Any]:
+        return {
+            key: {"next_run": s.next_run, "interval_s": s.interval_s, "last_reports": s.last_reports}
+            for key, s in self._tenants.items()
+        }
+
+
+__all__ = [
+    "EXPIRES_AT_FIELD",
+    "CompactionCheckpoint",
+    "CompactionCheckpointStore",
+    "CompactionReport",
+    "CompactionScheduler",
+    "TTLCompactor",
+    "default_checkpoint_store",
+    "ensure_expiry_index",
+    "expires_at_for",
+    "supports_filtered_compaction",
+]
@@ -3,6 +3,11 @@
 Provides a unified interface for graph operations across Neo4j (persistent,
 production-ready queries), NetworkX (in-memory, fast testing), and Qdrant
 (hybrid vector+graph retrieval via payload storage).
+
+NetworkX and Qdrant subgraph queries share one frontier-batched BFS
+(:mod:`domains.memory.graph_traversal`): Qdrant expands each BFS level with
+a single match-any scroll that only returns edge payloads, caches adjacency
+per namespace, and stops early once the node/edge budget is spent.
 """
 
 from __future__ import annotations
@@ -12,6 +17,14 @@ import logging
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from domains.memory.graph_traversal import (
+    DEFAULT_ADJACENCY_CACHE_SIZE,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_EDGES,
+    DEFAULT_MAX_NODES,
+    AdjacencyCache,
+    traverse_frontier,
+)
 from ultimate_discord_intelligence_bot.obs.metrics import get_metrics
 from ultimate_discord_intelligence_bot.step_result import StepResult
 
@@ -46,6 +59,8 @@ class UnifiedGraphStore:
         neo4j_password: str | None = None,
         qdrant_client: Any = None,
         enable_multi_backend: bool = True,
+        adjacency_cache_size: int = DEFAULT_ADJACENCY_CACHE_SIZE,
+        traversal_batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         """Initialize unified graph store.
 
@@ -56,6 +71,8 @@ class UnifiedGraphStore:
             neo4j_password: Neo4j password.
             qdrant_client: Existing Qdrant client instance (optional).
             enable_multi_backend: If True, syncs writes across all backends.
+            adjacency_cache_size: Qdrant adjacency lists cached per namespace (0 disables caching).
+            traversal_batch_size: Frontier node ids per batched Qdrant query.
         """
         from platform.config.configuration import get_config
 
@@ -70,6 +87,8 @@ class UnifiedGraphStore:
         self._neo4j_driver: Any = None
         self._networkx_graphs: dict[str, Any] = {}
         self._qdrant_client = qdrant_client
+        self._adjacency_cache = AdjacencyCache(adjacency_cache_size) if adjacency_cache_size > 0 else None
+        self.traversal_batch_size = traversal_batch_size
         if default_backend == GraphBackend.NEO4J or enable_multi_backend:
             try:
                 from neo4j import GraphDatabase
@@ -175,6 +194,8 @@ class UnifiedGraphStore:
         relation_filter: list[str] | None = None,
         namespace: str = "default",
         backend: GraphBackend | str | None = None,
+        max_nodes: int = DEFAULT_MAX_NODES,
+        max_edges: int = DEFAULT_MAX_EDGES,
     ) -> StepResult:
         """Query a subgraph starting from a node using BFS.
 
@@ -184,18 +205,23 @@ class UnifiedGraphStore:
             relation_filter: Only follow edges with these relation types.
             namespace: Logical namespace for multi-tenancy.
             backend: Override default backend for this operation.
+            max_nodes: Stop expanding once this many nodes were reached (NetworkX/Qdrant).
+            max_edges: Stop expanding once this many edges were followed (NetworkX/Qdrant).
 
         Returns:
-            StepResult with nodes, edges, and paths.
+            StepResult with nodes, edges, and paths; NetworkX/Qdrant results also
+            report ``truncated``, ``depth_reached`` and ``round_trips``.
         """
         backend = self._resolve_backend(backend)
         try:
             if backend == GraphBackend.NEO4J:
                 return self._neo4j_query_subgraph(start_node, max_depth, relation_filter, namespace)
             elif backend == GraphBackend.NETWORKX:
-                return self._nx_query_subgraph(start_node, max_depth, relation_filter, namespace)
+                return self._nx_query_subgraph(start_node, max_depth, relation_filter, namespace, max_nodes, max_edges)
             elif backend == GraphBackend.QDRANT:
-                return self._qdrant_query_subgraph(start_node, max_depth, relation_filter, namespace)
+                return self._qdrant_query_subgraph(
+                    start_node, max_depth, relation_filter, namespace, max_nodes, max_edges
+                )
             else:
                 return StepResult.fail(f"Unsupported backend: {backend}")
         except Exception as exc:
@@ -312,36 +338,49 @@ class UnifiedGraphStore:
         return StepResult.ok(source_id=source_id, target_id=target_id, relation=relation, backend="networkx")
 
     def _nx_query_subgraph(
-        self, start_node: str, max_depth: int, relation_filter: list[str] | None, namespace: str
+        self,
+        start_node: str,
+        max_depth: int,
+        relation_filter: list[str] | None,
+        namespace: str,
+        max_nodes: int = DEFAULT_MAX_NODES,
+        max_edges: int = DEFAULT_MAX_EDGES,
     ) -> StepResult:
         """Query subgraph from NetworkX using BFS."""
         graph = self._get_nx_graph(namespace)
         if start_node not in graph:
             return StepResult.fail(f"Start node {start_node} not found in graph", start_node=start_node)
-        from collections import deque
-
-        visited: set[str] = {start_node}
-        queue: deque[tuple[str, int]] = deque([(start_node, 0)])
-        while queue:
-            current, depth = queue.popleft()
-            if depth >= max_depth:
-                continue
-            for neighbor in graph.successors(current):
-                edge_data = graph.edges[current, neighbor]
-                if relation_filter:
-                    rel = edge_data.get("relation")
-                    if rel not in relation_filter:
-                        continue
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, depth + 1))
-        subgraph = graph.subgraph(visited).copy()
-        nodes = [{"id": n, **(subgraph.nodes[n] or {})} for n in subgraph.nodes]
-        edges = [{"source": s, "target": t, **(subgraph.edges[s, t] or {})} for s, t in subgraph.edges]
+
+        def fetch(node_ids: Sequence[str]) -> dict[str, list[dict[str, Any]]]:
+            return {
+                n: [{"target": t, **graph.edges[n, t]} for t in graph.successors(n)] for n in node_ids if n in graph
+            }
+
+        # In-memory adjacency is already a dict lookup; no cache and no batching needed.
+        traversal = traverse_frontier(
+            start_node,
+            fetch,
+            max_depth=max_depth,
+            relation_filter=relation_filter,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+            batch_size=max(1, max_nodes),
+        )
+        nodes = [{"id": n, **(graph.nodes[n] or {})} for n in traversal.nodes]
+        edges = traversal.edges
         self._metrics.counter(
             "graph_store_operations_total", labels={"backend": "networkx", "operation": "query"}
         ).inc()
-        return StepResult.ok(nodes=nodes, edges=edges, node_count=len(nodes), edge_count=len(edges), backend="networkx")
+        return StepResult.ok(
+            nodes=nodes,
+            edges=edges,
+            node_count=len(nodes),
+            edge_count=len(edges),
+            depth_reached=traversal.depth_reached,
+            truncated=traversal.truncated,
+            round_trips=0,
+            backend="networkx",
+        )
 
     def _qdrant_add_node(
         self, node_id: str, labels: list[str], properties: dict[str, Any], namespace: str
@@ -361,6 +400,8 @@ class UnifiedGraphStore:
                 collection_name=collection_name, vectors_config=VectorParams(size=384, distance=Distance.COSINE)
             )
         self._qdrant_client.upsert(collection_name=collection_name, points=[point])
+        if self._adjacency_cache is not None:
+            self._adjacency_cache.invalidate(namespace, [node_id])
         self._metrics.counter(
             "graph_store_operations_total", labels={"backend": "qdrant", "operation": "add_node"}
         ).inc()
@@ -379,6 +420,7 @@ class UnifiedGraphStore:
             collection_name=collection_name,
             scroll_filter=Filter(must=[FieldCondition(key="_node_id", match=MatchValue(value=source_id))]),
             limit=1,
+            with_vectors=True,
         )
         if not search_result[0]:
             return StepResult.fail(f"Source node {source_id} not found")
@@ -391,52 +433,90 @@ class UnifiedGraphStore:
 
         updated_point = PointStruct(id=point.id, vector=point.vector, payload=payload)
         self._qdrant_client.upsert(collection_name=collection_name, points=[updated_point])
+        if self._adjacency_cache is not None:
+            self._adjacency_cache.invalidate(namespace, [source_id])
         self._metrics.counter(
             "graph_store_operations_total", labels={"backend": "qdrant", "operation": "add_edge"}
         ).inc()
         return StepResult.ok(source_id=source_id, target_id=target_id, relation=relation, backend="qdrant")
 
     def _qdrant_query_subgraph(
-        self, start_node: str, max_depth: int, relation_filter: list[str] | None, namespace: str
+        self,
+        start_node: str,
+        max_depth: int,
+        relation_filter: list[str] | None,
+        namespace: str,
+        max_nodes: int = DEFAULT_MAX_NODES,
+        max_edges: int = DEFAULT_MAX_EDGES,
     ) -> StepResult:
-        """Query subgraph from Qdrant by traversing edge payloads."""
+        """Query subgraph from Qdrant by traversing edge payloads, one batched scroll per BFS level."""
         if self._qdrant_client is None:
             return StepResult.fail("Qdrant client not initialized")
         collection_name = f"graph_memory_{namespace}"
-        from collections import deque
-
-        from qdrant_client.models import FieldCondition, Filter, MatchValue
-
-        visited: set[str] = {start_node}
-        queue: deque[tuple[str, int]] = deque([(start_node, 0)])
-        all_nodes: list[dict] = []
-        all_edges: list[dict] = []
-        while queue:
-            current_id, depth = queue.popleft()
-            if depth >= max_depth:
-                continue
-            result = self._qdrant_client.scroll(
-                collection_name=collection_name,
-                scroll_filter=Filter(must=[FieldCondition(key="_node_id", match=MatchValue(value=current_id))]),
-                limit=1,
-            )
-            if not result[0]:
-                continue
-            point = result[0][0]
-            payload = point.payload
-            all_nodes.append(dict(payload))
-            for edge in payload.get("_edges", []):
-                target_id = edge["target"]
-                relation = edge.get("relation")
-                if relation_filter and relation not in relation_filter:
-                    continue
-                all_edges.append({"source": current_id, "target": target_id, "relation": relation})
-                if target_id not in visited:
-                    visited.add(target_id)
-                    queue.append((target_id, depth + 1))
+        round_trips = 0
+
+        def scroll_nodes(node_ids: Sequence[str], with_payload: bool | list[str]) -> list[Any]:
+            nonlocal round_trips
+            from qdrant_client.models import FieldCondition, Filter, MatchAny
+
+            node_filter = Filter(must=[FieldCondition(key="_node_id", match=MatchAny(any=list(node_ids)))])
+            points: list[Any] = []
+            offset = None
+            while True:
+                batch, offset = self._qdrant_client.scroll(
+                    collection_name=collection_name,
+                    scroll_filter=node_filter,
+                    limit=len(node_ids),
+                    offset=offset,
+                    with_payload=with_payload,
+                    with_vectors=False,
+                )
+                round_trips += 1
+                points.extend(batch)
+                if offset is None:
+                    return points
+
+        def fetch(node_ids: Sequence[str]) -> dict[str, list[dict[str, Any]]]:
+            points = scroll_nodes(node_ids, ["_node_id", "_edges"])
+            return {point.payload["_node_id"]: point.payload.get("_edges", []) for point in points}
+
+        traversal = traverse_frontier(
+            start_node,
+            fetch,
+            max_depth=max_depth,
+            relation_filter=relation_filter,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+            batch_size=self.traversal_batch_size,
+            cache=self._adjacency_cache,
+            namespace=namespace,
+        )
+        # Full payloads only for the nodes in the result, again batched.
+        payloads: dict[str, dict[str, Any]] = {}
+        node_ids = traversal.nodes
+        for offset in range(0, len(node_ids), self.traversal_batch_size):
+            for point in scroll_nodes(node_ids[offset : offset + self.traversal_batch_size], True):
+                payloads[point.payload["_node_id"]] = dict(point.payload)
+        all_nodes = [payloads[node_id] for node_id in node_ids if node_id in payloads]
+        all_edges = [
+            {"source": edge["source"], "target": edge["target"], "relation": edge.get("relation")}
+            for edge in traversal.edges
+        ]
         self._metrics.counter("graph_store_operations_total", labels={"backend": "qdrant", "operation": "query"}).inc()
+        self._metrics.counter("graph_store_round_trips_total", labels={"backend": "qdrant"}).inc(round_trips)
+        if traversal.cache_hits:
+            self._metrics.counter("graph_adjacency_cache_hits_total", labels={"backend": "qdrant"}).inc(
+                traversal.cache_hits
+            )
         return StepResult.ok(
-            nodes=all_nodes, edges=all_edges, node_count=len(all_nodes), edge_count=len(all_edges), backend="qdrant"
+            nodes=all_nodes,
+            edges=all_edges,
+            node_count=len(all_nodes),
+            edge_count=len(all_edges),
+            depth_reached=traversal.depth_reached,
+            truncated=traversal.truncated,
+            round_trips=round_trips,
+            backend="qdrant",
         )
 
     def close(self) -> None:
@@ -5,6 +5,13 @@ This tool evaluates expiration based on payload fields:
 - _ttl: time-to-live in seconds (int)
 
 If either field is missing, the point is considered non-expirable by this tool.
+
+With a qdrant-client ``QdrantClient`` the work is done by
+:class:`~domains.memory.ttl_compaction.TTLCompactor`, which deletes by range
+filter on the indexed ``expires_at`` field (``created_at + _ttl``, written by
+MemoryStorageTool), resumes from checkpoints and honours a time budget.
+Clients without filtered count/delete (the in-memory test double) fall back
+to scanning payloads.
 """
 
 from __future__ import annotations
@@ -13,6 +20,7 @@ import os
 import time
 from typing import TYPE_CHECKING, Any, Protocol, TypedDict, runtime_checkable
 
+from domains.memory.ttl_compaction import TTLCompactor, expires_at_for, supports_filtered_compaction
 from ultimate_discord_intelligence_bot.obs.metrics import get_metrics
 from ultimate_discord_intelligence_bot.step_result import StepResult
 
@@ -60,6 +68,8 @@ class _CompactionSummary(TypedDict, total=False):
     deleted: int
     remaining: int
     tenant_scoped: bool
+    mode: str
+    complete: bool
 
 
 class MemoryCompactionTool(BaseTool[StepResult]):
@@ -87,6 +97,9 @@ class MemoryCompactionTool(BaseTool[StepResult]):
                 self.client = None
         self._enable_compaction = str(os.getenv("ENABLE_MEMORY_COMPACTION", "1")).lower() in {"1", "true", "yes", "on"}
         self._batch_size = int(os.getenv("MEMORY_COMPACTION_BATCH_SIZE", "200") or 200)
+        budget = os.getenv("MEMORY_COMPACTION_TIME_BUDGET_S")
+        self._time_budget_s = float(budget) if budget else None
+        self._compactor = TTLCompactor(self.client) if supports_filtered_compaction(self.client) else None
 
     @staticmethod
     def _physical_name(name: str) -> str:
@@ -100,16 +113,12 @@ class MemoryCompactionTool(BaseTool[StepResult]):
         return target_base
 
     def _is_expired(self, payload: dict[str, Any], now: int) -> bool:
-        try:
-            created = int(payload.get("created_at", 0))
-            ttl = int(payload.get("_ttl", 0))
-        except Exception:
-            return False
-        if created <= 0 or ttl <= 0:
-            return False
-        return created + ttl <= now
+        expires_at = expires_at_for(payload)
+        return expires_at is not None and expires_at <= now
 
-    def _run(self, collection: str | None = None, max_delete: int | None = None) -> StepResult:
+    def _run(
+        self, collection: str | None = None, max_delete: int | None = None, time_budget_s: float | None = None
+    ) -> StepResult:
         if not self._enable_compaction:
             return StepResult.skip(reason="Compaction disabled via flag")
         if self.client is None:
@@ -122,6 +131,28 @@ class MemoryCompactionTool(BaseTool[StepResult]):
             return StepResult.ok(
                 collection=logical, scanned=0, deleted=0, remaining=0, tenant_scoped=current_tenant() is not None
             )
+        if self._compactor is not None:
+            report = self._compactor.compact(
+                physical,
+                time_budget_s=time_budget_s if time_budget_s is not None else self._time_budget_s,
+                max_delete=max_delete,
+            )
+            self._record_run()
+            return StepResult.ok(
+                collection=logical,
+                scanned=report.deleted,
+                deleted=report.deleted,
+                remaining=report.remaining,
+                tenant_scoped=current_tenant() is not None,
+                mode="indexed",
+                complete=report.complete,
+                backfilled=report.backfilled,
+                round_trips=report.round_trips,
+            )
+        return self._scan_compact(logical, physical, max_delete)
+
+    def _scan_compact(self, logical: str, physical: str, max_delete: int | None) -> StepResult:
+        """Scan every payload; for clients without filtered count/delete."""
         scanned = 0
         deleted = 0
         now = int(time.time())
@@ -166,6 +197,18 @@ class MemoryCompactionTool(BaseTool[StepResult]):
                     break
         except Exception:
             remaining = -1
+        self._record_run()
+        return StepResult.ok(
+            collection=logical,
+            scanned=scanned,
+            deleted=deleted,
+            remaining=remaining,
+            tenant_scoped=current_tenant() is not None,
+            mode="scan",
+            complete=max_delete is None or deleted < max_delete,
+        )
+
+    def _record_run(self) -> None:
         self._metrics.counter(
             "tool_runs_total",
             labels={
@@ -174,18 +217,12 @@ class MemoryCompactionTool(BaseTool[StepResult]):
                 "tenant_scoped": str(current_tenant() is not None).lower(),
             },
         ).inc()
-        return StepResult.ok(
-            collection=logical,
-            scanned=scanned,
-            deleted=deleted,
-            remaining=remaining,
-            tenant_scoped=current_tenant() is not None,
-        )
 
     def run(self, *args: Any, **kwargs: Any) -> StepResult:
         collection = kwargs.get("collection")
         max_delete = kwargs.get("max_delete")
-        return self._run(collection=collection, max_delete=max_delete)
+        time_budget_s = kwargs.get("time_budget_s")
+        return self._run(collection=collection, max_delete=max_delete, time_budget_s=time_budget_s)
 
 
 __all__ = ["MemoryCompactionTool"]
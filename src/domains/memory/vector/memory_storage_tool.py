@@ -7,6 +7,7 @@ import uuid
 from platform.config.configuration import get_config
 from typing import TYPE_CHECKING, Any, ClassVar, Protocol, TypedDict, cast, runtime_checkable
 
+from domains.memory.ttl_compaction import EXPIRES_AT_FIELD, ensure_expiry_index, expires_at_for
 from ultimate_discord_intelligence_bot.obs.metrics import get_metrics
 from ultimate_discord_intelligence_bot.step_result import StepResult
 
@@ -107,6 +108,7 @@ class MemoryStorageTool(BaseTool[StepResult]):
     embedding_fn: Callable[[str], list[float]] | None = None
     client: _QdrantLike | None = None
     _physical_names: ClassVar[dict[str, str]] = {}
+    _expiry_indexed: ClassVar[set[str]] = set()
 
     def __init__(
         self,
@@ -288,6 +290,9 @@ class MemoryStorageTool(BaseTool[StepResult]):
                     payload["created_at"] = int(_t.time())
                 except Exception:
                     ...
+            expires_at = expires_at_for(payload)
+            if expires_at is not None:
+                payload[EXPIRES_AT_FIELD] = expires_at
             payload["text"] = text
             if "PointStruct" in globals() and callable(PointStruct):
                 point = cast("Any", PointStruct)(id=str(uuid.uuid4()), vector=vector, payload=payload)
@@ -297,6 +302,8 @@ class MemoryStorageTool(BaseTool[StepResult]):
                 raise RuntimeError("Qdrant client not initialised")
             points: Sequence[Any] = [point]
             physical = self._physical_name(target)
+            if physical not in self._expiry_indexed and ensure_expiry_index(self.client, physical):
+                self._expiry_indexed.add(physical)
             self.client.upsert(collection_name=physical, points=points)
             self._metrics.counter(
                 "tool_runs_total",
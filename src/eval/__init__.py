@@ -1,8 +1,9 @@
 """Evaluation harness utilities."""
 
+from .engine import EvalEngine, EvalModel, OutputCache, RunJournal, rescore
 from .gates import compare
 from .loader import load_cases
 from .runner import run
 
 
-__all__ = ["compare", "load_cases", "run"]
+__all__ = ["EvalEngine", "EvalModel", "OutputCache", "RunJournal", "compare", "load_cases", "rescore", "run"]
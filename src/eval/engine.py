@@ -0,0 +1,370 @@
+"""Concurrent, cached and resumable evaluation engine.
+
+:func:`eval.runner.run` evaluates cases one after another and calls the model
+for every case on every run. :class:`EvalEngine` produces the same report
+shape, with these additions:
+
+- cases run on a bounded thread pool, and each model provider is throttled
+  by its own token bucket;
+- model outputs are stored in a content-addressed :class:`OutputCache`. The
+  key is the SHA-256 of ``(model, params, task, case)``, so identical prompts
+  are answered from the cache on every later run and by every other variant
+  that shares them;
+- a :class:`RunJournal` (JSONL) records each finished case. Re-running with
+  the same journal skips finished cases, so an interrupted run resumes;
+- :func:`rescore` rebuilds a report from a journal with new scorers, without
+  calling the model again.
+
+A case whose model call or scorer raises is logged with its id and scored 0,
+so failures lower ``quality`` instead of vanishing from the report. Failed
+cases are not journaled and are retried on the next run.
+
+:class:`EngineStats` reports throughput, cache hits and cost per case.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .loader import load_cases
+from .runner import score_case, summarize
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .runner import ModelFunc
+
+    Scorer = Callable[[str, str, dict[str, Any]], float]
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EvalModel:
+    """A model variant under evaluation.
+
+    ``name`` and ``params`` identify the variant in cache keys. Two variants
+    with the same name and params are assumed to produce the same outputs.
+    ``provider`` selects the rate limit bucket.
+    """
+
+    name: str
+    fn: ModelFunc
+    provider: str = "default"
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def cache_key(self, task: str, case: dict[str, Any]) -> str:
+        blob = json.dumps(
+            {"model": self.name, "params": self.params, "task": task, "case": case},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class OutputCache:
+    """SQLite-backed ``key -> (output, meta)`` store shared across runs."""
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS eval_outputs "
+                "(key TEXT PRIMARY KEY, output TEXT, meta TEXT, created_at REAL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> tuple[str, dict[str, Any]] | None:
+        with self._lock:
+            row = self._conn.execute("SELECT output, meta FROM eval_outputs WHERE key=?", (key,)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1] or "{}")
+
+    def put(self, key: str, output: str, meta: dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO eval_outputs (key, output, meta, created_at) VALUES (?,?,?,?)",
+                (key, output, json.dumps(meta, default=str), time.time()),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM eval_outputs").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class CaseRecord:
+    """One finished case as written to the run journal."""
+
+    task: str
+    case_id: str
+    key: str
+    output: str
+    meta: dict[str, Any]
+    score: float
+    cached: bool = False
+
+
+class RunJournal:
+    """Append-only JSONL log of finished cases for resuming and re-scoring."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[tuple[str, str], CaseRecord]:
+        records: dict[tuple[str, str], CaseRecord] = {}
+        if not self.path.exists():
+            return records
+        with self.path.open(encoding="utf-8") as fh:
+            for line in fh:
+                text = line.strip()
+                if not text:
+                    continue
+                try:
+                    record = CaseRecord(**json.loads(text))
+                except (ValueError, TypeError):
+                    # A crash mid-write can leave a truncated last line.
+                    continue
+                records[(record.task, record.case_id)] = record
+        return records
+
+    def append(self, record: CaseRecord) -> None:
+        line = json.dumps(asdict(record), default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+
+
+class _ProviderLimiter:
+    """Blocking per-provider token buckets with one second of burst capacity.
+
+    A caller that finds the bucket empty reserves the next token (the balance
+    goes negative) and sleeps until it is due, so waiters are served in order
+    without polling. ``clock`` and ``sleep`` are injectable for tests.
+    """
+
+    def __init__(
+        self,
+        rates: dict[str, float],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._rates = {name: rate for name, rate in rates.items() if rate > 0}
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = {name: max(1.0, rate) for name, rate in self._rates.items()}
+        self._stamps = dict.fromkeys(self._rates, clock())
+        self._lock = threading.Lock()
+
+    def acquire(self, provider: str) -> None:
+        rate = self._rates.get(provider)
+        if rate is None:
+            return
+        with self._lock:
+            now = self._clock()
+            tokens = min(max(1.0, rate), self._tokens[provider] + (now - self._stamps[provider]) * rate)
+            self._stamps[provider] = now
+            self._tokens[provider] = tokens - 1.0
+        if tokens < 1.0:
+            self._sleep((1.0 - tokens) / rate)
+
+
+@dataclass
+class EngineStats:
+    cases: int = 0
+    model_calls: int = 0
+    cache_hits: int = 0
+    resumed: int = 0
+    errors: int = 0
+    wall_seconds: float = 0.0
+    throughput_cases_per_s: float = 0.0
+    cost_usd: float = 0.0
+    cost_per_case_usd: float = 0.0
+    spent_usd: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class EvalRun:
+    report: dict[str, dict[str, float]]
+    stats: EngineStats
+    records: list[CaseRecord]
+
+
+def _case_id(task: str, index: int, case: dict[str, Any]) -> str:
+    return str(case.get("id", f"{task}-{index}"))
+
+
+class EvalEngine:
+    """Run golden cases concurrently with caching, rate limits and resume.
+
+    ``rate_limits`` maps provider name to requests per second; providers
+    without an entry are not throttled. Cache hits never wait on the limiter.
+    ``clock`` and ``sleep`` drive the limiter and default to
+    :func:`time.monotonic` and :func:`time.sleep`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 8,
+        rate_limits: dict[str, float] | None = None,
+        cache: OutputCache | None = None,
+        scorer: Scorer = score_case,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.cache = cache if cache is not None else OutputCache()
+        self.scorer = scorer
+        self._limiter = _ProviderLimiter(rate_limits or {}, clock=clock, sleep=sleep)
+
+    def run(
+        self,
+        dataset_dir: str | Path,
+        model: EvalModel,
+        *,
+        tenant: str | None = None,
+        journal: RunJournal | str | Path | None = None,
+    ) -> EvalRun:
+        cases = load_cases(Path(dataset_dir), tenant)
+        journal = RunJournal(journal) if isinstance(journal, str | Path) else journal
+        done = journal.load() if journal is not None else {}
+        stats = EngineStats()
+        stats_lock = threading.Lock()
+        started = time.perf_counter()
+
+        def evaluate(task: str, case_id: str, case: dict[str, Any]) -> CaseRecord:
+            key = model.cache_key(task, case)
+            hit = self.cache.get(key)
+            if hit is not None:
+                output, meta = hit
+            else:
+                self._limiter.acquire(model.provider)
+                output, meta = model.fn(task, case)
+                meta = dict(meta or {})
+                self.cache.put(key, output, meta)
+            record = CaseRecord(
+                task=task,
+                case_id=case_id,
+                key=key,
+                output=output,
+                meta=meta,
+                score=self.scorer(task, output, case),
+                cached=hit is not None,
+            )
+            if journal is not None:
+                journal.append(record)
+            with stats_lock:
+                if hit is not None:
+                    stats.cache_hits += 1
+                else:
+                    stats.model_calls += 1
+                    stats.spent_usd += float(meta.get("cost_usd", 0.0))
+            return record
+
+        by_case: dict[tuple[str, str], CaseRecord] = {}
+        pending: list[tuple[str, str, dict[str, Any]]] = []
+        for task, items in cases.items():
+            for index, case in enumerate(items):
+                case_id = _case_id(task, index, case)
+                previous = done.get((task, case_id))
+                if previous is not None and previous.key == model.cache_key(task, case):
+                    by_case[(task, case_id)] = previous
+                    stats.resumed += 1
+                else:
+                    pending.append((task, case_id, case))
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="eval") as pool:
+            futures = {(task, case_id): pool.submit(evaluate, task, case_id, case) for task, case_id, case in pending}
+            for (task, case_id), future in futures.items():
+                try:
+                    by_case[(task, case_id)] = future.result()
+                except Exception as exc:
+                    logger.exception("Eval case %s/%s failed; scoring it 0", task, case_id)
+                    stats.errors += 1
+                    by_case[(task, case_id)] = CaseRecord(
+                        task=task,
+                        case_id=case_id,
+                        key="",
+                        output="",
+                        meta={"error": f"{type(exc).__name__}: {exc}"},
+                        score=0.0,
+                    )
+
+        records: list[CaseRecord] = []
+        report: dict[str, dict[str, float]] = {}
+        for task, items in cases.items():
+            idents = [(task, _case_id(task, index, case)) for index, case in enumerate(items)]
+            task_records = [by_case[ident] for ident in idents if ident in by_case]
+            records.extend(task_records)
+            report[task] = summarize([(r.score, r.meta) for r in task_records])
+        stats.cases = len(records)
+        stats.wall_seconds = time.perf_counter() - started
+        stats.throughput_cases_per_s = stats.cases / stats.wall_seconds if stats.wall_seconds else 0.0
+        stats.cost_usd = sum(float(r.meta.get("cost_usd", 0.0)) for r in records)
+        stats.cost_per_case_usd = stats.cost_usd / stats.cases if stats.cases else 0.0
+        return EvalRun(report=report, stats=stats, records=records)
+
+
+def rescore(
+    journal: RunJournal | str | Path,
+    dataset_dir: str | Path,
+    *,
+    scorer: Scorer = score_case,
+    tenant: str | None = None,
+) -> dict[str, dict[str, float]]:
+    """Recompute the report from journaled outputs with ``scorer``.
+
+    Use this when only scorers changed: no model is called. Journaled cases
+    that are no longer in the dataset are ignored.
+    """
+    journal = RunJournal(journal) if isinstance(journal, str | Path) else journal
+    cases = load_cases(Path(dataset_dir), tenant)
+    lookup = {
+        (task, _case_id(task, index, case)): case for task, items in cases.items() for index, case in enumerate(items)
+    }
+    grouped: dict[str, list[tuple[float, dict[str, Any]]]] = {task: [] for task in cases}
+    for record in journal.load().values():
+        case = lookup.get((record.task, record.case_id))
+        if case is None:
+            continue
+        grouped[record.task].append((scorer(record.task, record.output, case), record.meta))
+    return {task: summarize(results) for task, results in grouped.items()}
+
+
+__all__ = [
+    "CaseRecord",
+    "EngineStats",
+    "EvalEngine",
+    "EvalModel",
+    "EvalRun",
+    "OutputCache",
+    "RunJournal",
+    "rescore",
+]
@@ -17,6 +17,36 @@ from .loader import load_cases
 ModelFunc = Callable[[str, dict[str, Any]], tuple[str, dict[str, float]]]
 
 
+def score_case(task: str, output: str, case: dict[str, Any]) -> float:
+    """Score one model ``output`` for ``case`` with the task's deterministic scorer."""
+    if task == "rag_qa":
+        ok = scorers.must_include(output, case.get("must_include", [])) and scorers.forbidden(
+            output, case.get("forbidden", [])
+        )
+    elif task == "summarize":
+        ok = scorers.must_include(output, case.get("expected_keywords", []))
+    elif task == "classification":
+        ok = scorers.classification(output, case.get("expected", ""))
+    elif task == "claimcheck":
+        ok = scorers.claimcheck(output, case.get("expected_label", ""))
+    elif task == "tool_tasks":
+        schema = {k: type(v) for k, v in case.get("expected", {}).items()}
+        ok = scorers.json_schema(output, schema)
+    else:
+        ok = False
+    return 1.0 if ok else 0.0
+
+
+def summarize(results: list[tuple[float, dict[str, Any]]]) -> dict[str, float]:
+    """Aggregate ``(score, meta)`` pairs for one task into the report shape."""
+    n = len(results) or 1
+    return {
+        "quality": sum(score for score, _ in results) / n,
+        "cost_usd": sum(float(meta.get("cost_usd", 0.0)) for _, meta in results),
+        "latency_ms": sum(float(meta.get("latency_ms", 0.0)) for _, meta in results) / n,
+    }
+
+
 def run(dataset_dir: str | Path, model: ModelFunc, tenant: str | None = None) -> dict[str, dict[str, float]]:
     """Run the evaluation suite.
 
@@ -29,45 +59,19 @@ def run(dataset_dir: str | Path, model: ModelFunc, tenant: str | None = None) ->
         where ``meta`` can include ``cost_usd`` and ``latency_ms``.
     tenant:
         Optional tenant slug for dataset overrides.
+
+    See :mod:`eval.engine` for the concurrent, cached and resumable variant.
     """
 
     root = Path(dataset_dir)
     cases = load_cases(root, tenant)
     report: dict[str, dict[str, float]] = {}
     for task, items in cases.items():
-        quality = 0.0
-        total_cost = 0.0
-        total_latency = 0.0
+        results = []
         for case in items:
             output, meta = model(task, case)
-            score = 0.0
-            if task == "rag_qa":
-                if scorers.must_include(output, case.get("must_include", [])) and scorers.forbidden(
-                    output, case.get("forbidden", [])
-                ):
-                    score = 1.0
-            elif task == "summarize":
-                if scorers.must_include(output, case.get("expected_keywords", [])):
-                    score = 1.0
-            elif task == "classification":
-                if scorers.classification(output, case.get("expected", "")):
-                    score = 1.0
-            elif task == "claimcheck":
-                if scorers.claimcheck(output, case.get("expected_label", "")):
-                    score = 1.0
-            elif task == "tool_tasks":
-                schema = {k: type(v) for k, v in case.get("expected", {}).items()}
-                if scorers.json_schema(output, schema):
-                    score = 1.0
-            quality += score
-            total_cost += float(meta.get("cost_usd", 0.0))
-            total_latency += float(meta.get("latency_ms", 0.0))
-        n = len(items) or 1
-        report[task] = {
-            "quality": quality / n,
-            "cost_usd": total_cost,
-            "latency_ms": total_latency / n,
-        }
+            results.append((score_case(task, output, case), meta))
+        report[task] = summarize(results)
     return report
 
 
@@ -82,6 +86,10 @@ def main() -> None:
         default="reports/eval/latest.json",
         help="where to write report",
     )
+    p.add_argument("--workers", type=int, default=1, help="concurrent cases (uses eval.engine when > 1)")
+    p.add_argument("--cache", type=str, help="SQLite cache of model outputs shared across runs")
+    p.add_argument("--journal", type=str, help="JSONL journal of finished cases; re-running resumes from it")
+    p.add_argument("--rescore", action="store_true", help="re-score --journal outputs without calling the model")
     args = p.parse_args()
 
     def echo_model(task: str, case: dict[str, Any]) -> tuple[str, dict[str, float]]:
@@ -104,7 +112,21 @@ def main() -> None:
             }
         return "", {"cost_usd": 0.0, "latency_ms": 0}
 
-    report = run(args.dataset, echo_model)
+    if args.rescore:
+        if not args.journal:
+            p.error("--rescore requires --journal")
+        from .engine import rescore
+
+        report = rescore(args.journal, args.dataset)
+    elif args.workers > 1 or args.cache or args.journal:
+        from .engine import EvalEngine, EvalModel, OutputCache
+
+        engine = EvalEngine(max_workers=args.workers, cache=OutputCache(args.cache) if args.cache else None)
+        result = engine.run(args.dataset, EvalModel(name="echo", fn=echo_model), journal=args.journal)
+        report = result.report
+        logger.info("eval stats: %s", json.dumps(result.stats.to_dict()))
+    else:
+        report = run(args.dataset, echo_model)
     Path(args.out).parent.mkdir(parents=True, exist_ok=True)
     with open(args.out, "w") as f:
         json.dump(report, f, indent=2)
@@ -2,8 +2,20 @@
 
 from . import viz
 from .extract import extract
+from .pooled_store import PooledKGStore, tenant_store
 from .reasoner import timeline
 from .store import KGEdge, KGNode, KGStore
+from .writer import index_episode
 
 
-__all__ = ["KGEdge", "KGNode", "KGStore", "extract", "timeline", "viz"]
+__all__ = [
+    "KGEdge",
+    "KGNode",
+    "KGStore",
+    "PooledKGStore",
+    "extract",
+    "index_episode",
+    "tenant_store",
+    "timeline",
+    "viz",
+]
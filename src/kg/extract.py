@@ -1,13 +1,48 @@
-"""Naive entity and claim extractor used during ingestion."""
+"""Naive entity and claim extractor used during ingestion.
+
+Text is scanned once, token by token, by :class:`StreamingExtractor`:
+
+- an *entity* is a run of capitalised words (``Alice``, ``New York City``)
+  separated by single whitespace characters;
+- a *claim* is a sentence containing ``is``/``are``/``was``/``were`` after
+  its first word.
+
+Sentence boundaries are tuned for speech transcripts, which are often
+barely punctuated. ``.``/``!``/``?`` end a sentence unless they follow an
+abbreviation or initial (``Dr.``, ``J.``) or sit inside a token
+(``3.5``, ``example.com``); a blank line always ends one. Sentences that run
+past ``max_sentence_chars`` are cut before the latest discourse marker
+(``so``, ``but``, ``okay``...) or, failing that, before the current word, so
+unpunctuated speech still yields claim-sized spans.
+
+Every token is looked at a bounded number of times, so cost is linear in the
+input. :meth:`StreamingExtractor.feed` accepts text in arbitrary pieces
+(e.g. Whisper segments) and returns items as soon as they are complete;
+offsets always refer to the concatenation of everything fed so far.
+"""
 
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 
-ENTITY_RE = re.compile(r"\b([A-Z][a-z]+(?:\s[A-Z][a-z]+)*)\b")
-CLAIM_RE = re.compile(r"([^.!?]+?(?:is|are|was|were)[^.!?]+)")
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Words (with an optional contraction suffix), numbers with inner separators,
+# terminator runs and blank lines. Everything else (spaces, commas, quotes) is
+# skipped by the search itself.
+TOKEN_RE = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?|\d+(?:[.,:]\d+)*|[.!?]+|\n[ \t\r]*\n")
+ENTITY_WORD_RE = re.compile(r"[A-Z][a-z]+")
+COPULAS = frozenset({"is", "are", "was", "were"})
+ABBREVIATIONS = frozenset(
+    {"mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "inc", "ltd", "co", "corp", "no", "approx"}
+)
+DISCOURSE_MARKERS = frozenset({"so", "but", "and", "because", "okay", "ok", "anyway", "like", "um", "uh", "yeah"})
+DEFAULT_MAX_SENTENCE_CHARS = 300
+MIN_SOFT_CUT_CHARS = 40
 
 
 @dataclass
@@ -17,8 +52,185 @@ class ExtractedItem:
     end: int
 
 
-def extract(text: str) -> tuple[list[ExtractedItem], list[ExtractedItem]]:
+class StreamingExtractor:
+    """Single-pass entity/claim extractor over text fed in pieces.
+
+    The extractor keeps only the unfinished sentence buffered, so memory is
+    bounded by ``max_sentence_chars`` regardless of transcript length.
+    """
+
+    def __init__(self, max_sentence_chars: int = DEFAULT_MAX_SENTENCE_CHARS) -> None:
+        self.max_sentence_chars = max(MIN_SOFT_CUT_CHARS * 2, max_sentence_chars)
+        self._buf = ""
+        self._base = 0  # absolute offset of _buf[0]
+        self._scan = 0  # index into _buf where tokenization resumes
+        self._sentence: int | None = None  # _buf index of the current sentence's first token
+        self._copulas: list[int] = []  # copula positions after the sentence's first token
+        self._soft_cut: int | None = None  # latest discourse marker worth cutting before
+        self._entity: tuple[int, int] | None = None  # open entity run (start, end)
+        self._entities: list[ExtractedItem] = []
+        self._claims: list[ExtractedItem] = []
+
+    def feed(self, text: str) -> tuple[list[ExtractedItem], list[ExtractedItem]]:
+        """Consume ``text`` and return entities and claims completed by it."""
+        self._buf += text
+        self._consume(final=False)
+        return self._drain()
+
+    def flush(self) -> tuple[list[ExtractedItem], list[ExtractedItem]]:
+        """Close the open entity and sentence at end of input."""
+        self._consume(final=True)
+        self._close_entity()
+        if self._sentence is not None:
+            self._close_sentence(len(self._buf))
+        self._compact()
+        return self._drain()
+
+    def _drain(self) -> tuple[list[ExtractedItem], list[ExtractedItem]]:
+        entities, claims = self._entities, self._claims
+        self._entities, self._claims = [], []
+        return entities, claims
+
+    def _consume(self, *, final: bool) -> None:
+        buf = self._buf
+        # Only scan up to the last space that follows a non-space character:
+        # nothing before it can change when more text arrives, and a
+        # terminator right before it can still see its next character.
+        limit = len(buf) if final else self._stable_end()
+        for match in TOKEN_RE.finditer(buf, self._scan, limit):
+            self._token(match.group(), *match.span())
+        self._scan = max(self._scan, limit)
+        self._compact()
+
+    def _stable_end(self) -> int:
+        buf, end = self._buf, len(self._buf)
+        while True:
+            end = buf.rfind(" ", self._scan, end)
+            if end <= self._scan or not buf[end - 1].isspace():
+                return max(end, self._scan)
+
+    def _token(self, token: str, start: int, end: int) -> None:
+        first = token[0]
+        if first == "\n":
+            self._close_entity()
+            if self._sentence is not None:
+                self._close_sentence(start)
+            return
+        if first in ".!?":
+            self._close_entity()
+            if self._sentence is not None and self._is_boundary(token, start, end):
+                self._close_sentence(start)
+            return
+        self._track_entity(token, start, end)
+        if self._sentence is None:
+            self._sentence = start
+            return
+        word = token.lower()
+        if word in COPULAS:
+            self._copulas.append(start)
+        elif word in DISCOURSE_MARKERS and start - self._sentence >= MIN_SOFT_CUT_CHARS:
+            self._soft_cut = start
+        if end - self._sentence > self.max_sentence_chars:
+            self._split_sentence(self._soft_cut if self._soft_cut is not None else start)
+
+    def _is_boundary(self, token: str, start: int, end: int) -> bool:
+        buf = self._buf
+        if end < len(buf) and not buf[end].isspace() and buf[end] not in "\"')]":
+            return False  # example.com, U.S.A
+        if token != ".":
+            return True
+        prev = TOKEN_RE.match(buf, self._word_start(start), start)
+        if prev is None:
+            return True
+        word = prev.group().lower()
+        return not (len(word) == 1 and word.isalpha()) and word not in ABBREVIATIONS
+
+    def _word_start(self, pos: int) -> int:
+        begin = pos
+        while begin > 0 and self._buf[begin - 1].isascii() and self._buf[begin - 1].isalpha():
+            begin -= 1
+        return begin
+
+    def _track_entity(self, token: str, start: int, end: int) -> None:
+        word_end = start + len(token.split("'", 1)[0])
+        is_word = ENTITY_WORD_RE.fullmatch(self._buf, start, word_end) is not None
+        run = self._entity
+        if run is not None and not (is_word and start == run[1] + 1 and self._buf[run[1]].isspace()):
+            self._close_entity()
+            run = None
+        if is_word:
+            self._entity = (run[0] if run else start, word_end)
+            if word_end != end:  # possessive or contraction ends the run
+                self._close_entity()
+
+    def _close_entity(self) -> None:
+        if self._entity is not None:
+            start, end = self._entity
+            self._entities.append(ExtractedItem(self._buf[start:end], self._base + start, self._base + end))
+            self._entity = None
+
+    def _close_sentence(self, end: int) -> None:
+        start = self._sentence
+        assert start is not None
+        if self._copulas:
+            text = self._buf[start:end].rstrip()
+            self._claims.append(ExtractedItem(text, self._base + start, self._base + start + len(text)))
+        self._sentence = None
+        self._copulas = []
+        self._soft_cut = None
+
+    def _split_sentence(self, cut: int) -> None:
+        """End the sentence before ``cut``; tokens from ``cut`` on start the next one."""
+        copulas = self._copulas
+        self._copulas = [pos for pos in copulas if pos < cut]
+        self._close_sentence(cut)
+        self._sentence = cut
+        self._copulas = [pos for pos in copulas if pos > cut]
+
+    def _compact(self) -> None:
+        """Drop buffered text that no open item can refer to any more."""
+        keep = self._scan
+        for pos in (self._sentence, self._entity[0] if self._entity else None):
+            if pos is not None:
+                keep = min(keep, pos)
+        # Keep the word before the scan point for abbreviation checks.
+        keep = min(keep, self._word_start(keep))
+        if keep == 0:
+            return
+        self._buf = self._buf[keep:]
+        self._base += keep
+        self._scan -= keep
+        if self._sentence is not None:
+            self._sentence -= keep
+        self._copulas = [pos - keep for pos in self._copulas]
+        if self._soft_cut is not None:
+            self._soft_cut -= keep
+        if self._entity is not None:
+            self._entity = (self._entity[0] - keep, self._entity[1] - keep)
+
+
+def extract(
+    text: str, max_sentence_chars: int = DEFAULT_MAX_SENTENCE_CHARS
+) -> tuple[list[ExtractedItem], list[ExtractedItem]]:
     """Return lists of naive entity and claim spans."""
-    entities = [ExtractedItem(m.group(1), m.start(1), m.end(1)) for m in ENTITY_RE.finditer(text)]
-    claims = [ExtractedItem(m.group(1), m.start(1), m.end(1)) for m in CLAIM_RE.finditer(text)]
-    return entities, claims
+    extractor = StreamingExtractor(max_sentence_chars)
+    entities, claims = extractor.feed(text)
+    tail_entities, tail_claims = extractor.flush()
+    return entities + tail_entities, claims + tail_claims
+
+
+def extract_stream(
+    segments: Iterable[str], max_sentence_chars: int = DEFAULT_MAX_SENTENCE_CHARS
+) -> Iterator[tuple[list[ExtractedItem], list[ExtractedItem]]]:
+    """Yield ``(entities, claims)`` completed by each segment, then the remainder.
+
+    Segments are concatenated as given, so include separators (Whisper
+    segment texts already start with a space).
+    """
+    extractor = StreamingExtractor(max_sentence_chars)
+    for segment in segments:
+        yield extractor.feed(segment)
+    yield extractor.flush()
+
+
+__all__ = ["ExtractedItem", "StreamingExtractor", "extract", "extract_stream"]
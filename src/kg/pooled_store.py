@@ -0,0 +1,131 @@
+"""File-backed KG store with a read connection pool and a single writer.
+
+:class:`KGStore` keeps one connection and is meant for one thread at a time.
+:class:`PooledKGStore` is for long-lived, shared use, such as the MCP
+grounding server answering concurrent tool calls:
+
+* the database runs in WAL mode, so readers never block the writer and see
+  the last committed snapshot;
+* ``read_connections`` read-only connections (``mode=ro``, ``query_only``)
+  are handed out per query from a pool, and a caller waits when all are busy;
+* a single writer connection, guarded by a lock, serialises all writes;
+* the lookup queries use constant SQL text, so each pooled connection
+  prepares a statement once and then reuses it from sqlite3's statement
+  cache.
+
+:func:`tenant_store` keeps one such store per tenant at
+``$MCP_KG_STORE_DIR/<tenant>.sqlite3`` (default ``data/kg``). Ingestion
+writes there (:mod:`kg.writer`) and the MCP KG server reads from there.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import queue
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .store import KGStore
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class PooledKGStore(KGStore):
+    """Thread-safe :class:`KGStore` over a database file."""
+
+    def __init__(self, path: str | Path, read_connections: int = 4, *, cached_statements: int = 64):
+        if str(path) == ":memory:":
+            raise ValueError("PooledKGStore needs a database file; use KGStore for in-memory graphs")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False, cached_statements=cached_statements)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self._write_lock:
+            self._ensure_tables()
+        uri = f"{self.path.resolve().as_uri()}?mode=ro"
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._all_readers: list[sqlite3.Connection] = []
+        for _ in range(max(1, read_connections)):
+            reader = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=cached_statements)
+            reader.row_factory = sqlite3.Row
+            reader.execute("PRAGMA query_only=ON")
+            self._all_readers.append(reader)
+            self._readers.put(reader)
+
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        reader = self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put(reader)
+
+    @contextmanager
+    def _writing(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            yield self.conn
+
+    @property
+    def read_connections(self) -> int:
+        return len(self._all_readers)
+
+    def close(self) -> None:
+        for reader in self._all_readers:
+            reader.close()
+        self._all_readers.clear()
+        with self._write_lock:
+            self.conn.close()
+
+
+_TENANT_STORES: dict[str, PooledKGStore] = {}
+_TENANT_STORES_LOCK = threading.Lock()
+
+
+def tenant_store_path(tenant: str) -> Path:
+    """Database file for ``tenant`` under ``MCP_KG_STORE_DIR`` (distinct tenants never share a file)."""
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", tenant).lstrip(".") or "default"
+    if safe != tenant:
+        safe += "-" + hashlib.sha1(tenant.encode("utf-8"), usedforsecurity=False).hexdigest()[:8]
+    return Path(os.getenv("MCP_KG_STORE_DIR", "data/kg")) / f"{safe}.sqlite3"
+
+
+def tenant_store(tenant: str, *, create: bool = True) -> PooledKGStore | None:
+    """Return the process-wide store for ``tenant``.
+
+    With ``create=False`` a tenant without a graph file gets ``None`` instead
+    of a new empty database (used by read-only callers).
+    """
+    key = str(tenant)
+    store = _TENANT_STORES.get(key)
+    if store is not None:
+        return store
+    path = tenant_store_path(key)
+    if not create and not path.exists():
+        return None
+    with _TENANT_STORES_LOCK:
+        store = _TENANT_STORES.get(key)
+        if store is None:
+            store = PooledKGStore(path, read_connections=int(os.getenv("MCP_KG_READ_CONNECTIONS", "4")))
+            _TENANT_STORES[key] = store
+    return store
+
+
+def close_tenant_stores() -> None:
+    """Close every cached tenant store (shutdown and tests)."""
+    with _TENANT_STORES_LOCK:
+        for store in _TENANT_STORES.values():
+            store.close()
+        _TENANT_STORES.clear()
+
+
+__all__ = ["PooledKGStore", "close_tenant_stores", "tenant_store", "tenant_store_path"]
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 
 """SQLite-backed knowledge graph store (final clean version).
@@ -16,9 +17,28 @@ Security guarantees:
 * All dynamic values passed via parameter placeholders ("?").
 * WHERE clause assembly joins static column-comparison fragments only; user input is never
     interpolated directly into SQL strings (documented via ``# noqa: S608``).
-* IN clause in ``neighbors`` consists solely of repeated '?' placeholders.
+* Multi-id lookups pass the ids as one JSON array parameter expanded with
+    ``json_each``, so every query text is constant. sqlite3 caches the prepared
+    statement per connection and reuses it on every later call.
 """
 
+# Reachable node ids within ``depth`` hops (params: start, depth, start).
+_NEIGHBORS_SQL = (
+    "WITH RECURSIVE reach(id, hops) AS ("
+    " SELECT ?, 0"
+    " UNION SELECT e.dst_id, r.hops + 1 FROM kg_edges e JOIN reach r ON e.src_id = r.id WHERE r.hops < ?"
+    ") SELECT DISTINCT id FROM reach WHERE id != ?"
+)
+_NODES_BY_IDS_SQL = "SELECT * FROM kg_nodes WHERE id IN (SELECT value FROM json_each(?))"
+_EDGES_AMONG_SQL = (
+    "SELECT * FROM kg_edges WHERE src_id IN (SELECT value FROM json_each(?))"
+    " AND dst_id IN (SELECT value FROM json_each(?)) ORDER BY id LIMIT ?"
+)
+_MENTIONS_SQL = (
+    "SELECT n.id AS node_id, n.name AS name, e.created_at AS created_at"
+    " FROM kg_edges e JOIN kg_nodes n ON n.id = e.dst_id WHERE e.src_id = ? AND e.type = ?"
+)
+
 
 @dataclass
 class KGNode:
@@ -49,6 +69,16 @@ class KGStore:
         self.conn.row_factory = sqlite3.Row
         self._ensure_tables()
 
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        """Connection for read queries; subclasses may hand out pooled readers."""
+        yield self.conn
+
+    @contextmanager
+    def _writing(self) -> Iterator[sqlite3.Connection]:
+        """Connection for writes; subclasses may serialise writers."""
+        yield self.conn
+
     def _ensure_tables(self) -> None:
         cur = self.conn.cursor()
         cur.execute(
@@ -94,6 +124,8 @@ class KGStore:
             )
             """
         )
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_kg_nodes_lookup ON kg_nodes(tenant, type, name)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_kg_edges_src ON kg_edges(src_id, type)")
         self.conn.commit()
 
     # Node operations
@@ -105,19 +137,19 @@ class KGStore:
         attrs: dict[str, Any] | None = None,
         created_at: str = "",
     ) -> int:
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO kg_nodes (tenant, type, name, attrs_json, created_at) VALUES (?, ?, ?, ?, ?)",
-            (tenant, node_type, name, json.dumps(attrs or {}), created_at),
-        )
-        self.conn.commit()
+        with self._writing() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "INSERT INTO kg_nodes (tenant, type, name, attrs_json, created_at) VALUES (?, ?, ?, ?, ?)",
+                (tenant, node_type, name, json.dumps(attrs or {}), created_at),
+            )
+            conn.commit()
         row_id = cur.lastrowid
         if row_id is None:  # pragma: no cover
             raise RuntimeError("Expected lastrowid for inserted kg_node")
         return int(row_id)
 
     def query_nodes(self, tenant: str, *, node_type: str | None = None, name: str | None = None) -> list[KGNode]:
-        cur = self.conn.cursor()
         conditions = ["tenant = ?"]
         params: list[Any] = [tenant]
         if node_type:
@@ -129,16 +161,24 @@ class KGStore:
         # Dynamic assembly of WHERE clause uses only static column comparison
         # fragments with parameter placeholders; safe from injection.
         query = "SELECT * FROM kg_nodes WHERE " + " AND ".join(conditions)
-        cur.execute(query, params)
-        rows = cur.fetchall()
+        with self._reading() as conn:
+            rows = conn.execute(query, params).fetchall()
         return [KGNode(**row) for row in rows]
 
     def get_node(self, node_id: int) -> KGNode | None:
-        cur = self.conn.cursor()
-        cur.execute("SELECT * FROM kg_nodes WHERE id = ?", (node_id,))
-        row = cur.fetchone()
+        with self._reading() as conn:
+            row = conn.execute("SELECT * FROM kg_nodes WHERE id = ?", (node_id,)).fetchone()
         return KGNode(**row) if row else None
 
+    def get_nodes(self, node_ids: Iterable[int]) -> list[KGNode]:
+        """Fetch several nodes with one statement, ordered by id."""
+        ids = sorted({int(i) for i in node_ids})
+        if not ids:
+            return []
+        with self._reading() as conn:
+            rows = conn.execute(_NODES_BY_IDS_SQL + " ORDER BY id", (json.dumps(ids),)).fetchall()
+        return [KGNode(**row) for row in rows]
+
     # Edge operations
     def add_edge(
         self,
@@ -150,12 +190,14 @@ class KGStore:
         provenance_id: int | None = None,
         created_at: str = "",
     ) -> int:
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO kg_edges (src_id, dst_id, type, weight, provenance_id, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-            (src_id, dst_id, edge_type, weight, provenance_id, created_at),
-        )
-        self.conn.commit()
+        with self._writing() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "INSERT INTO kg_edges (src_id, dst_id, type, weight, provenance_id, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (src_id, dst_id, edge_type, weight, provenance_id, created_at),
+            )
+            conn.commit()
         row_id = cur.lastrowid
         if row_id is None:  # pragma: no cover
             raise RuntimeError("Expected lastrowid for inserted kg_edge")
@@ -168,7 +210,6 @@ class KGStore:
         dst_id: int | None = None,
         edge_type: str | None = None,
     ) -> list[KGEdge]:
-        cur = self.conn.cursor()
         conditions: list[str] = []
         params: list[Any] = []
         if src_id is not None:
@@ -183,23 +224,27 @@ class KGStore:
         query = "SELECT * FROM kg_edges"
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
-        cur.execute(query, params)
-        rows = cur.fetchall()
+        with self._reading() as conn:
+            rows = conn.execute(query, params).fetchall()
         return [KGEdge(**row) for row in rows]
 
+    def edges_among(self, node_ids: Iterable[int], limit: int = 400) -> list[KGEdge]:
+        """Return edges whose endpoints are both in ``node_ids`` (one statement)."""
+        ids = json.dumps(sorted({int(i) for i in node_ids}))
+        with self._reading() as conn:
+            rows = conn.execute(_EDGES_AMONG_SQL, (ids, ids, int(limit))).fetchall()
+        return [KGEdge(**row) for row in rows]
+
+    def mentions(self, entity_id: int, edge_type: str = "mentions") -> list[tuple[int, str, str]]:
+        """Return ``(node_id, name, created_at)`` for each ``edge_type`` edge leaving ``entity_id``."""
+        with self._reading() as conn:
+            rows = conn.execute(_MENTIONS_SQL, (entity_id, edge_type)).fetchall()
+        return [(int(r["node_id"]), r["name"], r["created_at"]) for r in rows]
+
     def neighbors(self, node_id: int, depth: int = 1) -> Iterable[int]:
         """Return node IDs reachable within ``depth`` hops."""
-        seen = {node_id}
-        frontier = {node_id}
-        for _ in range(depth):
-            if not frontier:
-                break
-            cur = self.conn.cursor()
-            q_marks = ",".join(["?"] * len(frontier))
-            sql = "SELECT dst_id FROM kg_edges WHERE src_id IN (" + q_marks + ")"
-            cur.execute(sql, list(frontier))
-            rows = {r[0] for r in cur.fetchall()}
-            rows -= seen
-            seen |= rows
-            frontier = rows
-        return seen - {node_id}
+        if depth <= 0:
+            return set()
+        with self._reading() as conn:
+            rows = conn.execute(_NEIGHBORS_SQL, (node_id, int(depth), node_id)).fetchall()
+        return {int(r[0]) for r in rows}
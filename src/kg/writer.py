@@ -0,0 +1,67 @@
+"""Write ingested episodes into a tenant's knowledge graph.
+
+Each episode becomes an ``episode`` node; every entity that
+:mod:`kg.extract` finds in its transcript becomes (or reuses) an ``entity``
+node with a ``mentions`` edge to the episode. ``created_at`` on the edge is
+the episode's epoch timestamp, which is what :func:`kg.reasoner.timeline`
+orders by. This is the shape the MCP KG server's ``kg_query`` and
+``kg_timeline`` read.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from .extract import extract_stream
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .store import KGStore
+
+
+# Serialises get-or-create so concurrent ingests never duplicate a node.
+_INDEX_LOCK = threading.Lock()
+
+
+def _get_or_add_node(
+    store: KGStore, tenant: str, node_type: str, name: str, attrs: dict[str, Any] | None = None
+) -> tuple[int, bool]:
+    nodes = store.query_nodes(tenant, node_type=node_type, name=name)
+    if nodes:
+        return int(nodes[0].id or 0), False
+    return store.add_node(tenant, node_type, name, attrs), True
+
+
+def index_episode(
+    store: KGStore,
+    tenant: str,
+    episode_id: str,
+    texts: Iterable[str],
+    *,
+    created_at: str = "",
+    attrs: dict[str, Any] | None = None,
+) -> int:
+    """Link every entity mentioned in ``texts`` to ``episode_id``; returns the number of new edges.
+
+    An episode that is already in the graph is left as is, so re-ingesting it
+    is a no-op.
+    """
+    with _INDEX_LOCK:
+        episode_node, created = _get_or_add_node(store, tenant, "episode", episode_id, attrs)
+        if not created:
+            return 0
+        seen: set[str] = set()
+        for entities, _ in extract_stream(f" {text}" for text in texts):
+            for item in entities:
+                if item.text in seen:
+                    continue
+                seen.add(item.text)
+                entity_node, _ = _get_or_add_node(store, tenant, "entity", item.text)
+                store.add_edge(entity_node, episode_node, "mentions", created_at=created_at)
+        return len(seen)
+
+
+__all__ = ["index_episode"]
@@ -9,8 +9,12 @@ Resources:
 - grounding://profiles -> contents of config/grounding.yaml
 
 Notes:
-- Uses the SQLite-backed KGStore with default path (in-memory unless the app wires persistence).
-- Read-only and size-capped; returns empty sets when data is unavailable.
+- Each tenant's graph is the file-backed ``PooledKGStore`` that ingestion
+  fills (``kg.tenant_store``; ``$MCP_KG_STORE_DIR/<tenant>.sqlite3``, default
+  ``data/kg``, written when ``ENABLE_KG_INGEST`` is on). It is opened once and
+  kept for the life of the process. Concurrent tool calls share its pool of
+  read-only connections.
+- Read-only and size-capped; returns empty sets when the tenant has no graph yet.
 """
 
 from __future__ import annotations
@@ -20,6 +24,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 
 
 try:
@@ -54,14 +59,31 @@ class _StubMCP:  # pragma: no cover - used when FastMCP not installed
 kg_mcp = FastMCP("Grounding & KG Server") if _FASTMCP_AVAILABLE else _StubMCP("Grounding & KG Server")
 
 
-def _open_store():
-    # Default ephemeral store; production setups should wire a persistent path.
+_UNAVAILABLE = object()
+
+
+def _tenant_db_path(tenant: str) -> Path:
+    from kg.pooled_store import tenant_store_path
+
+    return tenant_store_path(tenant)
+
+
+def _open_store(tenant: str):
+    """Return the tenant's long-lived store, ``None`` if it has no graph, or ``_UNAVAILABLE``."""
     try:
-        from kg.store import KGStore  # type: ignore
+        from kg.pooled_store import tenant_store  # type: ignore
 
-        return KGStore()
+        # Read-only server: never create an empty graph for unknown tenants.
+        return tenant_store(str(tenant), create=False)
     except Exception:  # pragma: no cover
-        return None
+        return _UNAVAILABLE
+
+
+def close_stores() -> None:
+    """Close every cached tenant store (server shutdown and tests)."""
+    from kg.pooled_store import close_tenant_stores
+
+    close_tenant_stores()
 
 
 def _kg_query_impl(tenant: str, entity: str, depth: int = 1) -> dict:
@@ -70,31 +92,23 @@ def _kg_query_impl(tenant: str, entity: str, depth: int = 1) -> dict:
     Output shape: { nodes: [{id,type,name}], edges: [{src,dst,type}] }
     """
 
-    store = _open_store()
-    if store is None:
+    store = _open_store(tenant)
+    if store is _UNAVAILABLE:
         return {"nodes": [], "edges": [], "error": "kg_store_unavailable"}
+    if store is None:
+        return {"nodes": [], "edges": []}
     try:
-        nodes = store.query_nodes(tenant, type="entity", name=str(entity))
+        nodes = store.query_nodes(tenant, node_type="entity", name=str(entity))
         if not nodes:
             return {"nodes": [], "edges": []}
-        root = nodes[0]
-        # Collect neighbor ids up to depth
-        neighbor_ids = set(store.neighbors(int(root.id or 0), max(0, int(depth))))
-        include_ids = {int(root.id or 0)} | {int(x) for x in neighbor_ids}
-        # Build node list
-        out_nodes: list[dict[str, Any]] = []
-        for nid in include_ids:
-            n = store.get_node(nid)
-            if n is None:
-                continue
-            out_nodes.append({"id": int(n.id or 0), "type": n.type, "name": n.name})
-        # Build edges: gather direct edges from each included src
-        out_edges: list[dict[str, Any]] = []
-        for src in list(include_ids):
-            for e in store.query_edges(src_id=src):
-                if (e.dst_id in include_ids) and len(out_edges) < 200:
-                    out_edges.append({"src": int(e.src_id), "dst": int(e.dst_id), "type": e.type})
-        return {"nodes": out_nodes[:200], "edges": out_edges[:400]}
+        root_id = int(nodes[0].id or 0)
+        neighbor_ids = set(store.neighbors(root_id, max(0, int(depth))))
+        include_ids = {root_id} | {int(x) for x in neighbor_ids}
+        out_nodes = [{"id": int(n.id or 0), "type": n.type, "name": n.name} for n in store.get_nodes(include_ids)]
+        out_edges = [
+            {"src": int(e.src_id), "dst": int(e.dst_id), "type": e.type} for e in store.edges_among(include_ids, 200)
+        ]
+        return {"nodes": out_nodes[:200], "edges": out_edges}
     except Exception as exc:
         return {"nodes": [], "edges": [], "error": str(exc)}
 
@@ -102,9 +116,11 @@ def _kg_query_impl(tenant: str, entity: str, depth: int = 1) -> dict:
 def _kg_timeline_impl(tenant: str, entity: str) -> dict:
     """Return timeline events for an entity (best-effort; may be empty)."""
 
-    store = _open_store()
-    if store is None:
+    store = _open_store(tenant)
+    if store is _UNAVAILABLE:
         return {"events": [], "error": "kg_store_unavailable"}
+    if store is None:
+        return {"events": []}
     try:
         from kg.reasoner import timeline  # type: ignore
 
@@ -195,6 +211,7 @@ def grounding_profiles() -> Any:
 
 
 __all__ = [
+    "close_stores",
     "grounding_profiles",
     "kg_mcp",
     "kg_query",
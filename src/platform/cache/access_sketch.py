@@ -0,0 +1,172 @@
+"""Bounded-memory access-frequency tracking for cache warming.
+
+:class:`CountMinSketch` estimates how often any key was seen using a fixed
+``depth x width`` table of counters, whatever the number of distinct keys.
+Estimates never undercount; with conservative update the overcount is
+small for the keys that matter (the frequent ones).
+
+:class:`HeavyHitters` keeps the ``k`` keys with the highest sketch estimate
+in a min-heap, so deciding whether a key enters the top-k is O(log k).
+Counts decay: every ``decay_interval`` seconds all counters are multiplied by
+``decay_factor``, so heat reflects recent traffic and keys that went cold
+drop out on their own.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_SKETCH_WIDTH = 2048
+DEFAULT_SKETCH_DEPTH = 4
+DEFAULT_TOP_K = 100
+DEFAULT_DECAY_FACTOR = 0.5
+DEFAULT_DECAY_INTERVAL = 600.0
+# Second hash is salted so the row indices of two keys are independent.
+_SALT = "\x00cms"
+
+
+class CountMinSketch:
+    """Count-min sketch with conservative update and multiplicative decay."""
+
+    __slots__ = ("_rows", "depth", "total", "width")
+
+    def __init__(self, width: int = DEFAULT_SKETCH_WIDTH, depth: int = DEFAULT_SKETCH_DEPTH) -> None:
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self._rows = [[0.0] * width for _ in range(depth)]
+        self.total = 0.0
+
+    def _indices(self, key: str) -> list[int]:
+        # Kirsch-Mitzenmacher: depth indices from two hashes.
+        h1 = hash(key)
+        h2 = hash(key + _SALT) | 1
+        width = self.width
+        return [(h1 + i * h2) % width for i in range(self.depth)]
+
+    def add(self, key: str, count: float = 1.0) -> float:
+        """Count ``key`` and return its new estimate."""
+        indices = self._indices(key)
+        rows = self._rows
+        estimate = min(rows[i][j] for i, j in enumerate(indices)) + count
+        # Conservative update: only raise counters that are below the new estimate.
+        for i, j in enumerate(indices):
+            if rows[i][j] < estimate:
+                rows[i][j] = estimate
+        self.total += count
+        return estimate
+
+    def estimate(self, key: str) -> float:
+        rows = self._rows
+        return min(rows[i][j] for i, j in enumerate(self._indices(key)))
+
+    def decay(self, factor: float) -> None:
+        """Scale every counter by ``factor`` (0-1)."""
+        self._rows = [[value * factor for value in row] for row in self._rows]
+        self.total *= factor
+
+    def clear(self) -> None:
+        self._rows = [[0.0] * self.width for _ in range(self.depth)]
+        self.total = 0.0
+
+
+class HeavyHitters:
+    """Top-k keys by decayed access count, backed by a count-min sketch."""
+
+    def __init__(
+        self,
+        k: int = DEFAULT_TOP_K,
+        width: int = DEFAULT_SKETCH_WIDTH,
+        depth: int = DEFAULT_SKETCH_DEPTH,
+        decay_factor: float = DEFAULT_DECAY_FACTOR,
+        decay_interval: float = DEFAULT_DECAY_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0.0 < decay_factor <= 1.0:
+            raise ValueError("decay_factor must be in (0, 1]")
+        self.k = max(1, k)
+        self.sketch = CountMinSketch(width, depth)
+        self.decay_factor = decay_factor
+        self.decay_interval = decay_interval
+        self._clock = clock
+        self._next_decay = clock() + decay_interval
+        self._counts: dict[str, float] = {}
+        # (count, key) entries; stale ones (count no longer current) are skipped lazily.
+        self._heap: list[tuple[float, str]] = []
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def record(self, key: str, count: float = 1.0) -> bool:
+        """Count one access to ``key``; returns whether it is in the top-k."""
+        if self._clock() >= self._next_decay:
+            self.decay()
+        estimate = self.sketch.add(key, count)
+        counts = self._counts
+        if key in counts:
+            counts[key] = estimate
+            heapq.heappush(self._heap, (estimate, key))
+            if len(self._heap) > 4 * self.k:
+                self._rebuild_heap()
+            return True
+        if len(counts) < self.k:
+            counts[key] = estimate
+            heapq.heappush(self._heap, (estimate, key))
+            return True
+        floor, floor_key = self._min()
+        if estimate <= floor:
+            return False
+        heapq.heappop(self._heap)
+        del counts[floor_key]
+        counts[key] = estimate
+        heapq.heappush(self._heap, (estimate, key))
+        return True
+
+    def _min(self) -> tuple[float, str]:
+        heap, counts = self._heap, self._counts
+        while heap[0][1] not in counts or counts[heap[0][1]] != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0]
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(count, key) for key, count in self._counts.items()]
+        heapq.heapify(self._heap)
+
+    def decay(self) -> None:
+        """Apply one decay step now (normally triggered by ``record``)."""
+        factor = self.decay_factor
+        self.sketch.decay(factor)
+        self._counts = {key: count * factor for key, count in self._counts.items()}
+        self._rebuild_heap()
+        self._next_decay = self._clock() + self.decay_interval
+
+    def estimate(self, key: str) -> float:
+        return self._counts.get(key) or self.sketch.estimate(key)
+
+    def top(self, limit: int | None = None) -> list[tuple[str, float]]:
+        """Hottest keys first, as ``(key, decayed_count)``."""
+        ranked = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+        return ranked if limit is None else ranked[:limit]
+
+    def discard(self, key: str) -> None:
+        """Drop ``key`` from the top-k (its sketch counts stay)."""
+        if self._counts.pop(key, None) is not None:
+            self._rebuild_heap()
+
+    def clear(self) -> None:
+        self.sketch.clear()
+        self._counts.clear()
+        self._heap.clear()
+
+
+__all__ = ["CountMinSketch", "HeavyHitters"]
@@ -41,6 +41,12 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+def _current_tenant_id() -> str:
+    """Return the active tenant id; ``TenantContext`` itself is unhashable."""
+    ctx = current_tenant()
+    return str(getattr(ctx, "tenant_id", None) or "default")
+
+
 class PooledAgent:
     """Wrapper for pooled agent instances with metadata tracking.
 
@@ -185,7 +191,7 @@ class AgentPool:
             logger.warning("cannot_warmup_unknown_agent_type", agent_type=agent_type)
             return
 
-        tenant_id = current_tenant()
+        tenant_id = _current_tenant_id()
         created = 0
 
         for _ in range(count):
@@ -292,7 +298,7 @@ class AgentPool:
         Raises:
             RuntimeError: If no agent available and creation fails
         """
-        tenant_id = current_tenant()
+        tenant_id = _current_tenant_id()
         agent = await self._acquire_agent(agent_type, tenant_id)
 
         if agent is None:
@@ -7,13 +7,18 @@ and reduce latency for frequently accessed data in the Ultimate Discord Intellig
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
+from platform.cache.access_sketch import DEFAULT_DECAY_FACTOR, DEFAULT_DECAY_INTERVAL, DEFAULT_TOP_K, HeavyHitters
+from platform.security.rate_limit import TokenBucket
 from typing import TYPE_CHECKING, Any
 
+from ultimate_discord_intelligence_bot.obs.metrics import get_metrics
+
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -28,6 +33,12 @@ MIN_PATTERN_LENGTH = 3
 STABLE_PATTERN_LENGTH = 5
 MAX_PATTERN_HISTORY = 10
 PATTERN_VARIATION_THRESHOLD = 0.5
+MAX_ACCESS_TIMES = 32
+MAX_TRACKED_WARMED_KEYS = 10000
+DEFAULT_REFRESH_AHEAD_SECONDS = 60.0
+DEFAULT_CHECK_INTERVAL_SECONDS = 30.0
+DEFAULT_MAX_WARM_RATE = 20.0
+DEFAULT_WARM_BURST = 50
 
 
 @dataclass
@@ -38,10 +49,11 @@ class AccessPattern:
     access_count: int = 0
     last_accessed: float = 0.0
     first_accessed: float = 0.0
-    access_times: list[float] = field(default_factory=list)
+    access_times: deque[float] = field(default_factory=lambda: deque(maxlen=MAX_ACCESS_TIMES))
     average_interval: float = 0.0
     peak_hour: int = 0
     weekday_pattern: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+    heat: float = 0.0
 
     def record_access(self, timestamp: float | None = None) -> None:
         """Record a cache access event."""
@@ -55,9 +67,8 @@ class AccessPattern:
         dt = datetime.fromtimestamp(timestamp)
         self.peak_hour = dt.hour
         self.weekday_pattern[dt.weekday()] += 1
-        if len(self.access_times) > 1:
-            intervals = [self.access_times[i] - self.access_times[i - 1] for i in range(1, len(self.access_times))]
-            self.average_interval = sum(intervals) / len(intervals)
+        if self.access_count > 1:
+            self.average_interval = (self.last_accessed - self.first_accessed) / (self.access_count - 1)
 
     def get_access_frequency(self) -> float:
         """Calculate access frequency (accesses per hour)."""
@@ -83,70 +94,260 @@ class AccessPattern:
 
 
 class AccessPatternTracker:
-    """Tracks and analyzes cache access patterns for intelligent warming."""
+    """Tracks and analyzes cache access patterns for intelligent warming.
+
+    Heat is tracked per cache with a count-min sketch and a decayed top-k
+    heap (:class:`~platform.cache.access_sketch.HeavyHitters`), so memory is
+    bounded by the sketch size plus ``top_k`` patterns per cache no matter how
+    many distinct keys are seen. Detailed :class:`AccessPattern` records are
+    only kept for keys currently in the top-k.
+    """
 
-    def __init__(self, max_patterns: int = 10000):
+    def __init__(
+        self,
+        max_patterns: int = 10000,
+        top_k: int = DEFAULT_TOP_K,
+        decay_factor: float = DEFAULT_DECAY_FACTOR,
+        decay_interval: float = DEFAULT_DECAY_INTERVAL,
+    ):
         self.max_patterns = max_patterns
-        self.patterns: dict[str, AccessPattern] = {}
+        self.top_k = top_k
+        self.decay_factor = decay_factor
+        self.decay_interval = decay_interval
+        self.patterns: dict[tuple[str, str], AccessPattern] = {}
         self.key_cache_map: dict[str, str] = {}
-        self._lock = asyncio.Lock()
+        self._hitters: dict[str, HeavyHitters] = {}
+
+    def hitters(self, cache_name: str) -> HeavyHitters:
+        """Heavy-hitter tracker for ``cache_name`` (created on first use)."""
+        hitters = self._hitters.get(cache_name)
+        if hitters is None:
+            hitters = HeavyHitters(k=self.top_k, decay_factor=self.decay_factor, decay_interval=self.decay_interval)
+            self._hitters[cache_name] = hitters
+        return hitters
+
+    def record(self, cache_name: str, key: str, timestamp: float | None = None) -> bool:
+        """Record one access; returns whether ``key`` is currently hot (in the top-k)."""
+        hitters = self.hitters(cache_name)
+        hot = hitters.record(key)
+        pattern_key = (cache_name, key)
+        if not hot:
+            self.patterns.pop(pattern_key, None)
+            return False
+        pattern = self.patterns.get(pattern_key)
+        if pattern is None:
+            if len(self.patterns) >= self.max_patterns:
+                self._drop_cold_patterns()
+            pattern = self.patterns[pattern_key] = AccessPattern(key=key)
+            self.key_cache_map[key] = cache_name
+        pattern.record_access(timestamp)
+        pattern.heat = hitters.estimate(key)
+        return True
+
+    def _drop_cold_patterns(self) -> None:
+        """Forget patterns whose keys fell out of their cache's top-k (or the stalest one)."""
+        for cache_name, key in list(self.patterns):
+            if key not in self.hitters(cache_name):
+                del self.patterns[cache_name, key]
+        if len(self.patterns) >= self.max_patterns:
+            del self.patterns[min(self.patterns, key=lambda k: self.patterns[k].last_accessed)]
 
     async def record_access(self, cache_name: str, key: str, timestamp: float | None = None) -> None:
         """Record a cache access for pattern analysis."""
-        async with self._lock:
-            pattern_key = f"{cache_name}:{key}"
-            if pattern_key not in self.patterns:
-                if len(self.patterns) >= self.max_patterns:
-                    oldest_key = min(self.patterns.keys(), key=lambda k: self.patterns[k].last_accessed)
-                    del self.patterns[oldest_key]
-                self.patterns[pattern_key] = AccessPattern(key=key)
-                self.key_cache_map[key] = cache_name
-            self.patterns[pattern_key].record_access(timestamp)
+        self.record(cache_name, key, timestamp)
+
+    def hot_keys(self, cache_name: str, limit: int | None = None) -> list[tuple[str, float]]:
+        """Hottest keys of ``cache_name`` as ``(key, decayed_count)``, hottest first."""
+        hitters = self._hitters.get(cache_name)
+        return hitters.top(limit) if hitters is not None else []
 
     async def get_top_patterns(self, cache_name: str, limit: int = 50) -> list[AccessPattern]:
         """Get top access patterns for a specific cache."""
-        async with self._lock:
-            cache_patterns = [
-                pattern for pattern_key, pattern in self.patterns.items() if pattern_key.startswith(f"{cache_name}:")
-            ]
-            cache_patterns.sort(key=lambda p: p.get_popularity_score(), reverse=True)
-            return cache_patterns[:limit]
+        top: list[AccessPattern] = []
+        for key, heat in self.hot_keys(cache_name, limit):
+            pattern = self.patterns.get((cache_name, key))
+            if pattern is not None:
+                pattern.heat = heat
+                top.append(pattern)
+        return top
 
     async def get_predictive_candidates(self, cache_name: str, min_access_count: int = 5) -> list[str]:
         """Get keys that should be predictively warmed based on patterns."""
-        async with self._lock:
-            candidates = []
-            for pattern_key, pattern in self.patterns.items():
-                if not pattern_key.startswith(f"{cache_name}:"):
-                    continue
-                if pattern.access_count >= min_access_count:
-                    hours_since_last = (time.time() - pattern.last_accessed) / 3600
-                    if hours_since_last <= pattern.average_interval / 3600:
-                        candidates.append(pattern.key)
-            return candidates[:100]
+        candidates = []
+        now = time.time()
+        for pattern in await self.get_top_patterns(cache_name, limit=self.top_k):
+            if pattern.access_count >= min_access_count and now - pattern.last_accessed <= pattern.average_interval:
+                candidates.append(pattern.key)
+        return candidates[:100]
 
     async def cleanup_old_patterns(self, max_age_days: int = 30) -> int:
         """Remove patterns older than specified age."""
-        async with self._lock:
-            cutoff_time = time.time() - max_age_days * 24 * 3600
-            old_keys = [key for key, pattern in self.patterns.items() if pattern.last_accessed < cutoff_time]
-            for key in old_keys:
-                del self.patterns[key]
-            removed_count = len(old_keys)
-            if removed_count > 0:
-                logger.info(f"Cleaned up {removed_count} old access patterns")
-            return removed_count
+        cutoff_time = time.time() - max_age_days * 24 * 3600
+        old_keys = [key for key, pattern in self.patterns.items() if pattern.last_accessed < cutoff_time]
+        for cache_name, key in old_keys:
+            del self.patterns[cache_name, key]
+            if cache_name in self._hitters:
+                self._hitters[cache_name].discard(key)
+        removed_count = len(old_keys)
+        if removed_count > 0:
+            logger.info(f"Cleaned up {removed_count} old access patterns")
+        return removed_count
 
 
 class CacheWarmer:
-    """Intelligent cache warming service with predictive loading strategies."""
+    """Intelligent cache warming service with predictive loading strategies.
 
-    def __init__(self, cache: EnhancedRedisCache, warm_interval_hours: int = 6) -> None:
+    Reads made through :meth:`get` (or reported with :meth:`record_access`)
+    feed the access tracker. Each warming cycle checks the remaining TTL of
+    the hottest keys and re-populates, through the loader registered for the
+    key's prefix, those that are missing or expire within
+    ``refresh_ahead_seconds``. Warming traffic is capped by a token bucket.
+    """
+
+    def __init__(
+        self,
+        cache: EnhancedRedisCache,
+        warm_interval_hours: float = 6,
+        *,
+        tracker: AccessPatternTracker | None = None,
+        cache_name: str | None = None,
+        refresh_ahead_seconds: float = DEFAULT_REFRESH_AHEAD_SECONDS,
+        check_interval_seconds: float = DEFAULT_CHECK_INTERVAL_SECONDS,
+        max_warm_rate: float = DEFAULT_MAX_WARM_RATE,
+        warm_burst: int = DEFAULT_WARM_BURST,
+        hot_key_limit: int = 50,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
         self.cache = cache
         self.warm_interval_hours = warm_interval_hours
+        self.tracker = tracker or get_access_tracker()
+        self.cache_name = cache_name or getattr(cache, "namespace", "default")
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.hot_key_limit = hot_key_limit
+        self._clock = clock
+        self._rate_limiter = TokenBucket(rate=max_warm_rate, capacity=warm_burst)
+        self._loaders: dict[str, Callable[[str], dict[str, Any] | None]] = {}
+        # Warmed key -> when its previous entry would have expired; a hit after that saved a miss.
+        self._warmed: dict[str, float] = {}
+        self._stats = {
+            "lookups": 0,
+            "hits": 0,
+            "warmed_hits": 0,
+            "keys_warmed": 0,
+            "rate_limited": 0,
+            "load_failures": 0,
+            "warming_seconds": 0.0,
+        }
         self._warming_task: asyncio.Task[None] | None = None
         self._shutdown_event = asyncio.Event()
 
+    def register_loader(self, loader: Callable[[str], dict[str, Any] | None], prefix: str = "") -> None:
+        """Use ``loader`` to re-populate hot keys starting with ``prefix``."""
+        self._loaders[prefix] = loader
+
+    def _loader_for(self, key: str) -> Callable[[str], dict[str, Any] | None] | None:
+        matches = [prefix for prefix in self._loaders if key.startswith(prefix)]
+        return self._loaders[max(matches, key=len)] if matches else None
+
+    def record_access(self, key: str, hit: bool, timestamp: float | None = None) -> None:
+        """Report a lookup of ``key`` served outside :meth:`get`."""
+        self.tracker.record(self.cache_name, key, timestamp)
+        self._stats["lookups"] += 1
+        if not hit:
+            self._warmed.pop(key, None)
+            return
+        self._stats["hits"] += 1
+        expired_at = self._warmed.get(key)
+        if expired_at is not None and (timestamp or self._clock()) >= expired_at:
+            del self._warmed[key]
+            self._stats["warmed_hits"] += 1
+            get_metrics().counter("cache_warming_saved_misses_total", labels={"cache": self.cache_name}).inc()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Read ``key`` from the cache and record the access for warming."""
+        value = self.cache.get(key, track_access=False)
+        self.record_access(key, value is not None)
+        return value
+
+    async def warm_hot_keys(self, keys: list[str] | None = None) -> int:
+        """Re-populate hot keys that are missing or about to expire.
+
+        Args:
+            keys: Keys to consider; the tracker's hottest keys when omitted
+
+        Returns:
+            Number of keys written back to the cache
+        """
+        if not self._loaders:
+            return 0
+        if keys is None:
+            keys = [key for key, _ in self.tracker.hot_keys(self.cache_name, self.hot_key_limit)]
+        if not keys:
+            return 0
+        started = time.perf_counter()
+        ttls = await asyncio.to_thread(self.cache.ttl_many, keys)
+        now = self._clock()
+        loaded: dict[str, dict[str, Any]] = {}
+        expiries: dict[str, float] = {}
+        outcomes: dict[str, int] = defaultdict(int)
+        for key in keys:
+            ttl = ttls.get(key)
+            # -2: missing, -1: no expiry, None: lookup failed.
+            if ttl is None or ttl == -1 or ttl > self.refresh_ahead_seconds:
+                continue
+            loader = self._loader_for(key)
+            if loader is None:
+                outcomes["no_loader"] += 1
+                continue
+            if not self._rate_limiter.allow("warm"):
+                outcomes["rate_limited"] += 1
+                continue
+            try:
+                value = await asyncio.to_thread(loader, key)
+            except Exception as e:
+                logger.warning(f"Cache warming loader failed for key '{key}': {e}")
+                outcomes["failed"] += 1
+                continue
+            if value is None:
+                outcomes["empty"] += 1
+                continue
+            loaded[key] = value
+            expiries[key] = now + max(ttl, 0)
+        warmed = await asyncio.to_thread(self.cache.mset, loaded) if loaded else 0
+        if warmed:
+            outcomes["warmed"] += warmed
+            self._warmed.update(expiries)
+            if len(self._warmed) > MAX_TRACKED_WARMED_KEYS:
+                self._warmed = dict(list(self._warmed.items())[-MAX_TRACKED_WARMED_KEYS:])
+        elapsed = time.perf_counter() - started
+        self._stats["keys_warmed"] += warmed
+        self._stats["rate_limited"] += outcomes["rate_limited"]
+        self._stats["load_failures"] += outcomes["failed"]
+        self._stats["warming_seconds"] += elapsed
+        metrics = get_metrics()
+        for outcome, count in outcomes.items():
+            metrics.counter("cache_warming_keys_total", labels={"cache": self.cache_name, "outcome": outcome}).inc(
+                count
+            )
+        metrics.histogram("cache_warming_cycle_seconds", elapsed, labels={"cache": self.cache_name})
+        self._publish_hit_rates()
+        return warmed
+
+    def hit_rates(self) -> dict[str, float]:
+        """Observed hit rate and the hit rate warming is responsible for."""
+        lookups = self._stats["lookups"]
+        if not lookups:
+            return {"hit_rate": 0.0, "hit_rate_without_warming": 0.0, "hit_rate_gain": 0.0}
+        hit_rate = self._stats["hits"] / lookups
+        baseline = (self._stats["hits"] - self._stats["warmed_hits"]) / lookups
+        return {"hit_rate": hit_rate, "hit_rate_without_warming": baseline, "hit_rate_gain": hit_rate - baseline}
+
+    def _publish_hit_rates(self) -> None:
+        metrics = get_metrics()
+        for name, value in self.hit_rates().items():
+            metrics.gauge(f"cache_warming_{name}", labels={"cache": self.cache_name}).set(value)
+
     async def start_warming_cycle(self) -> None:
         """Start the periodic cache warming cycle."""
         if self._warming_task is not None:
@@ -166,25 +367,41 @@ class CacheWarmer:
         logger.info("Cache warming cycle stopped")
 
     async def _warming_loop(self) -> None:
-        """Main warming loop that runs periodically."""
+        """Main warming loop that runs periodically.
+
+        With loaders registered it runs every ``check_interval_seconds`` so
+        hot keys are refreshed before they expire.
+        """
         while not self._shutdown_event.is_set():
             try:
                 await self._perform_cache_warming()
-                await asyncio.sleep(self.warm_interval_hours * 3600)
+                interval = self.check_interval_seconds if self._loaders else self.warm_interval_hours * 3600
             except Exception as e:
                 logger.error(f"Cache warming cycle error: {e}")
-                await asyncio.sleep(300)
+                interval = 300
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._shutdown_event.wait(), timeout=interval)
+
+    def _hot_keys(self, limit: int) -> list[tuple[str, float]]:
+        """Hottest keys from the tracker, falling back to Redis access counters."""
+        hot = self.tracker.hot_keys(self.cache_name, limit)
+        if hot:
+            return hot
+        return [(key, float(count)) for key, count in self.cache.get_frequent_keys(limit=limit)]
 
     async def _perform_cache_warming(self) -> None:
         """Perform intelligent cache warming based on access patterns."""
         try:
-            frequent_keys = self.cache.get_frequent_keys(limit=50)
-            if not frequent_keys:
+            hot_keys = self._hot_keys(self.hot_key_limit)
+            if not hot_keys:
                 logger.debug("No frequent keys found for cache warming")
                 return
-            logger.info(f"Found {len(frequent_keys)} frequently accessed keys for warming")
-            for key, access_count in frequent_keys[:10]:
-                logger.debug(f"Would warm cache for key '{key}' (accessed {access_count} times)")
+            logger.info(f"Found {len(hot_keys)} frequently accessed keys for warming")
+            if self._loaders:
+                warmed = await self.warm_hot_keys([key for key, _ in hot_keys])
+                logger.info(f"Warmed {warmed} hot keys ahead of expiry")
+            else:
+                logger.debug("No cache warming loaders registered")
             efficiency = self.cache.get_cache_efficiency_score()
             logger.info(f"Current cache efficiency score: {efficiency:.2f}")
             if efficiency < MEDIUM_EFFICIENCY_THRESHOLD:
@@ -224,7 +441,7 @@ class CacheWarmer:
     def get_warming_stats(self) -> dict[str, Any]:
         """Get cache warming statistics and recommendations."""
         try:
-            frequent_keys = self.cache.get_frequent_keys(limit=20)
+            frequent_keys = self._hot_keys(20)
             efficiency = self.cache.get_cache_efficiency_score()
             cache_stats = self.cache.get_stats()
             return {
@@ -232,13 +449,14 @@ class CacheWarmer:
                 "frequent_keys_count": len(frequent_keys),
                 "top_keys": frequent_keys[:5],
                 "cache_stats": cache_stats,
+                "warming": {**self._stats, **self.hit_rates(), "loaders": len(self._loaders)},
                 "recommendations": self._generate_recommendations(efficiency, frequent_keys),
             }
         except Exception as e:
             logger.error(f"Failed to get warming stats: {e}")
             return {"error": str(e)}
 
-    def _generate_recommendations(self, efficiency: float, frequent_keys: list[tuple[str, int]]) -> list[str]:
+    def _generate_recommendations(self, efficiency: float, frequent_keys: list[tuple[str, float]]) -> list[str]:
         """Generate cache optimization recommendations."""
         recommendations = []
         if efficiency < LOW_EFFICIENCY_THRESHOLD:
@@ -258,22 +476,28 @@ class PredictiveCacheWarmer(CacheWarmer):
     """Advanced cache warmer with predictive loading based on usage patterns."""
 
     def __init__(
-        self, cache: EnhancedRedisCache, warm_interval_hours: int = 4, prediction_window_hours: int = 24
+        self,
+        cache: EnhancedRedisCache,
+        warm_interval_hours: float = 4,
+        prediction_window_hours: int = 24,
+        **kwargs: Any,
     ) -> None:
-        super().__init__(cache, warm_interval_hours)
+        super().__init__(cache, warm_interval_hours, **kwargs)
         self.prediction_window_hours = prediction_window_hours
-        self._usage_patterns: dict[str, list[int]] = {}
+        self._usage_patterns: dict[str, list[float]] = {}
 
     async def _perform_cache_warming(self) -> None:
         """Perform predictive cache warming based on historical patterns."""
         try:
             await self._analyze_usage_patterns()
-            frequent_keys = self.cache.get_frequent_keys(limit=100)
+            frequent_keys = self._hot_keys(100)
             if not frequent_keys:
                 logger.debug("No frequent keys found for predictive warming")
                 return
             predicted_keys = self._predict_needed_keys(frequent_keys)
             logger.info(f"Predictive warming: {len(predicted_keys)} keys predicted for future access")
+            if self._loaders and predicted_keys:
+                await self.warm_hot_keys(predicted_keys)
             efficiency = self.cache.get_cache_efficiency_score()
             predictive_score = self._calculate_predictive_score(frequent_keys)
             logger.info(f"Cache efficiency: {efficiency:.2f}, Predictive score: {predictive_score:.2f}")
@@ -283,7 +507,7 @@ class PredictiveCacheWarmer(CacheWarmer):
     async def _analyze_usage_patterns(self) -> None:
         """Analyze historical usage patterns for prediction."""
         try:
-            frequent_keys = self.cache.get_frequent_keys(limit=50)
+            frequent_keys = self._hot_keys(50)
             for key, count in frequent_keys:
                 if key not in self._usage_patterns:
                     self._usage_patterns[key] = []
@@ -293,7 +517,7 @@ class PredictiveCacheWarmer(CacheWarmer):
         except Exception as e:
             logger.error(f"Failed to analyze usage patterns: {e}")
 
-    def _predict_needed_keys(self, frequent_keys: list[tuple[str, int]]) -> list[str]:
+    def _predict_needed_keys(self, frequent_keys: list[tuple[str, float]]) -> list[str]:
         """Predict which keys will be needed based on patterns."""
         predicted = []
         for key, current_count in frequent_keys:
@@ -304,7 +528,7 @@ class PredictiveCacheWarmer(CacheWarmer):
                     predicted.append(key)
         return predicted[:20]
 
-    def _calculate_predictive_score(self, frequent_keys: list[tuple[str, int]]) -> float:
+    def _calculate_predictive_score(self, frequent_keys: list[tuple[str, float]]) -> float:
         """Calculate predictive cache score based on pattern stability."""
         if not frequent_keys:
             return 0.0
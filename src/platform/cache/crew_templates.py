@@ -0,0 +1,154 @@
+"""Reusable crew templates built on top of :class:`AgentPool`.
+
+Building the intelligence crew constructs every agent, its tool wrappers and
+its LLM client. Only the tasks depend on the request, so rebuilding the rest
+each time wastes setup time and allocations.
+
+:class:`CrewTemplateCache` builds the agent set for a ``(depth, tenant
+config)`` pair once. It then hands out leased copies for each request:
+
+- An agent set is an ``AgentPool`` entry whose agent type is the template
+  key. The pool already partitions entries by the current tenant, so tenants
+  never share agents.
+- Concurrent requests for the same template each get their own agent set.
+  The pool builds another one only when every existing set is leased.
+- Tool wrapper context (``_shared_context``) is cleared when a set is leased
+  out. Each request then creates its own Task and Crew objects, so no task
+  state leaks from one request to the next.
+
+Usage:
+    from platform.cache.crew_templates import CrewTemplateCache
+
+    templates = CrewTemplateCache()
+    async with templates.lease("deep", {"parallel_analysis": True}, build_agents) as agents:
+        crew = build_intelligence_crew(url, "deep", agents=agents)
+        crew.kickoff(inputs={"url": url})
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from .agent_pool import AgentPool
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class TemplateStats:
+    """Build and reuse counters for one template key."""
+
+    builds: int = 0
+    leases: int = 0
+    build_seconds: float = 0.0
+
+    @property
+    def reuses(self) -> int:
+        return max(0, self.leases - self.builds)
+
+    @property
+    def avg_build_seconds(self) -> float:
+        return self.build_seconds / self.builds if self.builds else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated setup time saved by leasing instead of rebuilding."""
+        return self.reuses * self.avg_build_seconds
+
+
+def template_key(depth: str, config: dict[str, Any] | None = None) -> str:
+    """Return a stable pool key for ``depth`` and a tenant config mapping."""
+    blob = json.dumps(config or {}, sort_keys=True, default=str, separators=(",", ":"))
+    digest = hashlib.sha1(blob.encode("utf-8"), usedforsecurity=False).hexdigest()[:12]
+    return f"crew_template:{depth}:{digest}"
+
+
+def reset_agent_state(agents: dict[str, Any]) -> None:
+    """Clear per-request tool context on every agent of a leased set."""
+    for agent in agents.values():
+        for tool in getattr(agent, "tools", None) or []:
+            if isinstance(getattr(tool, "_shared_context", None), dict):
+                tool._shared_context = {}
+
+
+class CrewTemplateCache:
+    """Lease pre-built agent sets per ``(depth, tenant config)``.
+
+    ``build_agents`` passed to :meth:`lease` is a zero-argument callable that
+    returns ``{agent_name: agent}``. It runs only when the pool holds no idle
+    set for the key and the current tenant.
+    """
+
+    def __init__(self, pool: AgentPool | None = None, max_idle_per_template: int = 4) -> None:
+        # Warmup would build several full agent sets in the background for
+        # every template key, which costs more than building on first use.
+        self.pool = pool if pool is not None else AgentPool(max_size=max_idle_per_template, warmup=False)
+        self._stats: dict[str, TemplateStats] = {}
+
+    def _register(self, key: str, build_agents: Callable[[], dict[str, Any]]) -> TemplateStats:
+        stats = self._stats.get(key)
+        if stats is not None:
+            return stats
+        stats = self._stats[key] = TemplateStats()
+
+        def factory() -> dict[str, Any]:
+            started = time.perf_counter()
+            agents = build_agents()
+            elapsed = time.perf_counter() - started
+            stats.builds += 1
+            stats.build_seconds += elapsed
+            logger.info("crew_template_built", template=key, agents=len(agents), build_seconds=elapsed)
+            return agents
+
+        self.pool.register_factory(key, factory)
+        return stats
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        depth: str,
+        config: dict[str, Any] | None,
+        build_agents: Callable[[], dict[str, Any]],
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Lease an agent set for one request and return it to the pool afterwards.
+
+        Raises:
+            RuntimeError: If no set is idle and ``build_agents`` fails
+        """
+        key = template_key(depth, config)
+        stats = self._register(key, build_agents)
+        builds_before = stats.builds
+        async with self.pool.acquire(key) as agents:
+            stats.leases += 1
+            outcome = "build" if stats.builds > builds_before else "reuse"
+            self.pool.metrics.increment_counter(
+                "crew_template_leases_total", labels={"depth": depth, "outcome": outcome}
+            )
+            reset_agent_state(agents)
+            yield agents
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        return {
+            key: {
+                "builds": stats.builds,
+                "leases": stats.leases,
+                "reuses": stats.reuses,
+                "avg_build_seconds": stats.avg_build_seconds,
+                "saved_seconds": stats.saved_seconds,
+            }
+            for key, stats in self._stats.items()
+        }
+
+
+__all__ = ["CrewTemplateCache", "TemplateStats", "reset_agent_state", "template_key"]
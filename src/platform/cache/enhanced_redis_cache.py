@@ -231,6 +231,35 @@ class EnhancedRedisCache:
                 logger.error(f"Unexpected error deleting cache key {key}: {e}")
                 return False
 
+    def ttl_many(self, keys: list[str]) -> dict[str, int]:
+        """Remaining TTL in seconds per key (-2 missing, -1 no expiry), pipelined."""
+        if not keys:
+            return {}
+        try:
+            pipeline = self._r.pipeline(transaction=False)
+            for key in keys:
+                pipeline.ttl(self._make_key(key))
+            return {key: int(ttl) for key, ttl in zip(keys, pipeline.execute(), strict=False)}
+        except Exception as e:
+            logger.error(f"Redis TTL lookup failed for {len(keys)} keys: {e}")
+            return {}
+
+    def delete_keys(self, keys: list[str] | set[str]) -> int:
+        """Delete many cache entries in pipelined batches of ``pipeline_size``.
+
+        Per-key deletes (rather than one multi-key DEL) keep this valid under
+        clustering, where keys hash to different slots. Returns the number of entries removed. Redis errors propagate so the
+        invalidation engine can report the batch as failed.
+        """
+        batch = [self._make_key(k) for k in keys]
+        deleted = 0
+        for start in range(0, len(batch), max(1, self.pipeline_size)):
+            pipeline = self._r.pipeline(transaction=False)
+            for cache_key in batch[start : start + self.pipeline_size]:
+                pipeline.delete(cache_key)
+            deleted += sum(int(result or 0) for result in pipeline.execute())
+        return deleted
+
     def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all keys matching pattern (use with caution in production)."""
         cache_pattern = self._make_key(pattern)
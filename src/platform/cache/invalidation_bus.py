@@ -0,0 +1,158 @@
+"""Cross-process cache invalidation over Redis pub/sub.
+
+Every worker keeps its own in-process L1 (the memory level of
+``MultiLevelCache``), so deleting a key from Redis is not enough: the other
+workers would keep serving their local copy until it expires. The
+:class:`RedisInvalidationBus` broadcasts the keys an
+:class:`~platform.cache.invalidation_engine.InvalidationEngine` removed on one
+channel; each worker runs a listener thread that hands received keys to its
+registered L1 evictors.
+
+Messages carry an ``origin`` id so the publishing worker skips its own
+broadcasts (it already evicted locally), and large invalidations are split
+into messages of at most ``max_keys_per_message`` keys.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from ultimate_discord_intelligence_bot.obs.metrics import get_metrics
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+logger = logging.getLogger(__name__)
+DEFAULT_CHANNEL = "cache:invalidations"
+DEFAULT_MAX_KEYS_PER_MESSAGE = 500
+LISTENER_POLL_SECONDS = 0.5
+
+
+class RedisInvalidationBus:
+    """Publish and receive cache-key invalidations on a Redis channel."""
+
+    def __init__(
+        self,
+        client: Any,
+        channel: str = DEFAULT_CHANNEL,
+        origin: str | None = None,
+        max_keys_per_message: int = DEFAULT_MAX_KEYS_PER_MESSAGE,
+    ) -> None:
+        """Create a bus on an existing (sync) Redis client.
+
+        Args:
+            client: ``redis.Redis``-compatible client used for publish and subscribe
+            channel: Pub/sub channel shared by every worker
+            origin: Identifier of this worker; random when omitted
+            max_keys_per_message: Keys per published message
+        """
+        self.client = client
+        self.channel = channel
+        self.origin = origin or uuid.uuid4().hex
+        self.max_keys_per_message = max(1, max_keys_per_message)
+        self._handlers: list[Callable[[list[str]], Any]] = []
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._ready = threading.Event()
+        self._stats = {"published_messages": 0, "published_keys": 0, "received_messages": 0, "received_keys": 0}
+
+    @classmethod
+    def from_url(cls, redis_url: str, **kwargs: Any) -> RedisInvalidationBus:
+        import redis
+
+        return cls(redis.from_url(redis_url), **kwargs)
+
+    def add_handler(self, handler: Callable[[list[str]], Any]) -> None:
+        """Register a callable that evicts the given keys from a local cache."""
+        self._handlers.append(handler)
+
+    def publish(self, keys: Iterable[str], reason: str = "") -> int:
+        """Broadcast ``keys`` to every subscribed worker; returns messages sent."""
+        batch = sorted(set(keys))
+        sent = 0
+        for start in range(0, len(batch), self.max_keys_per_message):
+            chunk = batch[start : start + self.max_keys_per_message]
+            payload = json.dumps({"origin": self.origin, "keys": chunk, "reason": reason}, separators=(",", ":"))
+            self.client.publish(self.channel, payload)
+            sent += 1
+        self._stats["published_messages"] += sent
+        self._stats["published_keys"] += len(batch)
+        if sent:
+            get_metrics().counter("cache_invalidation_broadcasts_total", labels={"direction": "out"}).inc(sent)
+        return sent
+
+    def start(self, timeout: float = 5.0) -> None:
+        """Subscribe and start the listener thread; returns once subscribed."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._listen, name=f"cache-invalidation-{self.origin[:8]}", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            logger.warning("Cache invalidation listener did not subscribe within %.1fs", timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _listen(self) -> None:
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(self.channel)
+            self._ready.set()
+            while not self._stopping.is_set():
+                try:
+                    message = pubsub.get_message(timeout=LISTENER_POLL_SECONDS)
+                except Exception as e:
+                    logger.warning(f"Cache invalidation listener error: {e}")
+                    self._stopping.wait(LISTENER_POLL_SECONDS)
+                    continue
+                if message and message.get("type") == "message":
+                    self.handle_message(message.get("data"))
+        finally:
+            self._ready.set()
+            try:
+                pubsub.close()
+            except Exception:
+                logger.debug("Failed to close invalidation pubsub", exc_info=True)
+
+    def handle_message(self, data: bytes | str | None) -> int:
+        """Apply one broadcast to the local handlers; returns keys handed over."""
+        if data is None:
+            return 0
+        try:
+            payload = json.loads(data.decode() if isinstance(data, bytes) else data)
+        except (ValueError, UnicodeDecodeError):
+            logger.warning("Ignoring malformed cache invalidation message")
+            return 0
+        if payload.get("origin") == self.origin:
+            return 0
+        keys = [str(k) for k in payload.get("keys", [])]
+        self._stats["received_messages"] += 1
+        self._stats["received_keys"] += len(keys)
+        get_metrics().counter("cache_invalidation_broadcasts_total", labels={"direction": "in"}).inc()
+        for handler in list(self._handlers):
+            try:
+                handler(keys)
+            except Exception as e:
+                logger.warning(f"Cache invalidation handler failed: {e}")
+        return len(keys)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {"channel": self.channel, "origin": self.origin, "running": self.running, **self._stats}
+
+
+__all__ = ["DEFAULT_CHANNEL", "RedisInvalidationBus"]
@@ -3,6 +3,14 @@ Cache invalidation engine for dependency-based cache invalidation.
 
 This module provides the core invalidation logic that handles cascading invalidation
 of cache entries based on their dependency relationships.
+
+Keys are removed from every registered backend (anything with a
+``delete_keys(keys)`` method, e.g. ``MultiLevelCache`` or
+``EnhancedRedisCache``) in chunks of ``max_batch_size``. Keys can also be
+grouped under tags and invalidated by tag; the tag index lives in Redis when
+a client is given so every worker sees the same tag membership. When a
+``RedisInvalidationBus`` is attached, invalidated keys are broadcast so other
+workers evict them from their in-process L1 as well.
 """
 
 from __future__ import annotations
@@ -13,11 +21,18 @@ import logging
 import time
 from dataclasses import dataclass, field
 from platform.cache.dependency_tracker import DependencyTracker, get_dependency_tracker
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from platform.cache.invalidation_bus import RedisInvalidationBus
 
 
 logger = logging.getLogger(__name__)
 CIRCUIT_BREAKER_RESET_TIMEOUT = 30
+DEFAULT_TAG_PREFIX = "cache:tags"
+DEFAULT_TAG_TTL = 86400
 
 
 @dataclass
@@ -63,6 +78,58 @@ class InvalidationBatch:
         return self.priority > other.priority
 
 
+class TagIndex:
+    """Tag -> cache key membership, kept in Redis sets when a client is given.
+
+    Without a client the index is process-local, which is only correct for
+    single-worker deployments.
+    """
+
+    def __init__(self, client: Any | None = None, prefix: str = DEFAULT_TAG_PREFIX, ttl: int = DEFAULT_TAG_TTL):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self._local: dict[str, set[str]] = {}
+
+    def _key(self, tag: str) -> str:
+        return f"{self.prefix}:{tag}"
+
+    def add(self, key: str, tags: Iterable[str]) -> None:
+        """Record ``key`` under each of ``tags``."""
+        tags = list(tags)
+        if self.client is None:
+            for tag in tags:
+                self._local.setdefault(tag, set()).add(key)
+            return
+        pipeline = self.client.pipeline(transaction=False)
+        for tag in tags:
+            pipeline.sadd(self._key(tag), key)
+            pipeline.expire(self._key(tag), self.ttl)
+        pipeline.execute()
+
+    def members(self, tags: Iterable[str]) -> set[str]:
+        """Union of the keys recorded under ``tags``."""
+        tags = list(tags)
+        if self.client is None:
+            return set().union(*(self._local.get(tag, set()) for tag in tags))
+        pipeline = self.client.pipeline(transaction=False)
+        for tag in tags:
+            pipeline.smembers(self._key(tag))
+        keys: set[str] = set()
+        for members in pipeline.execute():
+            keys.update(m.decode() if isinstance(m, bytes) else m for m in members)
+        return keys
+
+    def remove(self, tags: Iterable[str]) -> None:
+        """Forget ``tags`` once their keys have been invalidated."""
+        tags = list(tags)
+        if self.client is None:
+            for tag in tags:
+                self._local.pop(tag, None)
+        elif tags:
+            self.client.delete(*(self._key(tag) for tag in tags))
+
+
 class InvalidationEngine:
     """Engine for handling cache invalidation operations."""
 
@@ -73,8 +140,29 @@ class InvalidationEngine:
         max_concurrent_invalidations: int = 10,
         enable_circuit_breaker: bool = True,
         circuit_breaker_threshold: int = 5,
+        backends: Iterable[Any] | None = None,
+        bus: RedisInvalidationBus | None = None,
+        tag_index: TagIndex | None = None,
+        use_global_cache: bool = False,
     ):
+        """Create an invalidation engine.
+
+        Args:
+            dependency_tracker: Graph used for cascading invalidation
+            max_batch_size: Keys per backend delete call (and direct-call limit of ``invalidate_keys``)
+            max_concurrent_invalidations: Concurrent invalidation operations
+            enable_circuit_breaker: Stop invalidating after repeated failures
+            circuit_breaker_threshold: Failures before the breaker opens
+            backends: Caches exposing ``delete_keys(keys)`` and optionally ``evict_local(keys)``
+            bus: Broadcasts invalidated keys to other workers' L1 caches
+            tag_index: Tag membership store (process-local when omitted)
+            use_global_cache: Attach the process-wide ``MultiLevelCache`` (plus a Redis
+                bus and tag index when it has Redis) on first use instead of at construction
+        """
         self.dependency_tracker = dependency_tracker or get_dependency_tracker()
+        self.backends: list[Any] = []
+        self.bus = bus
+        self.tag_index = tag_index or TagIndex()
         self.max_batch_size = max_batch_size
         self.max_concurrent_invalidations = max_concurrent_invalidations
         self.enable_circuit_breaker = enable_circuit_breaker
@@ -89,16 +177,49 @@ class InvalidationEngine:
             "circuit_breaker_trips": 0,
             "average_batch_size": 0.0,
             "max_batch_size_processed": 0,
+            "backend_errors": 0,
+            "broadcast_failures": 0,
         }
         self._semaphore = asyncio.Semaphore(max_concurrent_invalidations)
         self._batch_queue: asyncio.Queue[InvalidationBatch] = asyncio.Queue()
         self._batch_processor_task: asyncio.Task | None = None
         self._monitor: Any | None = None
+        self._use_global_cache = use_global_cache
+        for backend in backends or ():
+            self.add_backend(backend)
+
+    def _bind_global_cache(self) -> None:
+        if not self._use_global_cache:
+            return
+        self._use_global_cache = False
+        from platform.cache.multi_level_cache import get_cache
+
+        cache = get_cache()
+        if cache.redis_available and cache.redis_client is not None:
+            from platform.cache.invalidation_bus import RedisInvalidationBus
+
+            if self.bus is None:
+                self.bus = RedisInvalidationBus(cache.redis_client)
+            self.tag_index = TagIndex(cache.redis_client)
+        self.add_backend(cache)
+
+    def add_backend(self, backend: Any) -> None:
+        """Register a cache to delete invalidated keys from.
+
+        Backends with an ``evict_local`` method are also hooked up to the bus
+        so broadcasts from other workers evict their in-process entries.
+        """
+        self.backends.append(backend)
+        if self.bus is not None and hasattr(backend, "evict_local"):
+            self.bus.add_handler(backend.evict_local)
 
     async def start(self) -> None:
         """Start the invalidation engine."""
         if self._batch_processor_task is None:
+            self._bind_global_cache()
             self._batch_processor_task = asyncio.create_task(self._process_batch_queue())
+            if self.bus is not None:
+                await asyncio.to_thread(self.bus.start)
             logger.info("Invalidation engine started")
 
     async def stop(self) -> None:
@@ -108,8 +229,35 @@ class InvalidationEngine:
             with contextlib.suppress(asyncio.CancelledError):
                 await self._batch_processor_task
             self._batch_processor_task = None
+            if self.bus is not None:
+                await asyncio.to_thread(self.bus.stop)
             logger.info("Invalidation engine stopped")
 
+    async def tag(self, key: str, tags: Iterable[str]) -> None:
+        """Group ``key`` under ``tags`` for later :meth:`invalidate_tags`."""
+        self._bind_global_cache()
+        await asyncio.to_thread(self.tag_index.add, key, tags)
+
+    async def invalidate_tags(
+        self, tags: Iterable[str], cascade: bool = True, reason: str = "tag_invalidation"
+    ) -> InvalidationResult:
+        """Invalidate every key recorded under any of ``tags``.
+
+        Unlike :meth:`invalidate_keys`, large tag sets are not queued: the
+        keys are deleted right away in ``max_batch_size`` chunks.
+        """
+        self._bind_global_cache()
+        tags = set(tags)
+        keys = await asyncio.to_thread(self.tag_index.members, tags)
+        if not keys:
+            return InvalidationResult()
+        result = await self._invalidate_keys_batch(keys, cascade, reason)
+        if not result.errors:
+            await asyncio.to_thread(self.tag_index.remove, tags)
+        if self._monitor:
+            self._monitor.record_invalidation(len(result.invalidated_keys), reason)
+        return result
+
     def set_monitor(self, monitor: Any) -> None:
         """Set the cache monitor for this invalidation engine."""
         self._monitor = monitor
@@ -186,7 +334,10 @@ class InvalidationEngine:
                     for key in keys:
                         dependents = await self.dependency_tracker.invalidate_key(key)
                         all_keys_to_invalidate.update(dependents)
-                invalidated_keys = await self._perform_invalidation(all_keys_to_invalidate)
+                invalidated_keys = await self._perform_invalidation(all_keys_to_invalidate, reason)
+                skipped_keys = all_keys_to_invalidate - invalidated_keys
+                if skipped_keys:
+                    errors.append(f"Failed to invalidate {len(skipped_keys)} keys")
                 if cascade:
                     for invalidated_key in invalidated_keys:
                         await self.dependency_tracker.unregister_key(invalidated_key)
@@ -219,7 +370,7 @@ class InvalidationEngine:
         invalidated_keys: set[str] = set()
         errors: list[str] = []
         try:
-            invalidated_keys = await self._perform_invalidation(keys)
+            invalidated_keys = await self._perform_invalidation(keys, reason)
             self._stats["total_invalidations"] += len(keys)
             self._stats["successful_invalidations"] += len(invalidated_keys)
             if len(invalidated_keys) < len(keys):
@@ -233,18 +384,36 @@ class InvalidationEngine:
             invalidated_keys=invalidated_keys, errors=errors, start_time=start_time, end_time=time.time()
         )
 
-    async def _perform_invalidation(self, keys: set[str]) -> set[str]:
-        """Perform the actual cache invalidation.
+    async def _perform_invalidation(self, keys: set[str], reason: str = "") -> set[str]:
+        """Delete ``keys`` from every backend in chunks and broadcast the result.
 
-        This is a placeholder that should be implemented to call the actual cache.
+        A chunk counts as invalidated only if every backend accepted it; keys
+        of failed chunks are left out of the returned set. Successfully
+        invalidated keys are published on the bus (if any) so that other
+        workers drop them from their in-process L1.
         """
-        invalidated = set()
-        for key in keys:
+        self._bind_global_cache()
+        invalidated: set[str] = set()
+        ordered = sorted(keys)
+        for start in range(0, len(ordered), max(1, self.max_batch_size)):
+            chunk = ordered[start : start + self.max_batch_size]
+            ok = True
+            for backend in self.backends:
+                try:
+                    await asyncio.to_thread(backend.delete_keys, chunk)
+                except Exception as e:
+                    ok = False
+                    self._stats["backend_errors"] += 1
+                    logger.warning(f"Failed to invalidate {len(chunk)} keys on {type(backend).__name__}: {e}")
+            if ok:
+                invalidated.update(chunk)
+                logger.debug(f"Invalidated {len(chunk)} cache keys")
+        if self.bus is not None and invalidated:
             try:
-                invalidated.add(key)
-                logger.debug(f"Invalidated cache key: {key}")
+                await asyncio.to_thread(self.bus.publish, invalidated, reason)
             except Exception as e:
-                logger.warning(f"Failed to invalidate key {key}: {e}")
+                self._stats["broadcast_failures"] += 1
+                logger.warning(f"Failed to broadcast invalidation of {len(invalidated)} keys: {e}")
         return invalidated
 
     async def _process_batch_queue(self) -> None:
@@ -317,6 +486,12 @@ class InvalidationEngine:
                 "max_batch_size_processed": self._stats["max_batch_size_processed"],
             },
             "queue": {"size": self._batch_queue.qsize(), "max_concurrent": self.max_concurrent_invalidations},
+            "backends": {
+                "count": len(self.backends),
+                "errors": self._stats["backend_errors"],
+                "broadcast_failures": self._stats["broadcast_failures"],
+                "bus": self.bus.get_stats() if self.bus is not None else None,
+            },
         }
 
     def is_healthy(self) -> bool:
@@ -328,10 +503,14 @@ _invalidation_engine: InvalidationEngine | None = None
 
 
 def get_invalidation_engine() -> InvalidationEngine:
-    """Get the global invalidation engine instance."""
+    """Get the global invalidation engine instance.
+
+    The process-wide cache is only created once the engine is started or
+    first used, so importing or looking up the engine has no side effects.
+    """
     global _invalidation_engine
     if _invalidation_engine is None:
-        _invalidation_engine = InvalidationEngine()
+        _invalidation_engine = InvalidationEngine(use_global_cache=True)
     return _invalidation_engine
 
 
@@ -351,6 +530,7 @@ __all__ = [
     "InvalidationBatch",
     "InvalidationEngine",
     "InvalidationResult",
+    "TagIndex",
     "get_invalidation_engine",
     "start_invalidation_engine",
     "stop_invalidation_engine",
@@ -6,12 +6,17 @@ import hashlib
 import json
 import logging
 import pickle
+import threading
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ultimate_discord_intelligence_bot.step_result import StepResult
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
 logger = logging.getLogger(__name__)
 try:
     import redis
@@ -23,7 +28,12 @@ except ImportError:
 
 
 class MultiLevelCache:
-    """Multi-level cache with memory → Redis → disk fallback."""
+    """Multi-level cache with memory → Redis → disk fallback.
+
+    The memory level is guarded by a lock: invalidation broadcasts evict
+    from it on the bus listener thread and engine deletes run via
+    ``asyncio.to_thread``, concurrently with normal reads and writes.
+    """
 
     def __init__(
         self,
@@ -32,6 +42,7 @@ class MultiLevelCache:
         default_ttl: int = 3600,
         enable_disk_cache: bool = False,
         disk_cache_path: str = "/tmp/cache",
+        redis_client: Any | None = None,
     ):
         """Initialize multi-level cache.
 
@@ -41,6 +52,7 @@ class MultiLevelCache:
             default_ttl: Default TTL in seconds
             enable_disk_cache: Whether to enable disk caching
             disk_cache_path: Path for disk cache storage
+            redis_client: Pre-built Redis client (takes precedence over redis_url)
         """
         self.max_memory_size = max_memory_size
         self.default_ttl = default_ttl
@@ -48,9 +60,13 @@ class MultiLevelCache:
         self.disk_cache_path = disk_cache_path
         self.memory_cache: dict[str, dict[str, Any]] = {}
         self.memory_access_times: dict[str, float] = {}
+        self._memory_lock = threading.RLock()
         self.redis_client: redis.Redis | None = None
         self.redis_available = False
-        if redis_url and REDIS_AVAILABLE:
+        if redis_client is not None:
+            self.redis_client = redis_client
+            self.redis_available = True
+        elif redis_url and REDIS_AVAILABLE:
             try:
                 self.redis_client = redis.from_url(redis_url, decode_responses=False)
                 self.redis_client.ping()
@@ -93,7 +109,7 @@ class MultiLevelCache:
         return time.time() - timestamp > ttl
 
     def _evict_lru(self) -> None:
-        """Evict least recently used item from memory cache."""
+        """Evict least recently used item from memory cache (caller holds ``_memory_lock``)."""
         if len(self.memory_cache) < self.max_memory_size:
             return
         lru_key = min(self.memory_access_times.keys(), key=lambda k: self.memory_access_times[k])
@@ -102,6 +118,12 @@ class MultiLevelCache:
         if lru_key in self.memory_access_times:
             del self.memory_access_times[lru_key]
 
+    def _promote(self, key: str, entry: dict[str, Any]) -> None:
+        with self._memory_lock:
+            self._evict_lru()
+            self.memory_cache[key] = entry
+            self.memory_access_times[key] = time.time()
+
     def get(self, operation: str, inputs: dict[str, Any], tenant: str = "", workspace: str = "") -> Any | None:
         """Get value from cache.
 
@@ -115,25 +137,22 @@ class MultiLevelCache:
             Cached value or None if not found/expired
         """
         key = self._generate_key(operation, inputs, tenant, workspace)
-        if key in self.memory_cache:
-            entry = self.memory_cache[key]
-            if not self._is_expired(entry["timestamp"], entry["ttl"]):
-                self.memory_access_times[key] = time.time()
-                logger.debug(f"Cache hit (memory): {operation}")
-                return entry["value"]
-            else:
+        with self._memory_lock:
+            entry = self.memory_cache.get(key)
+            if entry is not None:
+                if not self._is_expired(entry["timestamp"], entry["ttl"]):
+                    self.memory_access_times[key] = time.time()
+                    logger.debug(f"Cache hit (memory): {operation}")
+                    return entry["value"]
                 del self.memory_cache[key]
-                if key in self.memory_access_times:
-                    del self.memory_access_times[key]
+                self.memory_access_times.pop(key, None)
         if self.redis_available and self.redis_client:
             try:
                 data = self.redis_client.get(key)
                 if data:
                     entry = self._deserialize_value(data)
                     if not self._is_expired(entry["timestamp"], entry["ttl"]):
-                        self._evict_lru()
-                        self.memory_cache[key] = entry
-                        self.memory_access_times[key] = time.time()
+                        self._promote(key, entry)
                         logger.debug(f"Cache hit (Redis): {operation}")
                         return entry["value"]
                     else:
@@ -150,9 +169,7 @@ class MultiLevelCache:
                         data = f.read()
                     entry = self._deserialize_value(data)
                     if not self._is_expired(entry["timestamp"], entry["ttl"]):
-                        self._evict_lru()
-                        self.memory_cache[key] = entry
-                        self.memory_access_times[key] = time.time()
+                        self._promote(key, entry)
                         logger.debug(f"Cache hit (disk): {operation}")
                         return entry["value"]
                     else:
@@ -188,9 +205,10 @@ class MultiLevelCache:
         ttl = ttl or self.default_ttl
         timestamp = time.time()
         entry = {"value": value, "timestamp": timestamp, "ttl": ttl}
-        self._evict_lru()
-        self.memory_cache[key] = entry
-        self.memory_access_times[key] = timestamp
+        with self._memory_lock:
+            self._evict_lru()
+            self.memory_cache[key] = entry
+            self.memory_access_times[key] = timestamp
         if self.redis_available and self.redis_client:
             try:
                 data = self._serialize_value(entry)
@@ -223,12 +241,7 @@ class MultiLevelCache:
             True if successfully deleted
         """
         key = self._generate_key(operation, inputs, tenant, workspace)
-        deleted = False
-        if key in self.memory_cache:
-            del self.memory_cache[key]
-            deleted = True
-        if key in self.memory_access_times:
-            del self.memory_access_times[key]
+        deleted = self.evict_local([key]) > 0
         if self.redis_available and self.redis_client:
             try:
                 if self.redis_client.delete(key):
@@ -247,6 +260,57 @@ class MultiLevelCache:
                 logger.warning(f"Disk cache delete error: {e}")
         return deleted
 
+    def cache_key(self, operation: str, inputs: dict[str, Any], tenant: str = "", workspace: str = "") -> str:
+        """Storage key used for an operation/inputs pair (for tagging and invalidation)."""
+        return self._generate_key(operation, inputs, tenant, workspace)
+
+    def evict_local(self, keys: Iterable[str]) -> int:
+        """Drop storage keys from the in-process memory level only.
+
+        Used by invalidation broadcasts from other workers, which have already
+        removed the keys from Redis and disk.
+        """
+        evicted = 0
+        with self._memory_lock:
+            for key in keys:
+                if self.memory_cache.pop(key, None) is not None:
+                    evicted += 1
+                self.memory_access_times.pop(key, None)
+        return evicted
+
+    def delete_keys(self, keys: Iterable[str]) -> int:
+        """Delete storage keys from every level, pipelining the Redis deletes.
+
+        Each key gets its own DEL in one non-transactional pipeline, which
+        stays valid under Redis Cluster where the keys hash to different
+        slots (same as ``EnhancedRedisCache.delete_keys``). Returns the number
+        of entries removed across levels. Redis errors are raised (after the
+        memory level has been cleared) so the caller can report the batch as
+        failed.
+        """
+        batch = list(keys)
+        if not batch:
+            return 0
+        deleted = self.evict_local(batch)
+        if self.redis_available and self.redis_client:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for key in batch:
+                pipeline.delete(key)
+            deleted += sum(int(result or 0) for result in pipeline.execute())
+        if self.enable_disk_cache:
+            import os
+
+            for key in batch:
+                disk_path = os.path.join(self.disk_cache_path, f"{key}.cache")
+                try:
+                    os.remove(disk_path)
+                    deleted += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Disk cache delete error: {e}")
+        return deleted
+
     def clear(self, tenant: str = "", workspace: str = "") -> bool:
         """Clear cache for tenant/workspace or all.
 
@@ -257,18 +321,16 @@ class MultiLevelCache:
         Returns:
             True if successfully cleared
         """
-        cleared = False
-        if tenant and workspace:
-            namespace = f"{tenant}:{workspace}"
-            keys_to_remove = [k for k in self.memory_cache if f"cache:{namespace}:" in k]
-        else:
-            keys_to_remove = list(self.memory_cache.keys())
-        for key in keys_to_remove:
-            if key in self.memory_cache:
-                del self.memory_cache[key]
-            if key in self.memory_access_times:
-                del self.memory_access_times[key]
-            cleared = True
+        with self._memory_lock:
+            if tenant and workspace:
+                namespace = f"{tenant}:{workspace}"
+                keys_to_remove = [k for k in self.memory_cache if f"cache:{namespace}:" in k]
+            else:
+                keys_to_remove = list(self.memory_cache.keys())
+            for key in keys_to_remove:
+                self.memory_cache.pop(key, None)
+                self.memory_access_times.pop(key, None)
+        cleared = bool(keys_to_remove)
         if self.redis_available and self.redis_client:
             try:
                 pattern = f"cache:{tenant}:{workspace}:*" if tenant and workspace else "cache:*"
@@ -167,7 +167,6 @@ class ErrorContext:
         }
 
 
-@dataclass
 class StepResult(Mapping[str, Any]):
     """Enhanced container for pipeline step outcomes with comprehensive error handling.
 
@@ -182,23 +181,108 @@ class StepResult(Mapping[str, Any]):
     - Enhanced error context with debugging and recovery information
     - Performance impact tracking for error scenarios
     - Integration with observability systems
+
+    Results are created for every tool call, so the class is slotted and the
+    ``metadata``/``suggested_actions``/``related_errors`` containers are only
+    allocated when first accessed. A successful result therefore costs one
+    object plus its ``data`` dict.
     """
 
+    __slots__ = (
+        "_metadata",
+        "_related_errors",
+        "_suggested_actions",
+        "custom_status",
+        "data",
+        "error",
+        "error_category",
+        "error_context",
+        "error_severity",
+        "performance_impact",
+        "recovery_strategy",
+        "retryable",
+        "success",
+    )
+
     success: bool
-    data: dict[str, Any] = field(default_factory=dict)
-    error: str | None = None
-    custom_status: str | None = None
-    error_category: ErrorCategory | None = None
-    retryable: bool = False
-    metadata: dict[str, Any] = field(default_factory=dict)
+    data: dict[str, Any]
+    error: str | None
+    custom_status: str | None
+    error_category: ErrorCategory | None
+    retryable: bool
 
     # Enhanced error handling fields
-    error_context: ErrorContext | None = None
-    error_severity: ErrorSeverity = ErrorSeverity.MEDIUM
-    recovery_strategy: ErrorRecoveryStrategy | None = None
-    performance_impact: float = 0.0  # Estimated performance impact (0.0-1.0)
-    suggested_actions: list[str] = field(default_factory=list)
-    related_errors: list[str] = field(default_factory=list)  # Error IDs of related failures
+    error_context: ErrorContext | None
+    error_severity: ErrorSeverity
+    recovery_strategy: ErrorRecoveryStrategy | None
+    performance_impact: float  # Estimated performance impact (0.0-1.0)
+
+    def __init__(
+        self,
+        success: bool,
+        data: dict[str, Any] | None = None,
+        error: str | None = None,
+        custom_status: str | None = None,
+        error_category: ErrorCategory | None = None,
+        retryable: bool = False,
+        metadata: dict[str, Any] | None = None,
+        error_context: ErrorContext | None = None,
+        error_severity: ErrorSeverity = ErrorSeverity.MEDIUM,
+        recovery_strategy: ErrorRecoveryStrategy | None = None,
+        performance_impact: float = 0.0,
+        suggested_actions: list[str] | None = None,
+        related_errors: list[str] | None = None,  # Error IDs of related failures
+    ) -> None:
+        self.success = success
+        self.data = {} if data is None else data
+        self.error = error
+        self.custom_status = custom_status
+        self.error_category = error_category
+        self.retryable = retryable
+        self._metadata = metadata
+        self.error_context = error_context
+        self.error_severity = error_severity
+        self.recovery_strategy = recovery_strategy
+        self.performance_impact = performance_impact
+        self._suggested_actions = suggested_actions
+        self._related_errors = related_errors
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: dict[str, Any]) -> None:
+        self._metadata = value
+
+    @property
+    def suggested_actions(self) -> list[str]:
+        if self._suggested_actions is None:
+            self._suggested_actions = []
+        return self._suggested_actions
+
+    @suggested_actions.setter
+    def suggested_actions(self, value: list[str]) -> None:
+        self._suggested_actions = value
+
+    @property
+    def related_errors(self) -> list[str]:
+        if self._related_errors is None:
+            self._related_errors = []
+        return self._related_errors
+
+    @related_errors.setter
+    def related_errors(self, value: list[str]) -> None:
+        self._related_errors = value
+
+    def __repr__(self) -> str:
+        return (
+            f"StepResult(success={self.success!r}, data={self.data!r}, error={self.error!r}, "
+            f"custom_status={self.custom_status!r}, error_category={self.error_category!r}, "
+            f"retryable={self.retryable!r}, metadata={self._metadata or {}!r})"
+        )
 
     @classmethod
     def from_dict(cls, result: Any, context: ErrorContext | None = None) -> StepResult:
@@ -606,31 +690,36 @@ class StepResult(Mapping[str, Any]):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the result back to a ``dict`` for backward compatibility."""
-        result = dict(self.data)
-        status = self.custom_status or ("success" if self.success else "error")
-        result["status"] = status
+        return dict(self.to_dict_items())
+
+    def to_dict_items(self) -> Iterator[tuple[str, Any]]:
+        """Yield the ``to_dict()`` pairs without copying ``data``.
+
+        Later pairs override earlier ones, exactly as in ``to_dict()``, so
+        serializers can encode a result without building the intermediate dict.
+        """
+        yield from self.data.items()
+        yield "status", self.custom_status or ("success" if self.success else "error")
         if self.error:
-            result["error"] = self.error
+            yield "error", self.error
         if self.error_category:
-            result["error_category"] = self.error_category.value
+            yield "error_category", self.error_category.value
         if self.retryable:
-            result["retryable"] = self.retryable
-        if self.metadata:
-            result["metadata"] = self.metadata
+            yield "retryable", self.retryable
+        if self._metadata:
+            yield "metadata", self._metadata
 
         # Enhanced error information
         if self.error_context:
-            result["error_context"] = self.error_context.to_dict()
+            yield "error_context", self.error_context.to_dict()
         if self.error_severity != ErrorSeverity.MEDIUM:  # Only include if not default
-            result["error_severity"] = self.error_severity.value
+            yield "error_severity", self.error_severity.value
         if self.performance_impact > 0:
-            result["performance_impact"] = self.performance_impact
-        if self.suggested_actions:
-            result["suggested_actions"] = self.suggested_actions
-        if self.related_errors:
-            result["related_errors"] = self.related_errors
-
-        return result
+            yield "performance_impact", self.performance_impact
+        if self._suggested_actions:
+            yield "suggested_actions", self._suggested_actions
+        if self._related_errors:
+            yield "related_errors", self._related_errors
 
     def should_retry(self, attempt: int = 1) -> bool:
         """Determine if this error should be retried based on recovery strategy."""
@@ -715,8 +804,8 @@ class StepResult(Mapping[str, Any]):
             base["error_category"] = self.error_category.value
         if self.retryable:
             base["retryable"] = True
-        if self.metadata:
-            base["metadata"] = self.metadata
+        if self._metadata:
+            base["metadata"] = self._metadata
         yielded: list[str] = list(base.keys())
         # Top-level keys (excluding duplicated status/error already handled)
         for k in self.data:
@@ -743,7 +832,7 @@ class StepResult(Mapping[str, Any]):
             base_fields += 1
         if self.retryable:
             base_fields += 1
-        if self.metadata:
+        if self._metadata:
             base_fields += 1
         return len(self.data) + nested_extra + base_fields
 
@@ -842,7 +931,7 @@ class StepResult(Mapping[str, Any]):
             if self.error is not None:
                 flat["error"] = self.error
             return flat == other
-        return super().__eq__(other)
+        return Mapping.__eq__(self, other)
 
     def __hash__(self) -> int:  # pragma: no cover
         # Provide a stable hash combining status + frozenset of flattened items.
@@ -4,16 +4,26 @@ A/B Testing Framework for AI Router Performance
 
 Comprehensive framework for testing different routing strategies, measuring
 effectiveness, and validating AI routing improvements through controlled experiments.
+
+Per-strategy metrics are running sufficient statistics, so recording a
+sample and querying status are O(1) per strategy. With ``early_stopping``
+(default) strategies are compared by always-valid sequential tests after
+every sample; clearly losing strategies stop receiving traffic and the
+experiment concludes as soon as one strategy is left, instead of running to
+a fixed sample size. Pass an ``ExperimentStore`` to persist experiment state
+to SQLite and resume it after a restart.
 """
 
 import asyncio
 import logging
 import random
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from platform.experimentation.experiment_store import ExperimentStore
+from platform.experimentation.sequential_testing import ArmStatistics, SequentialExperiment
 from typing import Any
 
 
@@ -47,6 +57,9 @@ class ABTestConfig:
             "max_avg_cost": 0.01,
         }
     )
+    early_stopping: bool = True  # eliminate strategies once a sequential test rejects them
+    alpha: float = 0.05  # family-wise false-positive rate of the sequential tests
+    primary_metric: str = "success_rate"  # success_rate, quality, latency_ms or cost
 
 
 @dataclass
@@ -65,40 +78,29 @@ class ABTestResult:
 
 @dataclass
 class ExperimentMetrics:
-    """Comprehensive metrics for routing experiment."""
+    """Running metrics for one strategy in a routing experiment."""
 
     strategy: TestStrategy
-    samples: deque = field(default_factory=lambda: deque(maxlen=1000))
+    stats: ArmStatistics = field(default_factory=ArmStatistics)
     start_time: float = field(default_factory=time.time)
 
     def add_sample(self, latency_ms: float, cost: float, quality: float, success: bool):
         """Add a sample to the experiment."""
-        self.samples.append(
-            {
-                "timestamp": time.time(),
-                "latency_ms": latency_ms,
-                "cost": cost,
-                "quality": quality,
-                "success": success,
-            }
-        )
+        self.stats.add(latency_ms, cost, quality, success)
 
     def get_summary_stats(self) -> dict[str, float]:
         """Get summary statistics for the experiment."""
-        if not self.samples:
+        stats = self.stats
+        if not stats.count:
             return {}
 
-        successes = [s["success"] for s in self.samples]
-        latencies = [s["latency_ms"] for s in self.samples]
-        costs = [s["cost"] for s in self.samples]
-        qualities = [s["quality"] for s in self.samples]
-
         return {
-            "sample_count": len(self.samples),
-            "success_rate": sum(successes) / len(successes),
-            "avg_latency_ms": sum(latencies) / len(latencies),
-            "avg_cost": sum(costs) / len(costs),
-            "avg_quality": sum(qualities) / len(qualities),
+            "sample_count": stats.count,
+            "success_rate": stats.success_rate,
+            "avg_latency_ms": stats.latency_ms.mean,
+            "avg_cost": stats.cost.mean,
+            "avg_quality": stats.quality.mean,
+            "latency_std_ms": stats.latency_ms.variance**0.5,
             "duration_hours": (time.time() - self.start_time) / 3600,
         }
 
@@ -106,11 +108,15 @@ class ExperimentMetrics:
 class AIRouterABTester:
     """A/B testing framework for AI routing strategies."""
 
-    def __init__(self):
+    def __init__(self, store: ExperimentStore | None = None, persist_every: int = 20):
         self.active_experiments: dict[str, ABTestConfig] = {}
         self.experiment_metrics: dict[str, dict[TestStrategy, ExperimentMetrics]] = {}
+        self.sequential_tests: dict[str, SequentialExperiment] = {}
         self.routing_strategies: dict[TestStrategy, Callable] = {}
         self.global_results: list[ABTestResult] = []
+        self.store = store
+        self.persist_every = max(1, persist_every)
+        self._unsaved_samples: dict[str, int] = {}
 
     def register_strategy(self, strategy: TestStrategy, router_function: Callable):
         """Register a routing strategy for testing."""
@@ -127,16 +133,79 @@ class AIRouterABTester:
             if strategy not in self.routing_strategies:
                 raise ValueError(f"Strategy {strategy.value} not registered")
 
+        experiment = SequentialExperiment(
+            [strategy.value for strategy in config.strategies],
+            alpha=config.alpha,
+            primary_metric=config.primary_metric,
+            early_stopping=config.early_stopping,
+        )
+        start_time = time.time()
+        saved = self.store.load(config.test_name) if self.store is not None else None
+        if saved is not None and saved["status"] != "stopped":
+            experiment.restore(saved["state"])
+            start_time = saved["state"].get("start_time", start_time)
+            logger.info(f"Resuming A/B test experiment {config.test_name} from stored state")
+
         # Initialize experiment
         self.active_experiments[config.test_name] = config
-        self.experiment_metrics[config.test_name] = {}
-
-        for strategy in config.strategies:
-            self.experiment_metrics[config.test_name][strategy] = ExperimentMetrics(strategy)
+        self.sequential_tests[config.test_name] = experiment
+        self.experiment_metrics[config.test_name] = {
+            strategy: ExperimentMetrics(strategy, stats=experiment.arms[strategy.value], start_time=start_time)
+            for strategy in config.strategies
+        }
+        self._persist(config.test_name)
 
         logger.info(f"Started A/B test experiment: {config.test_name}")
         return config.test_name
 
+    def _record_sample(
+        self,
+        experiment_name: str,
+        strategy: TestStrategy,
+        latency_ms: float,
+        cost: float,
+        quality: float,
+        success: bool,
+    ) -> None:
+        """Update running statistics and the sequential tests with one sample."""
+        experiment = self.sequential_tests[experiment_name]
+        eliminated = experiment.record(strategy.value, latency_ms, cost, quality, success)
+        for arm in eliminated:
+            samples = experiment.eliminated[arm]
+            logger.info(f"A/B test {experiment_name}: strategy {arm} eliminated after {samples} samples")
+        if experiment.winner is not None and eliminated:
+            logger.info(f"A/B test {experiment_name}: {experiment.winner} wins, remaining traffic goes to it")
+        self._unsaved_samples[experiment_name] = self._unsaved_samples.get(experiment_name, 0) + 1
+        if eliminated or self._unsaved_samples[experiment_name] >= self.persist_every:
+            self._persist(experiment_name)
+
+    def _persist(self, experiment_name: str, status: str | None = None) -> None:
+        """Write experiment statistics to the store (if any)."""
+        self._unsaved_samples[experiment_name] = 0
+        if self.store is None:
+            return
+        config = self.active_experiments[experiment_name]
+        experiment = self.sequential_tests[experiment_name]
+        metrics = self.experiment_metrics[experiment_name]
+        state = experiment.to_dict()
+        state["start_time"] = min(m.start_time for m in metrics.values())
+        config_data = {
+            "strategies": [s.value for s in config.strategies],
+            "traffic_split": {s.value: w for s, w in config.traffic_split.items()},
+            "min_samples_per_strategy": config.min_samples_per_strategy,
+            "max_duration_hours": config.max_duration_hours,
+            "success_criteria": config.success_criteria,
+            "early_stopping": config.early_stopping,
+            "alpha": config.alpha,
+            "primary_metric": config.primary_metric,
+        }
+        if status is None:
+            status = "concluded" if experiment.concluded else "running"
+        try:
+            self.store.save(experiment_name, status=status, config=config_data, state=state)
+        except Exception as e:
+            logger.warning(f"Failed to persist A/B test experiment {experiment_name}: {e}")
+
     async def route_with_ab_testing(
         self,
         experiment_name: str,
@@ -152,8 +221,9 @@ class AIRouterABTester:
 
         config = self.active_experiments[experiment_name]
 
-        # Select strategy based on traffic split
-        selected_strategy = self._select_strategy(config)
+        # Select strategy based on traffic split, among strategies not yet eliminated
+        active = self.sequential_tests[experiment_name].active
+        selected_strategy = self._select_strategy(config, {TestStrategy(arm) for arm in active})
 
         # Route using selected strategy
         start_time = time.time()
@@ -169,8 +239,7 @@ class AIRouterABTester:
             success = result.get("status") == "success"
 
             # Record metrics
-            metrics = self.experiment_metrics[experiment_name][selected_strategy]
-            metrics.add_sample(latency_ms, cost, quality, success)
+            self._record_sample(experiment_name, selected_strategy, latency_ms, cost, quality, success)
 
             # Enhance result with A/B testing info
             result.update(
@@ -187,8 +256,7 @@ class AIRouterABTester:
         except Exception as e:
             # Record failure
             latency_ms = (time.time() - start_time) * 1000
-            metrics = self.experiment_metrics[experiment_name][selected_strategy]
-            metrics.add_sample(latency_ms, 0.0, 0.0, False)
+            self._record_sample(experiment_name, selected_strategy, latency_ms, 0.0, 0.0, False)
 
             return {
                 "status": "error",
@@ -197,18 +265,20 @@ class AIRouterABTester:
                 "ab_test_experiment": experiment_name,
             }
 
-    def _select_strategy(self, config: ABTestConfig) -> TestStrategy:
-        """Select strategy based on traffic split configuration."""
-        rand = random.random()  # nosec B311 - A/B test traffic split, not cryptographic
+    def _select_strategy(self, config: ABTestConfig, active: set[TestStrategy] | None = None) -> TestStrategy:
+        """Select strategy based on traffic split configuration, renormalized over ``active``."""
+        split = {s: w for s, w in config.traffic_split.items() if active is None or s in active}
+        total = sum(split.values())
+        rand = random.random() * total  # nosec B311 - A/B test traffic split, not cryptographic
         cumulative = 0.0
 
-        for strategy, weight in config.traffic_split.items():
+        for strategy, weight in split.items():
             cumulative += weight
             if rand <= cumulative:
                 return strategy
 
-        # Fallback to first strategy
-        return next(iter(config.strategies))
+        # Fallback to first (active) strategy
+        return next((s for s in config.strategies if active is None or s in active), config.strategies[0])
 
     def _assess_quality(self, response: str, task_type: str) -> float:
         """Simple quality assessment for A/B testing."""
@@ -235,23 +305,22 @@ class AIRouterABTester:
 
         config = self.active_experiments[experiment_name]
         metrics = self.experiment_metrics[experiment_name]
+        experiment = self.sequential_tests[experiment_name]
 
         status = {"experiment": experiment_name, "strategies": {}, "overall": {}}
 
         total_samples = 0
         total_duration = 0
+        min_samples_met = True
 
         for strategy in config.strategies:
             stats = metrics[strategy].get_summary_stats()
             status["strategies"][strategy.value] = stats
             total_samples += stats.get("sample_count", 0)
             total_duration = max(total_duration, stats.get("duration_hours", 0))
+            min_samples_met = min_samples_met and stats.get("sample_count", 0) >= config.min_samples_per_strategy
 
         # Check completion criteria
-        min_samples_met = all(
-            metrics[s].get_summary_stats().get("sample_count", 0) >= config.min_samples_per_strategy
-            for s in config.strategies
-        )
         max_duration_reached = total_duration >= config.max_duration_hours
 
         status["overall"] = {
@@ -259,7 +328,15 @@ class AIRouterABTester:
             "duration_hours": total_duration,
             "min_samples_met": min_samples_met,
             "max_duration_reached": max_duration_reached,
-            "complete": min_samples_met or max_duration_reached,
+            "stopped_early": experiment.concluded,
+            "complete": min_samples_met or max_duration_reached or experiment.concluded,
+        }
+        status["sequential"] = {
+            "primary_metric": experiment.primary_metric,
+            "active_strategies": list(experiment.active),
+            "eliminated": dict(experiment.eliminated),
+            "winner": experiment.winner,
+            "p_values": experiment.p_values(),
         }
 
         return status
@@ -271,6 +348,7 @@ class AIRouterABTester:
 
         config = self.active_experiments[experiment_name]
         metrics = self.experiment_metrics[experiment_name]
+        winner = self.sequential_tests[experiment_name].winner
         results = []
 
         for strategy in config.strategies:
@@ -303,8 +381,10 @@ class AIRouterABTester:
                     and result.avg_cost <= criteria.get("max_avg_cost", 0.01)
                 )
 
-                # Statistical significance (simplified)
-                result.statistical_significance = result.sample_count >= 30 and meets_criteria
+                # Significant when the sequential tests picked it, else the simplified sample-size rule
+                result.statistical_significance = meets_criteria and (
+                    winner == strategy.value or (winner is None and result.sample_count >= 30)
+                )
 
                 results.append(result)
 
@@ -325,6 +405,7 @@ class AIRouterABTester:
             return []
 
         results = self.analyze_experiment_results(experiment_name)
+        self._persist(experiment_name, status="stopped")
 
         # Clean up
         del self.active_experiments[experiment_name]
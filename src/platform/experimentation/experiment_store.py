@@ -0,0 +1,78 @@
+"""SQLite persistence for A/B experiment state."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from typing import Any
+
+
+class ExperimentStore:
+    """Lightweight SQLite-backed store of experiment configs and running statistics.
+
+    One row per experiment; the state is the JSON written by
+    ``SequentialExperiment.to_dict`` plus whatever the caller adds, so saving
+    costs the same however many samples the experiment has seen.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ab_experiments (
+                name TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                config_json TEXT NOT NULL,
+                state_json TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def save(self, name: str, *, status: str, config: dict[str, Any], state: dict[str, Any]) -> None:
+        self.conn.execute(
+            """
+            INSERT INTO ab_experiments (name, status, config_json, state_json, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                status = excluded.status,
+                config_json = excluded.config_json,
+                state_json = excluded.state_json,
+                updated_at = excluded.updated_at
+            """,
+            (name, status, json.dumps(config), json.dumps(state), time.time()),
+        )
+        self.conn.commit()
+
+    def load(self, name: str) -> dict[str, Any] | None:
+        """``{"status", "config", "state", "updated_at"}`` for ``name``, or None."""
+        row = self.conn.execute("SELECT * FROM ab_experiments WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "status": row["status"],
+            "config": json.loads(row["config_json"]),
+            "state": json.loads(row["state_json"]),
+            "updated_at": row["updated_at"],
+        }
+
+    def list_experiments(self, status: str | None = None) -> list[str]:
+        if status is None:
+            rows = self.conn.execute("SELECT name FROM ab_experiments ORDER BY updated_at DESC").fetchall()
+        else:
+            rows = self.conn.execute(
+                "SELECT name FROM ab_experiments WHERE status = ? ORDER BY updated_at DESC", (status,)
+            ).fetchall()
+        return [row["name"] for row in rows]
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+__all__ = ["ExperimentStore"]
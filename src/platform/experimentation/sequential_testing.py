@@ -0,0 +1,245 @@
+"""Streaming arm statistics and always-valid sequential tests for A/B experiments.
+
+Each arm keeps O(1) sufficient statistics: a success count and Welford
+running mean/variance for latency, cost and quality. Nothing per sample is
+stored, so summaries and tests cost the same after ten samples or ten
+million.
+
+:class:`SequentialExperiment` compares every pair of active arms with a
+mixture sequential probability ratio test (mSPRT, normal mixture over the
+difference of means). Its p-value is *always valid*: it may be checked after
+every sample and the experiment stopped as soon as it drops below ``alpha``
+without inflating the false-positive rate, unlike repeatedly running a
+fixed-horizon test. An arm that another active arm beats at level
+``alpha / pairs`` (Bonferroni) is eliminated and stops receiving traffic;
+once a single arm is left it is the winner.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+
+MIN_SEQUENTIAL_SAMPLES = 10
+# Default mixture variance is this fraction of the pooled per-sample variance,
+# i.e. the test is tuned for effects of roughly half a standard deviation.
+MIXTURE_VARIANCE_RATIO = 0.25
+_VARIANCE_FLOOR = 1e-12
+
+# metric -> True when larger values are better
+METRIC_DIRECTIONS = {"success_rate": True, "quality": True, "latency_ms": False, "cost": False}
+
+
+class RunningStats:
+    """Welford running mean and variance."""
+
+    __slots__ = ("m2", "mean", "n")
+
+    def __init__(self, n: int = 0, mean: float = 0.0, m2: float = 0.0) -> None:
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, value: float) -> None:
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 for fewer than two samples)."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {"n": self.n, "mean": self.mean, "m2": self.m2}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RunningStats:
+        return cls(int(data["n"]), float(data["mean"]), float(data["m2"]))
+
+
+@dataclass
+class ArmStatistics:
+    """Sufficient statistics for one experiment arm."""
+
+    count: int = 0
+    successes: int = 0
+    latency_ms: RunningStats = field(default_factory=RunningStats)
+    cost: RunningStats = field(default_factory=RunningStats)
+    quality: RunningStats = field(default_factory=RunningStats)
+
+    def add(self, latency_ms: float, cost: float, quality: float, success: bool) -> None:
+        self.count += 1
+        self.successes += bool(success)
+        self.latency_ms.add(latency_ms)
+        self.cost.add(cost)
+        self.quality.add(quality)
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.count if self.count else 0.0
+
+    def moments(self, metric: str) -> tuple[int, float, float]:
+        """``(n, mean, per-sample variance)`` of ``metric``."""
+        if metric == "success_rate":
+            # Variance from a smoothed rate so 0/n and n/n arms do not claim zero noise.
+            smoothed = (self.successes + 0.5) / (self.count + 1)
+            return self.count, self.success_rate, smoothed * (1 - smoothed)
+        stats: RunningStats = getattr(self, metric)
+        return stats.n, stats.mean, stats.variance
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "successes": self.successes,
+            "latency_ms": self.latency_ms.to_dict(),
+            "cost": self.cost.to_dict(),
+            "quality": self.quality.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ArmStatistics:
+        return cls(
+            count=int(data["count"]),
+            successes=int(data["successes"]),
+            latency_ms=RunningStats.from_dict(data["latency_ms"]),
+            cost=RunningStats.from_dict(data["cost"]),
+            quality=RunningStats.from_dict(data["quality"]),
+        )
+
+
+def msprt_p_value(
+    a: tuple[int, float, float], b: tuple[int, float, float], mixture_variance: float, previous: float = 1.0
+) -> float:
+    """Always-valid p-value for "means of a and b are equal" after the latest samples.
+
+    ``a`` and ``b`` are ``(n, mean, variance)``; ``previous`` is the p-value
+    from the previous check, since always-valid p-values never increase.
+    """
+    (n_a, mean_a, var_a), (n_b, mean_b, var_b) = a, b
+    if n_a == 0 or n_b == 0:
+        return previous
+    v = max(var_a / n_a + var_b / n_b, _VARIANCE_FLOOR)
+    diff = mean_b - mean_a
+    log_lr = 0.5 * math.log(v / (v + mixture_variance)) + mixture_variance * diff * diff / (
+        2 * v * (v + mixture_variance)
+    )
+    return min(previous, 1.0, math.exp(-log_lr) if log_lr < 700 else 0.0)
+
+
+class SequentialExperiment:
+    """Arms with running statistics and pairwise mSPRT early stopping."""
+
+    def __init__(
+        self,
+        arms: list[str],
+        *,
+        alpha: float = 0.05,
+        primary_metric: str = "success_rate",
+        mixture_variance: float | None = None,
+        min_samples: int = MIN_SEQUENTIAL_SAMPLES,
+        early_stopping: bool = True,
+    ) -> None:
+        if primary_metric not in METRIC_DIRECTIONS:
+            raise ValueError(f"primary_metric must be one of {sorted(METRIC_DIRECTIONS)}")
+        if not 0.0 < alpha < 1.0:
+            raise ValueError("alpha must be in (0, 1)")
+        self.arms: dict[str, ArmStatistics] = {arm: ArmStatistics() for arm in arms}
+        self.alpha = alpha
+        self.primary_metric = primary_metric
+        self.mixture_variance = mixture_variance
+        self.min_samples = max(2, min_samples)
+        self.early_stopping = early_stopping
+        self.active: list[str] = list(arms)
+        self.eliminated: dict[str, int] = {}
+        pairs = len(arms) * (len(arms) - 1) // 2
+        self.threshold = alpha / max(1, pairs)
+        self._p_values: dict[tuple[str, str], float] = {}
+        self._tau2: dict[tuple[str, str], float] = {}
+
+    @property
+    def winner(self) -> str | None:
+        return self.active[0] if len(self.active) == 1 and len(self.arms) > 1 else None
+
+    @property
+    def concluded(self) -> bool:
+        return self.winner is not None
+
+    def record(self, arm: str, latency_ms: float, cost: float, quality: float, success: bool) -> list[str]:
+        """Add a sample to ``arm``; returns the arms eliminated by it."""
+        self.arms[arm].add(latency_ms, cost, quality, success)
+        if not self.early_stopping or arm not in self.active or self.concluded:
+            return []
+        return self._test(arm)
+
+    def _pair(self, a: str, b: str) -> tuple[str, str]:
+        return (a, b) if a < b else (b, a)
+
+    def _test(self, arm: str) -> list[str]:
+        # Only pairs involving ``arm`` changed, so each sample costs O(arms).
+        metric = self.primary_metric
+        moments = self.arms[arm].moments(metric)
+        if moments[0] < self.min_samples:
+            return []
+        losers: list[str] = []
+        for other in self.active:
+            if other == arm:
+                continue
+            other_moments = self.arms[other].moments(metric)
+            if other_moments[0] < self.min_samples:
+                continue
+            key = self._pair(arm, other)
+            first, second = (moments, other_moments) if key[0] == arm else (other_moments, moments)
+            tau2 = self._tau2.get(key)
+            if tau2 is None:
+                # Fixed at first use; a mixture that kept moving with the data would void the guarantee.
+                tau2 = self.mixture_variance or max(
+                    MIXTURE_VARIANCE_RATIO * (first[2] + second[2]) / 2, _VARIANCE_FLOOR
+                )
+                self._tau2[key] = tau2
+            p_value = msprt_p_value(first, second, tau2, self._p_values.get(key, 1.0))
+            self._p_values[key] = p_value
+            if p_value <= self.threshold:
+                better = (moments[1] > other_moments[1]) == METRIC_DIRECTIONS[metric]
+                losers.append(other if better else arm)
+        eliminated = []
+        for loser in dict.fromkeys(losers):
+            if loser in self.active and len(self.active) > 1:
+                self.active.remove(loser)
+                self.eliminated[loser] = self.arms[loser].count
+                eliminated.append(loser)
+        return eliminated
+
+    def p_values(self) -> dict[str, float]:
+        return {f"{a}|{b}": p for (a, b), p in self._p_values.items()}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "arms": {arm: stats.to_dict() for arm, stats in self.arms.items()},
+            "active": self.active,
+            "eliminated": self.eliminated,
+            "p_values": self.p_values(),
+            "tau2": {f"{a}|{b}": t for (a, b), t in self._tau2.items()},
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Load state written by :meth:`to_dict` (arms not in this experiment are ignored)."""
+        for arm, data in state.get("arms", {}).items():
+            if arm in self.arms:
+                self.arms[arm] = ArmStatistics.from_dict(data)
+        self.active = [arm for arm in state.get("active", self.active) if arm in self.arms] or list(self.arms)
+        self.eliminated = {arm: int(n) for arm, n in state.get("eliminated", {}).items() if arm in self.arms}
+        self._p_values = {tuple(k.split("|", 1)): float(v) for k, v in state.get("p_values", {}).items()}
+        self._tau2 = {tuple(k.split("|", 1)): float(v) for k, v in state.get("tau2", {}).items()}
+
+
+__all__ = [
+    "METRIC_DIRECTIONS",
+    "ArmStatistics",
+    "RunningStats",
+    "SequentialExperiment",
+    "msprt_p_value",
+]
@@ -30,6 +30,7 @@ from .config import (
     get_request_timeout,
 )
 from .retry import is_circuit_breaker_enabled, is_retry_enabled
+from .revalidation import HTTP_NOT_MODIFIED, SingleFlight, Validators, record_outcome
 from .validators import validate_public_https_url
 
 
@@ -68,6 +69,8 @@ def _load_retry_config() -> dict[str, int | None]:
 
 _MEM_HTTP_CACHE: dict[str, tuple[float, str, int]] = {}
 _MEM_HTTP_NEG_CACHE: dict[str, object] = {}
+_MEM_HTTP_VALIDATORS: dict[str, Validators] = {}
+_MEM_HTTP_FLIGHTS = SingleFlight()
 _config = None
 _RETRY_CONFIG_CACHE: dict[str, dict[str, int | None]] | None = {}
 
@@ -498,6 +501,7 @@ def cached_get(
     exp_text = _MEM_HTTP_CACHE.get(key, (0.0, "", 0))
     exp, text, status = exp_text
     if exp > now:
+        record_outcome("fresh", requests_saved=1, bytes_saved=len(text.encode("utf-8")))
         return _CachedResponse(text=text, status_code=status)
     if getattr(settings, "enable_http_negative_cache", False):
         neg_meta = _MEM_HTTP_NEG_CACHE.get(key)
@@ -509,9 +513,32 @@ def cached_get(
             neg_exp, neg_status = (0.0, 404)
         if neg_exp > now:
             return _CachedResponse(text="", status_code=int(neg_status))
-    resp = resilient_get(url, params=params, headers=headers, timeout_seconds=timeout_seconds or get_request_timeout())
+    # Expired entries keep their body and validators: revalidate conditionally so
+    # an unchanged resource costs a 304 instead of a full download. Concurrent
+    # callers for the same key share one upstream request.
+    validators = _MEM_HTTP_VALIDATORS.get(key) if exp else None
+    request_headers = validators.conditional_headers(headers) if validators else headers
+
+    def _fetch():
+        return resilient_get(
+            url, params=params, headers=request_headers, timeout_seconds=timeout_seconds or get_request_timeout()
+        )
+
+    resp, shared = _MEM_HTTP_FLIGHTS.do(key, _fetch)
+    if shared:
+        record_outcome("collapsed", requests_saved=1)
+    if validators and getattr(resp, "status_code", 0) == HTTP_NOT_MODIFIED:
+        _MEM_HTTP_CACHE[key] = (_t.time() + ttl, text, status)
+        if not shared:
+            record_outcome("not_modified", bytes_saved=len(text.encode("utf-8")))
+        return _CachedResponse(text=text, status_code=status)
     if 200 <= getattr(resp, "status_code", 0) < 300:
         _MEM_HTTP_CACHE[key] = (_t.time() + ttl, getattr(resp, "text", ""), int(resp.status_code))
+        resp_validators = Validators.from_headers(getattr(resp, "headers", None))
+        if resp_validators:
+            _MEM_HTTP_VALIDATORS[key] = resp_validators
+        else:
+            _MEM_HTTP_VALIDATORS.pop(key, None)
     elif getattr(settings, "enable_http_negative_cache", False) and getattr(resp, "status_code", 0) in {404, 429}:
         retry_after_s: float | None = None
         try:
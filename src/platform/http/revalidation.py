@@ -0,0 +1,432 @@
+"""Conditional-request (ETag / Last-Modified) HTTP response cache.
+
+A TTL cache throws a response away when it expires and downloads the full body
+again. Most polled resources (channel feeds, sitemaps, API listings) rarely
+change between polls, so this cache keeps the validators the server sent and
+revalidates with ``If-None-Match`` / ``If-Modified-Since`` instead. A ``304 Not
+Modified`` answer refreshes the stored entry and costs only headers.
+
+Lookup outcomes:
+
+- ``fresh``: within ``max-age`` (or the caller's TTL); no request is made.
+- ``stale``: expired but inside the stale-while-revalidate window; the stored
+  body is returned immediately and a single background revalidation starts.
+- ``not_modified``: revalidated synchronously and the server answered 304.
+- ``modified``: revalidated and the server sent a new body.
+- ``miss``: nothing usable was cached.
+- ``collapsed``: another thread was already fetching the same key; the caller
+  waited for and shared that result.
+
+Callers that persist validators across restarts (the scheduler keeps
+``ingest_state.etag``) pass them as ``etag=`` / ``last_modified=``. With no
+stored entry, a 304 then comes back as an empty response with
+``not_modified=True``, meaning "unchanged since you last looked".
+
+Savings are exported as ``http_revalidation_requests_total{outcome}``,
+``http_cache_requests_saved_total`` and ``http_cache_bytes_saved_total``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+HTTP_NOT_MODIFIED = 304
+
+
+@dataclass(frozen=True)
+class Validators:
+    """Cache validators sent by the origin for one representation."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, Any] | None) -> Validators:
+        if not headers:
+            return cls()
+        try:
+            return cls(etag=headers.get("ETag") or headers.get("etag"), last_modified=headers.get("Last-Modified"))
+        except Exception:
+            return cls()
+
+    def __bool__(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self, headers: Mapping[str, str] | None = None) -> dict[str, str]:
+        """Return ``headers`` plus ``If-None-Match`` / ``If-Modified-Since``."""
+        merged = dict(headers or {})
+        if self.etag:
+            merged["If-None-Match"] = self.etag
+        if self.last_modified:
+            merged["If-Modified-Since"] = self.last_modified
+        return merged
+
+
+def parse_cache_control(value: str | None) -> dict[str, int | None]:
+    """Parse a ``Cache-Control`` header into ``{directive: seconds-or-None}``."""
+    directives: dict[str, int | None] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if not name:
+            continue
+        try:
+            directives[name.lower()] = int(arg.strip('"')) if arg else None
+        except ValueError:
+            directives[name.lower()] = None
+    return directives
+
+
+class CachedResponse:
+    """Minimal ``requests.Response`` stand-in served from the cache."""
+
+    def __init__(
+        self,
+        text: str,
+        status_code: int,
+        headers: Mapping[str, str] | None = None,
+        *,
+        cache_status: str = "miss",
+        not_modified: bool = False,
+    ) -> None:
+        self.text = text
+        self.status_code = status_code
+        self.headers = dict(headers or {})
+        self.cache_status = cache_status
+        self.not_modified = not_modified
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    @property
+    def etag(self) -> str | None:
+        return Validators.from_headers(self.headers).etag
+
+    def json(self) -> Any:
+        try:
+            return json.loads(self.text)
+        except Exception:
+            return {}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            import requests as _requests
+
+            raise _requests.HTTPError(f"status={self.status_code}")
+
+    def iter_content(self, chunk_size: int = 8192):
+        yield self.content
+
+
+@dataclass
+class _Entry:
+    text: str
+    status_code: int
+    headers: dict[str, str]
+    validators: Validators
+    fresh_until: float
+    stale_until: float
+
+    @property
+    def size(self) -> int:
+        return len(self.text.encode("utf-8"))
+
+    def response(self, cache_status: str) -> CachedResponse:
+        return CachedResponse(self.text, self.status_code, self.headers, cache_status=cache_status)
+
+
+class _Call:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one execution."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """Run ``fn`` once per in-flight ``key``; return ``(result, shared)``."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        assert call is not None
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
+
+
+def cache_key(url: str, params: Mapping[str, object] | None = None) -> str:
+    if not params:
+        return url
+    items = sorted((str(k), str(v)) for k, v in params.items())
+    return url + "?" + "&".join(f"{k}={v}" for k, v in items)
+
+
+def record_outcome(outcome: str, *, requests_saved: int = 0, bytes_saved: int = 0) -> None:
+    try:
+        from platform.observability import metrics
+
+        metrics.HTTP_REVALIDATION_REQUESTS.labels(outcome=outcome).inc()
+        if requests_saved:
+            metrics.HTTP_CACHE_REQUESTS_SAVED.inc(requests_saved)
+        if bytes_saved:
+            metrics.HTTP_CACHE_BYTES_SAVED.inc(bytes_saved)
+    except Exception:
+        logger.debug("http revalidation metric emit failed", exc_info=True)
+
+
+def _default_fetch(url: str, **kwargs: Any) -> Any:
+    from platform.http import http_utils
+
+    return http_utils.resilient_get(url, **kwargs)
+
+
+class RevalidatingCache:
+    """LRU cache of GET responses revalidated with conditional requests.
+
+    ``default_ttl`` applies when the response carries no ``max-age``; the
+    default of ``0`` revalidates on every lookup, which is cheap when the
+    origin supports validators. ``stale_while_revalidate`` likewise applies
+    when the response does not set the directive itself.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Any] | None = None,
+        *,
+        max_entries: int = 512,
+        default_ttl: float = 0.0,
+        stale_while_revalidate: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch or _default_fetch
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+        self._refreshers: set[threading.Thread] = set()
+        self.counts: dict[str, int] = dict.fromkeys(
+            ("fresh", "stale", "not_modified", "modified", "miss", "collapsed"), 0
+        )
+        self.bytes_saved = 0
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: Mapping[str, object] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout_seconds: int | None = None,
+        ttl_seconds: float | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> Any:
+        """GET ``url`` through the cache; see the module docstring for outcomes."""
+        key = cache_key(url, params)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None and now < entry.fresh_until:
+            self._count("fresh", requests_saved=1, bytes_saved=entry.size)
+            return entry.response("fresh")
+        if entry is not None and now < entry.stale_until:
+            self._count("stale")
+            self._refresh_in_background(key, url, params, headers, timeout_seconds, ttl_seconds)
+            return entry.response("stale")
+        caller_validators = Validators(etag=etag, last_modified=last_modified)
+
+        def fetch() -> Any:
+            return self._revalidate(key, url, params, headers, timeout_seconds, ttl_seconds, caller_validators)
+
+        response, shared = self._flights.do(key, fetch)
+        if shared:
+            self._count("collapsed", requests_saved=1)
+        return response
+
+    def stats(self) -> dict[str, Any]:
+        total = sum(self.counts.values())
+        saved = self.counts["fresh"] + self.counts["collapsed"]
+        return {
+            **self.counts,
+            "entries": len(self._entries),
+            "requests_saved": saved,
+            "bytes_saved": self.bytes_saved,
+            "hit_rate": (saved + self.counts["stale"] + self.counts["not_modified"]) / total if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def drain(self, timeout: float | None = None) -> None:
+        """Wait for background revalidations started so far."""
+        for thread in list(self._refreshers):
+            thread.join(timeout)
+
+    def _revalidate(
+        self,
+        key: str,
+        url: str,
+        params: Mapping[str, object] | None,
+        headers: Mapping[str, str] | None,
+        timeout_seconds: int | None,
+        ttl_seconds: float | None,
+        fallback: Validators,
+    ) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+        validators = entry.validators if entry is not None and entry.validators else fallback
+        request_headers = validators.conditional_headers(headers) if validators else dict(headers or {})
+        resp = self._fetch(url, params=params, headers=request_headers, timeout_seconds=timeout_seconds)
+        status = int(getattr(resp, "status_code", 0) or 0)
+        resp_headers = dict(getattr(resp, "headers", None) or {})
+        if status == HTTP_NOT_MODIFIED and validators:
+            if entry is None:
+                self._count("not_modified")
+                merged = {"ETag": validators.etag or "", "Last-Modified": validators.last_modified or ""}
+                merged.update(resp_headers)
+                return CachedResponse("", HTTP_NOT_MODIFIED, merged, cache_status="not_modified", not_modified=True)
+            entry.headers.update(resp_headers)
+            refreshed = self._store(key, entry.text, entry.status_code, entry.headers, ttl_seconds)
+            self._count("not_modified", bytes_saved=entry.size)
+            return (refreshed or entry).response("not_modified")
+        if 200 <= status < 300:
+            self._store(key, str(getattr(resp, "text", "")), status, resp_headers, ttl_seconds)
+            self._count("modified" if validators else "miss")
+        else:
+            self._count("miss")
+        return resp
+
+    def _store(
+        self, key: str, text: str, status: int, headers: dict[str, str], ttl_seconds: float | None
+    ) -> _Entry | None:
+        directives = parse_cache_control(headers.get("Cache-Control") or headers.get("cache-control"))
+        if "no-store" in directives:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        if "no-cache" in directives:
+            ttl = 0.0
+        elif directives.get("max-age") is not None:
+            ttl = float(directives["max-age"] or 0)
+        else:
+            ttl = self.default_ttl if ttl_seconds is None else float(ttl_seconds)
+        swr = directives.get("stale-while-revalidate")
+        window = float(swr) if swr is not None else self.stale_while_revalidate
+        now = self._clock()
+        entry = _Entry(text, status, headers, Validators.from_headers(headers), now + ttl, now + ttl + window)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        url: str,
+        params: Mapping[str, object] | None,
+        headers: Mapping[str, str] | None,
+        timeout_seconds: int | None,
+        ttl_seconds: float | None,
+    ) -> None:
+        if self._flights.in_flight(key):
+            return
+
+        def refresh() -> None:
+            try:
+                self._flights.do(
+                    key,
+                    lambda: self._revalidate(key, url, params, headers, timeout_seconds, ttl_seconds, Validators()),
+                )
+            except Exception:
+                logger.debug("background revalidation of %s failed", url, exc_info=True)
+            finally:
+                self._refreshers.discard(threading.current_thread())
+
+        thread = threading.Thread(target=refresh, name="http-revalidate", daemon=True)
+        self._refreshers.add(thread)
+        thread.start()
+
+    def _count(self, outcome: str, *, requests_saved: int = 0, bytes_saved: int = 0) -> None:
+        self.counts[outcome] += 1
+        self.bytes_saved += bytes_saved
+        record_outcome(outcome, requests_saved=requests_saved, bytes_saved=bytes_saved)
+
+
+_cache: RevalidatingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_revalidating_cache() -> RevalidatingCache:
+    """Process-wide cache configured from ``HTTP_REVALIDATE_*`` env vars."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            try:
+                size = int(os.getenv("HTTP_REVALIDATE_MAX_ENTRIES", "512"))
+                swr = float(os.getenv("HTTP_REVALIDATE_SWR_SECONDS", "0"))
+            except ValueError:
+                size, swr = 512, 0.0
+            _cache = RevalidatingCache(max_entries=size, stale_while_revalidate=swr)
+        return _cache
+
+
+def conditional_get(url: str, **kwargs: Any) -> Any:
+    """``RevalidatingCache.get`` on the process-wide cache."""
+    return get_revalidating_cache().get(url, **kwargs)
+
+
+__all__ = [
+    "CachedResponse",
+    "RevalidatingCache",
+    "SingleFlight",
+    "Validators",
+    "cache_key",
+    "conditional_get",
+    "get_revalidating_cache",
+    "parse_cache_control",
+    "record_outcome",
+]
@@ -0,0 +1,325 @@
+"""Shared async HTTP transport for OpenRouter chat completions.
+
+One :class:`AsyncChatTransport` is kept per event loop (see
+:func:`get_async_transport`), so concurrent ``aroute`` calls share its
+keep-alive connections instead of paying a TCP/TLS handshake per request:
+
+- by default requests go through an ``aiohttp`` connection pool bounded by
+  ``OPENROUTER_ASYNC_MAX_CONNECTIONS``; idle connections are kept for
+  ``OPENROUTER_ASYNC_KEEPALIVE_SECONDS``;
+- with ``OPENROUTER_ASYNC_HTTP2=1`` and the optional ``h2`` package
+  installed, an ``httpx`` HTTP/2 client multiplexes all in-flight requests
+  over a few connections instead. It is opt-in because httpx's HTTP/1.1
+  pool is far slower than aiohttp's at 100+ concurrent requests (see
+  ``benchmarks/openrouter_async_benchmark.py``);
+- ``stream=True`` requests server-sent events and hands each
+  ``choices[].delta.content`` token to ``on_token`` as it arrives;
+- cancelling the awaiting task closes the response, so an abandoned
+  generation stops being read (and billed by streaming providers) right away.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import random
+import weakref
+from dataclasses import dataclass
+from platform.http.http_utils import REQUEST_TIMEOUT_SECONDS
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+import httpx
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    TokenCallback = Callable[[str], Awaitable[None] | None]
+
+log = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Connection-level failures from either backend; HTTP error statuses are returned, not raised.
+TRANSPORT_ERRORS: tuple[type[BaseException], ...] = (aiohttp.ClientError, asyncio.TimeoutError, httpx.TransportError)
+
+
+@dataclass
+class ChatResponse:
+    """Outcome of one chat completion call.
+
+    Mirrors the parts of ``requests.Response`` the sync execution path reads
+    (``status_code``, ``json()``, ``text``) so error handling can be shared.
+    """
+
+    status_code: int
+    content: str = ""
+    body: dict[str, Any] | None = None
+    text: str = ""
+    streamed: bool = False
+    tokens: int = 0
+    usage: dict[str, Any] | None = None
+    http_version: str = "HTTP/1.1"
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self) -> dict[str, Any]:
+        return self.body or {}
+
+
+def _buffered(status: int, text: str, http_version: str) -> ChatResponse:
+    try:
+        body = json.loads(text) if text else None
+    except ValueError:
+        body = None
+    if not isinstance(body, dict):
+        body = None
+    content = ""
+    if body and status < 400:
+        content = body.get("choices", [{}])[0].get("message", {}).get("content", "") or ""
+    return ChatResponse(
+        status_code=status,
+        content=content,
+        body=body,
+        text=text,
+        usage=(body or {}).get("usage"),
+        http_version=http_version,
+    )
+
+
+class _EventStream:
+    """Accumulates an OpenAI-style SSE completion stream."""
+
+    def __init__(self, on_token: TokenCallback | None) -> None:
+        self.on_token = on_token
+        self.parts: list[str] = []
+        self.usage: dict[str, Any] | None = None
+        self.done = False
+
+    async def feed(self, line: str) -> None:
+        # Lines after [DONE] are still read so the connection can go back to the pool.
+        if self.done or not line.startswith("data:"):
+            return
+        data = line[5:].strip()
+        if data == "[DONE]":
+            self.done = True
+            return
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            return
+        self.usage = chunk.get("usage") or self.usage
+        for choice in chunk.get("choices") or []:
+            token = (choice.get("delta") or {}).get("content")
+            if not token:
+                continue
+            self.parts.append(token)
+            if self.on_token is not None:
+                pending = self.on_token(token)
+                if inspect.isawaitable(pending):
+                    await pending
+
+    def response(self, status: int, http_version: str) -> ChatResponse:
+        content = "".join(self.parts)
+        return ChatResponse(
+            status_code=status,
+            content=content,
+            body={"choices": [{"message": {"role": "assistant", "content": content}}], "usage": self.usage},
+            streamed=True,
+            tokens=len(self.parts),
+            usage=self.usage,
+            http_version=http_version,
+        )
+
+
+class AsyncChatTransport:
+    """Keep-alive client for chat completions, HTTP/2 on request."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout_seconds: float = REQUEST_TIMEOUT_SECONDS,
+        http2: bool = False,
+    ) -> None:
+        self.http2 = bool(http2) and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            log.info("HTTP/2 requested for OpenRouter but h2 is not installed; using HTTP/1.1 keep-alive")
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout_seconds = timeout_seconds
+        self.requests = 0
+        self._closed = False
+        self._session: aiohttp.ClientSession | None = None
+        self._client: httpx.AsyncClient | None = None
+        if self.http2:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(timeout_seconds),
+            )
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _aiohttp_session(self) -> aiohttp.ClientSession:
+        # Created lazily: aiohttp sessions must be opened inside the running loop.
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                keepalive_timeout=self.keepalive_expiry,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=self.timeout_seconds, sock_read=self.timeout_seconds
+                ),
+            )
+        return self._session
+
+    async def send(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        *,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+        on_token: TokenCallback | None = None,
+        attempts: int = 1,
+        base_backoff: float = 0.5,
+    ) -> ChatResponse:
+        """POST ``payload`` to ``url`` and return the completion.
+
+        :data:`TRANSPORT_ERRORS` and :data:`RETRY_STATUSES` are retried with
+        exponential backoff up to ``attempts`` times in total. A retry can
+        only happen before the first streamed token, so ``on_token`` never
+        sees a token twice.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncChatTransport is closed")
+        body = {**payload, "stream": True} if stream else payload
+        attempt = 0
+        while True:
+            attempt += 1
+            self.requests += 1
+            try:
+                if self._client is not None:
+                    response = await self._send_httpx(self._client, url, body, headers, stream, on_token)
+                else:
+                    response = await self._send_aiohttp(url, body, headers, stream, on_token)
+            except TRANSPORT_ERRORS as exc:
+                if attempt >= attempts:
+                    raise
+                log.debug("openrouter async transport error (attempt %d/%d): %s", attempt, attempts, exc)
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= attempts:
+                    return response
+            await asyncio.sleep(base_backoff * 2 ** (attempt - 1) + random.uniform(0, 0.05))  # noqa: S311
+
+    async def _send_aiohttp(
+        self,
+        url: str,
+        body: dict[str, Any],
+        headers: dict[str, str] | None,
+        stream: bool,
+        on_token: TokenCallback | None,
+    ) -> ChatResponse:
+        session = self._aiohttp_session()
+        async with session.request("POST", url, json=body, headers=headers) as response:
+            version = f"HTTP/{response.version.major}.{response.version.minor}" if response.version else "HTTP/1.1"
+            if not stream or response.status >= 400:
+                return _buffered(response.status, await response.text(), version)
+            events = _EventStream(on_token)
+            try:
+                async for raw in response.content:
+                    await events.feed(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+            except BaseException:
+                response.close()
+                raise
+            return events.response(response.status, version)
+
+    @staticmethod
+    async def _send_httpx(
+        client: httpx.AsyncClient,
+        url: str,
+        body: dict[str, Any],
+        headers: dict[str, str] | None,
+        stream: bool,
+        on_token: TokenCallback | None,
+    ) -> ChatResponse:
+        request = client.build_request("POST", url, json=body, headers=headers)
+        response = await client.send(request, stream=True)
+        try:
+            if not stream or response.status_code >= 400:
+                await response.aread()
+                return _buffered(response.status_code, response.text, response.http_version)
+            events = _EventStream(on_token)
+            async for line in response.aiter_lines():
+                await events.feed(line)
+            return events.response(response.status_code, response.http_version)
+        finally:
+            await response.aclose()
+
+    async def aclose(self) -> None:
+        self._closed = True
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._client is not None:
+            await self._client.aclose()
+
+
+_TRANSPORTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncChatTransport] = weakref.WeakKeyDictionary()
+
+
+def get_async_transport() -> AsyncChatTransport:
+    """Return the transport shared by all callers on the running event loop.
+
+    Connection pools are bound to the loop that opened them, so each loop
+    gets its own transport.
+    """
+    loop = asyncio.get_running_loop()
+    transport = _TRANSPORTS.get(loop)
+    if transport is None or transport.closed:
+        transport = AsyncChatTransport(
+            max_connections=int(os.getenv("OPENROUTER_ASYNC_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("OPENROUTER_ASYNC_MAX_KEEPALIVE", "20")),
+            keepalive_expiry=float(os.getenv("OPENROUTER_ASYNC_KEEPALIVE_SECONDS", "30")),
+            http2=os.getenv("OPENROUTER_ASYNC_HTTP2", "").lower() in {"1", "true", "yes", "on"},
+        )
+        _TRANSPORTS[loop] = transport
+    return transport
+
+
+async def aclose_async_transport() -> None:
+    """Close the running loop's shared transport, e.g. on application shutdown."""
+    transport = _TRANSPORTS.pop(asyncio.get_running_loop(), None)
+    if transport is not None:
+        await transport.aclose()
+
+
+__all__ = [
+    "HTTP2_AVAILABLE",
+    "RETRY_STATUSES",
+    "TRANSPORT_ERRORS",
+    "AsyncChatTransport",
+    "ChatResponse",
+    "aclose_async_transport",
+    "get_async_transport",
+]
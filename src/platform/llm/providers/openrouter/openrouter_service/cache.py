@@ -19,6 +19,17 @@ def make_key(prompt: str, model: str) -> str:
     return f"{model}:{digest}"
 
 
+def generate_key_from_params(**params: Any) -> str:
+    """Generate a stable cache key from keyword parameters (order-independent)."""
+    payload = "\x1f".join(f"{name}={params[name]!s}" for name in sorted(params))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def combine_keys(*keys: str) -> str:
+    """Combine several cache keys into one."""
+    return hashlib.sha256(":".join(keys).encode("utf-8")).hexdigest()
+
+
 class RedisLLMCache(BoundedLRUCache):
     """LLMCache-compatible adapter backed by Redis."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os as _os
 import sys
@@ -12,11 +13,13 @@ from typing import TYPE_CHECKING, Any
 
 from ultimate_discord_intelligence_bot.obs import metrics
 
+from .async_transport import TRANSPORT_ERRORS, ChatResponse, get_async_transport
 from .quality import basic_quality_assessment, quality_assessment
 from .service import get_settings
 
 
 if TYPE_CHECKING:
+    from .async_transport import TokenCallback
     from .state import RouteState
 try:
     from ultimate_discord_intelligence_bot.obs.enhanced_langsmith_integration import trace_llm_call as _trace_llm_call
@@ -37,6 +40,15 @@ except Exception:
     _VLLMAdapterCtor = None
 vllm_adapter_ctor: Any | None = _VLLMAdapterCtor
 log = logging.getLogger(__name__)
+OPENROUTER_CHAT_URL = "https://openrouter.ai/api/v1/chat/completions"
+_OVERFLOW_MARKERS = (
+    "maximum context length",
+    "context length exceeded",
+    "too many tokens",
+    "prompt is too long",
+    "exceeds the maximum allowed",
+    "token limit",
+)
 _MODULE_NAMES = (
     "ultimate_discord_intelligence_bot.services.openrouter_service",
     "src.ultimate_discord_intelligence_bot.services.openrouter_service",
@@ -155,6 +167,18 @@ def execute_offline(service: OpenRouterService, state: RouteState) -> dict[str,
     return result
 
 
+def _retry_attempts() -> int:
+    """Attempts per LLM POST, shared by the sync and async paths (local and OpenRouter)."""
+    return 3 if is_retry_enabled() else 1
+
+
+def _post_with_retry(url: str, request_callable: Any) -> Any:
+    attempts = _retry_attempts()
+    if attempts == 1:
+        return request_callable(url)
+    return http_request_with_retry("POST", url, request_callable=request_callable, max_attempts=attempts)
+
+
 def execute_online(service: OpenRouterService, state: RouteState) -> dict[str, Any]:
     prompt = state.prompt
     chosen = state.chosen_model
@@ -164,42 +188,18 @@ def execute_online(service: OpenRouterService, state: RouteState) -> dict[str, A
     if provider:
         payload["provider"] = provider
     settings = get_settings()
-    if (
-        chosen.startswith("local/")
-        and vllm_adapter_ctor is not None
-        and _has_vllm()
-        and getattr(settings, "enable_vllm_local", False)
-    ):
-        try:
-            AdapterType: Any = vllm_adapter_ctor
-            adapter = AdapterType()
-            vllm_result = adapter.route_to_local_model(prompt, chosen, state.task_type)
-            if vllm_result.get("status") == "success":
-                latency_ms = (time.perf_counter() - state.start_time) * 1000
-                trace_llm_call(
-                    name=f"vllm_{state.task_type}",
-                    prompt=prompt,
-                    response=vllm_result["response"],
-                    model=chosen,
-                    metadata={"provider": "vllm", "task_type": state.task_type, "local_inference": True},
-                    latency_ms=latency_ms,
-                    token_usage={
-                        "input_tokens": state.tokens_in,
-                        "output_tokens": vllm_result.get("tokens", 0),
-                        "total_tokens": state.tokens_in + vllm_result.get("tokens", 0),
-                    },
-                    cost=state.projected_cost,
-                )
-                _charge_tracker(state)
-                state.result = vllm_result
-                return vllm_result
-        except Exception as exc:
-            log.warning("vLLM local inference failed: %s, falling back to HTTP", exc)
+    if _use_vllm(chosen, settings):
+        vllm_result = _try_vllm(service, state)
+        if vllm_result is not None:
+            return vllm_result
     if getattr(settings, "local_llm_url", None):
         local_model = chosen.split("/", 1)[1] if "/" in chosen else chosen
         local_payload = {"model": local_model, "messages": payload["messages"]}
         local_url = str(getattr(settings, "local_llm_url", "")).rstrip("/") + "/v1/chat/completions"
-        resp = _call_resilient_post(local_url, json_payload=local_payload, timeout_seconds=REQUEST_TIMEOUT_SECONDS)
+        resp = _post_with_retry(
+            local_url,
+            lambda u, **_: _call_resilient_post(u, json_payload=local_payload, timeout_seconds=REQUEST_TIMEOUT_SECONDS),
+        )
         if resp is not None and getattr(resp, "status_code", 200) < 400:
             data = resp.json()
             message = data.get("choices", [{}])[0].get("message", {}).get("content", "")
@@ -214,72 +214,18 @@ def execute_online(service: OpenRouterService, state: RouteState) -> dict[str, A
             }
             _post_success(service, state, result_local, tokens_out, latency_ms, provider_family, offline=False)
             return result_local
-    url = "https://openrouter.ai/api/v1/chat/completions"
-    api_key = service.api_key or ""
-    headers = {"Authorization": f"Bearer {api_key}", "Accept": "application/json", "Content-Type": "application/json"}
-    ref = getattr(settings, "openrouter_referer", None) or _os.getenv("OPENROUTER_REFERER")
-    if ref:
-        ref = str(ref)
-        headers["Referer"] = ref
-        headers["HTTP-Referer"] = ref
-    title = getattr(settings, "openrouter_title", None) or _os.getenv("OPENROUTER_TITLE")
-    if title:
-        headers["X-Title"] = str(title)
+    url = OPENROUTER_CHAT_URL
+    headers = _openrouter_headers(service, settings)
     resp = None
 
-    def _is_overflow_error(response: Any) -> bool:
-        try:
-            status = getattr(response, "status_code", None)
-            body_txt = None
-            body = None
-            try:
-                body = response.json() if hasattr(response, "json") else None
-            except Exception:
-                body = None
-            try:
-                body_txt = response.text if hasattr(response, "text") else None
-            except Exception:
-                body_txt = None
-            if status in (400, 413, 422):
-                markers = (
-                    "maximum context length",
-                    "context length exceeded",
-                    "too many tokens",
-                    "prompt is too long",
-                    "exceeds the maximum allowed",
-                    "token limit",
-                )
-                text = " ".join(
-                    [str(body) if body is not None else "", str(body_txt) if body_txt is not None else ""]
-                ).lower()
-                return any(m in text for m in markers)
-        except Exception:
-            pass
-        return False
-
     def _retry_after_compression(reason: str) -> dict[str, Any] | None:
         """Attempt a single retry with aggressive prompt compression.
 
         Returns a result dict when retry succeeds; otherwise None to allow normal error handling.
         """
         try:
-            target_reduction = 0.5
-            max_tokens = None
-            try:
-                overrides = state.provider_overrides or {}
-                mt = overrides.get("max_tokens") if isinstance(overrides, dict) else None
-                if isinstance(mt, int) and mt > 0:
-                    max_tokens = int(max(256, mt * 2))
-            except Exception:
-                max_tokens = None
-            new_text, meta = service.prompt_engine.optimise_with_metadata(
-                state.prompt, target_token_reduction=target_reduction, max_tokens=max_tokens, force_enable=True
-            )
-            if not isinstance(new_text, str) or not new_text.strip():
+            if not _compress_for_retry(service, state):
                 return None
-            state.prompt = new_text
-            state.compression_metadata = meta
-            state.tokens_in = service.prompt_engine.count_tokens(new_text, state.chosen_model)
             retry_payload = {"model": state.chosen_model, "messages": [{"role": "user", "content": state.prompt}]}
             if provider:
                 retry_payload["provider"] = provider
@@ -309,47 +255,14 @@ def execute_online(service: OpenRouterService, state: RouteState) -> dict[str, A
 
     if is_retry_enabled():
         try:
-            resp = http_request_with_retry(
-                "POST",
+            resp = _post_with_retry(
                 url,
-                request_callable=lambda u, **_: _call_resilient_post(
+                lambda u, **_: _call_resilient_post(
                     u, headers=headers, json_payload=payload, timeout_seconds=REQUEST_TIMEOUT_SECONDS
                 ),
-                max_attempts=3,
             )
         except Exception as retry_exc:
-            latency_ms = (time.perf_counter() - state.start_time) * 1000
-            if service.logger:
-                try:
-                    service.logger.log_llm_call(
-                        state.task_type,
-                        chosen,
-                        str(provider),
-                        state.tokens_in,
-                        0,
-                        float(state.projected_cost),
-                        latency_ms,
-                        None,
-                        False,
-                        str(retry_exc),
-                    )
-                except Exception as log_exc:
-                    log.debug("logger failure in retry give-up: %s", log_exc)
-            error = {
-                "status": "error",
-                "error": str(retry_exc),
-                "model": chosen,
-                "tokens": state.tokens_in,
-                "provider": provider,
-            }
-            state.error = error
-            service._adaptive_record_outcome(
-                state,
-                reward=0.0,
-                status="error",
-                metadata={"stage": "http_retry", "error": str(retry_exc), "latency_ms": latency_ms},
-            )
-            return error
+            return _retry_give_up(service, state, retry_exc)
     else:
         resp = _call_resilient_post(url, headers=headers, json_payload=payload, timeout_seconds=REQUEST_TIMEOUT_SECONDS)
     if resp is None or getattr(resp, "status_code", 200) >= 400:
@@ -382,6 +295,232 @@ def execute_online(service: OpenRouterService, state: RouteState) -> dict[str, A
     return result
 
 
+async def execute_online_async(
+    service: OpenRouterService,
+    state: RouteState,
+    *,
+    stream: bool = False,
+    on_token: TokenCallback | None = None,
+) -> dict[str, Any]:
+    """Async counterpart of :func:`execute_online` on the shared keep-alive transport.
+
+    Network waits are awaited rather than parked on a thread, so one event
+    loop can keep hundreds of completions in flight. With ``stream=True``
+    each token is handed to ``on_token`` as it arrives and the result still
+    carries the full response. Cancelling the calling task closes the HTTP
+    response and skips all success bookkeeping.
+    """
+    chosen = state.chosen_model
+    provider = state.provider
+    payload: dict[str, Any] = {"model": chosen, "messages": [{"role": "user", "content": state.prompt}]}
+    if provider:
+        payload["provider"] = provider
+    settings = get_settings()
+    if _use_vllm(chosen, settings):
+        vllm_result = await asyncio.to_thread(_try_vllm, service, state)
+        if vllm_result is not None:
+            return vllm_result
+    transport = get_async_transport()
+    attempts = _retry_attempts()
+    if getattr(settings, "local_llm_url", None):
+        local_model = chosen.split("/", 1)[1] if "/" in chosen else chosen
+        local_payload = {"model": local_model, "messages": payload["messages"]}
+        local_url = str(getattr(settings, "local_llm_url", "")).rstrip("/") + "/v1/chat/completions"
+        local_resp = await transport.send(local_url, local_payload, stream=stream, on_token=on_token, attempts=attempts)
+        if local_resp.ok:
+            return _async_success(service, state, local_resp, local_model, provider={"order": ["local"]})
+    headers = _openrouter_headers(service, settings)
+    try:
+        resp = await transport.send(
+            OPENROUTER_CHAT_URL, payload, headers=headers, stream=stream, on_token=on_token, attempts=attempts
+        )
+    except TRANSPORT_ERRORS as exc:
+        if attempts > 1:
+            return _retry_give_up(service, state, exc)
+        raise
+    if resp.ok:
+        return _async_success(service, state, resp, chosen, provider=provider)
+    if resp.status_code == 413 or _is_overflow_error(resp):
+        try:
+            if _compress_for_retry(service, state):
+                retry_payload = {**payload, "messages": [{"role": "user", "content": state.prompt}]}
+                retry_resp = await transport.send(
+                    OPENROUTER_CHAT_URL, retry_payload, headers=headers, stream=stream, on_token=on_token
+                )
+                if retry_resp.ok:
+                    return _async_success(
+                        service,
+                        state,
+                        retry_resp,
+                        state.chosen_model,
+                        provider=provider,
+                        retry_reason="overflow_detected",
+                    )
+        except (*TRANSPORT_ERRORS, ValueError) as retry_exc:
+            log.debug("overflow retry after compression failed: %s", retry_exc)
+    raise RuntimeError(f"openrouter_error status={resp.status_code}")
+
+
+def _async_success(
+    service: OpenRouterService,
+    state: RouteState,
+    resp: ChatResponse,
+    count_model: str,
+    *,
+    provider: Any,
+    **extra: Any,
+) -> dict[str, Any]:
+    latency_ms = (time.perf_counter() - state.start_time) * 1000
+    tokens_out = service.prompt_engine.count_tokens(resp.content, count_model)
+    result: dict[str, Any] = {
+        "status": "success",
+        "model": state.chosen_model,
+        "response": resp.content,
+        "tokens": state.tokens_in,
+        "provider": provider,
+        **extra,
+    }
+    if resp.streamed:
+        result["streamed"] = True
+    _post_success(service, state, result, tokens_out, latency_ms, state.provider_family, offline=False)
+    return result
+
+
+def _use_vllm(chosen: str, settings: Any) -> bool:
+    return (
+        chosen.startswith("local/")
+        and vllm_adapter_ctor is not None
+        and _has_vllm()
+        and bool(getattr(settings, "enable_vllm_local", False))
+    )
+
+
+def _try_vllm(service: OpenRouterService, state: RouteState) -> dict[str, Any] | None:
+    """Run the prompt on the local vLLM adapter; ``None`` means fall back to HTTP."""
+    prompt = state.prompt
+    chosen = state.chosen_model
+    try:
+        AdapterType: Any = vllm_adapter_ctor
+        adapter = AdapterType()
+        vllm_result = adapter.route_to_local_model(prompt, chosen, state.task_type)
+        if vllm_result.get("status") == "success":
+            latency_ms = (time.perf_counter() - state.start_time) * 1000
+            trace_llm_call(
+                name=f"vllm_{state.task_type}",
+                prompt=prompt,
+                response=vllm_result["response"],
+                model=chosen,
+                metadata={"provider": "vllm", "task_type": state.task_type, "local_inference": True},
+                latency_ms=latency_ms,
+                token_usage={
+                    "input_tokens": state.tokens_in,
+                    "output_tokens": vllm_result.get("tokens", 0),
+                    "total_tokens": state.tokens_in + vllm_result.get("tokens", 0),
+                },
+                cost=state.projected_cost,
+            )
+            _charge_tracker(state)
+            state.result = vllm_result
+            return vllm_result
+    except Exception as exc:
+        log.warning("vLLM local inference failed: %s, falling back to HTTP", exc)
+    return None
+
+
+def _openrouter_headers(service: OpenRouterService, settings: Any) -> dict[str, str]:
+    api_key = service.api_key or ""
+    headers = {"Authorization": f"Bearer {api_key}", "Accept": "application/json", "Content-Type": "application/json"}
+    ref = getattr(settings, "openrouter_referer", None) or _os.getenv("OPENROUTER_REFERER")
+    if ref:
+        ref = str(ref)
+        headers["Referer"] = ref
+        headers["HTTP-Referer"] = ref
+    title = getattr(settings, "openrouter_title", None) or _os.getenv("OPENROUTER_TITLE")
+    if title:
+        headers["X-Title"] = str(title)
+    return headers
+
+
+def _is_overflow_error(response: Any) -> bool:
+    try:
+        status = getattr(response, "status_code", None)
+        body_txt = None
+        body = None
+        try:
+            body = response.json() if hasattr(response, "json") else None
+        except Exception:
+            body = None
+        try:
+            body_txt = response.text if hasattr(response, "text") else None
+        except Exception:
+            body_txt = None
+        if status in (400, 413, 422):
+            text = " ".join(
+                [str(body) if body is not None else "", str(body_txt) if body_txt is not None else ""]
+            ).lower()
+            return any(m in text for m in _OVERFLOW_MARKERS)
+    except Exception:
+        pass
+    return False
+
+
+def _compress_for_retry(service: OpenRouterService, state: RouteState) -> bool:
+    """Aggressively compress ``state.prompt`` in place before an overflow retry."""
+    target_reduction = 0.5
+    max_tokens = None
+    try:
+        overrides = state.provider_overrides or {}
+        mt = overrides.get("max_tokens") if isinstance(overrides, dict) else None
+        if isinstance(mt, int) and mt > 0:
+            max_tokens = int(max(256, mt * 2))
+    except Exception:
+        max_tokens = None
+    new_text, meta = service.prompt_engine.optimise_with_metadata(
+        state.prompt, target_token_reduction=target_reduction, max_tokens=max_tokens, force_enable=True
+    )
+    if not isinstance(new_text, str) or not new_text.strip():
+        return False
+    state.prompt = new_text
+    state.compression_metadata = meta
+    state.tokens_in = service.prompt_engine.count_tokens(new_text, state.chosen_model)
+    return True
+
+
+def _retry_give_up(service: OpenRouterService, state: RouteState, retry_exc: Exception) -> dict[str, Any]:
+    latency_ms = (time.perf_counter() - state.start_time) * 1000
+    if service.logger:
+        try:
+            service.logger.log_llm_call(
+                state.task_type,
+                state.chosen_model,
+                str(state.provider),
+                state.tokens_in,
+                0,
+                float(state.projected_cost),
+                latency_ms,
+                None,
+                False,
+                str(retry_exc),
+            )
+        except Exception as log_exc:
+            log.debug("logger failure in retry give-up: %s", log_exc)
+    error = {
+        "status": "error",
+        "error": str(retry_exc),
+        "model": state.chosen_model,
+        "tokens": state.tokens_in,
+        "provider": state.provider,
+    }
+    state.error = error
+    service._adaptive_record_outcome(
+        state,
+        reward=0.0,
+        status="error",
+        metadata={"stage": "http_retry", "error": str(retry_exc), "latency_ms": latency_ms},
+    )
+    return error
+
+
 def handle_failure(service: OpenRouterService, state: RouteState, exc: Exception) -> dict[str, Any]:
     latency_ms = (time.perf_counter() - state.start_time) * 1000
     if service.logger:
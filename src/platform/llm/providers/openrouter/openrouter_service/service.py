@@ -50,15 +50,22 @@ except Exception:
 
         get_settings = _get_settings_fallback
 from platform.llm.routing.services.rl_model_router import RLModelRouter
+from platform.prompts.engine.prompt_engine import PromptEngine
 
 from app.config.settings import ENABLE_RL_MODEL_ROUTING
-from ultimate_discord_intelligence_bot.cache import ENABLE_CACHE_V2, UnifiedCache, get_unified_cache
+
+try:
+    from ultimate_discord_intelligence_bot.cache import ENABLE_CACHE_V2, UnifiedCache, get_unified_cache
+except ImportError:
+    # The unified (v2) cache is not part of this tree; the legacy Redis/LRU cache path is used instead.
+    ENABLE_CACHE_V2 = False
+    UnifiedCache = Any
+    get_unified_cache = None
 
 from ..openrouter_helpers import choose_model_from_map as _choose_model_from_map_helper
 from ..openrouter_helpers import ctx_or_fallback as _ctx_or_fallback_helper
 from ..openrouter_helpers import deep_merge as _deep_merge_helper
 from ..openrouter_helpers import update_shadow_hit_ratio as _update_shadow_hit_ratio_helper
-from ..prompt_engine import PromptEngine
 from ..token_meter import TokenMeter
 
 
@@ -95,6 +102,7 @@ if TYPE_CHECKING:
     from ultimate_discord_intelligence_bot.tenancy.registry import TenantRegistry
 
     from ..logging_utils import AnalyticsStore
+    from .async_transport import TokenCallback
     from .state import RouteState
 
 
@@ -329,6 +337,44 @@ class OpenRouterService:
         self._adaptive_flush_events()
         return result
 
+    async def aroute(
+        self,
+        prompt: str,
+        task_type: str = "general",
+        model: str | None = None,
+        provider_opts: dict[str, Any] | None = None,
+        compress: bool = True,
+        *,
+        stream: bool = False,
+        on_token: TokenCallback | None = None,
+    ) -> dict[str, Any]:
+        """Route ``prompt`` without blocking a thread on the LLM call.
+
+        Same result as :meth:`route`. Requests share a keep-alive connection
+        pool per event loop; HTTP/2 is opt-in with ``OPENROUTER_ASYNC_HTTP2=1``
+        (and needs ``h2``). ``stream=True`` passes tokens to ``on_token`` as
+        they arrive. Cancelling the awaiting task aborts the request.
+
+        Both methods share the prepare/budget/cache workflow and only differ in
+        the execution leg. :meth:`route` does not wrap this coroutine: it is
+        called from threads that may already run an event loop, and a
+        per-call loop would discard the pooled connections.
+        """
+        from .workflow import aroute_prompt
+
+        result = await aroute_prompt(
+            self,
+            prompt,
+            task_type=task_type,
+            model=model,
+            provider_opts=provider_opts,
+            compress=compress,
+            stream=stream,
+            on_token=on_token,
+        )
+        self._adaptive_flush_events()
+        return result
+
     def _adaptive_record_outcome(
         self, state: RouteState, *, reward: float, status: str, metadata: dict[str, Any] | None = None
     ) -> None:
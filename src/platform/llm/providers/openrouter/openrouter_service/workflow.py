@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import TYPE_CHECKING, Any
@@ -16,12 +17,14 @@ except Exception:
 from .budget import enforce_budget_limits
 from .cache_layer import check_caches
 from .context import prepare_route_state
-from .execution import execute_offline, execute_online, handle_failure
+from .execution import execute_offline, execute_online, execute_online_async, handle_failure
 from .service import get_settings
 
 
 if TYPE_CHECKING:
+    from .async_transport import TokenCallback
     from .service import OpenRouterService
+    from .state import RouteState
 
 
 def route_prompt(
@@ -35,19 +38,71 @@ def route_prompt(
 ) -> dict[str, Any]:
     state = prepare_route_state(service, prompt, task_type, model, provider_opts)
     metrics.ROUTER_DECISIONS.labels(**state.labels()).inc()
-    if compress and get_settings().enable_prompt_compression and (PromptCompressionTool is not None):
-        try:
-            compressor = PromptCompressionTool()
-            result = compressor.run(
-                contexts=[prompt], target_token=provider_opts.get("max_tokens", 2000) * 2 if provider_opts else 4000
+    if compress and _compression_enabled():
+        _compress_prompt(state, prompt, provider_opts)
+    early = _check_budget_and_caches(service, state)
+    if early is not None:
+        return early
+    if state.offline_mode:
+        return execute_offline(service, state)
+    try:
+        return execute_online(service, state)
+    except Exception as exc:
+        return handle_failure(service, state, exc)
+
+
+async def aroute_prompt(
+    service: OpenRouterService,
+    prompt: str,
+    *,
+    task_type: str,
+    model: str | None,
+    provider_opts: dict[str, Any] | None,
+    compress: bool = True,
+    stream: bool = False,
+    on_token: TokenCallback | None = None,
+) -> dict[str, Any]:
+    """Async :func:`route_prompt`; the LLM call itself never blocks a thread.
+
+    Prompt compression runs a local model, so it is moved off the event loop.
+    ``asyncio.CancelledError`` is not turned into an error result: it
+    propagates to the caller after the HTTP response has been closed.
+    """
+    state = prepare_route_state(service, prompt, task_type, model, provider_opts)
+    metrics.ROUTER_DECISIONS.labels(**state.labels()).inc()
+    if compress and _compression_enabled():
+        await asyncio.to_thread(_compress_prompt, state, prompt, provider_opts)
+    early = _check_budget_and_caches(service, state)
+    if early is not None:
+        return early
+    if state.offline_mode:
+        return execute_offline(service, state)
+    try:
+        return await execute_online_async(service, state, stream=stream, on_token=on_token)
+    except Exception as exc:
+        return handle_failure(service, state, exc)
+
+
+def _compression_enabled() -> bool:
+    return get_settings().enable_prompt_compression and (PromptCompressionTool is not None)
+
+
+def _compress_prompt(state: RouteState, prompt: str, provider_opts: dict[str, Any] | None) -> None:
+    try:
+        compressor = PromptCompressionTool()
+        result = compressor.run(
+            contexts=[prompt], target_token=provider_opts.get("max_tokens", 2000) * 2 if provider_opts else 4000
+        )
+        if result.success:
+            state.prompt = result.data["compressed_prompt"]
+            logging.getLogger("router").info(
+                f"Compressed prompt: {result.data['tokens_saved']} tokens saved ({result.data['compression_ratio']:.2%} reduction)"
             )
-            if result.success:
-                state.prompt = result.data["compressed_prompt"]
-                logging.getLogger("router").info(
-                    f"Compressed prompt: {result.data['tokens_saved']} tokens saved ({result.data['compression_ratio']:.2%} reduction)"
-                )
-        except Exception:
-            pass
+    except Exception:
+        pass
+
+
+def _check_budget_and_caches(service: OpenRouterService, state: RouteState) -> dict[str, Any] | None:
     budget_error = enforce_budget_limits(service, state)
     if budget_error is not None:
         return budget_error
@@ -55,9 +110,4 @@ def route_prompt(
     if cache_hit is not None:
         return cache_hit
     state.start_time = time.perf_counter()
-    if state.offline_mode:
-        return execute_offline(service, state)
-    try:
-        return execute_online(service, state)
-    except Exception as exc:
-        return handle_failure(service, state, exc)
+    return None
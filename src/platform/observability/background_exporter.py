@@ -0,0 +1,160 @@
+"""Bounded background exporter for telemetry items.
+
+Exporting spans synchronously put network round-trips (and a client flush per
+span) on the request path. :class:`BackgroundExporter` decouples producers
+from the sink:
+
+- ``submit`` never blocks; when the bounded queue is full the new item is
+  dropped and counted instead of stalling the pipeline.
+- A daemon worker drains the queue in batches of up to ``batch_size`` items,
+  waiting at most ``flush_interval`` seconds to fill a batch.
+- ``flush`` waits until everything submitted so far was handed to the sink.
+
+Drops and queue depth are published through ``platform.observability.metrics``
+when Prometheus is available.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _record_drop(name: str) -> None:
+    try:
+        from platform.observability import metrics
+
+        metrics.TELEMETRY_EXPORT_DROPPED.labels(exporter=name, reason="queue_full").inc()
+    except Exception:
+        logger.debug("Telemetry drop metric emit failed", exc_info=True)
+
+
+def _record_depth(name: str, depth: int) -> None:
+    try:
+        from platform.observability import metrics
+
+        metrics.TELEMETRY_EXPORT_QUEUE_DEPTH.labels(exporter=name).set(depth)
+    except Exception:
+        logger.debug("Telemetry queue depth metric emit failed", exc_info=True)
+
+
+class BackgroundExporter(Generic[T]):
+    """Batching exporter backed by a bounded queue and one worker thread."""
+
+    def __init__(
+        self,
+        sink: Callable[[list[T]], None],
+        *,
+        name: str = "telemetry",
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._sink = sink
+        self.name = name
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[T] = queue.Queue(maxsize=max(1, max_queue_size))
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self._atexit_registered = False
+        self.submitted = 0
+        self.exported = 0
+        self.dropped = 0
+        self.failed_batches = 0
+
+    def submit(self, item: T) -> bool:
+        """Queue ``item`` for export; return ``False`` if it was dropped."""
+        if self._closed:
+            self.dropped += 1
+            return False
+        with self._idle:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.dropped += 1
+                _record_drop(self.name)
+                return False
+            self._pending += 1
+            self.submitted += 1
+        self._ensure_worker()
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all submitted items were exported (or ``timeout`` passes)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Stop accepting items and drain what is queued."""
+        self._closed = True
+        self.flush(timeout)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "exported": self.exported,
+            "dropped": self.dropped,
+            "failed_batches": self.failed_batches,
+            "queue_depth": self._queue.qsize(),
+        }
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._idle:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name=f"{self.name}-exporter", daemon=True)
+            self._worker.start()
+            if not self._atexit_registered:
+                # Restarted workers share one hook; registering per start would pile up close() calls.
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+    def _next_batch(self) -> list[T]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            _record_depth(self.name, self._queue.qsize())
+            try:
+                self._sink(batch)
+                self.exported += len(batch)
+            except Exception:
+                self.failed_batches += 1
+                logger.warning("%s exporter dropped a batch of %d items", self.name, len(batch), exc_info=True)
+            with self._idle:
+                self._pending -= len(batch)
+                if not self._pending:
+                    self._idle.notify_all()
+
+
+__all__ = ["BackgroundExporter"]
@@ -56,9 +56,18 @@ except ImportError:
         return b""
 
 
+from .quantile_sketch import (
+    DEFAULT_RELATIVE_ACCURACY,
+    DEFAULT_WINDOW_SECONDS,
+    QuantileSketch,
+    WindowedQuantileSketch,
+)
 from .slo import SLO, SLOEvaluator
 
 
+MAX_CACHED_SERIES_KEYS = 10_000
+
+
 def label_ctx(extra_labels: dict[str, str] | None = None) -> dict[str, str]:
     """Return tenant/workspace labels for metrics emission.
 
@@ -123,13 +132,29 @@ class Histogram:
 
 
 class MetricsCollector:
-    """Simple in-memory metrics collector for SLO monitoring."""
+    """Simple in-memory metrics collector for SLO monitoring.
 
-    def __init__(self):
+    Histograms are fixed-size quantile sketches (see ``quantile_sketch``):
+    quantiles are within ``relative_accuracy`` of the exact value, memory per
+    series does not grow with the number of observations, and quantiles over
+    the last ``window_seconds`` are available alongside all-time ones.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+    ):
         self.counters: dict[str, float] = defaultdict(float)
         self.gauges: dict[str, float] = defaultdict(float)
-        self.histograms: dict[str, list[float]] = defaultdict(list)
+        self.histograms: dict[str, WindowedQuantileSketch] = defaultdict(self._new_histogram)
         self.start_times: dict[str, float] = {}
+        self._keys: dict[tuple[Any, ...], str] = {}
+        self.relative_accuracy = relative_accuracy
+        self.window_seconds = window_seconds
+
+    def _new_histogram(self) -> WindowedQuantileSketch:
+        return WindowedQuantileSketch(self.relative_accuracy, window_seconds=self.window_seconds)
 
     def increment_counter(self, name: str, value: float = 1.0, labels: dict[str, str] | None = None) -> None:
         """Increment a counter metric."""
@@ -144,7 +169,7 @@ class MetricsCollector:
     def observe_histogram(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
         """Record a histogram observation."""
         key = self._make_key(name, labels)
-        self.histograms[key].append(value)
+        self.histograms[key].add(value)
 
     def start_timer(self, name: str, labels: dict[str, str] | None = None) -> str:
         """Start a timer and return a timer ID."""
@@ -172,33 +197,71 @@ class MetricsCollector:
         key = self._make_key(name, labels)
         return self.gauges.get(key, 0.0)
 
-    def get_histogram_quantile(self, name: str, quantile: float, labels: dict[str, str] | None = None) -> float:
-        """Get histogram quantile value."""
+    def get_histogram_quantile(
+        self,
+        name: str,
+        quantile: float,
+        labels: dict[str, str] | None = None,
+        window_seconds: float | None = None,
+    ) -> float:
+        """Get histogram quantile value, over the last ``window_seconds`` if given."""
         key = self._make_key(name, labels)
-        values = self.histograms.get(key, [])
-        if not values:
+        histogram = self.histograms.get(key)
+        if histogram is None:
             return 0.0
+        return histogram.quantile(quantile, window_seconds)
 
-        sorted_values = sorted(values)
-        index = int(quantile * (len(sorted_values) - 1))
-        return sorted_values[index]
+    def get_histogram_quantiles(
+        self,
+        name: str,
+        quantiles: tuple[float, ...] = (0.5, 0.95, 0.99),
+        labels: dict[str, str] | None = None,
+        window_seconds: float | None = None,
+    ) -> dict[float, float]:
+        """Get several quantiles from one snapshot of the histogram."""
+        histogram = self.histograms.get(self._make_key(name, labels))
+        if histogram is None:
+            return dict.fromkeys(quantiles, 0.0)
+        sketch = histogram.total if window_seconds is None else histogram.window(window_seconds)
+        return sketch.quantiles(quantiles)
+
+    def merged_histogram(self, name: str, window_seconds: float | None = None) -> QuantileSketch:
+        """Merge every label set recorded under ``name`` into one sketch."""
+        merged = QuantileSketch(self.relative_accuracy)
+        for key, histogram in list(self.histograms.items()):
+            if key == name or key.startswith(name + "{"):
+                merged.merge(histogram.total if window_seconds is None else histogram.window(window_seconds))
+        return merged
 
     def get_histogram_sum(self, name: str, labels: dict[str, str] | None = None) -> float:
         """Get histogram sum."""
         key = self._make_key(name, labels)
-        return sum(self.histograms.get(key, []))
+        histogram = self.histograms.get(key)
+        return histogram.sum if histogram is not None else 0.0
 
     def get_histogram_count(self, name: str, labels: dict[str, str] | None = None) -> int:
         """Get histogram count."""
         key = self._make_key(name, labels)
-        return len(self.histograms.get(key, []))
+        histogram = self.histograms.get(key)
+        return histogram.count if histogram is not None else 0
 
     def _make_key(self, name: str, labels: dict[str, str] | None) -> str:
         """Create a key for metric storage."""
         if not labels:
             return name
+        # Series keys are rebuilt on every observation; memoise them per label set.
+        cache_key = (name, *labels.items())
+        try:
+            return self._keys[cache_key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable label value
+            cache_key = None
         label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-        return f"{name}{{{label_str}}}"
+        key = f"{name}{{{label_str}}}"
+        if cache_key is not None and len(self._keys) < MAX_CACHED_SERIES_KEYS:
+            self._keys[cache_key] = key
+        return key
 
     def reset(self) -> None:
         """Reset all metrics."""
@@ -206,15 +269,21 @@ class MetricsCollector:
         self.gauges.clear()
         self.histograms.clear()
         self.start_times.clear()
+        self._keys.clear()
 
 
 class SLOMonitor:
-    """SLO monitoring and evaluation."""
+    """SLO monitoring and evaluation.
 
-    def __init__(self, slos: list[SLO]):
+    Latency SLOs are evaluated over the last ``window_seconds`` across all
+    label sets of the latency histogram.
+    """
+
+    def __init__(self, slos: list[SLO], window_seconds: float = DEFAULT_WINDOW_SECONDS):
         self.slos = slos
         self.evaluator = SLOEvaluator(slos)
-        self.metrics = MetricsCollector()
+        self.metrics = MetricsCollector(window_seconds=window_seconds)
+        self.window_seconds = window_seconds
 
     def record_request(self, endpoint: str, duration: float, status_code: int) -> None:
         """Record a request metric."""
@@ -257,7 +326,7 @@ class SLOMonitor:
         current_metrics["error_rate"] = error_rate
 
         # Calculate P95 latency
-        p95_latency = self.metrics.get_histogram_quantile("request_duration_seconds", 0.95)
+        p95_latency = self.metrics.merged_histogram("request_duration_seconds", self.window_seconds).quantile(0.95)
         current_metrics["p95_latency"] = p95_latency
 
         # Calculate cache hit rate
@@ -267,7 +336,9 @@ class SLOMonitor:
         current_metrics["cache_hit_rate"] = cache_hit_rate
 
         # Calculate vector search latency
-        vector_search_latency = self.metrics.get_histogram_quantile("vector_search_duration_seconds", 0.95)
+        vector_search_latency = self.metrics.merged_histogram(
+            "vector_search_duration_seconds", self.window_seconds
+        ).quantile(0.95)
         current_metrics["vector_search_latency"] = vector_search_latency
 
         # Evaluate SLOs
@@ -284,7 +355,7 @@ class SLOMonitor:
         return {
             "counters": dict(self.metrics.counters),
             "gauges": dict(self.metrics.gauges),
-            "histogram_counts": {k: len(v) for k, v in self.metrics.histograms.items()},
+            "histogram_counts": {k: v.count for k, v in self.metrics.histograms.items()},
             "slo_evaluation": self.evaluate_slos(),
         }
 
@@ -604,6 +675,41 @@ if PROMETHEUS_AVAILABLE:
         "Langfuse span operations",
         ["tenant", "workspace", "status"],
     )
+    TELEMETRY_EXPORT_DROPPED = _get_or_create_counter(
+        "telemetry_export_dropped_total",
+        "Telemetry items dropped by background exporters",
+        ["exporter", "reason"],
+    )
+    TELEMETRY_EXPORT_QUEUE_DEPTH = _get_or_create_gauge(
+        "telemetry_export_queue_depth",
+        "Items waiting in background exporter queues",
+        ["exporter"],
+    )
+    AUTOINTEL_COALESCE_REQUESTS = _get_or_create_counter(
+        "autointel_coalesce_requests_total",
+        "Autointel requests by coalescing outcome (leader, joined, cached)",
+        ["outcome"],
+    )
+    AUTOINTEL_RUNS_SAVED = _get_or_create_counter(
+        "autointel_pipeline_runs_saved_total",
+        "Autointel pipeline runs avoided by joining in-flight runs or cache hits",
+        [],
+    )
+    HTTP_REVALIDATION_REQUESTS = _get_or_create_counter(
+        "http_revalidation_requests_total",
+        "Revalidating HTTP cache lookups by outcome (fresh, stale, not_modified, modified, miss, collapsed)",
+        ["outcome"],
+    )
+    HTTP_CACHE_REQUESTS_SAVED = _get_or_create_counter(
+        "http_cache_requests_saved_total",
+        "Upstream HTTP requests avoided by fresh hits and collapsed concurrent fetches",
+        [],
+    )
+    HTTP_CACHE_BYTES_SAVED = _get_or_create_counter(
+        "http_cache_bytes_saved_total",
+        "Response body bytes not downloaded thanks to cache hits and 304 revalidations",
+        [],
+    )
 
     def get_metrics_data() -> bytes:
         """Returns the latest metrics data in Prometheus text format."""
@@ -655,6 +761,13 @@ else:
     RL_FEEDBACK_PROCESSING_LATENCY = PrometheusHistogram()
     LANGFUSE_TRACES = Counter()
     LANGFUSE_SPANS = Counter()
+    TELEMETRY_EXPORT_DROPPED = Counter()
+    TELEMETRY_EXPORT_QUEUE_DEPTH = Gauge()
+    AUTOINTEL_COALESCE_REQUESTS = Counter()
+    AUTOINTEL_RUNS_SAVED = Counter()
+    HTTP_REVALIDATION_REQUESTS = Counter()
+    HTTP_CACHE_REQUESTS_SAVED = Counter()
+    HTTP_CACHE_BYTES_SAVED = Counter()
 
     def get_metrics_data() -> bytes:
         """Returns empty metrics data when Prometheus is not available."""
@@ -662,6 +775,8 @@ else:
 
 
 __all__ = [
+    "AUTOINTEL_COALESCE_REQUESTS",
+    "AUTOINTEL_RUNS_SAVED",
     "CACHE_HIT_COUNT",
     "CACHE_MISS_COUNT",
     "CONTENT_ANALYSIS_COUNT",
@@ -676,6 +791,9 @@ __all__ = [
     "DISCORD_MESSAGE_ERROR_COUNT",
     "DISCORD_MESSAGE_LATENCY",
     "ERROR_COUNT",
+    "HTTP_CACHE_BYTES_SAVED",
+    "HTTP_CACHE_REQUESTS_SAVED",
+    "HTTP_REVALIDATION_REQUESTS",
     "IN_PROGRESS_REQUESTS",
     "LANGFUSE_SPANS",
     "LANGFUSE_TRACES",
@@ -701,6 +819,8 @@ __all__ = [
     "RL_FEEDBACK_PROCESSING_LATENCY",
     "RL_FEEDBACK_QUEUE_DEPTH",
     "ROUTER_DECISIONS",
+    "TELEMETRY_EXPORT_DROPPED",
+    "TELEMETRY_EXPORT_QUEUE_DEPTH",
     "TRAJECTORY_EVALUATIONS",
     "TRAJECTORY_FEEDBACK_EMISSIONS",
     "TRAJECTORY_FEEDBACK_PROCESSED",
@@ -0,0 +1,223 @@
+"""Budgeted sanitization of trace payloads.
+
+Pipeline spans carry whole transcripts, segment lists and analysis blobs.
+Exporting them verbatim made tracing cost grow with video length, so payloads
+are reduced to JSON-safe builtins under a :class:`PayloadBudget`:
+
+- strings longer than ``max_string_bytes`` keep their head plus a marker;
+- mappings/sequences keep ``max_items`` entries plus a count of the rest;
+- nesting deeper than ``max_depth`` is replaced by a short summary;
+- once ``max_total_bytes`` of output is reached, remaining values are omitted.
+
+Work is bounded by the budget rather than the input size. A
+:class:`PayloadSanitizer` lives for one pipeline run and memoizes results,
+truncated strings and its own outputs by identity, so the same stage result
+reported by several spans (and handed on to the exporter) is sanitized once.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+
+OMITTED = "[omitted: payload budget exhausted]"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, ""))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class PayloadBudget:
+    """Size limits applied to one exported payload."""
+
+    max_string_bytes: int = 4096
+    max_items: int = 100
+    max_depth: int = 8
+    max_total_bytes: int = 128 * 1024
+
+    @classmethod
+    def from_env(cls) -> PayloadBudget:
+        """Build a budget from ``TRACE_PAYLOAD_*`` environment variables."""
+        return cls(
+            max_string_bytes=_env_int("TRACE_PAYLOAD_MAX_STRING_BYTES", cls.max_string_bytes),
+            max_items=_env_int("TRACE_PAYLOAD_MAX_ITEMS", cls.max_items),
+            max_depth=_env_int("TRACE_PAYLOAD_MAX_DEPTH", cls.max_depth),
+            max_total_bytes=_env_int("TRACE_PAYLOAD_MAX_BYTES", cls.max_total_bytes),
+        )
+
+
+def _utf8_size(text: str) -> int:
+    # ``isascii`` is O(1) on CPython; only non-ASCII strings need encoding.
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def result_items(value: Any) -> Iterable[tuple[Any, Any]] | None:
+    """Return the ``to_dict()`` pairs of a StepResult-like object, else ``None``.
+
+    Both StepResult implementations expose ``to_dict_items()``, which streams
+    the pairs without copying ``data``; other mappings with ``to_dict()`` are
+    accepted too.
+    """
+    items = getattr(value, "to_dict_items", None)
+    if callable(items):
+        return items()
+    to_dict = getattr(value, "to_dict", None)
+    if callable(to_dict) and isinstance(value, Mapping):
+        return to_dict().items()
+    return None
+
+
+def _truncate(text: str, size: int, limit: int) -> str:
+    if text.isascii():
+        head = text[:limit]
+    else:
+        head = text.encode("utf-8")[:limit].decode("utf-8", errors="ignore")
+    return f"{head}...[truncated {size - limit} bytes]"
+
+
+@dataclass
+class PayloadSanitizer:
+    """Per-run sanitizer enforcing a :class:`PayloadBudget` on each payload.
+
+    Memoized values are assumed immutable for the rest of the run: strings
+    always are, and step results are not modified once reported. Plain dicts
+    and lists are re-walked on every call because callers reuse and mutate
+    them between spans.
+    """
+
+    budget: PayloadBudget = field(default_factory=PayloadBudget)
+    truncated_strings: int = 0
+    truncated_collections: int = 0
+    omitted_values: int = 0
+    memo_hits: int = 0
+    _memo: dict[tuple[int, int], tuple[Any, Any, int]] = field(default_factory=dict, init=False, repr=False)
+    _outputs: dict[int, Any] = field(default_factory=dict, init=False, repr=False)
+    _remaining: int = field(default=0, init=False, repr=False)
+
+    def prepare(self, value: Any) -> Any:
+        """Return a JSON-safe, budget-limited copy of ``value``.
+
+        Passing a value this sanitizer already returned is free, so payloads
+        can be handed from the pipeline to the exporter without re-walking.
+        """
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        if self._outputs.get(id(value)) is value:
+            self.memo_hits += 1
+            return value
+        self._remaining = self.budget.max_total_bytes
+        output = self._convert(value, 0)
+        if isinstance(output, (dict, list)):
+            self._outputs[id(output)] = output
+        return output
+
+    def clear(self) -> None:
+        """Drop memoized values (and the references they hold)."""
+        self._memo.clear()
+        self._outputs.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "truncated_strings": self.truncated_strings,
+            "truncated_collections": self.truncated_collections,
+            "omitted_values": self.omitted_values,
+            "memo_hits": self.memo_hits,
+            "memo_size": len(self._memo),
+        }
+
+    def _charge(self, cost: int) -> bool:
+        if self._remaining <= 0:
+            self.omitted_values += 1
+            return False
+        self._remaining -= cost
+        return True
+
+    def _convert(self, value: Any, depth: int) -> Any:
+        if value is None or isinstance(value, (bool, int, float)):
+            return value if self._charge(8) else OMITTED
+        if isinstance(value, str):
+            return self._convert_str(value)
+        if isinstance(value, dict):
+            return self._convert_mapping(value.items(), len(value), depth)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return self._convert_sequence(value, depth)
+
+        key = (id(value), depth)
+        cached = self._memo.get(key)
+        if cached is not None and cached[0] is value and cached[2] <= self._remaining:
+            self.memo_hits += 1
+            self._remaining -= cached[2]
+            return cached[1]
+        items = result_items(value)
+        if items is None:
+            return self._convert_str(str(value))
+        before = self._remaining
+        pairs = dict(items)
+        output = self._convert_mapping(pairs.items(), len(pairs), depth)
+        self._memo[key] = (value, output, before - self._remaining)
+        return output
+
+    def _convert_str(self, text: str) -> str:
+        limit = self.budget.max_string_bytes
+        if len(text) * 4 <= limit:
+            return text if self._charge(len(text)) else OMITTED
+        key = (id(text), -1)
+        cached = self._memo.get(key)
+        if cached is not None and cached[0] is text:
+            self.memo_hits += 1
+            return cached[1] if self._charge(cached[2]) else OMITTED
+        size = _utf8_size(text)
+        output = text
+        if size > limit:
+            output = _truncate(text, size, limit)
+            self.truncated_strings += 1
+            cost = limit
+            self._memo[key] = (text, output, cost)
+        else:
+            cost = size
+        return output if self._charge(cost) else OMITTED
+
+    def _convert_mapping(self, items: Any, size: int, depth: int) -> Any:
+        if depth >= self.budget.max_depth:
+            self.truncated_collections += 1
+            return f"<mapping with {size} keys>"
+        out: dict[str, Any] = {}
+        for index, (key, item) in enumerate(items):
+            if index >= self.budget.max_items:
+                out["__truncated_keys__"] = size - index
+                self.truncated_collections += 1
+                break
+            if self._remaining <= 0:
+                out["__omitted_keys__"] = size - index
+                self.omitted_values += size - index
+                break
+            out[str(key)] = self._convert(item, depth + 1)
+        return out
+
+    def _convert_sequence(self, values: Any, depth: int) -> Any:
+        size = len(values)
+        if depth >= self.budget.max_depth:
+            self.truncated_collections += 1
+            return f"<sequence with {size} items>"
+        out: list[Any] = []
+        for index, item in enumerate(values):
+            if index >= self.budget.max_items:
+                out.append(f"...[{size - index} more items]")
+                self.truncated_collections += 1
+                break
+            if self._remaining <= 0:
+                out.append(f"...[{size - index} items omitted]")
+                self.omitted_values += size - index
+                break
+            out.append(self._convert(item, depth + 1))
+        return out
+
+
+__all__ = ["OMITTED", "PayloadBudget", "PayloadSanitizer", "result_items"]
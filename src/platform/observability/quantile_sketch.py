@@ -0,0 +1,277 @@
+"""Bounded-memory streaming quantile sketches for histogram metrics.
+
+:class:`QuantileSketch` is a DDSketch-style sketch: values are counted in
+logarithmically sized buckets, so any quantile it reports is within
+``relative_accuracy`` of the true value (1% by default) no matter how many
+samples were added. Bucket count is capped at ``max_bins``; past that the
+lowest buckets are collapsed together, trading accuracy at the bottom of the
+distribution (never p50 and above in practice) for fixed memory. Sketches
+with the same accuracy merge exactly, which is how label sets and time
+slices are combined.
+
+:class:`WindowedQuantileSketch` adds time-windowed rotation: observations
+go to one of ``slices`` sub-sketches covering ``window_seconds`` between
+them, and slices that expire are folded into an all-time sketch. Quantiles
+over "the last N minutes" cost one merge of at most ``slices`` sketches.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+DEFAULT_WINDOW_SECONDS = 600.0
+DEFAULT_WINDOW_SLICES = 10
+_ceil = math.ceil
+_log = math.log
+# Values closer to zero than this are counted as zero.
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with a relative-error guarantee."""
+
+    __slots__ = (
+        "_collapse_floor",
+        "_gamma",
+        "_multiplier",
+        "_negative",
+        "_positive",
+        "count",
+        "max",
+        "max_bins",
+        "min",
+        "relative_accuracy",
+        "sum",
+        "zero_count",
+    )
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, max_bins: int = DEFAULT_MAX_BINS) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max(16, max_bins)
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self._gamma)
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        # Keys below the floor have been collapsed into it (per store).
+        self._collapse_floor = {"positive": -(2**62), "negative": -(2**62)}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+        if value < self.min:
+            self.min = value
+        if value > MIN_INDEXABLE_VALUE:
+            key = _ceil(_log(value) * self._multiplier)
+            bins = self._positive
+            try:
+                bins[key] += 1
+            except KeyError:
+                self._new_bin(bins, "positive", key, 1)
+        elif value < -MIN_INDEXABLE_VALUE:
+            key = _ceil(_log(-value) * self._multiplier)
+            bins = self._negative
+            try:
+                bins[key] += 1
+            except KeyError:
+                self._new_bin(bins, "negative", key, 1)
+        else:
+            self.zero_count += 1
+
+    def _new_bin(self, bins: dict[int, int], store: str, key: int, count: int) -> None:
+        floor = self._collapse_floor[store]
+        key = max(key, floor)
+        bins[key] = bins.get(key, 0) + count
+        if len(bins) > self.max_bins:
+            # Collapse the lowest quarter in one go so this stays amortised O(1).
+            keys = sorted(bins)
+            floor = keys[len(keys) - self.max_bins * 3 // 4]
+            collapsed = sum(bins.pop(k) for k in keys if k < floor)
+            bins[floor] += collapsed
+            self._collapse_floor[store] = floor
+
+    def _value(self, key: int) -> float:
+        # Midpoint of (gamma^(k-1), gamma^k] in the relative-error sense.
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> float:
+        """Value at quantile ``q`` (0-1); 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+        q = min(max(q, 0.0), 1.0)
+        rank = int(q * (self.count - 1))
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return max(-self._value(key), self.min)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return min(self._value(key), self.max)
+        return self.max
+
+    def quantiles(self, qs: Iterable[float]) -> dict[float, float]:
+        return {q: self.quantile(q) for q in qs}
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Add ``other``'s observations into this sketch and return it."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        stores = (("positive", self._positive, other._positive), ("negative", self._negative, other._negative))
+        for store, mine, theirs in stores:
+            self._collapse_floor[store] = max(self._collapse_floor[store], other._collapse_floor[store])
+            for key, count in theirs.items():
+                if key in mine:
+                    mine[key] += count
+                else:
+                    self._new_bin(mine, store, key, count)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def copy(self) -> QuantileSketch:
+        return QuantileSketch(self.relative_accuracy, self.max_bins).merge(self)
+
+    def clear(self) -> None:
+        self._positive.clear()
+        self._negative.clear()
+        self._collapse_floor = {"positive": -(2**62), "negative": -(2**62)}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def bin_count(self) -> int:
+        return len(self._positive) + len(self._negative)
+
+
+class WindowedQuantileSketch:
+    """Ring of time-slice sketches for recent-window and all-time quantiles.
+
+    Each observation touches only the current slice. Slices leaving the window
+    are folded into an all-time sketch before being reused, so all-time
+    quantiles stay exact to the sketch's accuracy at no per-sample cost.
+    """
+
+    __slots__ = (
+        "_clock",
+        "_current",
+        "_retired",
+        "_slice",
+        "_slice_end",
+        "_slice_seconds",
+        "_slices",
+        "window_seconds",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = DEFAULT_MAX_BINS,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        slices: int = DEFAULT_WINDOW_SLICES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window_seconds = window_seconds
+        self._retired = QuantileSketch(relative_accuracy, max_bins)
+        self._slices = [QuantileSketch(relative_accuracy, max_bins) for _ in range(max(1, slices))]
+        self._slice_seconds = window_seconds / len(self._slices)
+        self._clock = clock
+        self._slice = int(clock() // self._slice_seconds)
+        self._slice_end = (self._slice + 1) * self._slice_seconds
+        self._current = self._slices[self._slice % len(self._slices)]
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def count(self) -> int:
+        return self._retired.count + sum(sketch.count for sketch in self._slices)
+
+    @property
+    def sum(self) -> float:
+        return self._retired.sum + sum(sketch.sum for sketch in self._slices)
+
+    def add(self, value: float) -> None:
+        if self._clock() >= self._slice_end:
+            self._advance()
+        self._current.add(value)
+
+    def _advance(self) -> None:
+        """Retire the slices that fell out of the window since the last rotation."""
+        current = int(self._clock() // self._slice_seconds)
+        expired = min(current - self._slice, len(self._slices))
+        for offset in range(1, expired + 1):
+            sketch = self._slices[(self._slice + offset) % len(self._slices)]
+            if sketch.count:
+                self._retired.merge(sketch)
+                sketch.clear()
+        self._slice = current
+        self._slice_end = (current + 1) * self._slice_seconds
+        self._current = self._slices[current % len(self._slices)]
+
+    def window(self, window_seconds: float | None = None) -> QuantileSketch:
+        """Merged sketch of the most recent ``window_seconds`` (whole window by default)."""
+        if self._clock() >= self._slice_end:
+            self._advance()
+        seconds = self.window_seconds if window_seconds is None else min(window_seconds, self.window_seconds)
+        wanted = max(1, math.ceil(seconds / self._slice_seconds))
+        merged = QuantileSketch(self._retired.relative_accuracy, self._retired.max_bins)
+        for offset in range(wanted):
+            merged.merge(self._slices[(self._slice - offset) % len(self._slices)])
+        return merged
+
+    @property
+    def total(self) -> QuantileSketch:
+        """Merged sketch of every observation ever added."""
+        merged = self._retired.copy()
+        for sketch in self._slices:
+            merged.merge(sketch)
+        return merged
+
+    def quantile(self, q: float, window_seconds: float | None = None) -> float:
+        """Quantile over all time, or over the last ``window_seconds`` when given."""
+        sketch = self.total if window_seconds is None else self.window(window_seconds)
+        return sketch.quantile(q)
+
+    def clear(self) -> None:
+        self._retired.clear()
+        for sketch in self._slices:
+            sketch.clear()
+
+
+__all__ = [
+    "DEFAULT_RELATIVE_ACCURACY",
+    "DEFAULT_WINDOW_SECONDS",
+    "QuantileSketch",
+    "WindowedQuantileSketch",
+]
@@ -0,0 +1,246 @@
+"""Cold-start import profiling and import-time budgets.
+
+Each entry point is imported in a fresh interpreter started with
+``-X importtime``, so modules already loaded by the caller cannot hide their
+cost. The profiler parses CPython's report into a tree of
+:class:`ImportNode` and reports:
+
+- the wall time of the import itself, measured inside the child process,
+  and the time for the whole child process. The process time includes
+  interpreter startup and anything a ``.pth`` file imports first;
+- a tree of modules with self and cumulative microseconds, like
+  ``-X importtime`` but pruned to the expensive branches;
+- self time summed per subsystem (module name prefix), which shows which
+  package makes startup slow.
+
+:data:`STARTUP_BUDGETS` holds the import-time targets for the server and the
+bot entry point. ``tests/unit/observability/test_startup_budget.py`` enforces
+them.
+
+Usage:
+    PYTHONPATH=src python -m platform.observability.startup_profiler server.app --tree --min-ms 20
+    PYTHONPATH=src python -m platform.observability.startup_profiler --budget
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+SRC_DIR = Path(__file__).resolve().parents[2]
+
+# Cold-start budgets (seconds of child process time, interpreter startup
+# included). Set STARTUP_IMPORT_BUDGET_SECONDS to override all of them, e.g.
+# on slow CI runners.
+STARTUP_BUDGETS: dict[str, float] = {
+    "server.app": 3.0,
+    "ultimate_discord_intelligence_bot.main": 2.0,
+}
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S.*)$")
+
+_CHILD_CODE = (
+    "import importlib, sys, time\n"
+    "started = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "sys.stdout.write(repr(time.perf_counter() - started))\n"
+)
+
+
+@dataclass
+class ImportNode:
+    """One module from an ``-X importtime`` report."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    children: list[ImportNode] = field(default_factory=list)
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "module": self.module,
+            "self_us": self.self_us,
+            "cumulative_us": self.cumulative_us,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+@dataclass
+class StartupProfile:
+    """Result of importing ``module`` in a fresh interpreter."""
+
+    module: str
+    wall_seconds: float
+    process_seconds: float
+    roots: list[ImportNode]
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def modules_imported(self) -> int:
+        return sum(1 for root in self.roots for _ in root.walk())
+
+    def by_subsystem(self, depth: int = 2) -> dict[str, float]:
+        """Self time in seconds summed per module prefix of ``depth`` components, slowest first."""
+        totals: dict[str, int] = defaultdict(int)
+        for root in self.roots:
+            for node in root.walk():
+                totals[".".join(node.module.split(".")[:depth])] += node.self_us
+        ordered = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        return {name: us / 1e6 for name, us in ordered}
+
+    def to_dict(self, subsystem_depth: int = 2) -> dict[str, Any]:
+        return {
+            "module": self.module,
+            "wall_seconds": self.wall_seconds,
+            "process_seconds": self.process_seconds,
+            "modules_imported": self.modules_imported,
+            "error": self.error,
+            "subsystems": self.by_subsystem(subsystem_depth),
+        }
+
+
+def parse_importtime(report: str) -> list[ImportNode]:
+    """Build the import tree from ``-X importtime`` stderr.
+
+    CPython prints a module after all of its imports, indented two spaces per
+    nesting level, so nodes seen at ``depth + 1`` become children of the next
+    node printed at ``depth``.
+    """
+    pending: dict[int, list[ImportNode]] = defaultdict(list)
+    for line in report.splitlines():
+        match = _LINE_RE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        depth = max(0, (len(indent) - 1) // 2)
+        node = ImportNode(module.strip(), int(self_us), int(cumulative_us), depth)
+        node.children = pending.pop(depth + 1, [])
+        pending[depth].append(node)
+    return pending.get(0, [])
+
+
+def profile_imports(module: str, *, python: str | None = None, importtime: bool = True) -> StartupProfile:
+    """Import ``module`` in a fresh interpreter and return its profile.
+
+    With ``importtime=False`` only the wall time is measured, which avoids the
+    overhead of CPython's per-module reporting when checking budgets.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(SRC_DIR), env.get("PYTHONPATH", "")) if p)
+    cmd = [python or sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _CHILD_CODE, module]
+    started = time.perf_counter()
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=env, check=False)  # noqa: S603
+    process_seconds = time.perf_counter() - started
+    roots = parse_importtime(proc.stderr) if importtime else []
+    if proc.returncode != 0:
+        tail = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        error = tail[-1] if tail else f"exit code {proc.returncode}"
+        return StartupProfile(module, 0.0, process_seconds, roots, error=error)
+    return StartupProfile(module, float(proc.stdout.strip() or 0.0), process_seconds, roots)
+
+
+def budget_for(module: str) -> float | None:
+    override = os.getenv("STARTUP_IMPORT_BUDGET_SECONDS")
+    if override:
+        return float(override)
+    return STARTUP_BUDGETS.get(module)
+
+
+def render_tree(roots: list[ImportNode], *, min_ms: float = 10.0, max_depth: int = 8) -> str:
+    """Render modules whose cumulative time is at least ``min_ms``."""
+    lines: list[str] = []
+
+    def visit(node: ImportNode, level: int) -> None:
+        if node.cumulative_us < min_ms * 1000 or level > max_depth:
+            return
+        lines.append(
+            f"{node.cumulative_us / 1000:9.1f} ms {node.self_us / 1000:8.1f} ms  {'  ' * level}{node.module}"
+        )
+        for child in sorted(node.children, key=lambda c: c.cumulative_us, reverse=True):
+            visit(child, level + 1)
+
+    for root in sorted(roots, key=lambda r: r.cumulative_us, reverse=True):
+        visit(root, 0)
+    header = f"{'cumul':>12} {'self':>11}  module"
+    return "\n".join([header, *lines])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Profile cold-start imports of entry points.")
+    parser.add_argument("modules", nargs="*", help="modules to import (default: budgeted entry points)")
+    parser.add_argument("--tree", action="store_true", help="print the import tree")
+    parser.add_argument("--min-ms", type=float, default=10.0, help="hide tree branches cheaper than this")
+    parser.add_argument("--top", type=int, default=15, help="subsystems to list")
+    parser.add_argument("--group-depth", type=int, default=2, help="module name components per subsystem")
+    parser.add_argument("--budget", action="store_true", help="exit 1 if a module exceeds its budget")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or list(STARTUP_BUDGETS)
+    profiles = [profile_imports(module) for module in modules]
+    over_budget: list[str] = []
+    for profile in profiles:
+        budget = budget_for(profile.module)
+        if args.budget and budget is not None and (not profile.ok or profile.process_seconds > budget):
+            over_budget.append(profile.module)
+
+    if args.json:
+        print(json.dumps([p.to_dict(args.group_depth) for p in profiles], indent=2))
+    else:
+        for profile in profiles:
+            budget = budget_for(profile.module)
+            budget_note = f" (budget {budget:.2f} s)" if budget is not None else ""
+            if not profile.ok:
+                print(f"{profile.module}: import failed: {profile.error}")
+                continue
+            print(
+                f"{profile.module}: import {profile.wall_seconds:.3f} s, process {profile.process_seconds:.3f} s"
+                f"{budget_note}, {profile.modules_imported} modules"
+            )
+            for name, seconds in list(profile.by_subsystem(args.group_depth).items())[: args.top]:
+                print(f"  {seconds * 1000:9.1f} ms  {name}")
+            if args.tree:
+                print(render_tree(profile.roots, min_ms=args.min_ms))
+            print()
+    if over_budget:
+        print(f"over import-time budget: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+
+
+__all__ = [
+    "STARTUP_BUDGETS",
+    "ImportNode",
+    "StartupProfile",
+    "budget_for",
+    "parse_importtime",
+    "profile_imports",
+    "render_tree",
+]
@@ -1,6 +1,14 @@
 """Agent messaging infrastructure for collaborative intelligence."""
 
 from .redis_bus import AgentMessage, AgentMessageBus, MessagePriority, MessageType
+from .streams_bus import AgentStreamBus, create_agent_message_bus
 
 
-__all__ = ["AgentMessage", "AgentMessageBus", "MessagePriority", "MessageType"]
+__all__ = [
+    "AgentMessage",
+    "AgentMessageBus",
+    "AgentStreamBus",
+    "MessagePriority",
+    "MessageType",
+    "create_agent_message_bus",
+]
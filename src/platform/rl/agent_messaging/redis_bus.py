@@ -92,7 +92,9 @@ class AgentMessageBus:
     - Targeted messages (specific agent_id)
     - Broadcast messages (all agents in tenant)
     - Cross-tenant global broadcasts (for meta-learning)
-    - Message TTL and persistence
+    - Message TTL and persistence (history lists capped at ``max_history``)
+
+    Delivery is at-most-once; see ``AgentStreamBus`` for the Redis Streams transport.
     """
 
     def __init__(
@@ -101,6 +103,7 @@ class AgentMessageBus:
         redis_url: str | None = None,
         redis_db: int = 2,
         message_ttl: int = 3600,
+        max_history: int = 1000,
         enable_global_broadcast: bool = True,
     ):
         """Initialize Redis message bus.
@@ -109,6 +112,7 @@ class AgentMessageBus:
             redis_url: Redis connection URL (e.g., redis://localhost:6379).
             redis_db: Redis database index for agent messages (default: 2).
             message_ttl: Message time-to-live in seconds (default: 3600 = 1 hour).
+            max_history: Messages kept per history list (default: 1000).
             enable_global_broadcast: Allow cross-tenant global broadcasts.
         """
         from platform.config.configuration import get_config
@@ -117,6 +121,7 @@ class AgentMessageBus:
         self.redis_url = redis_url or getattr(config, "agent_bus_redis_url", "redis://redis:6379")
         self.redis_db = redis_db
         self.message_ttl = message_ttl
+        self.max_history = max_history
         self.enable_global_broadcast = enable_global_broadcast
         self._redis_client: Any = None
         self._pubsub: Any = None
@@ -182,13 +187,15 @@ class AgentMessageBus:
             else:
                 channel = self._get_channel_name(tenant_id, None)
             message_json = json.dumps(message.to_dict())
-            await self._redis_client.publish(channel, message_json)
             list_key = f"{channel}:history"
-            await self._redis_client.lpush(list_key, message_json)
-            await self._redis_client.expire(list_key, self.message_ttl)
+            pipeline = self._redis_client.pipeline(transaction=False)
+            pipeline.publish(channel, message_json)
+            pipeline.lpush(list_key, message_json)
+            pipeline.ltrim(list_key, 0, self.max_history - 1)
+            pipeline.expire(list_key, self.message_ttl)
             if self.enable_global_broadcast and message.priority == MessagePriority.URGENT:
-                global_channel = "agent_messages:__global__:broadcast"
-                await self._redis_client.publish(global_channel, message_json)
+                pipeline.publish("agent_messages:__global__:broadcast", message_json)
+            await pipeline.execute()
             self._metrics.counter(
                 "agent_messages_published_total",
                 labels={
@@ -0,0 +1,465 @@
+"""Redis Streams transport for the agent message bus.
+
+Drop-in alternative to :class:`~platform.rl.agent_messaging.redis_bus.AgentMessageBus`
+with at-least-once delivery:
+
+- Messages are appended with ``XADD ... MAXLEN ~`` so every stream is
+  trimmed as it grows; a publish (or a batch via :meth:`publish_many`) is a
+  single pipelined round trip.
+- Each agent has one consumer group, named ``<tenant>:<agent>``, on its
+  inbox stream and on the broadcast streams, so several instances of the
+  same agent share the load and every agent still sees every broadcast
+  once. The tenant prefix keeps agents with the same id in different
+  tenants apart on the shared global broadcast stream.
+- Consumers read in batches with ``XREADGROUP``, acknowledge a message once
+  all callbacks succeeded, and periodically claim messages another consumer
+  left pending for longer than ``claim_idle_ms``. Messages delivered more
+  than ``max_deliveries`` times move to a ``:dead`` stream.
+- Publishing applies backpressure: while a consumer group is more than
+  ``max_lag`` messages behind, publishers wait (up to
+  ``backpressure_timeout``) and then reject the message instead of letting
+  ``MAXLEN`` trim unread entries. Groups outlive their consumers, so an
+  agent that is retired for good must be removed with
+  :meth:`AgentStreamBus.delete_consumer_groups`; otherwise its growing lag
+  eventually blocks publishers on every stream it read, including the
+  global broadcast stream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import socket
+import time
+from platform.rl.agent_messaging.redis_bus import AgentMessage, AgentMessageBus, MessagePriority
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from ultimate_discord_intelligence_bot.obs.metrics import get_metrics
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterable
+
+logger = logging.getLogger(__name__)
+GLOBAL_TENANT = "__global__"
+DEFAULT_MAX_STREAM_LENGTH = 10_000
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_BLOCK_MS = 1_000
+DEFAULT_CLAIM_IDLE_MS = 30_000
+DEFAULT_MAX_DELIVERIES = 5
+DEFAULT_MAX_LAG = 5_000
+DEFAULT_BACKPRESSURE_TIMEOUT = 5.0
+LAG_CHECK_INTERVAL = 0.5
+
+
+class AgentStreamBus:
+    """Redis Streams message bus for agent collaboration."""
+
+    def __init__(
+        self,
+        *,
+        redis_url: str | None = None,
+        redis_db: int = 2,
+        client: Any | None = None,
+        max_stream_length: int = DEFAULT_MAX_STREAM_LENGTH,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        block_ms: int = DEFAULT_BLOCK_MS,
+        claim_idle_ms: int = DEFAULT_CLAIM_IDLE_MS,
+        max_deliveries: int = DEFAULT_MAX_DELIVERIES,
+        max_lag: int = DEFAULT_MAX_LAG,
+        backpressure_timeout: float = DEFAULT_BACKPRESSURE_TIMEOUT,
+        enable_global_broadcast: bool = True,
+        consumer_name: str | None = None,
+    ):
+        """Initialize the Streams message bus.
+
+        Args:
+            redis_url: Redis connection URL (e.g., redis://localhost:6379).
+            redis_db: Redis database index for agent messages (default: 2).
+            client: Pre-built ``redis.asyncio`` client (takes precedence over redis_url).
+            max_stream_length: Approximate ``MAXLEN`` each stream is trimmed to.
+            batch_size: Entries per ``XREADGROUP`` / claim call.
+            block_ms: How long a read blocks waiting for new entries.
+            claim_idle_ms: Pending time after which another consumer may claim an entry.
+            max_deliveries: Deliveries before an entry is dead-lettered.
+            max_lag: Unconsumed entries per group above which publishers are held back.
+            backpressure_timeout: Seconds a publisher waits for consumers to catch up.
+            enable_global_broadcast: Allow cross-tenant global broadcasts.
+            consumer_name: Name of this process within consumer groups.
+        """
+        if client is None:
+            from platform.config.configuration import get_config
+
+            config = get_config()
+            redis_url = redis_url or getattr(config, "agent_bus_redis_url", "redis://redis:6379")
+        self.redis_url = redis_url
+        self.redis_db = redis_db
+        self.max_stream_length = max_stream_length
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.max_deliveries = max_deliveries
+        self.max_lag = max_lag
+        self.backpressure_timeout = backpressure_timeout
+        self.enable_global_broadcast = enable_global_broadcast
+        self.consumer_name = consumer_name or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:6]}"
+        self._redis_client: Any = client
+        self._subscribers: dict[tuple[str, str], list[Callable[[AgentMessage], Coroutine[Any, Any, None]]]] = {}
+        self._consumer_tasks: dict[tuple[str, str], asyncio.Task[None]] = {}
+        self._lag_cache: dict[str, tuple[float, int]] = {}
+        self._metrics = get_metrics()
+
+    async def connect(self) -> None:
+        """Initialize Redis connection."""
+        if self._redis_client is not None:
+            return
+        try:
+            import redis.asyncio as redis
+
+            self._redis_client = redis.from_url(self.redis_url, db=self.redis_db, decode_responses=True)
+            await self._redis_client.ping()
+            logger.info(f"Connected to Redis stream bus at {self.redis_url} (DB {self.redis_db})")
+        except Exception as e:
+            logger.error(f"Failed to connect to Redis stream bus: {e}")
+            raise
+
+    async def disconnect(self) -> None:
+        """Stop consumers and close the Redis connection."""
+        tasks = list(self._consumer_tasks.values())
+        self._consumer_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self._redis_client is not None:
+            await self._redis_client.aclose()
+            self._redis_client = None
+        logger.info("Disconnected from Redis stream bus")
+
+    def _get_stream_name(self, tenant_id: str, agent_id: str | None = None) -> str:
+        """Stream key for an agent inbox or a tenant's broadcast stream."""
+        return f"agent_stream:{tenant_id}:{agent_id or 'broadcast'}"
+
+    @staticmethod
+    def _group_name(tenant_id: str, agent_id: str) -> str:
+        """Consumer group of an agent on every stream it reads."""
+        return f"{tenant_id}:{agent_id}"
+
+    def _subscribed_streams(self, agent_id: str, tenant_id: str, subscribe_to_broadcast: bool) -> dict[str, str]:
+        """Streams an agent reads, mapped to the id its group starts from."""
+        # The inbox is read from its start so messages sent before the agent came up are delivered;
+        # broadcast streams only from now on.
+        streams = {self._get_stream_name(tenant_id, agent_id): "0"}
+        if subscribe_to_broadcast:
+            streams[self._get_stream_name(tenant_id)] = "$"
+        if self.enable_global_broadcast:
+            streams[self._get_stream_name(GLOBAL_TENANT)] = "$"
+        return streams
+
+    def _streams_for(self, message: AgentMessage, tenant_id: str) -> list[str]:
+        streams = [self._get_stream_name(tenant_id, message.target_agent_id)]
+        if self.enable_global_broadcast and message.priority == MessagePriority.URGENT:
+            streams.append(self._get_stream_name(GLOBAL_TENANT))
+        return streams
+
+    async def publish(self, message: AgentMessage, *, tenant_id: str = "default") -> bool:
+        """Publish a message to the bus.
+
+        Args:
+            message: AgentMessage to publish.
+            tenant_id: Tenant context for the message.
+
+        Returns:
+            True if message was published successfully.
+        """
+        return await self.publish_many([message], tenant_id=tenant_id) == 1
+
+    async def publish_many(self, messages: Iterable[AgentMessage], *, tenant_id: str = "default") -> int:
+        """Publish several messages in one pipelined round trip.
+
+        Returns:
+            Number of messages published (0 when rejected by backpressure or on error).
+        """
+        if self._redis_client is None:
+            logger.warning("Redis client not connected - message not published")
+            return 0
+        batch = [(message, self._streams_for(message, tenant_id)) for message in messages]
+        if not batch:
+            return 0
+        streams = {stream for _, targets in batch for stream in targets}
+        try:
+            if not await self._admit(streams):
+                logger.warning(f"Consumers lagging on {sorted(streams)}; rejected {len(batch)} messages")
+                self._metrics.counter("agent_messages_backpressure_total", labels={"transport": "streams"}).inc(
+                    len(batch)
+                )
+                return 0
+            pipeline = self._redis_client.pipeline(transaction=False)
+            for message, targets in batch:
+                fields = {"data": json.dumps(message.to_dict())}
+                for stream in targets:
+                    pipeline.xadd(stream, fields, maxlen=self.max_stream_length, approximate=True)
+            await pipeline.execute()
+        except Exception as e:
+            logger.exception(f"Failed to publish {len(batch)} messages: {e}")
+            self._metrics.counter("agent_messages_errors_total", labels={"operation": "publish"}).inc()
+            return 0
+        for message, _ in batch:
+            self._metrics.counter(
+                "agent_messages_published_total",
+                labels={
+                    "type": message.type.value,
+                    "priority": message.priority.value,
+                    "targeted": str(message.target_agent_id is not None).lower(),
+                },
+            ).inc()
+        return len(batch)
+
+    async def stream_lag(self, stream: str) -> int:
+        """Entries the slowest consumer group on ``stream`` has not processed yet."""
+        try:
+            groups = await self._redis_client.xinfo_groups(stream)
+        except Exception:
+            return 0  # stream does not exist yet
+        return max(((group.get("lag") or 0) + (group.get("pending") or 0) for group in groups), default=0)
+
+    async def _admit(self, streams: set[str]) -> bool:
+        """Wait until every stream's consumers are within ``max_lag``; False on timeout."""
+        deadline = time.monotonic() + self.backpressure_timeout
+        delay = 0.01
+        for stream in streams:
+            while True:
+                now = time.monotonic()
+                checked_at, lag = self._lag_cache.get(stream, (0.0, 0))
+                if now - checked_at >= LAG_CHECK_INTERVAL:
+                    lag = await self.stream_lag(stream)
+                    self._lag_cache[stream] = (now, lag)
+                if lag <= self.max_lag:
+                    break
+                if now >= deadline:
+                    return False
+                await asyncio.sleep(min(delay, max(0.0, deadline - now)))
+                delay = min(delay * 2, LAG_CHECK_INTERVAL)
+                self._lag_cache.pop(stream, None)
+        return True
+
+    async def subscribe(
+        self,
+        agent_id: str,
+        callback: Callable[[AgentMessage], Coroutine[Any, Any, None]],
+        *,
+        tenant_id: str = "default",
+        subscribe_to_broadcast: bool = True,
+    ) -> None:
+        """Subscribe an agent to receive messages.
+
+        ``tenant_id`` and ``agent_id`` name the consumer group, so instances
+        subscribing with the same pair split the agent's messages between
+        them.
+
+        Args:
+            agent_id: Agent identifier to subscribe.
+            callback: Async callback function to handle received messages.
+            tenant_id: Tenant context.
+            subscribe_to_broadcast: Also subscribe to broadcast channel.
+        """
+        if self._redis_client is None:
+            raise RuntimeError("Redis client not connected - call connect() first")
+        group = self._group_name(tenant_id, agent_id)
+        streams = self._subscribed_streams(agent_id, tenant_id, subscribe_to_broadcast)
+        for stream, start_id in streams.items():
+            try:
+                await self._redis_client.xgroup_create(stream, group, id=start_id, mkstream=True)
+            except Exception as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+        key = (tenant_id, agent_id)
+        self._subscribers.setdefault(key, []).append(callback)
+        task = self._consumer_tasks.get(key)
+        if task is None or task.done():
+            self._consumer_tasks[key] = asyncio.create_task(self._consume(key, list(streams)))
+        logger.info(f"Agent {agent_id} consuming {sorted(streams)} as {self.consumer_name}")
+
+    async def unsubscribe(self, agent_id: str, *, tenant_id: str = "default") -> None:
+        """Stop consuming for an agent (its group and pending entries stay for other instances).
+
+        Use :meth:`delete_consumer_groups` when no instance will come back.
+
+        Args:
+            agent_id: Agent identifier to unsubscribe.
+            tenant_id: Tenant context.
+        """
+        key = (tenant_id, agent_id)
+        self._subscribers.pop(key, None)
+        task = self._consumer_tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        logger.info(f"Agent {agent_id} unsubscribed from tenant {tenant_id}")
+
+    async def delete_consumer_groups(self, agent_id: str, *, tenant_id: str = "default") -> int:
+        """Retire an agent: stop consuming and destroy its consumer groups.
+
+        Publishers wait on the slowest group of a stream, and a group with no
+        consumers left only falls further behind, so an abandoned group ends
+        up rejecting every publish to that stream. Entries still pending in
+        the destroyed groups are dropped.
+
+        Returns:
+            Number of groups destroyed.
+        """
+        if self._redis_client is None:
+            raise RuntimeError("Redis client not connected - call connect() first")
+        await self.unsubscribe(agent_id, tenant_id=tenant_id)
+        group = self._group_name(tenant_id, agent_id)
+        destroyed = 0
+        for stream in self._subscribed_streams(agent_id, tenant_id, subscribe_to_broadcast=True):
+            if await self._redis_client.exists(stream):
+                destroyed += int(await self._redis_client.xgroup_destroy(stream, group) or 0)
+            self._lag_cache.pop(stream, None)
+        logger.info(f"Deleted {destroyed} consumer groups of agent {agent_id} in tenant {tenant_id}")
+        return destroyed
+
+    async def _consume(self, key: tuple[str, str], streams: list[str]) -> None:
+        """Read, dispatch and acknowledge batches for one agent's consumer group."""
+        group = self._group_name(*key)
+        callbacks = self._subscribers.get(key, [])
+        next_claim = 0.0
+        # Also stop once deregistered: some clients swallow the cancellation of a blocking read.
+        while self._consumer_tasks.get(key) is asyncio.current_task():
+            try:
+                if time.monotonic() >= next_claim:
+                    for stream in streams:
+                        await self._claim_stale(stream, group, callbacks)
+                    next_claim = time.monotonic() + self.claim_idle_ms / 1000 / 2
+                response = await self._redis_client.xreadgroup(
+                    group,
+                    self.consumer_name,
+                    dict.fromkeys(streams, ">"),
+                    count=self.batch_size,
+                    block=self.block_ms,
+                )
+                if not response:
+                    await asyncio.sleep(0)  # clients that do not honour BLOCK would otherwise starve the loop
+                for stream, entries in response or []:
+                    await self._dispatch(stream, group, entries, callbacks)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Stream consumer for {group} failed: {e}")
+                self._metrics.counter("agent_messages_errors_total", labels={"operation": "receive"}).inc()
+                await asyncio.sleep(1.0)
+
+    async def _dispatch(
+        self,
+        stream: str,
+        group: str,
+        entries: list[tuple[str, dict[str, str]]],
+        callbacks: list[Callable[[AgentMessage], Coroutine[Any, Any, None]]],
+    ) -> int:
+        """Run callbacks for a batch and ack the entries every callback handled."""
+        acked: list[str] = []
+        calls: list[tuple[str, Coroutine[Any, Any, None]]] = []
+        for entry_id, fields in entries:
+            if fields is None:  # trimmed while pending
+                acked.append(entry_id)
+                continue
+            try:
+                message = AgentMessage.from_dict(json.loads(fields["data"]))
+            except Exception as e:
+                logger.warning(f"Dead-lettering malformed entry {entry_id} on {stream}: {e}")
+                await self._dead_letter(stream, group, entry_id, fields)
+                continue
+            if not callbacks:
+                acked.append(entry_id)
+            calls.extend((entry_id, callback(message)) for callback in callbacks)
+            self._metrics.counter("agent_messages_received_total", labels={"type": message.type.value}).inc()
+        failed: set[str] = set()
+        if calls:
+            results = await asyncio.gather(*(call for _, call in calls), return_exceptions=True)
+            for (entry_id, _), result in zip(calls, results, strict=True):
+                if isinstance(result, Exception):
+                    failed.add(entry_id)
+                    logger.warning(f"Agent message callback failed for {entry_id}: {result}")
+            acked.extend(dict.fromkeys(entry_id for entry_id, _ in calls if entry_id not in failed))
+        if acked:
+            await self._redis_client.xack(stream, group, *acked)
+        return len(acked)
+
+    async def _claim_stale(
+        self, stream: str, group: str, callbacks: list[Callable[[AgentMessage], Coroutine[Any, Any, None]]]
+    ) -> int:
+        """Take over entries pending too long elsewhere; dead-letter over-delivered ones."""
+        pending = await self._redis_client.xpending_range(
+            stream, group, min="-", max="+", count=self.batch_size, idle=self.claim_idle_ms
+        )
+        if not pending:
+            return 0
+        retry = [p["message_id"] for p in pending if p["times_delivered"] < self.max_deliveries]
+        for entry in pending:
+            if entry["times_delivered"] >= self.max_deliveries:
+                found = await self._redis_client.xrange(stream, min=entry["message_id"], max=entry["message_id"])
+                await self._dead_letter(stream, group, entry["message_id"], found[0][1] if found else {})
+        if not retry:
+            return 0
+        claimed = await self._redis_client.xclaim(
+            stream, group, self.consumer_name, min_idle_time=self.claim_idle_ms, message_ids=retry
+        )
+        self._metrics.counter("agent_messages_claimed_total").inc(len(claimed))
+        return await self._dispatch(stream, group, claimed, callbacks)
+
+    async def _dead_letter(self, stream: str, group: str, entry_id: str, fields: dict[str, str]) -> None:
+        pipeline = self._redis_client.pipeline(transaction=False)
+        pipeline.xadd(
+            f"{stream}:dead",
+            {**fields, "source_id": entry_id, "group": group},
+            maxlen=self.max_stream_length,
+            approximate=True,
+        )
+        pipeline.xack(stream, group, entry_id)
+        await pipeline.execute()
+        self._metrics.counter("agent_messages_dead_lettered_total").inc()
+
+    async def get_message_history(
+        self, agent_id: str | None = None, *, tenant_id: str = "default", limit: int = 100
+    ) -> list[AgentMessage]:
+        """Retrieve message history for an agent or broadcast.
+
+        Args:
+            agent_id: Agent ID to get history for (None = broadcast history).
+            tenant_id: Tenant context.
+            limit: Maximum number of messages to retrieve.
+
+        Returns:
+            List of AgentMessage objects (newest first).
+        """
+        if self._redis_client is None:
+            return []
+        try:
+            entries = await self._redis_client.xrevrange(self._get_stream_name(tenant_id, agent_id), count=limit)
+        except Exception as e:
+            logger.exception(f"Failed to retrieve message history: {e}")
+            return []
+        messages = []
+        for _, fields in entries:
+            try:
+                messages.append(AgentMessage.from_dict(json.loads(fields["data"])))
+            except Exception as e:
+                logger.warning(f"Failed to deserialize message: {e}")
+        return messages
+
+
+def create_agent_message_bus(**kwargs: Any) -> AgentMessageBus | AgentStreamBus:
+    """Bus for the configured transport (``AGENT_BUS_TRANSPORT=streams`` selects Streams)."""
+    if os.getenv("AGENT_BUS_TRANSPORT", "pubsub").lower() == "streams":
+        return AgentStreamBus(**kwargs)
+    return AgentMessageBus(**kwargs)
+
+
+__all__ = ["AgentStreamBus", "create_agent_message_bus"]
@@ -3,13 +3,34 @@
 Atomic refill+consume implemented via EVAL to avoid race conditions. Falls back
 to deny on script errors only for the current call (callers should also deploy
 local rate limiting as a safety belt when distributed mode is unavailable).
+
+Two flavours are provided:
+
+* :class:`RedisTokenBucket` - one script call per ``allow()``.
+* :class:`LeasedTokenBucket` - each process leases a batch of tokens from the
+  shared bucket in one script call and serves subsequent ``allow()`` calls
+  locally until the lease is spent or expires. Lease size adapts to the
+  observed per-key request rate. Unused tokens from an expired lease are
+  refunded in the same call that takes the next lease, so global limits stay
+  approximately correct while Redis traffic drops by roughly the lease size.
+
+:class:`HierarchicalRateLimiter` stacks leased buckets (e.g. one global bucket,
+then per tenant, then per tenant+route) and is what the ASGI middleware in
+``server.rate_limit`` uses.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 
+from .rate_limit import TokenBucket
+
 
 try:  # optional dependency
     import redis
@@ -22,13 +43,14 @@ _LUA_SCRIPT = """
 -- KEYS[1] = bucket key
 -- ARGV[1] = capacity
 -- ARGV[2] = refill_rate (tokens per second)
--- ARGV[3] = now (unix seconds as float)
+-- ARGV[3] = unused (kept for argument compatibility; server TIME is used)
 -- ARGV[4] = cost (tokens to consume)
 
 local bucket = KEYS[1]
 local capacity = tonumber(ARGV[1])
 local rate = tonumber(ARGV[2])
-local now = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
 local cost = tonumber(ARGV[4])
 
 local data = redis.call('HMGET', bucket, 'tokens', 'ts')
@@ -75,10 +97,301 @@ class RedisTokenBucket:
 
     def allow(self, key: str, *, tokens: int = 1) -> bool:
         try:
-            now = self._client.time()  # returns [seconds, microseconds]
-            now_sec = float(now[0]) + float(now[1]) / 1_000_000.0
-            res = self._script(keys=[f"rl:{key}"], args=[self.capacity, self.rate, now_sec, tokens])
+            # Server-side TIME inside the script keeps this to one round-trip.
+            res = self._script(keys=[f"rl:{key}"], args=[self.capacity, self.rate, 0, tokens])
             return bool(res and int(res[0]) == 1)
         except Exception:
             # Fail open: if backend is down, do not block
             return True
+
+
+_LEASE_LUA_SCRIPT = """
+-- Redis token bucket: refund an old lease, then grant a new one
+-- KEYS[1] = bucket key
+-- ARGV[1] = capacity
+-- ARGV[2] = refill_rate (tokens per second)
+-- ARGV[3] = requested lease size
+-- ARGV[4] = minimum acceptable grant (cost of the triggering request)
+-- ARGV[5] = refund (unused tokens from the caller's expired lease)
+
+local bucket = KEYS[1]
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local want = tonumber(ARGV[3])
+local need = tonumber(ARGV[4])
+local refund = tonumber(ARGV[5])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local data = redis.call('HMGET', bucket, 'tokens', 'ts')
+local tokens = tonumber(data[1])
+local ts = tonumber(data[2])
+if tokens == nil or ts == nil then
+  tokens = capacity
+  ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate + refund)
+
+local grant = math.min(want, math.floor(tokens))
+if grant < need then
+  grant = 0
+end
+tokens = tokens - grant
+
+redis.call('HMSET', bucket, 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', bucket, math.floor(10 + (capacity / math.max(rate, 0.0001))))
+return {grant, tostring(tokens)}
+"""
+
+
+@dataclass
+class _Lease:
+    tokens: float = 0.0
+    expires_at: float = 0.0
+    granted_at: float = 0.0
+    served: float = 0.0
+    observed_rate: float = 0.0
+
+
+@dataclass
+class LeasedTokenBucket:
+    """Token bucket that leases batches of tokens from Redis.
+
+    Parameters
+    ----------
+    rate / capacity:
+        Global refill rate (tokens/s) and bucket size shared by all processes.
+    url / client:
+        Redis URL, or an existing client (e.g. for tests).
+    lease_seconds:
+        How long a lease may be used locally before unused tokens are refunded.
+    min_lease / max_lease:
+        Bounds on lease size. ``max_lease`` defaults to the larger of a tenth
+        of capacity and half of one lease period's refill, so a saturated key
+        needs about two Redis calls per ``lease_seconds`` while a handful of
+        processes still cannot drain the shared bucket between them.
+    max_keys:
+        Number of per-key leases kept locally; the least recently used lease
+        is dropped beyond it, so attacker-chosen keys cannot grow memory
+        without bound. Tokens left in a dropped lease are not refunded and
+        come back through the bucket's normal refill.
+    fail_open:
+        When Redis is unreachable, allow (``True``) or fall back to a local
+        per-process :class:`TokenBucket` (``False``, the default).
+    """
+
+    rate: float
+    capacity: int
+    url: str | None = None
+    client: Any = None
+    lease_seconds: float = 1.0
+    min_lease: int = 1
+    max_lease: int | None = None
+    max_keys: int = 10_000
+    fail_open: bool = False
+    key_prefix: str = "rl:lease:"
+    _script: Any = field(default=None, init=False, repr=False)
+    _leases: OrderedDict[str, _Lease] = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _fallback: TokenBucket = field(init=False, repr=False)
+    _stats: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.client is None:
+            if redis is None:
+                raise RuntimeError("redis package is not installed")
+            if not self.url:
+                raise ValueError("either url or client is required")
+            self.client = redis.Redis.from_url(self.url, decode_responses=True)
+        self._script = self.client.register_script(_LEASE_LUA_SCRIPT)
+        if self.max_lease is None:
+            self.max_lease = max(self.min_lease, self.capacity // 10, math.ceil(self.rate * self.lease_seconds / 2))
+        self._fallback = TokenBucket(rate=self.rate, capacity=self.capacity)
+        self._stats = {"local_allowed": 0, "local_denied": 0, "lease_calls": 0, "backend_errors": 0}
+
+    def stats(self) -> dict[str, int]:
+        """Return counters for local decisions and Redis lease calls."""
+        with self._lock:
+            return dict(self._stats)
+
+    def try_local(self, key: str, tokens: float = 1.0) -> bool | None:
+        """Serve ``allow()`` from the local lease without touching Redis.
+
+        Returns ``True`` when the lease covers the request, ``False`` when the
+        bucket recently refused a lease (so the request is denied locally),
+        and ``None`` when a new lease must be fetched.
+        """
+        now = time.monotonic()
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease is None or now >= lease.expires_at:
+                return None
+            self._leases.move_to_end(key)
+            if lease.tokens >= tokens:
+                lease.tokens -= tokens
+                lease.served += tokens
+                self._stats["local_allowed"] += 1
+                return True
+            if lease.tokens == 0 and lease.served == 0:
+                # Negative lease: Redis had nothing for us until this expires.
+                self._stats["local_denied"] += 1
+                return False
+            return None
+
+    def allow(self, key: str, tokens: float = 1.0) -> bool:
+        """Return ``True`` if ``key`` may consume ``tokens`` now."""
+        if tokens <= 0:
+            raise ValueError("tokens must be positive")
+        local = self.try_local(key, tokens)
+        if local is not None:
+            return local
+        return self._acquire(key, tokens)
+
+    async def allow_async(self, key: str, tokens: float = 1.0) -> bool:
+        """Async variant that only leaves the event loop when Redis is needed."""
+        local = self.try_local(key, tokens)
+        if local is not None:
+            return local
+        return await asyncio.to_thread(self._acquire, key, tokens)
+
+    def _observed_rate(self, lease: _Lease | None, now: float) -> float:
+        """EWMA of the locally observed request rate across successive leases."""
+        if lease is None:
+            return 0.0
+        return 0.5 * lease.observed_rate + 0.5 * (lease.served / max(now - lease.granted_at, 1e-3))
+
+    def _acquire(self, key: str, tokens: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            lease = self._leases.pop(key, None)
+            refund = lease.tokens if lease is not None else 0.0
+            observed = self._observed_rate(lease, now)
+            wanted = math.ceil(observed * self.lease_seconds)
+            size = int(min(self.max_lease or self.capacity, max(self.min_lease, wanted, math.ceil(tokens))))
+            self._stats["lease_calls"] += 1
+        try:
+            res = self._script(
+                keys=[f"{self.key_prefix}{key}"],
+                args=[self.capacity, self.rate, size, math.ceil(tokens), refund],
+            )
+            granted = float(res[0]) if res else 0.0
+        except Exception:
+            with self._lock:
+                self._stats["backend_errors"] += 1
+            return True if self.fail_open else self._fallback.allow(key, tokens)
+
+        with self._lock:
+            new = _Lease(
+                tokens=max(0.0, granted - tokens) if granted else 0.0,
+                expires_at=now + self.lease_seconds,
+                granted_at=now,
+                served=tokens if granted else 0.0,
+                observed_rate=observed,
+            )
+            if not granted:
+                # Cache the refusal briefly so a hot key cannot hammer Redis.
+                new.expires_at = now + min(self.lease_seconds, tokens / max(self.rate, 1e-6))
+            self._leases[key] = new
+            while len(self._leases) > self.max_keys:
+                self._leases.popitem(last=False)
+            self._stats["local_allowed" if granted else "local_denied"] += 1
+        return bool(granted)
+
+    def release(self, key: str | None = None) -> None:
+        """Refund unused leased tokens to Redis (all keys when ``key`` is ``None``)."""
+        with self._lock:
+            keys = [key] if key is not None else list(self._leases)
+            refunds = {k: self._leases.pop(k).tokens for k in keys if k in self._leases}
+        for k, refund in refunds.items():
+            if refund <= 0:
+                continue
+            try:
+                self._script(keys=[f"{self.key_prefix}{k}"], args=[self.capacity, self.rate, 0, 0, refund])
+            except Exception:
+                with self._lock:
+                    self._stats["backend_errors"] += 1
+
+
+@dataclass(frozen=True)
+class RateLimitTier:
+    """One level of a :class:`HierarchicalRateLimiter`.
+
+    ``scope`` selects which request attributes form the bucket key:
+    ``"global"`` (one bucket for every request), ``"tenant"`` or ``"route"``
+    (tenant + route).
+    """
+
+    scope: str
+    rate: float
+    capacity: int
+
+
+class HierarchicalRateLimiter:
+    """Per-tenant and per-tenant/route leased token buckets.
+
+    A request must pass every tier, checked broadest first. Tokens taken
+    from a broader tier are not returned when a narrower tier denies, which
+    errs on the side of limiting.
+    """
+
+    def __init__(
+        self,
+        tiers: list[RateLimitTier],
+        *,
+        url: str | None = None,
+        client: Any = None,
+        lease_seconds: float = 1.0,
+        fail_open: bool = False,
+    ) -> None:
+        if client is None:
+            if redis is None:
+                raise RuntimeError("redis package is not installed")
+            if not url:
+                raise ValueError("either url or client is required")
+            client = redis.Redis.from_url(url, decode_responses=True)
+        self.tiers = tiers
+        self._buckets = [
+            LeasedTokenBucket(
+                rate=tier.rate,
+                capacity=tier.capacity,
+                client=client,
+                lease_seconds=lease_seconds,
+                fail_open=fail_open,
+                key_prefix=f"rl:lease:{tier.scope}:",
+            )
+            for tier in tiers
+        ]
+
+    @staticmethod
+    def _key(tier: RateLimitTier, tenant: str, route: str) -> str:
+        if tier.scope == "global":
+            return "*"
+        return tenant if tier.scope == "tenant" else f"{tenant}|{route}"
+
+    def allow(self, tenant: str, route: str, tokens: float = 1.0) -> bool:
+        return all(
+            bucket.allow(self._key(tier, tenant, route), tokens)
+            for tier, bucket in zip(self.tiers, self._buckets, strict=True)
+        )
+
+    async def allow_async(self, tenant: str, route: str, tokens: float = 1.0) -> bool:
+        for tier, bucket in zip(self.tiers, self._buckets, strict=True):
+            if not await bucket.allow_async(self._key(tier, tenant, route), tokens):
+                return False
+        return True
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {tier.scope: bucket.stats() for tier, bucket in zip(self.tiers, self._buckets, strict=True)}
+
+    def release(self) -> None:
+        for bucket in self._buckets:
+            bucket.release()
+
+
+__all__ = [
+    "HierarchicalRateLimiter",
+    "LeasedTokenBucket",
+    "RateLimitTier",
+    "RedisTokenBucket",
+]
@@ -163,9 +163,9 @@ class Scheduler:
         for update in state_updates:
             self._state_batcher.add_update(
                 "ingest_state",
-                "cursor=?, last_seen_at=?",
+                "cursor=?, last_seen_at=?, etag=?",
                 "watchlist_id=?",
-                (update["cursor"], update["last_seen_at"], update["watchlist_id"]),
+                (update["cursor"], update["last_seen_at"], update.get("etag"), update["watchlist_id"]),
             )
         try:
             task = asyncio.create_task(self._state_batcher.flush())
@@ -175,8 +175,8 @@ class Scheduler:
             with self._lock:
                 for update in state_updates:
                     self.conn.execute(
-                        "UPDATE ingest_state SET cursor=?, last_seen_at=? WHERE watchlist_id=?",
-                        (update["cursor"], update["last_seen_at"], update["watchlist_id"]),
+                        "UPDATE ingest_state SET cursor=?, last_seen_at=?, etag=? WHERE watchlist_id=?",
+                        (update["cursor"], update["last_seen_at"], update.get("etag"), update["watchlist_id"]),
                     )
                 self.conn.commit()
 
@@ -191,14 +191,17 @@ class Scheduler:
         for wid, tenant, workspace, source_type, handle, label in rows:
             with self._lock:
                 state_row = self.conn.execute(
-                    "SELECT cursor, last_seen_at FROM ingest_state WHERE watchlist_id=?", (wid,)
+                    "SELECT cursor, last_seen_at, etag FROM ingest_state WHERE watchlist_id=?", (wid,)
                 ).fetchone()
             cursor = state_row[0] if state_row else None
             last_polled = datetime.fromisoformat(state_row[1]) if state_row and state_row[1] else None
             interval = self.learner.recommend("scheduler", {"source_type": source_type}, [30, 300])
             if last_polled and now - last_polled < timedelta(seconds=interval):
                 continue
-            state = {"cursor": cursor} if cursor is not None else {}
+            state: dict[str, object] = {"cursor": cursor} if cursor is not None else {}
+            if state_row and state_row[2]:
+                # Connectors that poll feeds send this back as If-None-Match.
+                state["etag"] = state_row[2]
             watch = Watch(
                 id=wid, source_type=source_type, handle=handle, tenant=tenant, workspace=workspace, label=label
             )
@@ -219,7 +222,14 @@ class Scheduler:
                         visibility="public",
                     )
                     jobs_to_enqueue.append(job)
-            state_updates.append({"watchlist_id": wid, "cursor": state.get("cursor"), "last_seen_at": now.isoformat()})
+            state_updates.append(
+                {
+                    "watchlist_id": wid,
+                    "cursor": state.get("cursor"),
+                    "last_seen_at": now.isoformat(),
+                    "etag": state.get("etag"),
+                }
+            )
             self.learner.record("scheduler", {"source_type": source_type}, interval, float(reward))
         if jobs_to_enqueue:
             self.queue.enqueue_bulk(jobs_to_enqueue)
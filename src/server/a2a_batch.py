@@ -0,0 +1,100 @@
+"""Concurrent execution of JSON-RPC calls for the A2A adapter.
+
+Tools are synchronous, so every call runs in a worker thread and the event
+loop stays free for other requests. Batch items run concurrently, with at most
+``A2A_BATCH_CONCURRENCY`` in flight per request, and each call is bounded by
+``A2A_ITEM_TIMEOUT_SECONDS`` (``0`` disables the timeout).
+
+- ``run_call`` runs one call in a thread, enforcing the timeout.
+- ``run_batch`` returns results in request order.
+- ``stream_batch`` yields ``(index, result)`` pairs as soon as each finishes.
+
+A timed-out call keeps running in its thread (Python threads cannot be
+cancelled). Its result is discarded and ``on_timeout`` supplies the response.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, ""))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class BatchSettings:
+    """Concurrency limit and per-call timeout for JSON-RPC execution."""
+
+    concurrency: int = 8
+    item_timeout: float | None = 30.0
+
+    @classmethod
+    def from_env(cls) -> BatchSettings:
+        concurrency = int(_env_float("A2A_BATCH_CONCURRENCY", cls.concurrency))
+        timeout = _env_float("A2A_ITEM_TIMEOUT_SECONDS", cls.item_timeout or 0.0)
+        return cls(concurrency=max(1, concurrency), item_timeout=timeout if timeout > 0 else None)
+
+
+async def run_call(
+    call: Callable[[], Any], on_timeout: Callable[[float], Any], timeout: float | None
+) -> Any:
+    """Run ``call`` in a worker thread; return ``on_timeout(timeout)`` if it overruns."""
+    try:
+        return await asyncio.wait_for(asyncio.to_thread(call), timeout)
+    except asyncio.TimeoutError:
+        assert timeout is not None
+        return on_timeout(timeout)
+
+
+async def _run_limited(
+    index: int,
+    call: Callable[[], Any],
+    on_timeout: Callable[[int, float], Any],
+    semaphore: asyncio.Semaphore,
+    timeout: float | None,
+) -> tuple[int, Any]:
+    async with semaphore:
+        return index, await run_call(call, lambda seconds: on_timeout(index, seconds), timeout)
+
+
+async def stream_batch(
+    calls: Sequence[Callable[[], Any]],
+    on_timeout: Callable[[int, float], Any],
+    settings: BatchSettings | None = None,
+) -> AsyncIterator[tuple[int, Any]]:
+    """Yield ``(index, result)`` for each call in completion order."""
+    settings = settings or BatchSettings.from_env()
+    semaphore = asyncio.Semaphore(settings.concurrency)
+    tasks = [
+        asyncio.ensure_future(_run_limited(i, call, on_timeout, semaphore, settings.item_timeout))
+        for i, call in enumerate(calls)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def run_batch(
+    calls: Sequence[Callable[[], Any]],
+    on_timeout: Callable[[int, float], Any],
+    settings: BatchSettings | None = None,
+) -> list[Any]:
+    """Run all calls concurrently and return their results in request order."""
+    results: list[Any] = [None] * len(calls)
+    async for index, result in stream_batch(calls, on_timeout, settings):
+        results[index] = result
+    return results
+
+
+__all__ = ["BatchSettings", "run_batch", "run_call", "stream_batch"]
@@ -2,6 +2,7 @@
 
 This adapter exposes:
  - POST /a2a/jsonrpc : JSON-RPC 2.0 method dispatch for tools/actions (single or batch)
+ - POST /a2a/jsonrpc/stream : same dispatch, responses streamed over SSE as they complete
  - GET  /a2a/agent-card: Agent Card describing currently-enabled capabilities
  - GET  /a2a/skills: Minimal skills list with input schemas
 
@@ -9,6 +10,7 @@ Notes
 - Uses dynamic tool registry resolution so feature flags toggled at runtime in tests
   are respected without process restart.
 - Wraps tool calls with optional metrics and tracing if the observability layer is enabled.
+- Runs tools in worker threads; batch items run concurrently (see ``a2a_batch``).
 - Honors optional API key auth via env flags.
 """
 
@@ -16,16 +18,21 @@ from __future__ import annotations
 
 import contextlib
 import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any
 
 from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
+from . import a2a_batch as _batch
 from .a2a_discovery import attach_discovery_routes as _attach_discovery
 from .a2a_metrics import inc_tool_runs as _inc_tool_runs
 from .a2a_metrics import observe_batch_size as _observe_batch_size
 from .a2a_metrics import observe_request_latency as _observe_request_latency
 from .a2a_metrics import observe_tool_latency as _observe_tool_latency
 from .a2a_streaming import attach_streaming_demo as _attach_streaming_demo
+from .a2a_streaming import format_sse as _format_sse
 from .a2a_tools import api_key_ok as _api_key_ok
 from .a2a_tools import get_tools as _get_tools
 
@@ -147,130 +154,190 @@ def _sr_to_result(sr: StepResult) -> dict[str, Any]:
     return {"status": "success" if sr.success else "error", "data": payload, "error": sr.error}
 
 
+def _sr_to_response(id_val: Any, sr: StepResult) -> dict[str, Any]:
+    if sr.success:
+        return _jsonrpc_result(id_val, _sr_to_result(sr))
+    msg = sr.error or "error"
+    code = -32603
+    if isinstance(msg, str):
+        if msg.startswith("Unknown method"):
+            code = -32601
+        elif msg.startswith("Invalid params"):
+            code = -32602
+    return _jsonrpc_error(id_val, code, msg, data=sr.data)
+
+
 def _ctx_from_request(tenant_id: str | None, workspace_id: str | None) -> TenantContext | None:
     if tenant_id and workspace_id:
         return TenantContext(tenant_id, workspace_id)
     return None
 
 
-@router.post("/jsonrpc")
-async def jsonrpc_endpoint(
-    request: Request,
-    x_tenant_id: str | None = Header(default=None, alias="X-Tenant-Id"),
-    x_workspace_id: str | None = Header(default=None, alias="X-Workspace-Id"),
-    x_api_key: str | None = Header(default=None, alias="X-API-Key"),
-):
-    """Handle JSON-RPC 2.0 requests (single or batch)."""
+@dataclass
+class _RpcCall:
+    """One validated JSON-RPC call, ready to run in a worker thread."""
+
+    id_val: Any
+    method: str
+    params: dict[str, Any] | None
+    ctx: TenantContext | None
+    mode: str
+
+    @property
+    def tool_name(self) -> str:
+        return _tool_label(self.method, self.params)
+
+    def run(self) -> StepResult:
+        if self.ctx is not None:
+            with with_tenant(self.ctx):
+                return self._run()
+        return self._run()
+
+    def _run(self) -> StepResult:
+        t0 = time.perf_counter()
+        with tracing.start_span("a2a.jsonrpc.tool") as span:
+            try:
+                span.set_attribute("tool", self.tool_name)
+                span.set_attribute("mode", self.mode)
+            except Exception:
+                pass
+            sr = _dispatch(self.method, self.params)
+            with contextlib.suppress(Exception):
+                span.set_attribute("outcome", "success" if sr.success else "error")
+        dt = max(0.0, time.perf_counter() - t0)
+        _observe_tool_latency(self.tool_name, dt, "success" if sr.success else "error")
+        _inc_tool_runs(self.tool_name, "success" if sr.success else "error")
+        return sr
+
+    def timed_out(self, seconds: float) -> StepResult:
+        _inc_tool_runs(self.tool_name, "timeout")
+        return StepResult.fail(f"Timeout: {self.tool_name} exceeded {seconds:g}s")
+
+
+def _parse_call(
+    item: Any, x_tenant_id: str | None, x_workspace_id: str | None, mode: str
+) -> _RpcCall | dict[str, Any]:
+    """Validate one request object; return the call or a JSON-RPC error response."""
+    if not isinstance(item, dict) or item.get("jsonrpc") != "2.0":
+        return _jsonrpc_error(None, -32600, "Invalid Request")
+    method = item.get("method")
+    id_val = item.get("id")
+    params = item.get("params") if isinstance(item.get("params"), dict) else None
+    if not isinstance(method, str):
+        return _jsonrpc_error(id_val, -32600, "Invalid Request: method must be string")
+    tenant_id = x_tenant_id or (params.get("tenant_id") if params else None)
+    workspace_id = x_workspace_id or (params.get("workspace_id") if params else None)
+    ctx = _ctx_from_request(str(tenant_id) if tenant_id else None, str(workspace_id) if workspace_id else None)
+    return _RpcCall(id_val, method, params, ctx, mode)
+
+
+async def _read_request(request: Request, x_api_key: str | None) -> Any:
     if x_api_key is None and hasattr(request, "headers") and isinstance(request.headers, dict):
         x_api_key = request.headers.get("X-API-Key") or request.headers.get("x-api-key")
     if not _api_key_ok(x_api_key):
         raise HTTPException(status_code=401, detail="Unauthorized")
     try:
-        body = await request.json()
+        return await request.json()
     except Exception as exc:
         raise HTTPException(status_code=400, detail="Invalid JSON body") from exc
+
+
+async def _iter_batch(
+    body: list[Any], x_tenant_id: str | None, x_workspace_id: str | None
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield batch responses as items complete; invalid items are reported first.
+
+    Notifications (items without ``id``) run but produce no response.
+    """
+    calls: list[_RpcCall] = []
+    for item in body:
+        parsed = _parse_call(item, x_tenant_id, x_workspace_id, "batch")
+        if isinstance(parsed, _RpcCall):
+            calls.append(parsed)
+        else:
+            yield parsed
+    async for index, sr in _batch.stream_batch(
+        [call.run for call in calls], lambda index, seconds: calls[index].timed_out(seconds)
+    ):
+        if calls[index].id_val is not None:
+            yield _sr_to_response(calls[index].id_val, sr)
+
+
+@router.post("/jsonrpc")
+async def jsonrpc_endpoint(
+    request: Request,
+    x_tenant_id: str | None = Header(default=None, alias="X-Tenant-Id"),
+    x_workspace_id: str | None = Header(default=None, alias="X-Workspace-Id"),
+    x_api_key: str | None = Header(default=None, alias="X-API-Key"),
+):
+    """Handle JSON-RPC 2.0 requests (single or batch).
+
+    Tools run in worker threads; batch items run concurrently and the
+    responses keep the order of the request items.
+    """
+    body = await _read_request(request, x_api_key)
     if isinstance(body, list):
         if len(body) == 0:
             return _jsonrpc_error(None, -32600, "Invalid Request: empty batch")
         _observe_batch_size(len(body))
         req_start = time.perf_counter()
+        parsed = [_parse_call(item, x_tenant_id, x_workspace_id, "batch") for item in body]
+        calls = [p for p in parsed if isinstance(p, _RpcCall)]
+        results = iter(
+            await _batch.run_batch(
+                [call.run for call in calls], lambda index, seconds: calls[index].timed_out(seconds)
+            )
+        )
         responses: list[dict[str, Any]] = []
-        for item in body:
-            if not isinstance(item, dict) or item.get("jsonrpc") != "2.0":
-                responses.append(_jsonrpc_error(None, -32600, "Invalid Request"))
+        for p in parsed:
+            if not isinstance(p, _RpcCall):
+                responses.append(p)
                 continue
-            method = item.get("method")
-            id_val = item.get("id")
-            params = item.get("params") if isinstance(item.get("params"), dict) else None
-            if not isinstance(method, str):
-                responses.append(_jsonrpc_error(id_val, -32600, "Invalid Request: method must be string"))
-                continue
-            tenant_id = x_tenant_id or (params.get("tenant_id") if params else None)
-            workspace_id = x_workspace_id or (params.get("workspace_id") if params else None)
-            ctx = _ctx_from_request(str(tenant_id) if tenant_id else None, str(workspace_id) if workspace_id else None)
-
-            def _execute_one(
-                method_name: str = method, method_params: dict[str, Any] | None = params, request_id: Any = id_val
-            ) -> dict[str, Any] | None:
-                tool_name = _tool_label(method_name, method_params)
-                t0 = time.perf_counter()
-                with tracing.start_span("a2a.jsonrpc.tool") as span:
-                    try:
-                        span.set_attribute("tool", tool_name)
-                        span.set_attribute("mode", "batch")
-                    except Exception:
-                        pass
-                    sr = _dispatch(method_name, method_params)
-                    with contextlib.suppress(Exception):
-                        span.set_attribute("outcome", "success" if sr.success else "error")
-                dt = max(0.0, time.perf_counter() - t0)
-                _observe_tool_latency(tool_name, dt, "success" if sr.success else "error")
-                _inc_tool_runs(tool_name, "success" if sr.success else "error")
-                if sr.success:
-                    return _jsonrpc_result(request_id, _sr_to_result(sr)) if request_id is not None else None
-                msg = sr.error or "error"
-                code = -32603
-                if isinstance(msg, str):
-                    if msg.startswith("Unknown method"):
-                        code = -32601
-                    elif msg.startswith("Invalid params"):
-                        code = -32602
-                return _jsonrpc_error(request_id, code, msg, data=sr.data) if request_id is not None else None
-
-            if ctx is not None:
-                with with_tenant(ctx):
-                    resp = _execute_one()
-            else:
-                resp = _execute_one()
-            if resp is not None:
-                responses.append(resp)
+            sr = next(results)
+            if p.id_val is not None:
+                responses.append(_sr_to_response(p.id_val, sr))
         _observe_request_latency("batch", max(0.0, time.perf_counter() - req_start))
         return responses
     if not isinstance(body, dict) or body.get("jsonrpc") != "2.0":
         raise HTTPException(status_code=400, detail="Invalid JSON-RPC request")
-    method = body.get("method")
-    id_val = body.get("id")
-    params = body.get("params") if isinstance(body.get("params"), dict) else None
-    if not isinstance(method, str):
-        return _jsonrpc_error(id_val, -32600, "Invalid Request: method must be string")
-    tenant_id = x_tenant_id or (params.get("tenant_id") if params else None)
-    workspace_id = x_workspace_id or (params.get("workspace_id") if params else None)
-    ctx = _ctx_from_request(str(tenant_id) if tenant_id else None, str(workspace_id) if workspace_id else None)
+    call = _parse_call(body, x_tenant_id, x_workspace_id, "single")
+    if not isinstance(call, _RpcCall):
+        return call
     req_start = time.perf_counter()
+    sr = await _batch.run_call(call.run, call.timed_out, _batch.BatchSettings.from_env().item_timeout)
+    _observe_request_latency("single", max(0.0, time.perf_counter() - req_start))
+    return _sr_to_response(call.id_val, sr)
 
-    def _execute(method_name: str = method, method_params: dict[str, Any] | None = params) -> StepResult:
-        tool_name = _tool_label(method_name, method_params)
-        t0 = time.perf_counter()
-        with tracing.start_span("a2a.jsonrpc.tool") as span:
-            try:
-                span.set_attribute("tool", tool_name)
-                span.set_attribute("mode", "single")
-            except Exception:
-                pass
-            sr = _dispatch(method_name, method_params)
-            with contextlib.suppress(Exception):
-                span.set_attribute("outcome", "success" if sr.success else "error")
-        dt = max(0.0, time.perf_counter() - t0)
-        _observe_tool_latency(tool_name, dt, "success" if sr.success else "error")
-        _inc_tool_runs(tool_name, "success" if sr.success else "error")
-        return sr
 
-    if ctx is not None:
-        with with_tenant(ctx):
-            sr = _execute()
-    else:
-        sr = _execute()
-    _observe_request_latency("single", max(0.0, time.perf_counter() - req_start))
-    if sr.success:
-        return _jsonrpc_result(id_val, _sr_to_result(sr))
-    msg = sr.error or "error"
-    code = -32603
-    if isinstance(msg, str):
-        if msg.startswith("Unknown method"):
-            code = -32601
-        elif msg.startswith("Invalid params"):
-            code = -32602
-    return _jsonrpc_error(id_val, code, msg, data=sr.data)
+@router.post("/jsonrpc/stream")
+async def jsonrpc_stream_endpoint(
+    request: Request,
+    x_tenant_id: str | None = Header(default=None, alias="X-Tenant-Id"),
+    x_workspace_id: str | None = Header(default=None, alias="X-Workspace-Id"),
+    x_api_key: str | None = Header(default=None, alias="X-API-Key"),
+) -> StreamingResponse:
+    """Stream JSON-RPC responses over SSE as each call completes.
+
+    Accepts a single request or a batch. Every response is sent as an
+    ``event: result`` whose data is the JSON-RPC response object, so clients
+    correlate results by ``id``; a final ``event: done`` closes the stream.
+    """
+    body = await _read_request(request, x_api_key)
+    items = body if isinstance(body, list) else [body]
+    if not items:
+        raise HTTPException(status_code=400, detail="Invalid Request: empty batch")
+    _observe_batch_size(len(items))
+
+    async def events() -> AsyncIterator[str]:
+        req_start = time.perf_counter()
+        count = 0
+        async for response in _iter_batch(items, x_tenant_id, x_workspace_id):
+            count += 1
+            yield _format_sse(response, event="result")
+        _observe_request_latency("stream", max(0.0, time.perf_counter() - req_start))
+        yield _format_sse({"count": count}, event="done")
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
 _attach_streaming_demo(router)
@@ -1,15 +1,25 @@
-"""Optional streaming demo endpoint for the A2A adapter.
+"""SSE helpers and the optional streaming demo endpoint for the A2A adapter.
 
-Separated to keep the main router lean. Uses the same ENABLE_A2A_STREAMING_DEMO flag.
+Separated to keep the main router lean. ``format_sse`` frames events for
+``/a2a/jsonrpc/stream``; the demo route uses the ENABLE_A2A_STREAMING_DEMO flag.
 """
 
 from __future__ import annotations
 
+import json
+from typing import Any
+
 from fastapi import APIRouter, Response
 
 from .a2a_tools import is_enabled as _is_enabled
 
 
+def format_sse(data: Any, event: str | None = None) -> str:
+    """Frame ``data`` as one Server-Sent Event (JSON-encoded, single line)."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, default=str, separators=(',', ':'))}\n\n"
+
+
 def attach_streaming_demo(router: APIRouter) -> None:
     if not _is_enabled("ENABLE_A2A_STREAMING_DEMO", False):
         return
@@ -41,4 +51,4 @@ def attach_streaming_demo(router: APIRouter) -> None:
             return Response(payload, media_type="text/event-stream")
 
 
-__all__ = ["attach_streaming_demo"]
+__all__ = ["attach_streaming_demo", "format_sse"]
@@ -88,7 +88,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     add_metrics_middleware(app, settings)
     add_api_cache_middleware(app, settings)
     register_metrics_endpoint(app, settings)
-    add_rate_limit_middleware(app)
+    add_rate_limit_middleware(app, settings)
     register_pilot_route(app, settings)
     register_health_routes(app)
     register_activities_echo(app, settings)
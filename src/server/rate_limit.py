@@ -11,6 +11,13 @@ Behaviour:
 
 Configuration:
     * RATE_LIMIT_BURST or RATE_LIMIT_RPS: integer burst per second (default 10).
+    * RATE_LIMIT_REDIS_URL: when set, a pure-ASGI limiter backed by leased
+      Redis token buckets replaces the fixed window. A global bucket shared by
+      all processes keeps RATE_LIMIT_RPS/RATE_LIMIT_BURST as the floor, so the
+      limit cannot be escaped by varying headers. Per-tenant buckets use
+      RATE_LIMIT_TENANT_RPS/RATE_LIMIT_TENANT_BURST (defaulting to the global
+      values); per-route buckets are added when RATE_LIMIT_ROUTE_RPS (and
+      optionally RATE_LIMIT_ROUTE_BURST) is set.
 
 Typing & Optional Dependency Notes:
     The code can run without Starlette installed (tests using a FastAPI shim).
@@ -130,7 +137,83 @@ class FixedWindowRateLimiter(BaseHTTPMiddleware):
         return await call_next(request)
 
 
-def add_rate_limit_middleware(app: FastAPI) -> None:
+def _is_exempt_path(path: str, metrics_path: str) -> bool:
+    mp_norm = metrics_path.rstrip("/") or "/metrics"
+    rp_norm = path.rstrip("/") or path
+    return rp_norm == mp_norm or rp_norm == "/health" or rp_norm.startswith(mp_norm + "/")
+
+
+def _tenant_of(scope: dict) -> str:
+    state = scope.get("state")
+    if isinstance(state, dict) and state.get("tenant_id"):
+        return str(state["tenant_id"])
+    for name, value in scope.get("headers") or ():
+        if name.lower() == b"x-tenant-id":
+            return value.decode("latin-1") or "anonymous"
+    return "anonymous"
+
+
+class TenantRateLimitMiddleware:
+    """Pure-ASGI per-tenant/per-route limiter using leased Redis buckets.
+
+    Unlike :class:`FixedWindowRateLimiter` this does not wrap requests in
+    ``BaseHTTPMiddleware``; allowed requests are passed straight through and
+    most decisions are served from the process-local lease without awaiting
+    Redis. The tenant is taken from ``scope["state"]["tenant_id"]`` when an
+    authentication layer has set it, else from the ``X-Tenant-Id`` header
+    (``"anonymous"`` when absent); the route is the request path. The header
+    is client-controlled, so it only partitions the budget below the global
+    tier built by :func:`add_rate_limit_middleware`, never replaces it.
+    """
+
+    def __init__(self, app: Any, limiter: Any, metrics_path: str | None = None) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.metrics_path = metrics_path or os.getenv("PROMETHEUS_ENDPOINT_PATH") or "/metrics"
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope.get("type") != "http" or scope.get("_skip_rate_limit"):
+            await self.app(scope, receive, send)
+            return
+        path = scope.get("path", "/")
+        if _is_exempt_path(path, self.metrics_path):
+            await self.app(scope, receive, send)
+            return
+        if await self.limiter.allow_async(_tenant_of(scope), path):
+            await self.app(scope, receive, send)
+            return
+        try:
+            metrics.get_metrics().RATE_LIMIT_REJECTIONS.labels(path, str(scope.get("method", "GET")).upper()).inc()
+        except Exception as exc:
+            logging.debug("rate limit metrics error: %s", exc)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"retry-after", b"1")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b"Rate limit exceeded"})
+
+
+def _build_tenant_limiter(redis_url: str, burst: int) -> Any:
+    from platform.security.redis_rate_limit import HierarchicalRateLimiter, RateLimitTier
+
+    rps = float(os.getenv("RATE_LIMIT_RPS", str(burst)))
+    tenant_rps = float(os.getenv("RATE_LIMIT_TENANT_RPS", str(rps)))
+    tenant_burst = int(os.getenv("RATE_LIMIT_TENANT_BURST", str(burst)))
+    tiers = [
+        RateLimitTier("global", rate=rps, capacity=burst),
+        RateLimitTier("tenant", rate=tenant_rps, capacity=tenant_burst),
+    ]
+    route_rps = os.getenv("RATE_LIMIT_ROUTE_RPS")
+    if route_rps:
+        route_burst = int(os.getenv("RATE_LIMIT_ROUTE_BURST", route_rps))
+        tiers.append(RateLimitTier("route", rate=float(route_rps), capacity=route_burst))
+    return HierarchicalRateLimiter(tiers, url=redis_url)
+
+
+def add_rate_limit_middleware(app: FastAPI, settings: Any | None = None) -> None:
     enable = os.getenv("ENABLE_RATE_LIMITING", "0").lower() in ("1", "true", "yes", "on")
     if not enable:
         return
@@ -138,12 +221,21 @@ def add_rate_limit_middleware(app: FastAPI) -> None:
         burst = int(os.getenv("RATE_LIMIT_BURST", os.getenv("RATE_LIMIT_RPS", "10")))
     except Exception:
         burst = 10
-    if middleware_shim is not None:
-        middleware_shim.install_middleware_support()
     from typing import cast as _cast
 
     app_any = _cast("Any", app)
+    redis_url = os.getenv("RATE_LIMIT_REDIS_URL") or getattr(settings, "rate_limit_redis_url", None)
+    if redis_url:
+        try:
+            limiter = _build_tenant_limiter(str(redis_url), max(1, burst))
+        except Exception as exc:
+            logging.warning("tenant rate limiter unavailable, using fixed window: %s", exc)
+        else:
+            app_any.add_middleware(TenantRateLimitMiddleware, limiter=limiter)
+            return
+    if middleware_shim is not None:
+        middleware_shim.install_middleware_support()
     app_any.add_middleware(FixedWindowRateLimiter, burst=burst)
 
 
-__all__ = ["add_rate_limit_middleware"]
+__all__ = ["TenantRateLimitMiddleware", "add_rate_limit_middleware"]
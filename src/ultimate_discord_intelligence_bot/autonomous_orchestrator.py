@@ -8,6 +8,7 @@ self-orchestrated command interface.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
 import time
@@ -60,6 +61,8 @@ except Exception:
 
 
 from app.config.settings import Settings
+from app.discord.autointel_coalescer import final_result
+from platform.cache.crew_templates import CrewTemplateCache
 from ultimate_discord_intelligence_bot.obs.metrics import get_metrics
 
 from .config import prompts as prompt_config
@@ -233,7 +236,7 @@ class AutonomousIntelligenceOrchestrator:
             agent_name, self.agent_coordinators, self.crew_instance, logger_instance=self.logger
         )
 
-    def _task_completion_callback(self, task_output: Any) -> None:
+    def _task_completion_callback(self, task_output: Any, agent_coordinators: dict[str, Any] | None = None) -> None:
         """Callback to extract and propagate structured data after each task (delegates to crew_builders)."""
         return crew_builders.task_completion_callback(
             task_output,
@@ -243,7 +246,7 @@ class AutonomousIntelligenceOrchestrator:
             extract_key_values_callback=self._extract_key_values_from_text,
             logger_instance=self.logger,
             metrics_instance=self.metrics,
-            agent_coordinators=self.agent_coordinators,
+            agent_coordinators=self.agent_coordinators if agent_coordinators is None else agent_coordinators,
         )
 
     def _extract_key_values_from_text(self, text: str) -> dict[str, Any]:
@@ -258,25 +261,70 @@ class AutonomousIntelligenceOrchestrator:
         """Detect when agents generate placeholder/mock responses instead of calling tools."""
         return quality_assessors.detect_placeholder_responses(task_name, output_data, self.logger, self.metrics)
 
-    def _build_intelligence_crew(self, url: str, depth: str) -> Crew:
-        """Build a single chained CrewAI crew for the complete intelligence workflow (delegates to crew_builders)."""
+    def _build_intelligence_crew(self, url: str, depth: str, agents: dict[str, Any] | None = None) -> Crew:
+        """Build a single chained CrewAI crew for the complete intelligence workflow (delegates to crew_builders).
+
+        When ``agents`` is a leased crew template, only the tasks and the crew
+        are created, and task callbacks propagate context to that set alone.
+        """
         if self.crew_instance is None:
             from .crew_core import UltimateDiscordIntelligenceBotCrew
 
             self.crew_instance = UltimateDiscordIntelligenceBotCrew()
             self.logger.debug("✨ Initialized crew_instance for agent creation")
         settings = Settings()
+        callback = self._task_completion_callback
+        if agents is not None:
+            callback = functools.partial(self._task_completion_callback, agent_coordinators=agents)
         return crew_builders.build_intelligence_crew(
             url,
             depth,
             agent_getter_callback=self._get_or_create_agent,
-            task_completion_callback=self._task_completion_callback,
+            task_completion_callback=callback,
             logger_instance=self.logger,
             enable_parallel_memory_ops=settings.enable_parallel_memory_ops,
             enable_parallel_analysis=settings.enable_parallel_analysis,
             enable_parallel_fact_checking=settings.enable_parallel_fact_checking,
+            agents=agents,
         )
 
+    @staticmethod
+    def _crew_template_config() -> dict[str, Any]:
+        """Settings that change how the intelligence crew's agents are built."""
+        settings = Settings()
+        return {
+            "parallel_memory_ops": bool(settings.enable_parallel_memory_ops),
+            "parallel_analysis": bool(settings.enable_parallel_analysis),
+            "parallel_fact_checking": bool(settings.enable_parallel_fact_checking),
+            "enhanced_memory": bool(getattr(settings, "enable_enhanced_memory", False)),
+        }
+
+    def _build_template_agents(self) -> dict[str, Any]:
+        """Create a fresh agent set for a crew template (tools and LLM clients included)."""
+        if self.crew_instance is None:
+            from .crew_core import UltimateDiscordIntelligenceBotCrew
+
+            self.crew_instance = UltimateDiscordIntelligenceBotCrew()
+        return {name: getattr(self.crew_instance, name)() for name in crew_builders.INTELLIGENCE_CREW_AGENTS}
+
+    async def _kickoff_crew(self, crew: Crew, url: str, depth: str) -> CrewOutput:
+        """Populate initial tool context and run ``crew.kickoff`` off the event loop."""
+        initial_context = {"url": url, "depth": depth}
+        self.logger.info(f"🔧 Populating initial context on all agents: {initial_context}")
+        for agent in crew.agents:
+            self._populate_agent_tool_context(agent, initial_context)
+        self.logger.info(f"Kickoff crew with inputs: url={url}, depth={depth}")
+        try:
+            return await asyncio.to_thread(crew.kickoff, inputs={"url": url, "depth": depth})
+        except Exception as crew_exec_error:
+            error_msg = str(crew_exec_error)
+            if "maximum context length" in error_msg or "token" in error_msg.lower():
+                self.logger.warning(
+                    f"CrewAI memory token limit exceeded (likely >8192 tokens). Continuing with memory disabled. Error: {error_msg}"
+                )
+                return await asyncio.to_thread(crew.kickoff, inputs={"url": url, "depth": depth})
+            raise
+
     def _build_specialized_crew(self, routed_tool: str, url: str, depth: str) -> Crew | None:
         """Build a specialized crew for a specific routed tool.
 
@@ -429,6 +477,7 @@ class AutonomousIntelligenceOrchestrator:
         self.workflow_dependencies = orchestrator_utilities.initialize_workflow_dependencies()
         self.agent_coordinators = {}
         self.crew_instance = None
+        self.crew_templates = CrewTemplateCache()
 
     @staticmethod
     def _normalize_acquisition_data(acquisition: StepResult | dict[str, Any] | None) -> dict[str, Any]:
@@ -503,7 +552,7 @@ class AutonomousIntelligenceOrchestrator:
 
     async def execute_autonomous_intelligence_workflow(
         self, interaction: Any, url: str, depth: str = "standard", tenant_ctx: Any = None
-    ) -> None:
+    ) -> bool:
         """Execute the complete autonomous intelligence workflow using proper CrewAI architecture.
 
         ARCHITECTURE CHANGE (2025-10-03):
@@ -527,6 +576,10 @@ class AutonomousIntelligenceOrchestrator:
             url: URL to analyze
             depth: Analysis depth (standard, deep, comprehensive, experimental)
             tenant_ctx: Optional tenant context for isolation
+
+        Returns:
+            ``True`` if the final report was delivered, ``False`` if the workflow
+            reported an error to the interaction instead.
         """
         start_time = time.time()
         workflow_id = f"autointel_{int(start_time)}_{hash(url) % 10000}"
@@ -590,12 +643,14 @@ class AutonomousIntelligenceOrchestrator:
                         from .tenancy import with_tenant
 
                         with with_tenant(tenant_ctx):
-                            await self._execute_crew_workflow(interaction, url, depth, workflow_id, start_time)
+                            delivered = await self._execute_crew_workflow(
+                                interaction, url, depth, workflow_id, start_time
+                            )
                     except Exception as tenancy_error:
                         self.logger.warning(f"Tenant context execution failed: {tenancy_error}")
-                        await self._execute_crew_workflow(interaction, url, depth, workflow_id, start_time)
+                        delivered = await self._execute_crew_workflow(interaction, url, depth, workflow_id, start_time)
                 else:
-                    await self._execute_crew_workflow(interaction, url, depth, workflow_id, start_time)
+                    delivered = await self._execute_crew_workflow(interaction, url, depth, workflow_id, start_time)
                 tracker = current_request_tracker()
                 if tracker and tracker.total_spent > 0:
                     cost_msg = f"💰 **Cost Tracking:**\n• Total: ${tracker.total_spent:.3f}\n• Budget: ${budget_limits['total']:.2f}\n• Utilization: {tracker.total_spent / budget_limits['total'] * 100:.1f}%"
@@ -604,18 +659,22 @@ class AutonomousIntelligenceOrchestrator:
                             await interaction.followup.send(cost_msg)
                         except Exception:
                             self.logger.info(cost_msg)
+            return delivered
         except Exception as e:
             self.logger.error(f"Autonomous intelligence workflow failed: {e}", exc_info=True)
             await self._send_error_response(interaction, "Autonomous Workflow", str(e))
             self.metrics.counter("autointel_workflows_total", labels={"depth": depth, "outcome": "error"}).inc()
+            return False
 
     async def _execute_crew_workflow(
         self, interaction: Any, url: str, depth: str, workflow_id: str, start_time: float
-    ) -> None:
+    ) -> bool:
         """Execute workflow using proper CrewAI architecture with task chaining.
 
         This method builds ONE crew with chained tasks instead of 25 separate crews.
         Tasks use context=[previous_task] for data flow, not embedded f-strings.
+        Returns ``True`` only if every part of the report was sent; the report is
+        sent inside :func:`final_result` so a coalesced run shares just that.
         """
         import asyncio
 
@@ -641,6 +700,7 @@ class AutonomousIntelligenceOrchestrator:
                     pass
                 agentops.start_session(tags=session_tags)
                 self.logger.info(f"AgentOps session started with tags: {session_tags}")
+            crew = None
             routed_tool = self._route_query_to_tool(url)
             if routed_tool:
                 self.logger.info(f"Semantic router selected tool: {routed_tool}. Overriding default crew.")
@@ -657,24 +717,16 @@ class AutonomousIntelligenceOrchestrator:
                     5,
                 )
             await self._send_progress_update(interaction, "🤖 Building CrewAI multi-agent system...", 1, 5)
-            crew = self._build_intelligence_crew(url, depth)
-            initial_context = {"url": url, "depth": depth}
-            self.logger.info(f"🔧 Populating initial context on all agents: {initial_context}")
-            for agent in crew.agents:
-                self._populate_agent_tool_context(agent, initial_context)
-            await self._send_progress_update(interaction, "⚙️ Executing intelligence workflow...", 2, 5)
-            self.logger.info(f"Kickoff crew with inputs: url={url}, depth={depth}")
-            try:
-                result: CrewOutput = await asyncio.to_thread(crew.kickoff, inputs={"url": url, "depth": depth})
-            except Exception as crew_exec_error:
-                error_msg = str(crew_exec_error)
-                if "maximum context length" in error_msg or "token" in error_msg.lower():
-                    self.logger.warning(
-                        f"CrewAI memory token limit exceeded (likely >8192 tokens). Continuing with memory disabled. Error: {error_msg}"
-                    )
-                    result: CrewOutput = await asyncio.to_thread(crew.kickoff, inputs={"url": url, "depth": depth})
-                else:
-                    raise
+            if crew is not None:
+                await self._send_progress_update(interaction, "⚙️ Executing intelligence workflow...", 2, 5)
+                result: CrewOutput = await self._kickoff_crew(crew, url, depth)
+            else:
+                async with self.crew_templates.lease(
+                    depth, self._crew_template_config(), self._build_template_agents
+                ) as agents:
+                    crew = self._build_intelligence_crew(url, depth, agents=agents)
+                    await self._send_progress_update(interaction, "⚙️ Executing intelligence workflow...", 2, 5)
+                    result = await self._kickoff_crew(crew, url, depth)
             await self._send_progress_update(interaction, "📊 Processing crew results...", 3, 5)
             if hasattr(result, "tasks_output") and result.tasks_output:
                 task_outputs = {
@@ -716,30 +768,35 @@ class AutonomousIntelligenceOrchestrator:
             else:
                 result_message += f"**Analysis:**\n{result!s}\n\n"
             await self._send_progress_update(interaction, "✅ Intelligence analysis complete!", 5, 5)
-            if len(result_message) > 1900:
-                chunks = [result_message[i : i + 1900] for i in range(0, len(result_message), 1900)]
-                for chunk in chunks:
+            delivered = True
+            with final_result(interaction):
+                if len(result_message) > 1900:
+                    chunks = [result_message[i : i + 1900] for i in range(0, len(result_message), 1900)]
+                    for chunk in chunks:
+                        try:
+                            if hasattr(interaction, "followup"):
+                                await interaction.followup.send(chunk)
+                            elif hasattr(interaction, "channel"):
+                                await interaction.channel.send(chunk)
+                        except Exception as send_error:
+                            delivered = False
+                            self.logger.warning(f"Failed to send message chunk: {send_error}")
+                else:
                     try:
                         if hasattr(interaction, "followup"):
-                            await interaction.followup.send(chunk)
+                            await interaction.followup.send(result_message)
                         elif hasattr(interaction, "channel"):
-                            await interaction.channel.send(chunk)
+                            await interaction.channel.send(result_message)
                     except Exception as send_error:
-                        self.logger.warning(f"Failed to send message chunk: {send_error}")
-            else:
-                try:
-                    if hasattr(interaction, "followup"):
-                        await interaction.followup.send(result_message)
-                    elif hasattr(interaction, "channel"):
-                        await interaction.channel.send(result_message)
-                except Exception as send_error:
-                    self.logger.warning(f"Failed to send result message: {send_error}")
+                        delivered = False
+                        self.logger.warning(f"Failed to send result message: {send_error}")
             processing_time = time.time() - start_time
             self.metrics.counter("autointel_workflows_total", labels={"depth": depth, "outcome": "success"}).inc()
             self.metrics.histogram("autointel_workflow_duration", processing_time, labels={"depth": depth})
             if Settings().feature_flags.ENABLE_AGENT_COLLABORATION:
                 agentops.end_session("Success")
                 self.logger.info("AgentOps session ended with status: Success")
+            return delivered
         except Exception as e:
             self.logger.error(f"Crew workflow execution failed: {e}", exc_info=True)
             await self._send_error_response(interaction, "Crew Workflow", str(e))
@@ -747,6 +804,7 @@ class AutonomousIntelligenceOrchestrator:
             if Settings().feature_flags.ENABLE_AGENT_COLLABORATION:
                 agentops.end_session("Fail")
                 self.logger.info("AgentOps session ended with status: Fail")
+            return False
 
     def _get_available_capabilities(self) -> list[str]:
         """Delegates to workflow_planners.get_available_capabilities."""
@@ -0,0 +1,85 @@
+"""On-disk transcript cache used by the content pipeline.
+
+Transcripts are keyed by ``(video_id, model)`` and stored as one JSON file per
+key under ``root`` (``TRANSCRIPT_CACHE_DIR``, default
+``data/transcript_cache``). The pipeline enables the cache with
+``ENABLE_TRANSCRIPT_CACHE``; a disabled cache never touches the filesystem.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptCache:
+    """Read-through store for transcripts and their segments."""
+
+    def __init__(self, root: str | Path | None = None, enabled: bool = True) -> None:
+        self.root = Path(root or os.getenv("TRANSCRIPT_CACHE_DIR", "data/transcript_cache"))
+        self.enabled = enabled
+
+    def _path(self, video_id: str, model: str | None) -> Path:
+        digest = hashlib.sha256(f"{video_id}\0{model or 'default'}".encode()).hexdigest()
+        return self.root / f"{digest}.json"
+
+    def load(self, video_id: str | None, model: str | None = None) -> dict[str, Any] | None:
+        """Return the cached payload for ``video_id``/``model``, or ``None``."""
+        if not self.enabled or not video_id:
+            return None
+        path = self._path(video_id, model)
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable transcript cache entry %s", path, exc_info=True)
+            return None
+        if not isinstance(payload, dict) or not isinstance(payload.get("transcript"), str):
+            return None
+        return payload
+
+    def store(
+        self,
+        video_id: str | None,
+        model: str | None,
+        transcript: str,
+        segments: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """Persist a transcript; failures are logged and never raised."""
+        if not self.enabled or not video_id:
+            return
+        payload = {
+            "video_id": video_id,
+            "model": model,
+            "transcript": transcript,
+            "segments": segments or [],
+            "cached_at": time.time(),
+        }
+        path = self._path(video_id, model)
+        tmp: str | None = None
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp, path)
+        except OSError:
+            logger.warning("Failed to write transcript cache entry %s", path, exc_info=True)
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+
+
+__all__ = ["TranscriptCache"]
@@ -0,0 +1,239 @@
+"""
+Streaming window signals for Live Clip Radar.
+
+Viral-moment checks run on every chat message, so their cost must not grow
+with the window size. These structures keep running aggregates that are
+updated in amortized O(1) per message:
+
+- ChatWindow: recent messages plus per-second counters in a ring, with a
+  running count for the velocity window and for the baseline horizon.
+- SentimentWindow: running sums over the last two blocks of sentiment scores.
+- RollingSum: running total over the last N values (laughter tallies).
+
+Sentiment is scored in batches (score_sentiment_batch) so a poll that returns
+hundreds of chat messages is scored in one call.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+from collections import deque
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from ultimate_discord_intelligence_bot.creator_ops.features.clip_radar_models import ChatMessage, SentimentScore
+
+
+POSITIVE_KEYWORDS = ("good", "great", "awesome", "amazing", "love", "best", "excellent")
+NEGATIVE_KEYWORDS = ("bad", "terrible", "awful", "hate", "worst", "horrible", "disgusting")
+_POSITIVE = frozenset(POSITIVE_KEYWORDS)
+_SENTIMENT_RE = re.compile("|".join(POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS))
+_REPEATED_CHARS_RE = re.compile("(.)\\1{2,}")
+_LAUGH_EMOJI_RE = re.compile("[😂🤣😆😄😃😀]")
+
+
+class ChatWindow:
+    """Recent chat messages with constant-time velocity and baseline counts.
+
+    Message counts are kept per whole second in a ring covering
+    ``horizon_seconds``. ``recent`` counts messages from the newest second
+    back ``velocity_seconds``; ``total`` counts everything inside the horizon.
+    Both are adjusted as seconds enter and leave their windows, so counts are
+    exact to one-second resolution. Only the last ``maxlen`` messages are kept
+    for context.
+    """
+
+    def __init__(self, maxlen: int = 1000, horizon_seconds: int = 600, velocity_seconds: int = 60) -> None:
+        self.horizon = horizon_seconds
+        self.velocity_seconds = velocity_seconds
+        self._messages: deque[ChatMessage] = deque(maxlen=maxlen)
+        self._counts = [0] * horizon_seconds
+        self._stamps = [-1] * horizon_seconds
+        self._newest: int | None = None
+        self.total = 0
+        self.recent = 0
+
+    def append(self, message: ChatMessage) -> None:
+        self._messages.append(message)
+        self._count(int(message.timestamp.timestamp()))
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[ChatMessage]:
+        return iter(self._messages)
+
+    def tail(self, n: int) -> list[ChatMessage]:
+        """Return the last ``n`` messages, oldest first, without copying the window."""
+        items = list(itertools.islice(reversed(self._messages), n))
+        items.reverse()
+        return items
+
+    def clear(self) -> None:
+        self._messages.clear()
+        self._counts = [0] * self.horizon
+        self._stamps = [-1] * self.horizon
+        self._newest = None
+        self.total = self.recent = 0
+
+    def count_since(self, since: datetime) -> int:
+        """Messages stamped at or after ``since`` (to one-second resolution)."""
+        if self._newest is None:
+            return 0
+        cutoff = int(since.timestamp())
+        if cutoff == self._newest - self.velocity_seconds:
+            return self.recent
+        if cutoff <= self._newest - self.horizon:
+            return self.total
+        return sum(self._slot(second) for second in range(cutoff, self._newest + 1))
+
+    def rate_per_minute(self) -> float:
+        """Average messages per minute across the baseline horizon."""
+        return self.total / (self.horizon / 60.0)
+
+    def _slot(self, second: int) -> int:
+        index = second % self.horizon
+        return self._counts[index] if self._stamps[index] == second else 0
+
+    def _count(self, second: int) -> None:
+        if self._newest is None:
+            self._newest = second
+        elif second > self._newest:
+            self._advance(second)
+        elif second <= self._newest - self.horizon:
+            return
+        index = second % self.horizon
+        if self._stamps[index] != second:
+            self._stamps[index] = second
+            self._counts[index] = 0
+        self._counts[index] += 1
+        self.total += 1
+        if second >= self._newest - self.velocity_seconds:
+            self.recent += 1
+
+    def _advance(self, second: int) -> None:
+        newest = self._newest
+        assert newest is not None
+        if second - newest >= self.horizon:
+            self._counts = [0] * self.horizon
+            self._stamps = [-1] * self.horizon
+            self.total = self.recent = 0
+        else:
+            for leaving in range(newest - self.velocity_seconds, second - self.velocity_seconds):
+                self.recent -= self._slot(leaving)
+            for leaving in range(newest - self.horizon + 1, second - self.horizon + 1):
+                self.total -= self._slot(leaving)
+                self._stamps[leaving % self.horizon] = -1
+        self._newest = second
+
+
+class SentimentWindow:
+    """Sentiment history with running averages over the last two blocks.
+
+    Entries are ``{"timestamp", "sentiment", "message"}`` dicts. The newest
+    ``block`` scores and the ``block`` before them are tracked with running
+    sums, so comparing them does not copy the history.
+    """
+
+    def __init__(self, maxlen: int = 100, block: int = 10) -> None:
+        self.block = block
+        self._entries: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self._recent: deque[float] = deque()
+        self._older: deque[float] = deque()
+        self._recent_sum = 0.0
+        self._older_sum = 0.0
+
+    def append(self, entry: dict[str, Any]) -> None:
+        self._entries.append(entry)
+        score = float(entry["sentiment"])
+        if len(self._recent) == self.block:
+            moved = self._recent.popleft()
+            self._recent_sum -= moved
+            self._older.append(moved)
+            self._older_sum += moved
+            if len(self._older) > self.block:
+                self._older_sum -= self._older.popleft()
+        self._recent.append(score)
+        self._recent_sum += score
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._recent.clear()
+        self._older.clear()
+        self._recent_sum = self._older_sum = 0.0
+
+    def averages(self, min_older: int = 5) -> tuple[float, float] | None:
+        """Return ``(recent_avg, older_avg)`` once both blocks have enough scores."""
+        if len(self._recent) < self.block or len(self._older) < min_older:
+            return None
+        return self._recent_sum / len(self._recent), self._older_sum / len(self._older)
+
+
+class RollingSum:
+    """Running total of the last ``size`` values."""
+
+    def __init__(self, size: int) -> None:
+        self._values: deque[int] = deque(maxlen=size)
+        self.total = 0
+
+    def push(self, value: int) -> None:
+        if len(self._values) == self._values.maxlen:
+            self.total -= self._values[0]
+        self._values.append(value)
+        self.total += value
+
+    def clear(self) -> None:
+        self._values.clear()
+        self.total = 0
+
+
+def count_laughter(text: str, keywords: Sequence[str]) -> tuple[int, int]:
+    """Return ``(keyword_hits, indicators)`` for one message.
+
+    ``keywords`` must already be lower-cased. Indicators add repeated-character
+    runs ("hahaha", "!!!") and laughing emoji to the keyword hits.
+    """
+    lowered = text.lower()
+    hits = sum(lowered.count(keyword) for keyword in keywords)
+    indicators = hits + len(_REPEATED_CHARS_RE.findall(lowered)) + len(_LAUGH_EMOJI_RE.findall(text))
+    return hits, indicators
+
+
+def score_sentiment_batch(texts: Sequence[str]) -> list[SentimentScore]:
+    """Keyword sentiment for many messages in one call.
+
+    Each message scores +/-0.2 per distinct positive/negative keyword it
+    contains (capped at 1.0); ties are neutral.
+    """
+    scores: list[SentimentScore] = []
+    for text in texts:
+        found = set(_SENTIMENT_RE.findall(text.lower()))
+        positive = len(found & _POSITIVE)
+        negative = len(found) - positive
+        if positive > negative:
+            score, label = min(1.0, positive / 5.0), "positive"
+        elif negative > positive:
+            score, label = max(-1.0, -negative / 5.0), "negative"
+        else:
+            score, label = 0.0, "neutral"
+        scores.append(SentimentScore(score=score, confidence=abs(score), label=label, keywords=sorted(found)))
+    return scores
+
+
+__all__ = [
+    "NEGATIVE_KEYWORDS",
+    "POSITIVE_KEYWORDS",
+    "ChatWindow",
+    "RollingSum",
+    "SentimentWindow",
+    "count_laughter",
+    "score_sentiment_batch",
+]
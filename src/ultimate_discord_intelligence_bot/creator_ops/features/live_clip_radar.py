@@ -6,10 +6,9 @@ Provides automatic detection of viral moments and clip generation for live strea
 import asyncio
 import contextlib
 import logging
-import re
 import uuid
-from collections import defaultdict, deque
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from datetime import datetime, timedelta
 
 from ultimate_discord_intelligence_bot.creator_ops.config import CreatorOpsConfig
@@ -25,6 +24,13 @@ from ultimate_discord_intelligence_bot.creator_ops.features.clip_radar_models im
     StreamStatus,
     ViralMoment,
 )
+from ultimate_discord_intelligence_bot.creator_ops.features.clip_radar_signals import (
+    ChatWindow,
+    RollingSum,
+    SentimentWindow,
+    count_laughter,
+    score_sentiment_batch,
+)
 from ultimate_discord_intelligence_bot.creator_ops.integrations.twitch_client import TwitchClient
 from ultimate_discord_intelligence_bot.creator_ops.integrations.youtube_client import YouTubeClient
 from ultimate_discord_intelligence_bot.creator_ops.media import NLPPipeline, SpeakerDiarization, WhisperASR
@@ -34,6 +40,9 @@ from ultimate_discord_intelligence_bot.step_result import StepResult
 
 logger = logging.getLogger(__name__)
 
+# Chat messages from one poll are scored for sentiment in chunks of this size.
+SENTIMENT_BATCH_SIZE = 256
+
 
 class LiveClipRadar:
     """Main class for Live Clip Radar functionality."""
@@ -48,8 +57,10 @@ class LiveClipRadar:
         self.nlp_pipeline = NLPPipeline(config)
         self.monitoring_configs: dict[str, MonitoringConfig] = {}
         self.active_streams: dict[str, StreamInfo] = {}
-        self.chat_queues: dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
-        self.sentiment_history: dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        self.chat_queues: dict[str, ChatWindow] = defaultdict(ChatWindow)
+        self.sentiment_history: dict[str, SentimentWindow] = defaultdict(SentimentWindow)
+        self.laughter_windows: dict[str, RollingSum] = defaultdict(lambda: RollingSum(20))
+        self.sentiment_scorer: Callable[[Sequence[str]], list[SentimentScore]] = score_sentiment_batch
         self.monitoring_tasks: dict[str, asyncio.Task] = {}
         self.viral_moments: list[ViralMoment] = []
         self.clip_candidates: list[ClipCandidate] = []
@@ -122,6 +133,7 @@ class LiveClipRadar:
                 del self.chat_queues[stream_key]
             if stream_key in self.sentiment_history:
                 del self.sentiment_history[stream_key]
+            self.laughter_windows.pop(stream_key, None)
             logger.info(f"Stopped monitoring {stream_key}")
             return StepResult.ok(data={"stream_key": stream_key})
         except Exception as e:
@@ -150,6 +162,7 @@ class LiveClipRadar:
             if not chat_result.success:
                 logger.error(f"Failed to get YouTube live chat: {chat_result.error}")
                 return
+            messages = []
             for message_data in chat_result.data.get("messages", []):
                 chat_message = ChatMessage(
                     message_id=message_data.get("id", ""),
@@ -163,7 +176,8 @@ class LiveClipRadar:
                     emotes=self._extract_emotes(message_data.get("displayMessage", "")),
                     metadata=message_data,
                 )
-                await self._process_chat_message(stream_key, chat_message, config)
+                messages.append(chat_message)
+            await self._process_chat_batch(stream_key, messages, config)
             await asyncio.sleep(5)
         except Exception as e:
             logger.error(f"YouTube stream monitoring error: {e!s}")
@@ -175,6 +189,7 @@ class LiveClipRadar:
             if not chat_result.success:
                 logger.error(f"Failed to get Twitch chat: {chat_result.error}")
                 return
+            messages = []
             for message_data in chat_result.data.get("messages", []):
                 chat_message = ChatMessage(
                     message_id=message_data.get("id", ""),
@@ -189,22 +204,32 @@ class LiveClipRadar:
                     badges=message_data.get("badges", []),
                     metadata=message_data,
                 )
-                await self._process_chat_message(stream_key, chat_message, config)
+                messages.append(chat_message)
+            await self._process_chat_batch(stream_key, messages, config)
             await asyncio.sleep(3)
         except Exception as e:
             logger.error(f"Twitch stream monitoring error: {e!s}")
 
     async def _process_chat_message(self, stream_key: str, message: ChatMessage, config: MonitoringConfig) -> None:
         """Process a chat message for viral moment detection."""
-        try:
-            self.chat_queues[stream_key].append(message)
-            sentiment = await self._analyze_sentiment(message.message)
-            self.sentiment_history[stream_key].append(
-                {"timestamp": message.timestamp, "sentiment": sentiment.score, "message": message.message}
-            )
-            await self._check_viral_moments(stream_key, message, sentiment, config)
-        except Exception as e:
-            logger.error(f"Failed to process chat message: {e!s}")
+        await self._process_chat_batch(stream_key, [message], config)
+
+    async def _process_chat_batch(
+        self, stream_key: str, messages: Sequence[ChatMessage], config: MonitoringConfig
+    ) -> None:
+        """Process chat messages in arrival order, scoring sentiment per chunk."""
+        for start in range(0, len(messages), SENTIMENT_BATCH_SIZE):
+            chunk = messages[start : start + SENTIMENT_BATCH_SIZE]
+            sentiments = await self._analyze_sentiment_batch([message.message for message in chunk])
+            for message, sentiment in zip(chunk, sentiments, strict=True):
+                try:
+                    self.chat_queues[stream_key].append(message)
+                    self.sentiment_history[stream_key].append(
+                        {"timestamp": message.timestamp, "sentiment": sentiment.score, "message": message.message}
+                    )
+                    await self._check_viral_moments(stream_key, message, sentiment, config)
+                except Exception as e:
+                    logger.error(f"Failed to process chat message: {e!s}")
 
     async def _check_viral_moments(
         self, stream_key: str, trigger_message: ChatMessage, sentiment: SentimentScore, config: MonitoringConfig
@@ -229,10 +254,7 @@ class LiveClipRadar:
         """Check for chat velocity spikes."""
         try:
             chat_queue = self.chat_queues[stream_key]
-            now = trigger_message.timestamp
-            one_minute_ago = now - timedelta(minutes=1)
-            recent_messages = [msg for msg in chat_queue if msg.timestamp >= one_minute_ago]
-            current_velocity = len(recent_messages)
+            current_velocity = chat_queue.count_since(trigger_message.timestamp - timedelta(minutes=1))
             baseline = self._calculate_baseline_velocity(stream_key)
             if baseline > 0 and current_velocity > baseline * config.chat_velocity_threshold:
                 velocity_ratio = current_velocity / baseline
@@ -245,7 +267,7 @@ class LiveClipRadar:
                     stream_id=trigger_message.stream_id,
                     confidence=min(1.0, velocity_ratio / config.chat_velocity_threshold),
                     trigger_message=trigger_message,
-                    context_messages=list(recent_messages[-10:]),
+                    context_messages=chat_queue.tail(10),
                     metrics={
                         "current_velocity": current_velocity,
                         "baseline_velocity": baseline,
@@ -264,15 +286,10 @@ class LiveClipRadar:
     ) -> ViralMoment | None:
         """Check for sentiment flips."""
         try:
-            sentiment_history = self.sentiment_history[stream_key]
-            if len(sentiment_history) < 10:
+            averages = self.sentiment_history[stream_key].averages()
+            if averages is None:
                 return None
-            recent_sentiments = [entry["sentiment"] for entry in list(sentiment_history)[-10:]]
-            avg_recent = sum(recent_sentiments) / len(recent_sentiments)
-            older_sentiments = [entry["sentiment"] for entry in list(sentiment_history)[-20:-10]]
-            if len(older_sentiments) < 5:
-                return None
-            avg_older = sum(older_sentiments) / len(older_sentiments)
+            avg_recent, avg_older = averages
             sentiment_change = abs(avg_recent - avg_older)
             if sentiment_change > config.sentiment_flip_threshold:
                 flip_type = "positive_surge" if avg_recent > avg_older else "negative_surge"
@@ -285,7 +302,7 @@ class LiveClipRadar:
                     stream_id=trigger_message.stream_id,
                     confidence=min(1.0, sentiment_change / config.sentiment_flip_threshold),
                     trigger_message=trigger_message,
-                    context_messages=list(self.chat_queues[stream_key])[-10:],
+                    context_messages=self.chat_queues[stream_key].tail(10),
                     metrics={
                         "sentiment_change": sentiment_change,
                         "previous_avg": avg_older,
@@ -305,21 +322,12 @@ class LiveClipRadar:
     ) -> ViralMoment | None:
         """Check for laughter indicators."""
         try:
-            message_lower = trigger_message.message.lower()
-            laughter_count = 0
-            for keyword in config.laughter_keywords:
-                laughter_count += message_lower.count(keyword.lower())
-            repeated_patterns = re.findall("(.)\\1{2,}", message_lower)
-            laughter_count += len(repeated_patterns)
-            emoji_patterns = re.findall("[😂🤣😆😄😃😀]", trigger_message.message)
-            laughter_count += len(emoji_patterns)
+            keywords = [keyword.lower() for keyword in config.laughter_keywords]
+            keyword_hits, laughter_count = count_laughter(trigger_message.message, keywords)
+            laughter_window = self.laughter_windows[stream_key]
+            laughter_window.push(keyword_hits)
             if laughter_count > 0:
-                recent_messages = list(self.chat_queues[stream_key])[-20:]
-                total_laughter = 0
-                for msg in recent_messages:
-                    msg_lower = msg.message.lower()
-                    for keyword in config.laughter_keywords:
-                        total_laughter += msg_lower.count(keyword.lower())
+                total_laughter = laughter_window.total
                 confidence = min(1.0, laughter_count / 5.0)
                 if confidence > config.detection_sensitivity:
                     moment = ViralMoment(
@@ -331,7 +339,7 @@ class LiveClipRadar:
                         stream_id=trigger_message.stream_id,
                         confidence=confidence,
                         trigger_message=trigger_message,
-                        context_messages=list(recent_messages[-5:]),
+                        context_messages=self.chat_queues[stream_key].tail(5),
                         metrics={
                             "laughter_count": laughter_count,
                             "total_laughter": total_laughter,
@@ -507,28 +515,15 @@ class LiveClipRadar:
 
     async def _analyze_sentiment(self, text: str) -> SentimentScore:
         """Analyze sentiment of text."""
+        return (await self._analyze_sentiment_batch([text]))[0]
+
+    async def _analyze_sentiment_batch(self, texts: Sequence[str]) -> list[SentimentScore]:
+        """Analyze sentiment of several texts with one scorer call."""
         try:
-            positive_keywords = ["good", "great", "awesome", "amazing", "love", "best", "excellent"]
-            negative_keywords = ["bad", "terrible", "awful", "hate", "worst", "horrible", "disgusting"]
-            text_lower = text.lower()
-            positive_count = sum(1 for word in positive_keywords if word in text_lower)
-            negative_count = sum(1 for word in negative_keywords if word in text_lower)
-            if positive_count > negative_count:
-                score = min(1.0, positive_count / 5.0)
-                label = "positive"
-            elif negative_count > positive_count:
-                score = max(-1.0, -negative_count / 5.0)
-                label = "negative"
-            else:
-                score = 0.0
-                label = "neutral"
-            confidence = abs(score)
-            return SentimentScore(
-                score=score, confidence=confidence, label=label, keywords=positive_keywords + negative_keywords
-            )
+            return self.sentiment_scorer(texts)
         except Exception as e:
             logger.error(f"Failed to analyze sentiment: {e!s}")
-            return SentimentScore(score=0.0, confidence=0.0, label="neutral")
+            return [SentimentScore(score=0.0, confidence=0.0, label="neutral") for _ in texts]
 
     def _extract_emotes(self, message: str) -> list[str]:
         """Extract emotes from a message."""
@@ -605,16 +600,9 @@ class LiveClipRadar:
         """Calculate baseline chat velocity for a stream."""
         try:
             chat_queue = self.chat_queues[stream_key]
-            if len(chat_queue) < 10:
-                return 1.0
-            now = datetime.now()
-            ten_minutes_ago = now - timedelta(minutes=10)
-            recent_messages = [msg for msg in chat_queue if msg.timestamp >= ten_minutes_ago]
-            if len(recent_messages) < 5:
+            if len(chat_queue) < 10 or chat_queue.total < 5:
                 return 1.0
-            time_span = (now - ten_minutes_ago).total_seconds() / 60.0
-            velocity = len(recent_messages) / time_span
-            return max(1.0, velocity)
+            return max(1.0, chat_queue.rate_per_minute())
         except Exception as e:
             logger.error(f"Failed to calculate baseline velocity: {e!s}")
             return 1.0
@@ -653,6 +641,7 @@ class LiveClipRadar:
             self.clip_candidates.clear()
             self.chat_queues.clear()
             self.sentiment_history.clear()
+            self.laughter_windows.clear()
             self.baseline_metrics.clear()
             self.moment_callbacks.clear()
             self.clip_callbacks.clear()
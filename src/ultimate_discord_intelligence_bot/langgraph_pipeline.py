@@ -177,12 +177,14 @@ def verification_node(state: MissionState) -> dict:
         print("--- No claims to verify ---")
         return {"verification_result": StepResult.ok(data={"verified_claims": []})}
 
+    claims = claims_result.data.get("claims", [])
     verified_claims = []
-    for claim in claims_result.data.get("claims", []):
-        fact_check_result = _run_with_retries(
-            lambda claim_text=claim: fact_checker.run(claim=claim_text),
-            step_name="fact_check",
-        )
+    for claim, fact_check_result in zip(claims, fact_checker.run_many(claims), strict=True):
+        if not fact_check_result.success and fact_check_result.should_retry(1):
+            fact_check_result = _run_with_retries(
+                lambda claim_text=claim: fact_checker.run(claim=claim_text),
+                step_name="fact_check",
+            )
         if fact_check_result.success:
             verified_claims.append(fact_check_result.data)
 
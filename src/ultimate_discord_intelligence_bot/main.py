@@ -13,8 +13,21 @@ if callable(ensure_platform_proxy):  # type: ignore
     with suppress(Exception):
         ensure_platform_proxy()  # type: ignore
 
-from domains.orchestration.crew import get_crew
-from ultimate_discord_intelligence_bot.enhanced_crew_integration import execute_crew_with_quality_monitoring
+
+def get_crew():
+    """Return the crew factory, importing the crew and its tools on first use."""
+    from domains.orchestration.crew import get_crew as _get_crew
+
+    return _get_crew()
+
+
+async def execute_crew_with_quality_monitoring(**kwargs):
+    """Run the crew with quality monitoring; imported lazily to keep startup cheap."""
+    from ultimate_discord_intelligence_bot.enhanced_crew_integration import (
+        execute_crew_with_quality_monitoring as _execute,
+    )
+
+    return await _execute(**kwargs)
 
 
 def create_app():
@@ -53,6 +53,9 @@ class _Metric(Protocol):
 
 
 class _NoOpMetric:
+    def labels(self, *args: Any, **kwargs: Any) -> _NoOpMetric:
+        return self
+
     def inc(self, *args: Any, **kwargs: Any) -> None:
         return None
 
@@ -175,6 +178,13 @@ def get_metrics() -> _MetricsFacade:
         return _MetricsFacade(None)
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve module-level metric constants (``metrics.ROUTER_DECISIONS``) through the facade."""
+    if name.isupper():
+        return getattr(get_metrics(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "CACHE_HITS",
     "CACHE_HIT_RATE_RATIO",
@@ -3,7 +3,7 @@
 Re-exports from platform.observability.tracing for backward compatibility.
 """
 
-from platform.observability.tracing import init_tracing, trace_call
+from platform.observability.tracing import init_tracing, start_span, trace_call
 
 
-__all__ = ["init_tracing", "trace_call"]
+__all__ = ["init_tracing", "start_span", "trace_call"]
@@ -21,6 +21,7 @@ from crewai import Crew, Process, Task
 # Import functions from the new focused modules for backward compatibility
 from .agent_managers import get_or_create_agent, populate_agent_tool_context
 from .crew_builders_focused import (
+    INTELLIGENCE_CREW_AGENTS,
     build_crew_with_tasks,
     build_intelligence_crew,
     create_acquisition_task,
@@ -35,6 +36,7 @@ logger = logging.getLogger(__name__)
 
 # Export all functions for backward compatibility
 __all__ = [
+    "INTELLIGENCE_CREW_AGENTS",
     # CrewAI types
     "Crew",
     "Process",
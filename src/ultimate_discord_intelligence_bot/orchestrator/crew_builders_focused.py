@@ -16,6 +16,15 @@ from crewai import Crew, Process, Task
 
 logger = logging.getLogger(__name__)
 
+# Agents used by the chained intelligence crew, in task order.
+INTELLIGENCE_CREW_AGENTS: tuple[str, ...] = (
+    "acquisition_specialist",
+    "transcription_engineer",
+    "analysis_cartographer",
+    "verification_director",
+    "knowledge_integrator",
+)
+
 
 def create_acquisition_task(agent: Any, callback: Any | None = None, content_url: str | None = None) -> Task:
     """Create the content acquisition task.
@@ -175,6 +184,7 @@ def build_intelligence_crew(
     enable_parallel_memory_ops: bool = False,
     enable_parallel_analysis: bool = False,
     enable_parallel_fact_checking: bool = False,
+    agents: dict[str, Any] | None = None,
 ) -> Crew:
     """Build a complete intelligence crew with optimized parallel execution.
 
@@ -190,6 +200,8 @@ def build_intelligence_crew(
         enable_parallel_memory_ops: Enable parallel memory operations
         enable_parallel_analysis: Enable parallel analysis tasks
         enable_parallel_fact_checking: Enable parallel fact checking
+        agents: Pre-built agents keyed by ``INTELLIGENCE_CREW_AGENTS`` names,
+            e.g. leased from a crew template; only fresh tasks are created
 
     Returns:
         Configured Crew instance with optimized task execution
@@ -222,25 +234,15 @@ def build_intelligence_crew(
         _logger.info(
             f"📈 Expected performance improvement: {perf_estimate['estimated_time_savings_percent']:.1f}% time savings"
         )
-    if agent_getter_callback:
-        agents = {
-            "acquisition_specialist": agent_getter_callback("acquisition_specialist"),
-            "transcription_engineer": agent_getter_callback("transcription_engineer"),
-            "analysis_cartographer": agent_getter_callback("analysis_cartographer"),
-            "verification_director": agent_getter_callback("verification_director"),
-            "knowledge_integrator": agent_getter_callback("knowledge_integrator"),
-        }
+    if agents is not None:
+        agents = dict(agents)
+    elif agent_getter_callback:
+        agents = {name: agent_getter_callback(name) for name in INTELLIGENCE_CREW_AGENTS}
     else:
         from ..crew_core import UltimateDiscordIntelligenceBotCrew
 
         crew_instance = UltimateDiscordIntelligenceBotCrew()
-        agents = {
-            "acquisition_specialist": crew_instance.acquisition_specialist(),
-            "transcription_engineer": crew_instance.transcription_engineer(),
-            "analysis_cartographer": crew_instance.analysis_cartographer(),
-            "verification_director": crew_instance.verification_director(),
-            "knowledge_integrator": crew_instance.knowledge_integrator(),
-        }
+        agents = {name: getattr(crew_instance, name)() for name in INTELLIGENCE_CREW_AGENTS}
     tasks = []
     acquisition_task = create_acquisition_task(
         agent=agents["acquisition_specialist"], callback=task_completion_callback, content_url=url
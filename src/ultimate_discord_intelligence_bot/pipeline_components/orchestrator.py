@@ -9,6 +9,7 @@ from contextlib import ExitStack, contextmanager, suppress
 from dataclasses import dataclass, field
 from pathlib import Path
 from platform.config.configuration import get_config
+from platform.observability.payload_sanitizer import PayloadSanitizer
 from typing import TYPE_CHECKING, Any, cast
 
 from ultimate_discord_intelligence_bot.obs import metrics
@@ -47,6 +48,7 @@ class _PipelineContext:
     langfuse_trace_finalized: bool = False
     langfuse_trace_output: dict[str, Any] | None = None
     langfuse_trace_error: str | None = None
+    langfuse_sanitizer: PayloadSanitizer = field(default_factory=PayloadSanitizer)
 
 
 @dataclass
@@ -81,16 +83,12 @@ class ContentPipeline(PipelineExecutionMixin, PipelineBase):
         super().__init__(*args, **kwargs)
         self._active_pipeline_ctx: _PipelineContext | None = None
 
-    def _langfuse_prepare_payload(self, value: Any) -> Any:
-        if isinstance(value, StepResult):
-            return self._langfuse_prepare_payload(value.to_dict())
-        if isinstance(value, dict):
-            return {str(k): self._langfuse_prepare_payload(v) for k, v in value.items()}
-        if isinstance(value, (list, tuple, set)):
-            return [self._langfuse_prepare_payload(v) for v in value]
-        if isinstance(value, (str, int, float, bool)) or value is None:
-            return value
-        return str(value)
+    def _langfuse_prepare_payload(self, value: Any, ctx: _PipelineContext | None = None) -> Any:
+        # Results are reported by several spans and the final trace; the
+        # per-run sanitizer converts each one once and caps payload size.
+        if ctx is None:
+            return PayloadSanitizer().prepare(value)
+        return ctx.langfuse_sanitizer.prepare(value)
 
     def _langfuse_start_span(
         self, ctx: _PipelineContext, name: str, input_data: dict[str, Any], metadata: dict[str, Any] | None = None
@@ -102,8 +100,9 @@ class ContentPipeline(PipelineExecutionMixin, PipelineBase):
         result = service.create_span(
             trace,
             name,
-            self._langfuse_prepare_payload(input_data),
-            metadata=self._langfuse_prepare_payload(metadata or {}),
+            self._langfuse_prepare_payload(input_data, ctx),
+            metadata=self._langfuse_prepare_payload(metadata or {}, ctx),
+            sanitizer=ctx.langfuse_sanitizer,
         )
         if result.success:
             span = result.data.get("span")
@@ -119,8 +118,8 @@ class ContentPipeline(PipelineExecutionMixin, PipelineBase):
         span = ctx.langfuse_spans.pop(name, None)
         if not span:
             return
-        payload = self._langfuse_prepare_payload(output_data or {})
-        service.update_span(span, payload, error=error)
+        payload = self._langfuse_prepare_payload(output_data or {}, ctx)
+        service.update_span(span, payload, error=error, sanitizer=ctx.langfuse_sanitizer)
 
     def _langfuse_error_message(self, payload: Any) -> str | None:
         if isinstance(payload, dict):
@@ -136,16 +135,20 @@ class ContentPipeline(PipelineExecutionMixin, PipelineBase):
         if ctx is None or not ctx.langfuse_service or (not ctx.langfuse_trace):
             return
         service = ctx.langfuse_service
-        sanitized = self._langfuse_prepare_payload(payload)
+        sanitized = self._langfuse_prepare_payload(payload, ctx)
         ctx.langfuse_trace_output = sanitized
         error_message = ctx.langfuse_trace_error
         if status != "success":
             error_message = error_message or self._langfuse_error_message(payload)
         metadata = {"duration_seconds": duration, "status": status}
         if ctx.langfuse_pipeline_span:
-            service.update_span(ctx.langfuse_pipeline_span, sanitized, error=error_message)
+            service.update_span(
+                ctx.langfuse_pipeline_span, sanitized, error=error_message, sanitizer=ctx.langfuse_sanitizer
+            )
             ctx.langfuse_pipeline_span = None
-        service.finalize_trace(ctx.langfuse_trace, sanitized, error=error_message, metadata=metadata)
+        service.finalize_trace(
+            ctx.langfuse_trace, sanitized, error=error_message, metadata=metadata, sanitizer=ctx.langfuse_sanitizer
+        )
         ctx.langfuse_trace_finalized = True
         ctx.langfuse_trace_error = error_message
 
@@ -187,6 +190,8 @@ class ContentPipeline(PipelineExecutionMixin, PipelineBase):
             langfuse_service = getattr(self, "langfuse_service", None)
             langfuse_trace = None
             langfuse_pipeline_span = None
+            new_sanitizer = getattr(langfuse_service, "new_payload_sanitizer", None)
+            sanitizer = new_sanitizer() if callable(new_sanitizer) else PayloadSanitizer()
             if langfuse_service and getattr(langfuse_service, "enabled", False):
                 tenant_ctx = current_tenant()
                 tenant_id = getattr(tenant_ctx, "tenant_id", None) if tenant_ctx else None
@@ -198,6 +203,7 @@ class ContentPipeline(PipelineExecutionMixin, PipelineBase):
                     metadata={"orchestrator": self._orchestrator, "workspace": workspace_id},
                     input_data={"url": url, "quality": quality},
                     tags=[self._orchestrator],
+                    sanitizer=sanitizer,
                 )
                 if trace_result.success:
                     langfuse_trace = trace_result.data.get("trace")
@@ -206,6 +212,7 @@ class ContentPipeline(PipelineExecutionMixin, PipelineBase):
                         "pipeline_execution",
                         {"url": url, "quality": quality},
                         metadata={"phase": "pipeline_start"},
+                        sanitizer=sanitizer,
                     )
                     if span_result.success:
                         langfuse_pipeline_span = span_result.data.get("span")
@@ -216,6 +223,7 @@ class ContentPipeline(PipelineExecutionMixin, PipelineBase):
                 langfuse_service=langfuse_service,
                 langfuse_trace=langfuse_trace,
                 langfuse_pipeline_span=langfuse_pipeline_span,
+                langfuse_sanitizer=sanitizer,
             )
             self._active_pipeline_ctx = ctx
             try:
@@ -233,6 +241,7 @@ class ContentPipeline(PipelineExecutionMixin, PipelineBase):
                 raise
             finally:
                 self._active_pipeline_ctx = None
+                ctx.langfuse_sanitizer.clear()
                 if langfuse_service and ctx.langfuse_pipeline_span and (not ctx.langfuse_trace_finalized):
                     langfuse_service.update_span(
                         ctx.langfuse_pipeline_span,
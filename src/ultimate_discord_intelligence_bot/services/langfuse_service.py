@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
+from collections.abc import Callable
 from platform.config.settings import SecureConfig, get_settings
+from platform.observability.background_exporter import BackgroundExporter
+from platform.observability.payload_sanitizer import PayloadBudget, PayloadSanitizer
 from typing import Any
 
 from ultimate_discord_intelligence_bot.obs import metrics
@@ -22,31 +24,48 @@ except Exception as exc:
     _LANGFUSE_IMPORT_ERROR = exc
 
 
-def _sanitize(value: Any) -> Any:
-    """Sanitize values for Langfuse payloads (best-effort)."""
-    if isinstance(value, StepResult):
-        return _sanitize(value.to_dict())
-    if isinstance(value, dict):
-        return {str(k): _sanitize(v) for k, v in value.items()}
-    if isinstance(value, (list, tuple, set)):
-        return [_sanitize(v) for v in value]
-    if isinstance(value, (str, int, float, bool)) or value is None:
-        return value
+# A queued export: the client call plus the metric hook to run if it raises.
+_Export = tuple[Callable[[], None], Callable[[], None]]
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, ""))
+    except ValueError:
+        return default
+
+
+def _count_span(status: str) -> None:
     try:
-        json.dumps(value)
-        return value
+        metrics.LANGFUSE_SPANS.labels(**metrics.label_ctx(), status=status).inc()
     except Exception:
-        return str(value)
+        logger.debug("Langfuse span metric emit failed (%s)", status, exc_info=True)
 
 
 class LangfuseService:
-    """Feature-flagged Langfuse exporter that complies with ``StepResult`` semantics."""
+    """Feature-flagged Langfuse exporter that complies with ``StepResult`` semantics.
+
+    Payloads are sanitized under a :class:`PayloadBudget` (``TRACE_PAYLOAD_*``
+    env vars). Span updates and trace finalization are shipped by a bounded
+    background exporter (``LANGFUSE_EXPORT_ASYNC``, ``LANGFUSE_EXPORT_QUEUE_SIZE``,
+    ``LANGFUSE_EXPORT_BATCH_SIZE``, ``LANGFUSE_EXPORT_FLUSH_INTERVAL``) that
+    flushes the client once per batch and drops on overflow.
+    """
 
     def __init__(self, settings: SecureConfig | None = None) -> None:
         self._settings = settings or get_settings()
         self.enabled = bool(getattr(self._settings, "enable_langfuse_export", False))
         self._client: Any | None = None
         self._import_error: Exception | None = _LANGFUSE_IMPORT_ERROR
+        self.payload_budget = PayloadBudget.from_env()
+        self._exporter: BackgroundExporter[_Export] | None = None
         self.public_key = getattr(self._settings, "langfuse_public_key", None) or os.getenv("LANGFUSE_PUBLIC_KEY")
         self.secret_key = getattr(self._settings, "langfuse_secret_key", None) or os.getenv("LANGFUSE_SECRET_KEY")
         self.base_url = getattr(self._settings, "langfuse_base_url", None) or os.getenv("LANGFUSE_BASE_URL")
@@ -70,6 +89,22 @@ class LangfuseService:
             logger.warning("Failed to initialize Langfuse client: %s", exc)
             self._import_error = exc
             self.enabled = False
+            return
+        if _env_flag("LANGFUSE_EXPORT_ASYNC", True):
+            self._exporter = BackgroundExporter(
+                self._export_batch,
+                name="langfuse",
+                max_queue_size=int(_env_number("LANGFUSE_EXPORT_QUEUE_SIZE", 1000)),
+                batch_size=int(_env_number("LANGFUSE_EXPORT_BATCH_SIZE", 50)),
+                flush_interval=_env_number("LANGFUSE_EXPORT_FLUSH_INTERVAL", 1.0),
+            )
+
+    def new_payload_sanitizer(self) -> PayloadSanitizer:
+        """Return a sanitizer for one pipeline run, sharing this service's budget."""
+        return PayloadSanitizer(self.payload_budget)
+
+    def _prepare(self, value: Any, sanitizer: PayloadSanitizer | None) -> Any:
+        return (sanitizer or PayloadSanitizer(self.payload_budget)).prepare(value)
 
     def create_trace(
         self,
@@ -79,11 +114,12 @@ class LangfuseService:
         metadata: dict[str, Any] | None = None,
         input_data: dict[str, Any] | None = None,
         tags: list[str] | None = None,
+        sanitizer: PayloadSanitizer | None = None,
     ) -> StepResult:
         if not self._client or not self.enabled or CreateTrace is None:
             return StepResult.skip(reason="langfuse_disabled")
-        metadata = _sanitize(metadata or {})
-        input_payload = _sanitize(input_data or {})
+        metadata = self._prepare(metadata or {}, sanitizer)
+        input_payload = self._prepare(input_data or {}, sanitizer)
         tags = tags or []
         try:
             trace = self._client.trace(
@@ -109,24 +145,24 @@ class LangfuseService:
             )
 
     def create_span(
-        self, trace: Any, name: str, input_data: dict[str, Any], *, metadata: dict[str, Any] | None = None
+        self,
+        trace: Any,
+        name: str,
+        input_data: dict[str, Any],
+        *,
+        metadata: dict[str, Any] | None = None,
+        sanitizer: PayloadSanitizer | None = None,
     ) -> StepResult:
         if not self._client or not self.enabled or CreateSpan is None or (trace is None):
             return StepResult.skip(reason="langfuse_disabled")
-        metadata = _sanitize(metadata or {})
-        input_payload = _sanitize(input_data)
+        metadata = self._prepare(metadata or {}, sanitizer)
+        input_payload = self._prepare(input_data, sanitizer)
         try:
             span = trace.span(CreateSpan(name=name, input=input_payload, metadata=metadata))
-            try:
-                metrics.LANGFUSE_SPANS.labels(**metrics.label_ctx(), status="started").inc()
-            except Exception:
-                logger.debug("Langfuse span metric emit failed", exc_info=True)
+            _count_span("started")
             return StepResult.ok(span=span, span_name=name)
         except Exception as exc:
-            try:
-                metrics.LANGFUSE_SPANS.labels(**metrics.label_ctx(), status="error").inc()
-            except Exception:
-                logger.debug("Langfuse span metric emit failed (error)", exc_info=True)
+            _count_span("error")
             return StepResult.with_context(
                 success=False,
                 error=f"Langfuse span creation failed: {exc}",
@@ -134,31 +170,25 @@ class LangfuseService:
                 context=ErrorContext(operation="langfuse_span", component="langfuse", tenant=name, workspace=name),
             )
 
-    def update_span(self, span: Any, output_data: dict[str, Any] | None = None, error: str | None = None) -> StepResult:
+    def update_span(
+        self,
+        span: Any,
+        output_data: dict[str, Any] | None = None,
+        error: str | None = None,
+        *,
+        sanitizer: PayloadSanitizer | None = None,
+    ) -> StepResult:
         if not self._client or not self.enabled or UpdateSpan is None or (span is None):
             return StepResult.skip(reason="langfuse_disabled")
-        output_payload = _sanitize(output_data or {})
-        try:
+        output_payload = self._prepare(output_data or {}, sanitizer)
+
+        def export() -> None:
             span.update(UpdateSpan(output=output_payload, level="ERROR" if error else "DEFAULT", status_message=error))
-            self.flush()
-            try:
-                metrics.LANGFUSE_SPANS.labels(
-                    **metrics.label_ctx(), status="completed" if not error else "errored"
-                ).inc()
-            except Exception:
-                logger.debug("Langfuse span completion metric emit failed", exc_info=True)
-            return StepResult.ok()
-        except Exception as exc:
-            try:
-                metrics.LANGFUSE_SPANS.labels(**metrics.label_ctx(), status="update_error").inc()
-            except Exception:
-                logger.debug("Langfuse span metric emit failed (update error)", exc_info=True)
-            return StepResult.with_context(
-                success=False,
-                error=f"Langfuse span update failed: {exc}",
-                error_category=ErrorCategory.DEPENDENCY_FAILURE,
-                context=ErrorContext(operation="langfuse_span", component="langfuse"),
-            )
+            _count_span("completed" if not error else "errored")
+
+        return self._dispatch(
+            (export, lambda: _count_span("update_error")), "Langfuse span update failed", operation="langfuse_span"
+        )
 
     def finalize_trace(
         self,
@@ -166,33 +196,68 @@ class LangfuseService:
         output_data: dict[str, Any] | None = None,
         error: str | None = None,
         metadata: dict[str, Any] | None = None,
+        *,
+        sanitizer: PayloadSanitizer | None = None,
     ) -> StepResult:
         if not self._client or not self.enabled or trace is None:
             return StepResult.skip(reason="langfuse_disabled")
-        try:
-            payload: dict[str, Any] = {"output": _sanitize(output_data or {})}
-            metadata_payload = _sanitize(metadata or {})
-            if metadata_payload:
-                payload["metadata"] = metadata_payload
-            status = "ERROR" if error else "SUCCESS"
-            payload["status"] = status
-            if error:
-                payload["status_message"] = error
+        payload: dict[str, Any] = {"output": self._prepare(output_data or {}, sanitizer)}
+        metadata_payload = self._prepare(metadata or {}, sanitizer)
+        if metadata_payload:
+            payload["metadata"] = metadata_payload
+        status = "ERROR" if error else "SUCCESS"
+        payload["status"] = status
+        if error:
+            payload["status_message"] = error
+
+        def export() -> None:
             if UpdateTrace is not None:
                 trace.update(UpdateTrace(**payload))
             else:
                 trace.update(**payload)
-            self.flush()
+
+        return self._dispatch((export, lambda: None), "Langfuse trace update failed", operation="langfuse_trace")
+
+    def _dispatch(self, item: _Export, failure: str, *, operation: str) -> StepResult:
+        """Queue ``item`` for background export, or run it inline when export is synchronous."""
+        if self._exporter is not None:
+            if self._exporter.submit(item):
+                return StepResult.ok(queued=True)
+            return StepResult.skip(reason="langfuse_export_queue_full")
+        export, on_error = item
+        try:
+            export()
+            self._flush_client()
             return StepResult.ok()
         except Exception as exc:
+            on_error()
             return StepResult.with_context(
                 success=False,
-                error=f"Langfuse trace update failed: {exc}",
+                error=f"{failure}: {exc}",
                 error_category=ErrorCategory.DEPENDENCY_FAILURE,
-                context=ErrorContext(operation="langfuse_trace", component="langfuse"),
+                context=ErrorContext(operation=operation, component="langfuse"),
             )
 
-    def flush(self) -> None:
+    def _export_batch(self, batch: list[_Export]) -> None:
+        for export, on_error in batch:
+            try:
+                export()
+            except Exception:
+                on_error()
+                logger.debug("Langfuse export failed", exc_info=True)
+        self._flush_client()
+
+    def export_stats(self) -> dict[str, int]:
+        """Background exporter counters (empty when exporting synchronously)."""
+        return self._exporter.stats() if self._exporter is not None else {}
+
+    def flush(self, timeout: float | None = 10.0) -> None:
+        """Wait for queued exports, then flush the Langfuse client."""
+        if self._exporter is not None:
+            self._exporter.flush(timeout)
+        self._flush_client()
+
+    def _flush_client(self) -> None:
         if not self._client or not self.enabled:
             return
         try:
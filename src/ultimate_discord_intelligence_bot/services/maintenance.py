@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import logging
+import os
 from typing import TYPE_CHECKING, Any
 
+from domains.memory.ttl_compaction import CompactionScheduler, TTLCompactor, supports_filtered_compaction
+from domains.memory.vector.memory_compaction_tool import MemoryCompactionTool
+
 from ..tenancy import current_tenant
-from ..tools.memory.memory_compaction_tool import MemoryCompactionTool
 
 
 if TYPE_CHECKING:
     from ultimate_discord_intelligence_bot.step_result import StepResult
 
 
+logger = logging.getLogger(__name__)
+_scheduler: CompactionScheduler | None = None
+
+
 class MemoryMaintenance:
     """Coordinate memory maintenance actions such as compaction.
 
@@ -38,4 +46,44 @@ class MemoryMaintenance:
         return summaries
 
 
-__all__ = ["MemoryMaintenance"]
+async def start_compaction_scheduler(client: Any | None = None) -> CompactionScheduler | None:
+    """Start the background TTL compaction scheduler when ``ENABLE_MEMORY_COMPACTION`` is on.
+
+    Every tenant with a memory collection in Qdrant is compacted each
+    ``MEMORY_COMPACTION_INTERVAL_S`` seconds, ``MEMORY_COMPACTION_TIME_BUDGET_S``
+    per collection. Returns the running scheduler, or ``None`` when disabled or
+    the client cannot run filtered deletes.
+    """
+    global _scheduler
+    if _scheduler is not None:
+        return _scheduler
+    if os.getenv("ENABLE_MEMORY_COMPACTION", "0").lower() not in {"1", "true", "yes", "on"}:
+        return None
+    if client is None:
+        from domains.memory.vector.client_factory import get_qdrant_client
+
+        client = get_qdrant_client()
+    if not supports_filtered_compaction(client):
+        logger.info("Memory compaction scheduler not started: client has no filtered delete support")
+        return None
+    budget = os.getenv("MEMORY_COMPACTION_TIME_BUDGET_S")
+    scheduler = CompactionScheduler(
+        TTLCompactor(client),
+        interval_s=float(os.getenv("MEMORY_COMPACTION_INTERVAL_S", "3600")),
+        time_budget_s=float(budget) if budget else 30.0,
+        discover=True,
+    )
+    await scheduler.start()
+    _scheduler = scheduler
+    return scheduler
+
+
+async def stop_compaction_scheduler() -> None:
+    """Stop the scheduler started by :func:`start_compaction_scheduler`, if any."""
+    global _scheduler
+    if _scheduler is not None:
+        await _scheduler.stop()
+        _scheduler = None
+
+
+__all__ = ["MemoryMaintenance", "start_compaction_scheduler", "stop_compaction_scheduler"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from platform.config.configuration import get_config
 from typing import TYPE_CHECKING
@@ -26,7 +27,9 @@ class TokenMeter:
     def __post_init__(self) -> StepResult:
         if self.max_cost_per_request is None:
             config = get_config()
-            self.max_cost_per_request = config.cost_max_per_request
+            self.max_cost_per_request = getattr(config, "cost_max_per_request", None)
+            if self.max_cost_per_request is None:
+                self.max_cost_per_request = float(os.getenv("COST_MAX_PER_REQUEST", "1.0"))
 
     def estimate_cost(self, tokens: int, model: str, prices: dict[str, float] | None = None) -> StepResult:
         """Return the projected cost for ``tokens`` on ``model``.
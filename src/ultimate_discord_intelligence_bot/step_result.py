@@ -168,7 +168,7 @@ class ErrorContext:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult(Mapping[str, Any]):
     """Enhanced container for pipeline step outcomes with comprehensive error handling.
 
@@ -183,6 +183,10 @@ class StepResult(Mapping[str, Any]):
     - Enhanced error context with debugging and recovery information
     - Performance impact tracking for error scenarios
     - Integration with observability systems
+
+    Results are created for every pipeline step and tool call, so the class
+    is slotted (no per-instance ``__dict__``), like
+    ``platform.core.step_result.StepResult``.
     """
 
     success: bool = True
@@ -760,32 +764,45 @@ class StepResult(Mapping[str, Any]):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the result back to a ``dict`` for backward compatibility."""
-        data_view = self.data
-        payload = None if data_view is None else {k: v for k, v in self._data.items() if k != "metadata"}
+        result = dict(self.to_dict_items())
+        if result["data"] is self._data:
+            result["data"] = dict(self._data)
+        return result
+
+    def to_dict_items(self) -> Iterator[tuple[str, Any]]:
+        """Yield the ``to_dict()`` pairs without copying the payload.
 
-        result: dict[str, Any] = {"data": payload}
-        result["success"] = self.success
-        status = self.custom_status or ("success" if self.success else "error")
-        result["status"] = status
-        result["error"] = self.error
+        The ``"data"`` value may be the live internal mapping, so callers must
+        treat it as read-only. Serializers use this to encode a result without
+        building the intermediate dict.
+        """
+        data_view = self.data
+        if data_view is None:
+            payload = None
+        elif "metadata" in self._data:
+            payload = {k: v for k, v in self._data.items() if k != "metadata"}
+        else:
+            payload = self._data
+        yield "data", payload
+        yield "success", self.success
+        yield "status", self.custom_status or ("success" if self.success else "error")
+        yield "error", self.error
         if self.error_category:
-            result["error_category"] = self.error_category.value
-        result["retryable"] = self.retryable
-        result["metadata"] = self.metadata
+            yield "error_category", self.error_category.value
+        yield "retryable", self.retryable
+        yield "metadata", self.metadata
 
         # Enhanced error information
         if self.error_context:
-            result["error_context"] = self.error_context.to_dict()
+            yield "error_context", self.error_context.to_dict()
         if self.error_severity != ErrorSeverity.MEDIUM:  # Only include if not default
-            result["error_severity"] = self.error_severity.value
+            yield "error_severity", self.error_severity.value
         if self.performance_impact > 0:
-            result["performance_impact"] = self.performance_impact
+            yield "performance_impact", self.performance_impact
         if self.suggested_actions:
-            result["suggested_actions"] = self.suggested_actions
+            yield "suggested_actions", self.suggested_actions
         if self.related_errors:
-            result["related_errors"] = self.related_errors
-
-        return result
+            yield "related_errors", self.related_errors
 
     def should_retry(self, attempt: int = 1) -> bool:
         """Determine if this error should be retried based on recovery strategy."""
@@ -1074,7 +1091,7 @@ class StepResult(Mapping[str, Any]):
             if self.error is not None:
                 flat["error"] = self.error
             return flat == other
-        return super().__eq__(other)
+        return Mapping.__eq__(self, other)  # zero-arg super() breaks in a slots=True dataclass
 
     def __hash__(self) -> int:  # pragma: no cover
         # Provide a stable hash combining status + frozenset of flattened items.
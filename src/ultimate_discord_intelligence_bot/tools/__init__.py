@@ -7,19 +7,16 @@ This package contains tools organized into domain-specific modules:
 - memory: Storage and retrieval tools
 - observability: Monitoring and system health tools
 
-Avoid importing all tool modules at package import time to prevent optional
-dependencies from being required during unrelated imports/tests.
-Import specific tools or submodules explicitly as needed.
+Importing this package loads no tool module. ``MAPPING`` maps each exported
+tool name to the module that defines it. The module is imported on first
+attribute access (PEP 562), and the class is cached in the package namespace,
+so later lookups are plain attribute reads. ``tool_load_times()`` reports
+what has been loaded so far and how long each import took.
 """
 
-# Ensure src directory is in path for absolute imports
-import sys
+import time
 
 
-_src_path = "/home/crew/src"
-if _src_path not in sys.path:
-    sys.path.insert(0, _src_path)
-
 MAPPING = {
     # Acquisition tools (migrated to domains/ingestion/providers/)
     "AudioTranscriptionTool": "domains.ingestion.providers.audio_transcription_tool",
@@ -266,28 +263,26 @@ __all__ = [
 ]
 
 
+# Tool name -> seconds spent importing its module on first access.
+_LOAD_TIMES: dict[str, float] = {}
+
+
 def __getattr__(name: str):  # PEP 562: lazy attribute loading
     mod = MAPPING.get(name)
     if mod is None:
         raise AttributeError(name)
-    import sys
     from importlib import import_module
 
+    started = time.perf_counter()
     try:
-        # Handle both relative (starting with '.') and absolute imports
-        if mod.startswith("."):
-            module_path = f"{__name__}{mod}"
-        else:
-            # Absolute import (e.g., 'domains.intelligence.analysis.social_graph_analysis_tool')
-            # Ensure src directory is in path for absolute imports
-            src_path = "/home/crew/src"
-            if src_path not in sys.path:
-                sys.path.insert(0, src_path)
-            module_path = mod
-        module = import_module(module_path)
+        # Relative entries live in this package; absolute ones (e.g.
+        # 'domains.intelligence.analysis.social_graph_analysis_tool') are
+        # resolved from the installed source tree like any other import.
+        module = import_module(f"{__name__}{mod}" if mod.startswith(".") else mod)
     except Exception as exc:  # Optional dependency or heavy module failed to import
         # Provide a soft-fail stub so imports don't break across frameworks/scaffolds.
         # The stub mirrors a minimal tool surface and returns a StepResult.fail() when run.
+        # It is not cached, so the import is retried once the dependency is installed.
         def _make_stub(_tool_name: str, _error: Exception):
             class _MissingDependencyTool:
                 name = _tool_name
@@ -309,11 +304,19 @@ def __getattr__(name: str):  # PEP 562: lazy attribute loading
         return _make_stub(name, exc)
 
     try:
-        return getattr(module, name)
+        value = getattr(module, name)
     except AttributeError as exc:  # pragma: no cover - defensive
         raise AttributeError(name) from exc
+    _LOAD_TIMES[name] = time.perf_counter() - started
+    globals()[name] = value
+    return value
+
+
+def tool_load_times() -> dict[str, float]:
+    """Return import seconds for each tool loaded so far, slowest first."""
+    return dict(sorted(_LOAD_TIMES.items(), key=lambda item: item[1], reverse=True))
 
 
 def __dir__():
     # Expose lazy-exported names to introspection and linters
-    return sorted(list(globals().keys()) + __all__)
+    return sorted(set(globals()) | set(__all__))
@@ -167,7 +167,7 @@ class BaseTool(StepResultHelperMixin, Generic[R_co]):
                 ctx = current_tenant()
                 tenant_id = ctx.tenant_id if ctx else "default"
                 import asyncio
-                from platform.rl.agent_messaging import AgentMessageBus
+                from platform.rl.agent_messaging import create_agent_message_bus
 
                 try:
                     asyncio.get_running_loop()
@@ -175,7 +175,7 @@ class BaseTool(StepResultHelperMixin, Generic[R_co]):
                     return
 
                 async def _publish():
-                    bus = AgentMessageBus()
+                    bus = create_agent_message_bus()
                     await bus.connect()
                     try:
                         message = AgentMessage(
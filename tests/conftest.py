@@ -22,6 +22,10 @@ if _SRC.exists():
     if src_path not in sys.path:
         sys.path.insert(0, src_path)
 
+# Keep on-disk stores out of the checkout; tests that need a file pass their own path.
+os.environ.setdefault("MEMORY_COMPACTION_CHECKPOINT_PATH", ":memory:")
+os.environ.setdefault("SPARSE_STATS_DB_PATH", ":memory:")
+
 # Ensure 'platform' resolves to a proxy that exposes stdlib attributes while
 # acting as a package for our repo's 'platform/*' submodules (avoids stdlib shadowing).
 try:
@@ -0,0 +1,105 @@
+"""
+Tests for the Live Clip Radar streaming window signals.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+from ultimate_discord_intelligence_bot.creator_ops.features.clip_radar_models import ChatMessage, PlatformType
+from ultimate_discord_intelligence_bot.creator_ops.features.clip_radar_signals import (
+    ChatWindow,
+    RollingSum,
+    SentimentWindow,
+    count_laughter,
+    score_sentiment_batch,
+)
+
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _message(offset_seconds: float, text: str = "hello") -> ChatMessage:
+    return ChatMessage(
+        message_id=f"m{offset_seconds}",
+        user_id="u",
+        username="user",
+        message=text,
+        timestamp=START + timedelta(seconds=offset_seconds),
+        platform=PlatformType.TWITCH,
+        channel_id="channel",
+        stream_id="stream",
+    )
+
+
+def _naive_count(messages: list[ChatMessage], since: datetime) -> int:
+    cutoff = int(since.timestamp())
+    return sum(1 for m in messages if int(m.timestamp.timestamp()) >= cutoff)
+
+
+class TestChatWindow:
+    def test_velocity_matches_scan_as_window_slides(self):
+        window = ChatWindow(maxlen=10_000)
+        messages = []
+        offsets = [i * 0.7 for i in range(400)] + [400 + i * 3.1 for i in range(200)]
+        for offset in offsets:
+            message = _message(offset)
+            window.append(message)
+            messages.append(message)
+            since = message.timestamp - timedelta(minutes=1)
+            assert window.count_since(since) == _naive_count(messages, since)
+
+    def test_total_covers_horizon_and_resets_after_gap(self):
+        window = ChatWindow(horizon_seconds=600)
+        for offset in range(0, 900, 3):
+            window.append(_message(offset))
+        assert window.total == len([offset for offset in range(0, 900, 3) if offset > 897 - 600])
+        assert window.rate_per_minute() == window.total / 10
+
+        window.append(_message(5000))
+        assert window.total == window.recent == 1
+
+    def test_late_messages_and_tail(self):
+        window = ChatWindow(maxlen=3)
+        for offset in (100, 101, 102, 90):
+            window.append(_message(offset))
+        assert window.recent == 4
+        assert len(window) == 3
+        assert [m.timestamp for m in window.tail(2)] == [_message(102).timestamp, _message(90).timestamp]
+
+
+class TestSentimentWindow:
+    def test_averages_over_last_two_blocks(self):
+        window = SentimentWindow(maxlen=100)
+        scores = [0.1 * (i % 7) - 0.3 for i in range(35)]
+        for i, score in enumerate(scores):
+            window.append({"timestamp": START, "sentiment": score, "message": str(i)})
+            averages = window.averages()
+            history = scores[: i + 1]
+            if len(history) < 15:
+                assert averages is None
+                continue
+            recent, older = history[-10:], history[-20:-10]
+            assert averages is not None
+            assert abs(averages[0] - sum(recent) / 10) < 1e-9
+            assert abs(averages[1] - sum(older) / len(older)) < 1e-9
+
+
+def test_rolling_sum_keeps_last_values():
+    rolling = RollingSum(3)
+    for value in (1, 2, 3, 4):
+        rolling.push(value)
+    assert rolling.total == 9
+
+
+def test_count_laughter_counts_keywords_runs_and_emoji():
+    hits, indicators = count_laughter("LOL hahaha 😂 !!!", ["lol", "haha"])
+    assert hits == 2
+    assert indicators == 4
+
+
+def test_score_sentiment_batch_uses_distinct_keywords():
+    positive, negative, neutral = score_sentiment_batch(
+        ["great great amazing", "terrible and awful", "good but bad"]
+    )
+    assert (positive.label, positive.score) == ("positive", 0.4)
+    assert (negative.label, negative.score) == ("negative", -0.4)
+    assert (neutral.label, neutral.score) == ("neutral", 0.0)
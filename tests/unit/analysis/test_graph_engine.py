@@ -0,0 +1,80 @@
+import random
+
+import numpy as np
+import pytest
+
+from domains.intelligence.analysis.graph_engine import (
+    CSRGraph,
+    betweenness_centrality,
+    bfs_distances,
+    eigenvector_centrality,
+    label_propagation_communities,
+    pagerank,
+    reachable_within,
+)
+
+
+def _random_adjacency(n: int, p: float, seed: int = 7) -> dict[str, list[str]]:
+    rng = random.Random(seed)
+    return {f"n{i}": [f"n{j}" for j in range(n) if j != i and rng.random() < p] for i in range(n)}
+
+
+def test_csr_build_dedupes_and_includes_neighbour_only_nodes() -> None:
+    graph = CSRGraph.from_adjacency({"a": ["b", "b", "a"], "b": ["c"]})
+    assert graph.node_ids == ("a", "b", "c")
+    assert graph.num_edges == 2
+    assert graph.neighbours(graph.index["a"]).tolist() == [graph.index["b"]]
+    assert graph.to_undirected().num_edges == 4
+
+
+def test_bfs_and_reachability() -> None:
+    graph = CSRGraph.from_adjacency({"a": ["b"], "b": ["c"], "c": ["d"], "x": []})
+    dist = bfs_distances(graph, graph.index["a"])
+    assert dist[graph.index["d"]] == 3
+    assert dist[graph.index["x"]] == -1
+    within = {graph.node_ids[i] for i in reachable_within(graph, graph.index["a"], 2)}
+    assert within == {"b", "c"}
+
+
+def test_betweenness_matches_networkx() -> None:
+    nx = pytest.importorskip("networkx")
+    adjacency = _random_adjacency(40, 0.08)
+    graph = CSRGraph.from_adjacency(adjacency)
+    expected = nx.betweenness_centrality(nx.DiGraph([(u, v) for u, vs in adjacency.items() for v in vs]), normalized=False)
+    raw = betweenness_centrality(graph, normalized=False)
+    for node, score in expected.items():
+        assert raw[graph.index[node]] == pytest.approx(score)
+
+
+def test_sampled_betweenness_approximates_exact() -> None:
+    graph = CSRGraph.from_adjacency(_random_adjacency(60, 0.1), undirected=True)
+    exact = betweenness_centrality(graph)
+    approx = betweenness_centrality(graph, sample_size=45, seed=1)
+    assert np.argmax(approx) in np.argsort(exact)[-5:]
+
+
+def test_eigenvector_and_pagerank_converge() -> None:
+    nx = pytest.importorskip("networkx")
+    pytest.importorskip("scipy")  # networkx.pagerank backend
+    adjacency = _random_adjacency(30, 0.2)
+    graph = CSRGraph.from_adjacency(adjacency)
+    nx_graph = nx.DiGraph([(u, v) for u, vs in adjacency.items() for v in vs])
+    pr = pagerank(graph, tol=1e-10)
+    for node, score in nx.pagerank(nx_graph, tol=1e-10).items():
+        assert pr[graph.index[node]] == pytest.approx(score, abs=1e-6)
+    undirected = CSRGraph.from_adjacency(adjacency, undirected=True)
+    ev = eigenvector_centrality(undirected, max_iter=1000, tol=1e-12)
+    assert ev.sum() == pytest.approx(1.0)
+    reference = nx.eigenvector_centrality(nx_graph.to_undirected(), max_iter=1000, tol=1e-12)
+    total = sum(reference.values())
+    for node, score in reference.items():
+        assert ev[undirected.index[node]] == pytest.approx(score / total, abs=1e-6)
+
+
+def test_label_propagation_separates_cliques() -> None:
+    left = {f"l{i}": [f"l{j}" for j in range(5) if j != i] for i in range(5)}
+    right = {f"r{i}": [f"r{j}" for j in range(5) if j != i] for i in range(5)}
+    graph = CSRGraph.from_adjacency({**left, **right, "l0": [*left["l0"], "r0"]})
+    communities = [{graph.node_ids[i] for i in members} for members in label_propagation_communities(graph)]
+    assert len(communities) == 2
+    assert set(left) in communities and set(right) in communities
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from domains.intelligence.analysis.trend_forecasting_tool import TrendForecastingTool
+from domains.intelligence.analysis.trend_series import (
+    CHARACTERISTICS,
+    SIMILARITY,
+    TrendSeriesStore,
+    dominant_period,
+    lag_cross_correlation,
+    linear_trend,
+    rolling_mean_std,
+    seasonal_decompose,
+)
+
+
+DAY = 86400.0
+
+
+def _points(n: int, *, platform: str = "youtube", start: float = 1_700_000_000.0, step: float = DAY, lag: float = 0.0):
+    return [
+        {
+            "timestamp": start + lag + i * step,
+            "platform": platform,
+            "content_id": f"{platform}-{i}",
+            "engagement_metrics": {"total_engagement": 100 + 10 * i + 50 * (i % 7 == 0), "reach": 1000},
+            "content_metadata": {"content_type": "video", "keywords": ["clip", "drama"]},
+        }
+        for i in range(n)
+    ]
+
+
+def test_store_appends_incrementally_and_keeps_groups_time_ordered() -> None:
+    store = TrendSeriesStore(capacity=4)
+    store.append(list(reversed(_points(10))))
+    assert len(store) == 10
+    group = store.groups(CHARACTERISTICS)["youtube_video"]
+    assert np.all(np.diff(group.timestamp) > 0)
+    version = store.version
+    store.append(_points(3, platform="tiktok"))
+    assert store.version == version + 1
+    assert store.groups(CHARACTERISTICS)["youtube_video"] is group  # unchanged view reused
+    assert set(store.groups(CHARACTERISTICS)) == {"youtube_video", "tiktok_video"}
+    assert len(store.groups(SIMILARITY)["clip_drama"]) == 13
+
+
+def test_rolling_and_linear_helpers() -> None:
+    values = np.arange(10, dtype=float)
+    mean, std = rolling_mean_std(values, 4)
+    assert mean.tolist() == pytest.approx([1.5 + i for i in range(7)])
+    assert std == pytest.approx(np.full(7, np.std([0, 1, 2, 3])))
+    assert linear_trend(2 * values + 3) == pytest.approx((2.0, 3.0))
+
+
+def test_seasonality_and_lag_detection() -> None:
+    t = np.arange(70)
+    series = 10 + 0.1 * t + 5 * np.sin(2 * np.pi * t / 7)
+    period, strength = dominant_period(series, max_period=30)
+    assert period == 7 and strength > 0.5
+    trend, seasonal, residual = seasonal_decompose(series, 7)
+    assert np.allclose(trend + seasonal + residual, series)
+    assert seasonal[:7].sum() == pytest.approx(0.0, abs=1e-9)
+
+    rng = np.random.default_rng(0)
+    source = rng.random(200)
+    target = np.concatenate([np.zeros(5), source[:-5]])
+    assert lag_cross_correlation(source, target, max_lag=24)[0] == 5
+
+
+def test_tool_forecasts_and_appends_per_tenant() -> None:
+    tool = TrendForecastingTool(confidence_threshold=0.0)
+    first = tool.run(_points(30) + _points(30, platform="tiktok", lag=2 * 3600), tenant="t1", workspace="w")
+    assert first.success
+    data = first.data
+    assert {f["trend_id"] for f in data["trend_forecasts"]} == {"youtube_video", "tiktok_video"}
+    propagation = data["propagation_forecasts"][0]
+    assert propagation["source_platform"] == "youtube"
+    assert propagation["propagation_delays"]["tiktok"] == pytest.approx(2.0)
+
+    more = _points(5, platform="twitter", start=1_700_000_000.0 + 40 * DAY)
+    second = tool.run(more, forecasting_config={"append": True}, tenant="t1", workspace="w")
+    assert second.data["metadata"]["data_points_analyzed"] == 65
+    assert tool.run(more, tenant="t2", workspace="w").data["metadata"]["data_points_analyzed"] == 5
+
+
+def test_memoized_forecasts_are_copies_and_stores_are_bounded() -> None:
+    tool = TrendForecastingTool(confidence_threshold=0.0, max_stores=2)
+    assert tool.run(_points(30), tenant="t1", workspace="w").success
+    store = tool._stores[("t1", "w")]
+    tool._generate_trend_forecasts(store)[0]["predicted_values"].clear()
+    assert tool._generate_trend_forecasts(store)[0]["predicted_values"]
+
+    tool.run(_points(10), tenant="t2", workspace="w")
+    tool.run(_points(10), tenant="t1", workspace="w")
+    tool.run(_points(10), tenant="t3", workspace="w")
+    assert list(tool._stores) == [("t1", "w"), ("t3", "w")]
@@ -0,0 +1,82 @@
+# isort: skip_file
+import json
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from server import a2a_router
+from ultimate_discord_intelligence_bot.step_result import StepResult
+
+
+def _sleep(seconds: float, tag: str = "") -> StepResult:
+    time.sleep(seconds)
+    return StepResult.ok(data={"slept": seconds, "tag": tag})
+
+
+@pytest.fixture()
+def client(monkeypatch):
+    monkeypatch.setattr(a2a_router, "_get_tools", lambda: {"tools.sleep": _sleep})
+    monkeypatch.setenv("A2A_BATCH_CONCURRENCY", "8")
+    monkeypatch.setenv("A2A_ITEM_TIMEOUT_SECONDS", "5")
+    app = FastAPI()
+    app.include_router(a2a_router.router)
+    return TestClient(app)
+
+
+def _call(id_val, seconds, tag=""):
+    return {"jsonrpc": "2.0", "id": id_val, "method": "tools.sleep", "params": {"seconds": seconds, "tag": tag}}
+
+
+def test_batch_items_run_concurrently_in_request_order(client):
+    batch = [_call(i, 0.3, tag=f"t{i}") for i in range(4)]
+    started = time.perf_counter()
+    r = client.post("/a2a/jsonrpc", json=batch)
+    elapsed = time.perf_counter() - started
+    assert r.status_code == 200
+    data = r.json()
+    assert [item["id"] for item in data] == [0, 1, 2, 3]
+    assert [item["result"]["data"]["tag"] for item in data] == ["t0", "t1", "t2", "t3"]
+    assert elapsed < 0.9
+
+
+def test_batch_respects_concurrency_limit(client, monkeypatch):
+    monkeypatch.setenv("A2A_BATCH_CONCURRENCY", "1")
+    started = time.perf_counter()
+    r = client.post("/a2a/jsonrpc", json=[_call(i, 0.15) for i in range(3)])
+    assert r.status_code == 200
+    assert time.perf_counter() - started >= 0.45
+
+
+def test_batch_item_timeout_and_invalid_items(client, monkeypatch):
+    monkeypatch.setenv("A2A_ITEM_TIMEOUT_SECONDS", "0.1")
+    batch = [_call("slow", 0.5), {"jsonrpc": "1.0"}, _call("fast", 0.0), _call(None, 0.0)]
+    r = client.post("/a2a/jsonrpc", json=batch)
+    data = r.json()
+    assert [item["id"] for item in data] == ["slow", None, "fast"]
+    assert data[0]["error"]["code"] == -32603
+    assert data[0]["error"]["message"].startswith("Timeout: tools.sleep")
+    assert data[1]["error"]["code"] == -32600
+    assert data[2]["result"]["status"] == "success"
+
+
+def test_single_call_timeout(client, monkeypatch):
+    monkeypatch.setenv("A2A_ITEM_TIMEOUT_SECONDS", "0.05")
+    data = client.post("/a2a/jsonrpc", json=_call(1, 0.3)).json()
+    assert data["error"]["message"].startswith("Timeout")
+
+
+def test_stream_emits_results_as_they_complete(client):
+    batch = [_call("slow", 0.4), _call("fast", 0.0), {"bad": True}]
+    r = client.post("/a2a/jsonrpc/stream", json=batch)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    events = []
+    for block in r.text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    assert [name for name, _ in events] == ["result", "result", "result", "done"]
+    ids = [payload.get("id") for _, payload in events[:3]]
+    assert ids == [None, "fast", "slow"]
+    assert events[-1][1] == {"count": 3}
@@ -0,0 +1,239 @@
+import asyncio
+import io
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from app.discord.autointel_coalescer import AutointelCoalescer, AutointelKey, canonical_url, final_result
+
+
+class _Followup:
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, bool]] = []
+        self.files: list[bytes] = []
+
+    async def send(self, content: str | None = None, ephemeral: bool = False, file=None, embed=None) -> None:
+        self.sent.append((content or getattr(embed, "title", ""), ephemeral))
+        if file is not None:
+            self.files.append(file.fp.read())
+
+
+class _File:
+    """Stand-in for ``discord.File``: its stream can be read once."""
+
+    def __init__(self, fp, filename=None, *, spoiler=False, description=None) -> None:
+        self.fp = fp
+        self.filename = filename
+        self.spoiler = spoiler
+        self.description = description
+
+
+class _Interaction:
+    def __init__(self, guild_id: int = 1) -> None:
+        self.id = guild_id
+        self.guild_id = guild_id
+        self.followup = _Followup()
+        self.response = _Followup()
+
+
+def _pipeline(runs: list[str], release: asyncio.Event | None = None, ephemeral: bool = False, final: bool = True):
+    async def run(interaction) -> bool:
+        runs.append("run")
+        if release is not None:
+            await release.wait()
+        await interaction.followup.send("🚀 Starting analysis")
+        with final_result(interaction):
+            await interaction.followup.send("briefing", ephemeral=ephemeral)
+        return final
+
+    return run
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://youtu.be/abc123?si=tracking",
+        "https://www.youtube.com/watch?v=abc123&feature=share",
+        "https://m.youtube.com/shorts/abc123/",
+        "HTTPS://YouTube.com/watch?utm_source=x&v=abc123#t=10",
+    ],
+)
+def test_canonical_url_collapses_youtube_variants(url):
+    assert canonical_url(url) == "https://youtube.com/watch?v=abc123"
+
+
+def test_canonical_url_keeps_meaningful_query():
+    assert canonical_url("https://Example.com/a/?b=2&a=1&utm_medium=x") == "https://example.com/a?a=1&b=2"
+
+
+def test_canonical_url_strips_share_params_only_on_social_hosts():
+    assert (
+        canonical_url("https://example.com/search?s=cats&ref=main&gclid=1")
+        == "https://example.com/search?ref=main&s=cats"
+    )
+    assert canonical_url("https://x.com/user/status/1?s=20&t=abc") == "https://x.com/user/status/1?t=abc"
+    assert canonical_url("https://www.instagram.com/reel/xyz/?igshid=1&ref=share") == "https://instagram.com/reel/xyz"
+
+
+async def test_concurrent_requests_share_one_run():
+    coalescer = AutointelCoalescer()
+    runs: list[str] = []
+    release = asyncio.Event()
+    key = AutointelKey.build("guild_1", "https://youtu.be/abc", "standard")
+    interactions = [_Interaction() for _ in range(3)]
+    tasks = [
+        asyncio.create_task(coalescer.run(key, interaction, _pipeline(runs, release)))
+        for interaction in interactions
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    outcomes = await asyncio.gather(*tasks)
+
+    assert runs == ["run"]
+    assert sorted(outcomes) == ["joined", "joined", "leader"]
+    for interaction in interactions:
+        assert ("briefing", False) in interaction.followup.sent
+    assert coalescer.stats()["runs_saved"] == 2
+
+
+async def test_cache_answers_repeats_until_ttl_expires():
+    now = [0.0]
+    coalescer = AutointelCoalescer(ttl_seconds=60, clock=lambda: now[0])
+    runs: list[str] = []
+    key = AutointelKey.build("guild_1", "https://example.com/v", "deep")
+
+    assert await coalescer.run(key, _Interaction(), _pipeline(runs)) == "leader"
+    repeat = _Interaction()
+    assert await coalescer.run(key, repeat, _pipeline(runs)) == "cached"
+    assert repeat.followup.sent[-1] == ("briefing", False)
+    other_guild = AutointelKey.build("guild_2", "https://example.com/v", "deep")
+    assert await coalescer.run(other_guild, _Interaction(), _pipeline(runs)) == "leader"
+
+    now[0] = 61
+    assert await coalescer.run(key, _Interaction(), _pipeline(runs)) == "leader"
+    assert len(runs) == 3
+    assert coalescer.stats()["hit_rate"] == pytest.approx(1 / 4)
+
+
+async def test_failed_runs_are_not_cached():
+    coalescer = AutointelCoalescer()
+    runs: list[str] = []
+    key = AutointelKey.build("guild_1", "https://example.com/v", "standard")
+    await coalescer.run(key, _Interaction(), _pipeline(runs, ephemeral=True))
+    assert await coalescer.run(key, _Interaction(), _pipeline(runs)) == "leader"
+    assert len(runs) == 2
+
+
+async def test_pipeline_errors_propagate_to_joiners():
+    coalescer = AutointelCoalescer()
+    release = asyncio.Event()
+    key = AutointelKey.build("guild_1", "https://example.com/v", "standard")
+
+    async def boom(_interaction) -> None:
+        await release.wait()
+        raise RuntimeError("download failed")
+
+    tasks = [asyncio.create_task(coalescer.run(key, _Interaction(), boom)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert coalescer.stats()["inflight"] == 0
+
+
+async def test_acknowledgement_only_runs_are_not_cached():
+    coalescer = AutointelCoalescer()
+    runs: list[str] = []
+    key = AutointelKey.build("guild_1", "https://example.com/v", "standard")
+    await coalescer.run(key, _Interaction(), _pipeline(runs, final=False))
+    assert await coalescer.run(key, _Interaction(), _pipeline(runs)) == "leader"
+    assert len(runs) == 2
+
+
+async def test_attachments_are_rebuilt_for_every_send_and_replay_failures_logged(caplog):
+    coalescer = AutointelCoalescer()
+    key = AutointelKey.build("guild_1", "https://example.com/v", "standard")
+
+    async def with_report(interaction) -> bool:
+        with final_result(interaction):
+            await interaction.followup.send("report", file=_File(io.BytesIO(b"pdf-bytes"), "report.pdf"))
+        return True
+
+    leader = _Interaction()
+    await coalescer.run(key, leader, with_report)
+    repeat = _Interaction()
+    assert await coalescer.run(key, repeat, with_report) == "cached"
+    assert leader.followup.files == repeat.followup.files == [b"pdf-bytes"]
+
+    async def broken(*_args, **_kwargs) -> None:
+        raise ConnectionError("discord down")
+
+    failing = _Interaction()
+    failing.followup.send = broken
+    with caplog.at_level(logging.WARNING, logger="app.discord.autointel_coalescer"):
+        assert await coalescer.run(key, failing, with_report) == "cached"
+    assert "Failed to replay" in caplog.text
+
+
+def test_orchestrator_error_embeds_are_not_cached():
+    from ultimate_discord_intelligence_bot.orchestrator.discord_error_handlers import send_error_response
+
+    coalescer = AutointelCoalescer()
+    key = AutointelKey.build("guild_1", "https://example.com/v", "standard")
+    runs: list[str] = []
+
+    async def failing_workflow(interaction) -> bool:
+        runs.append("run")
+        await interaction.followup.send("🤖 Building CrewAI multi-agent system...")
+        await send_error_response(interaction, "Crew Workflow", "transcription failed", logging.getLogger(__name__))
+        return False
+
+    async def scenario() -> tuple[str, _Interaction]:
+        leader = _Interaction()
+        await coalescer.run(key, leader, failing_workflow)
+        return await coalescer.run(key, _Interaction(), failing_workflow), leader
+
+    outcome, leader = asyncio.run(scenario())
+    assert outcome == "leader"
+    assert runs == ["run", "run"]
+    assert leader.followup.sent[-1][1] is False
+    assert "transcription failed" in leader.followup.sent[-1][0]
+    assert coalescer.stats()["cached_entries"] == 0
+
+
+def test_only_final_result_messages_are_replayed():
+    coalescer = AutointelCoalescer()
+    key = AutointelKey.build("guild_1", "https://example.com/v", "standard")
+
+    async def scenario() -> _Interaction:
+        await coalescer.run(key, _Interaction(), _pipeline([]))
+        repeat = _Interaction()
+        assert await coalescer.run(key, repeat, _pipeline([])) == "cached"
+        return repeat
+
+    repeat = asyncio.run(scenario())
+    assert [content for content, _ in repeat.followup.sent] == [
+        "♻️ Returning a recent analysis of this URL.",
+        "briefing",
+    ]
+
+
+async def test_background_queued_runs_bypass_the_coalescer(monkeypatch):
+    from app.discord import registrations
+
+    calls: list[str] = []
+
+    async def fake_run(interaction, url, depth) -> bool:
+        calls.append(url)
+        return False
+
+    monkeypatch.setattr(registrations, "_run_autointel", fake_run)
+    coalescer = AutointelCoalescer()
+    monkeypatch.setattr(registrations, "get_autointel_coalescer", lambda: coalescer)
+    interaction = _Interaction()
+    interaction.client = SimpleNamespace(background_worker=object(), orchestrator=object())
+    await registrations._execute_autointel(interaction, "https://example.com/v")
+    await registrations._execute_autointel(interaction, "https://example.com/v")
+    assert len(calls) == 2
+    assert coalescer.stats()["leader"] == 0
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import random
+import time
+
+from kg.extract import StreamingExtractor, extract, extract_stream
+
+
+TRANSCRIPT = (
+    "Dr. Smith is in New York City. Is this true? The value is 3.5 percent! "
+    "See example.com which is down. J. K. Rowling was born in 1965.\n\n"
+    "Alice's team were late and Bob Jones said nothing\n\nThe End is near"
+)
+
+
+def spans(items):
+    return [(item.text, item.start, item.end) for item in items]
+
+
+def test_sentence_boundaries_tuned_for_transcripts():
+    entities, claims = extract(TRANSCRIPT)
+    assert [c.text for c in claims] == [
+        "Dr. Smith is in New York City",
+        "The value is 3.5 percent",
+        "See example.com which is down",
+        "J. K. Rowling was born in 1965",
+        "Alice's team were late and Bob Jones said nothing",
+        "The End is near",
+    ]
+    assert {"New York City", "Bob Jones", "Alice", "Rowling"} <= {e.text for e in entities}
+    for item in entities + claims:
+        assert TRANSCRIPT[item.start : item.end] == item.text
+
+
+def test_streaming_matches_single_pass_for_any_segmentation():
+    text = " ".join([TRANSCRIPT] * 20)
+    expected = tuple(spans(items) for items in extract(text))
+    rng = random.Random(3)
+    for _ in range(20):
+        cuts = sorted(rng.sample(range(1, len(text)), 40))
+        segments = [text[a:b] for a, b in zip([0, *cuts], [*cuts, len(text)], strict=True)]
+        entities, claims = [], []
+        for seg_entities, seg_claims in extract_stream(segments):
+            entities += seg_entities
+            claims += seg_claims
+        assert (spans(entities), spans(claims)) == expected
+
+
+def test_feed_returns_items_as_soon_as_they_are_complete():
+    extractor = StreamingExtractor()
+    entities, claims = extractor.feed(" Alice is great. Bob")
+    assert [c.text for c in claims] == ["Alice is great"]
+    assert [e.text for e in entities] == ["Alice"]
+    entities, claims = extractor.feed(" was here")
+    assert [e.text for e in entities] == ["Bob"]
+    assert claims == []
+    entities, claims = extractor.flush()
+    assert spans(claims) == [("Bob was here", 17, 29)]
+    assert entities == []
+
+
+def test_unpunctuated_speech_is_cut_into_bounded_claims():
+    text = (
+        "so basically the thing is that we were talking about the economy and it was bad but then "
+        "the senator said inflation is transitory and honestly I think that is wrong okay anyway "
+    ) * 200
+    _, claims = extract(text, max_sentence_chars=200)
+    assert len(claims) > 100
+    assert all(len(c.text) <= 200 for c in claims)
+    # Cuts prefer discourse markers over arbitrary words.
+    assert sum(c.text.split()[0] in {"so", "but", "and", "okay", "anyway"} for c in claims[1:]) > len(claims) // 2
+
+
+def test_cost_is_linear_in_input_length():
+    sentence = "and the numbers they showed on the screen kept going up without any punctuation at all "
+
+    def seconds(repeats: int) -> float:
+        text = sentence * repeats
+        started = time.perf_counter()
+        extract(text)
+        return time.perf_counter() - started
+
+    seconds(50)
+    small, large = seconds(500), seconds(4000)
+    assert large < small * 8 * 3
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from kg import PooledKGStore
+from mcp_server import kg_server
+
+
+def _seed(store, tenant: str = "t") -> dict[str, int]:
+    ids = {
+        "alice": store.add_node(tenant, "entity", "Alice"),
+        "ep1": store.add_node(tenant, "episode", "Ep1"),
+        "ep2": store.add_node(tenant, "episode", "Ep2"),
+        "bob": store.add_node(tenant, "entity", "Bob"),
+    }
+    store.add_edge(ids["alice"], ids["ep2"], "mentions", created_at="2")
+    store.add_edge(ids["alice"], ids["ep1"], "mentions", created_at="1")
+    store.add_edge(ids["ep1"], ids["bob"], "features")
+    return ids
+
+
+def test_pooled_store_reads_concurrently_and_sees_committed_writes(tmp_path):
+    store = PooledKGStore(tmp_path / "kg.sqlite3", read_connections=3)
+    try:
+        ids = _seed(store)
+        assert set(store.neighbors(ids["alice"], depth=1)) == {ids["ep1"], ids["ep2"]}
+        assert set(store.neighbors(ids["alice"], depth=2)) == {ids["ep1"], ids["ep2"], ids["bob"]}
+        assert [n.name for n in store.get_nodes(ids.values())] == ["Alice", "Ep1", "Ep2", "Bob"]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: len(store.edges_among(ids.values())), range(64)))
+        assert results == [3] * 64
+
+        extra = store.add_node("t", "episode", "Ep3")
+        store.add_edge(ids["alice"], extra, "mentions", created_at="3")
+        assert [m[1] for m in store.mentions(ids["alice"])] == ["Ep2", "Ep1", "Ep3"]
+        with store._reading() as reader, pytest.raises(Exception, match="readonly|read-only"):
+            reader.execute("DELETE FROM kg_nodes")
+    finally:
+        store.close()
+
+
+def test_kg_server_keeps_one_store_per_tenant(tmp_path, monkeypatch):
+    monkeypatch.setenv("MCP_KG_STORE_DIR", str(tmp_path))
+    kg_server.close_stores()
+    try:
+        assert kg_server.kg_query("acme", "Alice") == {"nodes": [], "edges": []}
+        assert not list(tmp_path.iterdir())
+
+        writer = PooledKGStore(kg_server._tenant_db_path("acme"))
+        _seed(writer, tenant="acme")
+        writer.close()
+
+        result = kg_server.kg_query("acme", "Alice", depth=2)
+        assert {n["name"] for n in result["nodes"]} == {"Alice", "Ep1", "Ep2", "Bob"}
+        assert len(result["edges"]) == 3
+        timeline = kg_server.kg_timeline("acme", "Alice")
+        assert [e["name"] for e in timeline["events"]] == ["Ep1", "Ep2"]
+        assert kg_server._open_store("acme") is kg_server._open_store("acme")
+        assert kg_server._tenant_db_path("a/b") != kg_server._tenant_db_path("a_b")
+    finally:
+        kg_server.close_stores()
+
+
+
+def test_ingest_fills_the_store_the_kg_server_reads(tmp_path, monkeypatch):
+    from domains.ingestion.pipeline import pipeline
+
+    monkeypatch.setenv("MCP_KG_STORE_DIR", str(tmp_path))
+    kg_server.close_stores()
+    try:
+        job = pipeline.IngestJob("youtube", "ep-42", "https://youtube.test/v", "acme", "main", [])
+        texts = ["Alice met Bob in Paris.", "Alice is back."]
+        pipeline._index_knowledge_graph(job, "ep-42", texts, "2024-01-02T00:00:00+00:00")
+        pipeline._index_knowledge_graph(job, "ep-42", texts, "")  # re-ingesting the same episode adds nothing
+
+        result = kg_server.kg_query("acme", "Alice")
+        assert {n["name"] for n in result["nodes"]} == {"Alice", "ep-42"}
+        timeline = kg_server.kg_timeline("acme", "Paris")
+        episode = result["edges"][0]["dst"]
+        assert timeline["events"] == [{"node_id": episode, "name": "ep-42", "timestamp": 1704153600.0}]
+        assert kg_server.kg_query("other", "Alice") == {"nodes": [], "edges": []}
+    finally:
+        kg_server.close_stores()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from eval import runner
+from eval.engine import EvalEngine, EvalModel, OutputCache, RunJournal, rescore
+
+
+DATA_DIR = Path("datasets/golden/core/v1")
+
+
+def _oracle(calls: list[str], delay: float = 0.0):
+    lock = threading.Lock()
+
+    def model(task: str, case: dict):
+        with lock:
+            calls.append(f"{task}:{case['id']}")
+        time.sleep(delay)
+        output = {
+            "rag_qa": "The sky is blue",
+            "summarize": "Paris is the capital",
+            "classification": case.get("expected", ""),
+            "claimcheck": case.get("expected_label", ""),
+            "tool_tasks": json.dumps(case.get("expected", {})),
+        }.get(task, "")
+        return output, {"cost_usd": 0.01, "latency_ms": 5}
+
+    return model
+
+
+def test_engine_matches_sequential_runner_and_caches_outputs():
+    calls: list[str] = []
+    model = EvalModel(name="oracle", fn=_oracle(calls))
+    engine = EvalEngine(max_workers=4)
+
+    first = engine.run(DATA_DIR, model)
+    assert first.report == runner.run(DATA_DIR, _oracle([]))
+    n_cases = first.stats.cases
+    assert len(calls) == n_cases == first.stats.model_calls
+    assert first.stats.cost_per_case_usd == 0.01
+
+    second = engine.run(DATA_DIR, model)
+    assert len(calls) == n_cases
+    assert second.stats.cache_hits == n_cases and second.stats.spent_usd == 0
+    assert second.report == first.report
+
+    variant = EvalModel(name="oracle", fn=_oracle(calls), params={"temperature": 0.2})
+    engine.run(DATA_DIR, variant)
+    assert len(calls) == 2 * n_cases
+
+
+def test_cases_run_concurrently_with_provider_rate_limit():
+    started: list[str] = []
+    lock = threading.Lock()
+    first_pair = threading.Barrier(2, timeout=5)
+
+    def model(task: str, case: dict):
+        with lock:
+            started.append(case["id"])
+            paired = len(started) <= 2
+        if paired:
+            # Only returns if two cases are in flight at the same time.
+            first_pair.wait()
+        return "", {}
+
+    result = EvalEngine(max_workers=2).run(DATA_DIR, EvalModel(name="pair", fn=model))
+    assert result.stats.errors == 0 and not first_pair.broken
+
+    # A frozen clock never refills the bucket, so each sleep is exactly the
+    # reservation the limiter computed.
+    sleeps: list[float] = []
+    limited = EvalModel(name="limited", fn=_oracle([]), provider="openrouter")
+    EvalEngine(max_workers=8, rate_limits={"openrouter": 20.0}, clock=lambda: 0.0, sleep=sleeps.append).run(
+        DATA_DIR, limited
+    )
+    # Burst capacity is one second of tokens, so no waiting for this small suite.
+    assert sleeps == []
+    burst = EvalEngine(max_workers=8, rate_limits={"openrouter": 2.0}, clock=lambda: 0.0, sleep=sleeps.append)
+    run = burst.run(DATA_DIR, EvalModel(name="burst", fn=_oracle([]), provider="openrouter"))
+    assert sorted(sleeps) == [pytest.approx(k / 2.0) for k in range(1, run.stats.cases - 1)]
+
+
+def test_failed_cases_score_zero_and_are_logged(caplog):
+    calls: list[str] = []
+    oracle = _oracle(calls)
+
+    def flaky(task: str, case: dict):
+        if task == "rag_qa":
+            raise RuntimeError("provider down")
+        return oracle(task, case)
+
+    with caplog.at_level(logging.ERROR, logger="eval.engine"):
+        result = EvalEngine().run(DATA_DIR, EvalModel(name="flaky", fn=flaky))
+    assert result.stats.errors == 1
+    assert result.report["rag_qa"]["quality"] == 0.0
+    assert result.stats.cases == len(result.records) == len(calls) + 1
+    assert any("rag_qa" in record.getMessage() for record in caplog.records)
+
+
+def test_journal_resumes_and_rescore_skips_model(tmp_path):
+    journal = RunJournal(tmp_path / "run.jsonl")
+    calls: list[str] = []
+    model = EvalModel(name="oracle", fn=_oracle(calls))
+    first = EvalEngine(cache=OutputCache(tmp_path / "cache.sqlite")).run(DATA_DIR, model, journal=journal)
+
+    # A fresh engine and cache still skips everything journaled.
+    resumed = EvalEngine().run(DATA_DIR, model, journal=journal)
+    assert resumed.stats.resumed == first.stats.cases
+    assert len(calls) == first.stats.cases
+    assert resumed.report == first.report
+
+    strict = rescore(journal, DATA_DIR, scorer=lambda task, output, case: 0.0)
+    assert all(entry["quality"] == 0.0 for entry in strict.values())
+    assert rescore(journal, DATA_DIR) == first.report
+    assert len(calls) == first.stats.cases
@@ -0,0 +1,98 @@
+"""Frontier-batched BFS, adjacency caching and budgets for UnifiedGraphStore."""
+
+from __future__ import annotations
+
+from domains.memory.graph_traversal import AdjacencyCache, traverse_frontier
+from domains.memory.unified_graph_store import GraphBackend, UnifiedGraphStore
+
+import pytest
+
+
+def tree(fanout: int, depth: int) -> dict[str, list[dict[str, str]]]:
+    graph: dict[str, list[dict[str, str]]] = {}
+    level = ["root"]
+    for d in range(depth):
+        next_level = []
+        for node in level:
+            children = [f"{node}.{i}" for i in range(fanout)]
+            graph[node] = [{"target": c, "relation": "KNOWS" if i else "CITES"} for i, c in enumerate(children)]
+            next_level.extend(children)
+        level = next_level
+    return graph
+
+
+def test_one_fetch_per_level_with_cache_and_budget():
+    graph = tree(fanout=4, depth=4)
+    calls: list[list[str]] = []
+
+    def fetch(node_ids):
+        calls.append(list(node_ids))
+        return {n: graph[n] for n in node_ids if n in graph}
+
+    cache = AdjacencyCache()
+    result = traverse_frontier("root", fetch, max_depth=3, cache=cache)
+    assert result.round_trips == 3 and len(calls) == 3
+    assert len(result.nodes) == 1 + 4 + 16 + 64
+    assert result.depth_reached == 3 and not result.truncated
+
+    again = traverse_frontier("root", fetch, max_depth=3, cache=cache)
+    assert again.round_trips == 0 and again.cache_hits == 1 + 4 + 16
+    assert again.depths == result.depths
+
+    cache.invalidate("default", ["root.1"])
+    assert traverse_frontier("root", fetch, max_depth=3, cache=cache).round_trips == 1
+
+    cited = traverse_frontier("root", fetch, max_depth=4, relation_filter=["CITES"])
+    assert cited.nodes == ["root", "root.0", "root.0.0", "root.0.0.0", "root.0.0.0.0"]
+
+    capped = traverse_frontier("root", fetch, max_depth=4, max_nodes=30)
+    assert capped.truncated and len(capped.nodes) == 30
+    assert capped.depth_reached == 3 and capped.round_trips == 3  # cut off inside level 3, no level-4 fetch
+    assert all(edge["target"] in capped.depths for edge in capped.edges)
+
+
+@pytest.fixture
+def nx_store():
+    pytest.importorskip("networkx")
+    store = UnifiedGraphStore(default_backend=GraphBackend.NETWORKX, enable_multi_backend=False)
+    for source, edges in tree(fanout=3, depth=3).items():
+        for edge in edges:
+            store.add_edge(source, edge["target"], relation=edge["relation"])
+    return store
+
+
+def test_networkx_backend_uses_shared_traversal(nx_store):
+    result = nx_store.query_subgraph(start_node="root", max_depth=2)
+    assert result.success
+    assert result.data["node_count"] == 1 + 3 + 9
+    assert result.data["edge_count"] == 3 + 9
+    assert result.data["truncated"] is False
+    capped = nx_store.query_subgraph(start_node="root", max_depth=3, max_nodes=5)
+    assert capped.data["truncated"] is True and capped.data["node_count"] == 5
+
+
+def test_qdrant_backend_batches_frontier_queries():
+    qdrant_client = pytest.importorskip("qdrant_client")
+    client = qdrant_client.QdrantClient(":memory:")
+    store = UnifiedGraphStore(default_backend=GraphBackend.QDRANT, enable_multi_backend=False, qdrant_client=client)
+    graph = tree(fanout=3, depth=3)
+    nodes = {"root"} | {edge["target"] for edges in graph.values() for edge in edges}
+    for node in sorted(nodes):
+        store.add_node(node, labels=["Creator"], properties={"bio": "x" * 100})
+    for source, edges in graph.items():
+        for edge in edges:
+            assert store.add_edge(source, edge["target"], relation=edge["relation"]).success
+
+    result = store.query_subgraph(start_node="root", max_depth=3)
+    assert result.success
+    assert result.data["node_count"] == len(nodes)
+    assert result.data["edge_count"] == 3 + 9 + 27
+    assert result.data["round_trips"] == 3 + 1  # one per level, one for the payloads
+    assert {node["_node_id"] for node in result.data["nodes"]} == nodes
+    assert all(node["bio"] == "x" * 100 for node in result.data["nodes"])
+
+    # Cached adjacency: only the payload fetch goes to Qdrant.
+    assert store.query_subgraph(start_node="root", max_depth=3).data["round_trips"] == 1
+    store.add_edge("root.0.0.0", "root", relation="CITES")
+    refreshed = store.query_subgraph(start_node="root", max_depth=4)
+    assert refreshed.data["edge_count"] == 3 + 9 + 27 + 1
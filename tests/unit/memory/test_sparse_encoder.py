@@ -0,0 +1,98 @@
+"""BM25 sparse encoder statistics and EnhancedVectorStore hybrid search with rank fusion."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from domains.memory.enhanced_vector_store import EnhancedVectorStore, HybridSearchConfig
+from domains.memory.sparse_encoder import BM25SparseEncoder, SparseStatsStore, term_id, tokenize
+from domains.memory.vector_store import VectorRecord
+
+
+SRC = Path(__file__).resolve().parents[3] / "src"
+
+
+def test_term_ids_are_stable_across_processes():
+    code = "from domains.memory.sparse_encoder import term_id; print(term_id('creator'))"
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    other = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert int(other.stdout) == term_id("creator")
+    assert tokenize("The Creator's 2nd_video, RE-UPLOADED!") == ["creator", "s", "2nd", "video", "re", "uploaded"]
+
+
+def test_document_statistics_replace_and_persist(tmp_path):
+    path = str(tmp_path / "sparse.db")
+    encoder = BM25SparseEncoder(SparseStatsStore(path))
+    docs = ["rust async runtime", "python async await", "python packaging wheels"]
+    vectors = encoder.encode_documents("c", docs, doc_ids=["1", "2", "3"])
+    assert all(v.indices == sorted(v.indices) and len(v.indices) == 3 for v in vectors)
+    assert encoder.get_stats("c")["doc_count"] == 3
+
+    # Re-upserting an id replaces its terms; removing drops them.
+    encoder.encode_documents("c", ["python typing"], doc_ids=["1"])
+    assert encoder.store.collection_stats("c").doc_count == 3
+    assert encoder.store.document_frequencies("c", [term_id("rust"), term_id("python")]) == {term_id("python"): 3}
+    encoder.remove_documents("c", ["3", "missing"])
+
+    reopened = BM25SparseEncoder(SparseStatsStore(path))
+    assert reopened.store.collection_stats("c").doc_count == 2
+    query = reopened.encode_query("c", "python async rust")
+    assert query.indices == sorted([term_id("python"), term_id("async")])  # "rust" no longer in any document
+    # The rarer term gets the higher IDF.
+    weights = dict(zip(query.indices, query.values, strict=True))
+    assert weights[term_id("async")] > weights[term_id("python")]
+    assert reopened.encode_query("other", "python").indices == []
+
+
+def point(point_id: int, score: float) -> SimpleNamespace:
+    return SimpleNamespace(id=point_id, score=score, payload={})
+
+
+def test_rank_fusion_ignores_score_scales():
+    store = EnhancedVectorStore.__new__(EnhancedVectorStore)
+    store.hybrid_config = HybridSearchConfig(dense_weight=1, sparse_weight=1)
+    dense = [point(1, 0.91), point(2, 0.90), point(3, 0.89)]
+    sparse = [point(3, 42.0), point(4, 17.0)]
+    fused = store._combine_search_results(dense, sparse, limit=3)
+    assert [r.id for r in fused] == ["3", "1", "2"]
+    assert fused[0].dense_score == 0.89 and fused[0].sparse_score == 42.0
+
+    store.hybrid_config.fusion = "normalized"
+    fused = store._combine_search_results(dense, sparse, limit=4)
+    assert {r.id: r.hybrid_score for r in fused} == pytest.approx({"1": 1.0, "3": 1.0, "2": 0.5, "4": 0.0})
+
+
+def test_hybrid_search_finds_lexical_match_in_qdrant():
+    pytest.importorskip("qdrant_client")
+    store = EnhancedVectorStore(url=":memory:")
+    assert store.create_collection_with_hybrid_config("t:w:docs", dimension=4, quantization=False)
+    texts = ["weekly podcast about chess openings", "cooking pasta at home", "chess endgame study", "travel vlog"]
+    vectors = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]
+    records = [
+        VectorRecord(content=text, metadata={"tenant": "t"}, vector=vector, id=str(i))
+        for i, (text, vector) in enumerate(zip(texts, vectors, strict=True))
+    ]
+    store.upsert("t:w:docs", records)
+    assert store.sparse_encoder.get_stats("t__w__docs")["doc_count"] == 4
+
+    results = store.hybrid_search("t:w:docs", [0.0, 0.6, 0.8, 0.0], query_text="chess endgame", limit=3)
+    assert results[0].id == "2" and results[0].sparse_score and results[0].dense_score == pytest.approx(0.8)
+    assert {r.id for r in results} == {"0", "1", "2"}
+    assert results[0].payload["content"] == "chess endgame study"
+
+
+def test_sparse_stats_persist_by_default_unless_qdrant_is_in_memory(monkeypatch, caplog):
+    monkeypatch.delenv("SPARSE_STATS_DB_PATH", raising=False)
+    assert EnhancedVectorStore._sparse_stats_path("http://qdrant:6333") == "./data/sparse_stats.db"
+    assert EnhancedVectorStore._sparse_stats_path(":memory:") == ":memory:"
+
+    monkeypatch.setenv("SPARSE_STATS_DB_PATH", ":memory:")
+    with caplog.at_level("WARNING", logger="domains.memory.enhanced_vector_store"):
+        assert EnhancedVectorStore._sparse_stats_path(None) == ":memory:"
+    assert "lost on restart" in caplog.text
@@ -0,0 +1,132 @@
+"""Index-driven, checkpointed TTL compaction and its per-tenant scheduler."""
+
+from __future__ import annotations
+
+from domains.memory.ttl_compaction import CompactionCheckpointStore, CompactionScheduler, TTLCompactor
+from ultimate_discord_intelligence_bot.tenancy.context import TenantContext
+
+import pytest
+
+
+qdrant_client = pytest.importorskip("qdrant_client")
+from qdrant_client.http import models as qmodels  # noqa: E402
+
+
+NOW = 1_700_000_000
+
+
+def make_collection(client, name: str, expires: list[int | None], legacy: int = 0) -> None:
+    client.create_collection(name, vectors_config=qmodels.VectorParams(size=2, distance=qmodels.Distance.COSINE))
+    points = []
+    for i, expires_at in enumerate(expires):
+        payload = {"text": f"doc {i}"} if expires_at is None else {"text": f"doc {i}", "expires_at": expires_at}
+        points.append(qmodels.PointStruct(id=i, vector=[1.0, 0.0], payload=payload))
+    for j in range(legacy):  # written before expires_at existed
+        payload = {"created_at": NOW - 100, "_ttl": 10 if j % 2 else 1_000}
+        points.append(qmodels.PointStruct(id=len(expires) + j, vector=[1.0, 0.0], payload=payload))
+    client.upsert(name, points=points)
+
+
+def test_compaction_deletes_by_range_and_resumes_from_checkpoint(tmp_path):
+    client = qdrant_client.QdrantClient(":memory:")
+    expires = [NOW - 10_000 + i * 20 for i in range(600)] + [None] * 50  # 501 expired by NOW
+    make_collection(client, "t__w__content", expires, legacy=20)
+    path = str(tmp_path / "checkpoints.db")
+    compactor = TTLCompactor(client, CompactionCheckpointStore(path), max_batch=40)
+
+    partial = compactor.compact("t__w__content", now=NOW, max_delete=100)
+    assert partial.backfilled == 10 + 10 and partial.deleted == 100 and not partial.complete
+
+    # A new process picks up the checkpoint and finishes.
+    resumed = TTLCompactor(client, CompactionCheckpointStore(path), max_batch=40)
+    report = resumed.compact("t__w__content", now=NOW)
+    assert report.complete and report.watermark == NOW
+    assert partial.deleted + report.deleted == 501 + 10  # plus the legacy points with a 10 s TTL
+    assert report.remaining == client.count("t__w__content").count == 670 - 511
+
+    # Caught up: the next run only looks at what expired since.
+    later = resumed.compact("t__w__content", now=NOW + 100)
+    assert later.deleted == 5 and later.round_trips <= 4
+
+
+def test_scheduler_runs_each_tenant_on_its_own_interval():
+    client = qdrant_client.QdrantClient(":memory:")
+    alpha, beta = TenantContext("alpha", "main"), TenantContext("beta", "main")
+    make_collection(client, "alpha__main__content", [1, 2, None])
+    make_collection(client, "beta__main__content", [1, None])
+    clock = [float(NOW)]
+    compactor = TTLCompactor(client, CompactionCheckpointStore())
+    scheduler = CompactionScheduler(compactor, ["content", "transcripts"], interval_s=60, clock=lambda: clock[0])
+    scheduler.add_tenant(alpha)
+    scheduler.add_tenant(beta, interval_s=600)
+
+    first = scheduler.run_due()
+    assert {key: [r.deleted for r in reports] for key, reports in first.items()} == {
+        "alpha:main": [2],
+        "beta:main": [1],
+    }
+    assert scheduler.seconds_until_due() == 60
+
+    clock[0] += 61
+    assert set(scheduler.run_due()) == {"alpha:main"}
+    assert scheduler.get_status()["beta:main"]["last_reports"][0]["remaining"] == 1
+
+
+def test_storage_tool_writes_expires_at_and_tool_compacts_by_index(monkeypatch):
+    from domains.memory.vector.memory_compaction_tool import MemoryCompactionTool
+    from domains.memory.vector.memory_storage_tool import MemoryStorageTool
+
+    monkeypatch.setenv("ENABLE_MEMORY_TTL", "0")
+    monkeypatch.setenv("ENABLE_MEMORY_COMPACTION", "1")
+    client = qdrant_client.QdrantClient(":memory:")
+    client.create_collection("ttl_tool", vectors_config=qmodels.VectorParams(size=3, distance=qmodels.Distance.COSINE))
+    store = MemoryStorageTool(client=client, collection="ttl_tool", embedding_fn=lambda text: [0.1, 0.2, 0.3])
+    assert store.run(text="expired", metadata={"created_at": 1_000, "_ttl": 5}, collection="ttl_tool").success
+    assert store.run(text="kept", metadata={"_ttl": 3_600}, collection="ttl_tool").success
+    points, _ = client.scroll("ttl_tool", with_payload=True)
+    assert sorted(p.payload["expires_at"] for p in points)[0] == 1_005
+
+    result = MemoryCompactionTool(client=client, collection="ttl_tool").run(collection="ttl_tool")
+    assert result.success
+    assert result.data["mode"] == "indexed" and result.data["complete"]
+    assert result.data["deleted"] == 1 and result.data["remaining"] == 1
+
+
+def test_scheduler_discovers_tenants_from_collection_names():
+    client = qdrant_client.QdrantClient(":memory:")
+    make_collection(client, "alpha__main__content", [1, None])
+    make_collection(client, "beta__ops__transcripts", [1, 2])
+    make_collection(client, "gamma__main__other", [1])
+    make_collection(client, "unscoped", [1])
+    compactor = TTLCompactor(client, CompactionCheckpointStore())
+    scheduler = CompactionScheduler(compactor, ["content", "transcripts"], discover=True, clock=lambda: float(NOW))
+
+    reports = scheduler.run_due()
+    assert {key: [r.deleted for r in rs] for key, rs in reports.items()} == {"alpha:main": [1], "beta:ops": [2]}
+    assert scheduler.discover_tenants() == 0
+
+
+def test_compaction_scheduler_starts_only_behind_its_flag(monkeypatch):
+    import asyncio
+
+    from ultimate_discord_intelligence_bot.services import maintenance
+
+    client = qdrant_client.QdrantClient(":memory:")
+    make_collection(client, "alpha__main__content", [1, None])
+
+    async def scenario():
+        monkeypatch.setenv("ENABLE_MEMORY_COMPACTION", "false")
+        assert await maintenance.start_compaction_scheduler(client) is None
+        monkeypatch.setenv("ENABLE_MEMORY_COMPACTION", "1")
+        scheduler = await maintenance.start_compaction_scheduler(client)
+        try:
+            assert scheduler is not None and await maintenance.start_compaction_scheduler(client) is scheduler
+            for _ in range(50):
+                if scheduler.get_status():
+                    break
+                await asyncio.sleep(0.02)
+            assert scheduler.get_status()["alpha:main"]["last_reports"][0]["deleted"] == 1
+        finally:
+            await maintenance.stop_compaction_scheduler()
+
+    asyncio.run(scenario())
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from platform.observability.startup_profiler import STARTUP_BUDGETS, budget_for, parse_importtime, profile_imports
+from ultimate_discord_intelligence_bot import tools
+
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     leaf_a
+import time:        50 |        150 |   mid
+import time:        30 |         30 |   sibling
+import time:        20 |        200 | top
+import time:        10 |         10 | other
+"""
+
+
+def test_parse_importtime_builds_tree():
+    roots = parse_importtime(REPORT)
+    assert [r.module for r in roots] == ["top", "other"]
+    top = roots[0]
+    assert [c.module for c in top.children] == ["mid", "sibling"]
+    assert top.children[0].children[0].module == "leaf_a"
+    assert top.cumulative_us == 200
+
+
+def test_tools_package_import_loads_no_tool_modules():
+    profile = profile_imports("ultimate_discord_intelligence_bot.tools")
+    assert profile.ok, profile.error
+    loaded = {node.module for root in profile.roots for node in root.walk()}
+    tool_modules = {mod if not mod.startswith(".") else f"{tools.__name__}{mod}" for mod in tools.MAPPING.values()}
+    assert not loaded & tool_modules
+
+
+def test_lazy_tool_is_cached_after_first_access(monkeypatch):
+    monkeypatch.setitem(tools.MAPPING, "JSONDecoder", "json")
+    try:
+        cls = tools.JSONDecoder
+        assert vars(tools)["JSONDecoder"] is cls
+        assert "JSONDecoder" in tools.tool_load_times()
+    finally:
+        vars(tools).pop("JSONDecoder", None)
+        tools._LOAD_TIMES.pop("JSONDecoder", None)
+
+
+@pytest.mark.parametrize("module", sorted(STARTUP_BUDGETS))
+def test_entry_point_cold_import_within_budget(module):
+    profile = profile_imports(module, importtime=False)
+    if not profile.ok and "ModuleNotFoundError" in (profile.error or ""):
+        pytest.skip(f"{module} needs an uninstalled dependency: {profile.error}")
+    assert profile.ok, profile.error
+    assert profile.process_seconds <= budget_for(module), (
+        f"{module} cold start took {profile.process_seconds:.2f}s (budget {budget_for(module):.2f}s); "
+        "run `python -m platform.observability.startup_profiler --tree` to find the slow imports"
+    )
@@ -0,0 +1,142 @@
+"""Tests for budgeted trace payloads and the background Langfuse exporter."""
+
+from __future__ import annotations
+
+import threading
+from platform.observability.background_exporter import BackgroundExporter
+from platform.observability.payload_sanitizer import OMITTED, PayloadBudget, PayloadSanitizer
+from types import SimpleNamespace
+
+import pytest
+
+from ultimate_discord_intelligence_bot.services import langfuse_service as lf
+from ultimate_discord_intelligence_bot.step_result import StepResult
+
+
+def test_sanitizer_truncates_strings_and_collections():
+    sanitizer = PayloadSanitizer(PayloadBudget(max_string_bytes=16, max_items=3, max_depth=2))
+    out = sanitizer.prepare({"text": "x" * 100, "items": list(range(10)), "deep": {"a": {"b": {"c": 1}}}})
+    assert out["text"] == "x" * 16 + "...[truncated 84 bytes]"
+    assert out["items"] == [0, 1, 2, "...[7 more items]"]
+    assert out["deep"] == {"a": "<mapping with 1 keys>"}
+    assert sanitizer.truncated_strings == 1
+    assert sanitizer.truncated_collections == 2
+
+
+def test_sanitizer_truncates_multibyte_text_on_character_boundary():
+    out = PayloadSanitizer(PayloadBudget(max_string_bytes=5)).prepare(["é" * 10])
+    assert out[0].startswith("éé...[truncated")
+
+
+def test_sanitizer_enforces_total_budget():
+    sanitizer = PayloadSanitizer(PayloadBudget(max_string_bytes=64, max_total_bytes=100))
+    out = sanitizer.prepare({f"k{i}": "y" * 40 for i in range(10)})
+    assert out["k0"] == "y" * 40
+    assert out["__omitted_keys__"] > 0 or OMITTED in out.values()
+    assert sanitizer.omitted_values > 0
+
+
+def test_sanitizer_memoizes_results_and_its_own_outputs():
+    sanitizer = PayloadSanitizer(PayloadBudget(max_string_bytes=32))
+    result = StepResult.ok(transcript="word " * 1000)
+    span = sanitizer.prepare({"transcription": result})
+    trace = sanitizer.prepare({"transcription": result, "status": "success"})
+    assert trace["transcription"] is span["transcription"]
+    assert sanitizer.prepare(trace) is trace
+    assert sanitizer.memo_hits >= 2
+    sanitizer.clear()
+    assert sanitizer.stats()["memo_size"] == 0
+
+
+def test_background_exporter_drops_on_overflow():
+    release = threading.Event()
+    batches: list[list[int]] = []
+
+    def sink(batch: list[int]) -> None:
+        release.wait(5)
+        batches.append(batch)
+
+    exporter = BackgroundExporter(sink, name="test", max_queue_size=2, batch_size=1, flush_interval=0.01)
+    assert exporter.submit(0)
+    # Wait until the worker holds item 0 so the queue capacity is free again.
+    for _ in range(500):
+        if exporter.stats()["queue_depth"] == 0:
+            break
+        threading.Event().wait(0.001)
+    accepted = [exporter.submit(i) for i in range(1, 5)]
+    assert accepted == [True, True, False, False]
+    assert exporter.dropped == 2
+    release.set()
+    assert exporter.flush(timeout=5)
+    assert sorted(i for batch in batches for i in batch) == [0, 1, 2]
+    assert exporter.stats()["exported"] == 3
+
+
+def test_background_exporter_batches_items():
+    batches: list[list[int]] = []
+    exporter = BackgroundExporter(batches.append, name="test", batch_size=4, flush_interval=0.5)
+    for i in range(8):
+        exporter.submit(i)
+    assert exporter.flush(timeout=5)
+    assert [i for batch in batches for i in batch] == list(range(8))
+    assert len(batches) < 8
+
+
+def test_background_exporter_registers_atexit_once(monkeypatch):
+    from platform.observability import background_exporter
+
+    registered: list[object] = []
+    monkeypatch.setattr(background_exporter.atexit, "register", registered.append)
+    exporter = BackgroundExporter(lambda batch: None, name="test")
+    for _ in range(3):
+        exporter.submit(1)
+        assert exporter.flush(timeout=5)
+        exporter._worker = threading.Thread(target=lambda: None)  # simulate a dead worker
+    assert len(registered) == 1
+
+
+class _FakeSpan:
+    def __init__(self) -> None:
+        self.updates: list[object] = []
+
+    def update(self, payload: object) -> None:
+        self.updates.append(payload)
+
+
+class _FakeClient:
+    def __init__(self, **kwargs: object) -> None:
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(lf, "_LangfuseClient", _FakeClient)
+    monkeypatch.setattr(lf, "CreateTrace", dict)
+    monkeypatch.setattr(lf, "UpdateSpan", lambda **kw: kw)
+    monkeypatch.setenv("LANGFUSE_EXPORT_FLUSH_INTERVAL", "0.01")
+    monkeypatch.setenv("TRACE_PAYLOAD_MAX_STRING_BYTES", "8")
+    settings = SimpleNamespace(enable_langfuse_export=True, langfuse_public_key="pk", langfuse_secret_key="sk")
+    return lf.LangfuseService(settings=settings)
+
+
+def test_langfuse_updates_are_exported_in_background_batches(service):
+    span = _FakeSpan()
+    for _ in range(3):
+        assert service.update_span(span, {"transcript": "abcdefghijklmnop"}).data == {"queued": True}
+    service.flush(timeout=5)
+    assert len(span.updates) == 3
+    assert span.updates[0]["output"]["transcript"].startswith("abcdefgh...[truncated")
+    assert service._client.flushes <= 3
+    assert service.export_stats()["exported"] == 3
+
+
+def test_langfuse_synchronous_mode(monkeypatch, service):
+    monkeypatch.setenv("LANGFUSE_EXPORT_ASYNC", "0")
+    settings = SimpleNamespace(enable_langfuse_export=True, langfuse_public_key="pk", langfuse_secret_key="sk")
+    sync_service = lf.LangfuseService(settings=settings)
+    span = _FakeSpan()
+    assert sync_service.update_span(span, {"x": 1}).success
+    assert span.updates and sync_service.export_stats() == {}
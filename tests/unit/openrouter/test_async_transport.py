@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+
+from platform.llm.providers.openrouter.openrouter_service.async_transport import (
+    AsyncChatTransport,
+    aclose_async_transport,
+    get_async_transport,
+)
+
+
+TOKENS = ["Hel", "lo", " wor", "ld"]
+
+
+@asynccontextmanager
+async def stub_server():
+    seen = {"connections": set(), "payloads": [], "fail_first": 0, "stream_closed": asyncio.Event()}
+
+    async def completions(request: web.Request) -> web.StreamResponse:
+        seen["connections"].add(id(request.transport))
+        payload = await request.json()
+        seen["payloads"].append(payload)
+        if seen["fail_first"]:
+            seen["fail_first"] -= 1
+            return web.json_response({"error": "busy"}, status=503)
+        if not payload.get("stream"):
+            text = "".join(TOKENS)
+            return web.json_response({"choices": [{"message": {"content": text}}], "usage": {"total_tokens": 4}})
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        delay = float(request.query.get("delay", "0"))
+        try:
+            for token in TOKENS:
+                chunk = {"choices": [{"delta": {"content": token}}]}
+                await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                await asyncio.sleep(delay)
+            await response.write(b"data: [DONE]\n\n")
+        except (asyncio.CancelledError, ConnectionResetError):
+            seen["stream_closed"].set()
+            raise
+        return response
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", completions)
+    runner = web.AppRunner(app, handler_cancellation=True)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    seen["url"] = f"http://127.0.0.1:{port}/v1/chat/completions"
+    try:
+        yield seen
+    finally:
+        await runner.cleanup()
+
+
+def test_completions_reuse_one_keepalive_connection():
+    async def run() -> None:
+        async with stub_server() as server:
+            transport = AsyncChatTransport()
+            try:
+                for _ in range(5):
+                    resp = await transport.send(server["url"], {"model": "m", "messages": []})
+                    assert resp.ok
+                    assert resp.content == "Hello world"
+                    assert resp.usage == {"total_tokens": 4}
+                assert len(server["connections"]) == 1
+            finally:
+                await transport.aclose()
+
+    asyncio.run(run())
+
+
+def test_stream_hands_tokens_to_callback():
+    received: list[str] = []
+
+    async def on_token(token: str) -> None:
+        received.append(token)
+
+    async def run() -> None:
+        async with stub_server() as server:
+            transport = AsyncChatTransport()
+            try:
+                resp = await transport.send(server["url"], {"model": "m"}, stream=True, on_token=on_token)
+            finally:
+                await transport.aclose()
+            assert resp.streamed and resp.content == "Hello world"
+            assert resp.json()["choices"][0]["message"]["content"] == "Hello world"
+            assert server["payloads"][0]["stream"] is True
+
+    asyncio.run(run())
+    assert received == TOKENS
+
+
+def test_cancelling_a_stream_closes_the_response():
+    async def run() -> None:
+        async with stub_server() as server:
+            first_token = asyncio.Event()
+            transport = AsyncChatTransport()
+            task = asyncio.create_task(
+                transport.send(
+                    server["url"] + "?delay=5",
+                    {"model": "m"},
+                    stream=True,
+                    on_token=lambda _token: first_token.set(),
+                )
+            )
+            try:
+                await asyncio.wait_for(first_token.wait(), timeout=5)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                await asyncio.wait_for(server["stream_closed"].wait(), timeout=5)
+            finally:
+                await transport.aclose()
+
+    asyncio.run(run())
+
+
+def test_retries_retryable_status():
+    async def run() -> None:
+        async with stub_server() as server:
+            server["fail_first"] = 2
+            transport = AsyncChatTransport()
+            try:
+                resp = await transport.send(server["url"], {"model": "m"}, attempts=3, base_backoff=0.0)
+                assert resp.ok and transport.requests == 3
+                server["fail_first"] = 1
+                resp = await transport.send(server["url"], {"model": "m"}, attempts=1)
+                assert resp.status_code == 503 and not resp.ok
+            finally:
+                await transport.aclose()
+
+    asyncio.run(run())
+
+
+def test_shared_transport_is_per_event_loop():
+    async def run() -> AsyncChatTransport:
+        transport = get_async_transport()
+        assert get_async_transport() is transport
+        await aclose_async_transport()
+        assert transport.closed
+        return transport
+
+    assert asyncio.run(run()) is not asyncio.run(run())
+
+
+def test_aroute_end_to_end_against_stub_server(monkeypatch):
+    from platform.llm.providers.openrouter.openrouter_service import execution
+    from platform.llm.providers.openrouter.openrouter_service.service import OpenRouterService
+
+    received: list[str] = []
+
+    async def run() -> tuple[dict, dict, list]:
+        async with stub_server() as server:
+            monkeypatch.setattr(execution, "OPENROUTER_CHAT_URL", server["url"])
+            service = OpenRouterService(api_key="test-key")
+            try:
+                buffered = await service.aroute("Say hello", compress=False)
+                streamed = await service.aroute(
+                    "Say hello again", compress=False, stream=True, on_token=received.append
+                )
+            finally:
+                await aclose_async_transport()
+            return buffered, streamed, server["payloads"]
+
+    buffered, streamed, payloads = asyncio.run(run())
+    assert buffered["status"] == streamed["status"] == "success"
+    assert buffered["response"] == streamed["response"] == "Hello world"
+    assert streamed["streamed"] is True and received == TOKENS
+    assert [p["messages"][0]["content"] for p in payloads] == ["Say hello", "Say hello again"]
+    assert payloads[0]["model"] == buffered["model"]
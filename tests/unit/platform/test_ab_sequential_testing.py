@@ -0,0 +1,101 @@
+"""Running statistics, mSPRT early stopping and SQLite persistence for A/B experiments."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import statistics
+from platform.experimentation import ab_testing_framework as ab
+from platform.experimentation.experiment_store import ExperimentStore
+from platform.experimentation.sequential_testing import RunningStats, SequentialExperiment
+
+
+def test_running_stats_match_batch_statistics():
+    rng = random.Random(1)
+    values = [rng.gauss(100, 15) for _ in range(1000)]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    assert stats.n == 1000
+    assert abs(stats.mean - statistics.fmean(values)) < 1e-9
+    assert abs(stats.variance - statistics.variance(values)) < 1e-6
+
+
+def run(experiment: SequentialExperiment, rates: dict[str, float], n: int, seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(n):
+        if experiment.concluded:
+            return
+        arm = rng.choice(experiment.active)
+        experiment.record(arm, 100.0, 0.001, 0.5, rng.random() < rates[arm])
+
+
+def test_clear_winner_stops_early_and_aa_tests_rarely_stop():
+    experiment = SequentialExperiment(["a", "b", "c"])
+    run(experiment, {"a": 0.9, "b": 0.6, "c": 0.5}, 5000, seed=2)
+    assert experiment.winner == "a"
+    assert sum(stats.count for stats in experiment.arms.values()) < 1000
+    assert set(experiment.eliminated) == {"b", "c"}
+
+    # Always-valid: checking after every sample keeps false stops near alpha.
+    false_stops = 0
+    for seed in range(40):
+        null = SequentialExperiment(["a", "b"], alpha=0.05)
+        run(null, {"a": 0.7, "b": 0.7}, 600, seed=100 + seed)
+        false_stops += null.concluded
+    assert false_stops <= 5
+
+
+def make_tester(store: ExperimentStore | None = None) -> ab.AIRouterABTester:
+    rng = random.Random(3)
+    rates = {ab.TestStrategy.PERFORMANCE_BASED: 0.95, ab.TestStrategy.COST_OPTIMIZED: 0.5}
+    tester = ab.AIRouterABTester(store=store, persist_every=5)
+    for strategy, rate in rates.items():
+
+        async def router(prompt, task_type, optimization_target, rate=rate, **kwargs):
+            return {"status": "success" if rng.random() < rate else "error", "response": "ok", "cost": 0.001}
+
+        tester.register_strategy(strategy, router)
+    return tester
+
+
+def config() -> ab.ABTestConfig:
+    strategies = [ab.TestStrategy.PERFORMANCE_BASED, ab.TestStrategy.COST_OPTIMIZED]
+    return ab.ABTestConfig(
+        test_name="routing",
+        strategies=strategies,
+        traffic_split=dict.fromkeys(strategies, 0.5),
+        min_samples_per_strategy=500,
+    )
+
+
+def test_tester_routes_all_traffic_to_winner_and_resumes_from_sqlite(tmp_path):
+    store = ExperimentStore(str(tmp_path / "ab.db"))
+    tester = make_tester(store)
+    name = tester.start_experiment(config())
+
+    async def drive(n: int) -> list[str]:
+        return [(await tester.route_with_ab_testing(name, "prompt"))["ab_test_strategy"] for _ in range(n)]
+
+    asyncio.run(drive(300))
+    status = tester.get_experiment_status(name)
+    assert status["sequential"]["winner"] == ab.TestStrategy.PERFORMANCE_BASED.value
+    assert status["overall"]["stopped_early"] and status["overall"]["complete"]
+    assert status["overall"]["total_samples"] == 300
+    losing = status["strategies"][ab.TestStrategy.COST_OPTIMIZED.value]["sample_count"]
+    assert losing < 150
+    assert set(asyncio.run(drive(20))) == {ab.TestStrategy.PERFORMANCE_BASED.value}
+
+    saved = store.load(name)
+    assert saved is not None and saved["status"] == "concluded"
+
+    resumed = make_tester(ExperimentStore(str(tmp_path / "ab.db")))
+    resumed.start_experiment(config())
+    resumed_status = resumed.get_experiment_status(name)
+    assert resumed_status["sequential"]["winner"] == ab.TestStrategy.PERFORMANCE_BASED.value
+    assert resumed_status["strategies"][ab.TestStrategy.COST_OPTIMIZED.value]["sample_count"] == losing
+
+    results = tester.stop_experiment(name)
+    assert results[0].strategy is ab.TestStrategy.PERFORMANCE_BASED
+    assert results[0].statistical_significance
+    assert store.load(name)["status"] == "stopped"
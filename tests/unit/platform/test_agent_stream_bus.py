@@ -0,0 +1,144 @@
+"""Redis Streams transport for the agent message bus."""
+
+from __future__ import annotations
+
+import asyncio
+from platform.rl.agent_messaging import AgentMessage, AgentStreamBus, MessagePriority, MessageType
+
+import pytest
+
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def make_bus(server, **kwargs) -> AgentStreamBus:
+    client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    kwargs.setdefault("block_ms", 20)
+    kwargs.setdefault("enable_global_broadcast", False)
+    return AgentStreamBus(client=client, **kwargs)
+
+
+def note(i: int, target: str | None = "worker") -> AgentMessage:
+    return AgentMessage(type=MessageType.NOTE, content=f"m{i}", target_agent_id=target)
+
+
+async def wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_instances_of_one_agent_share_messages_and_ack_them():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        buses = [make_bus(server, consumer_name=f"c{i}", batch_size=4) for i in range(2)]
+        seen: list[list[str]] = [[], []]
+        for i, bus in enumerate(buses):
+
+            async def handle(message, i=i):
+                seen[i].append(message.content)
+                await asyncio.sleep(0.005)
+
+            await bus.subscribe("worker", handle)
+        assert await buses[0].publish_many([note(i) for i in range(40)]) == 40
+        await wait_for(lambda: len(seen[0]) + len(seen[1]) == 40)
+        assert sorted(seen[0] + seen[1]) == sorted(f"m{i}" for i in range(40))
+        assert seen[0] and seen[1]
+        for _ in range(200):  # the last batch is acked once its callbacks return
+            if await buses[0].stream_lag("agent_stream:default:worker") == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert await buses[0].stream_lag("agent_stream:default:worker") == 0
+        for bus in buses:
+            await bus.disconnect()
+
+    asyncio.run(scenario())
+
+
+def test_failed_messages_are_reclaimed_then_dead_lettered():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        bus = make_bus(server, claim_idle_ms=0, max_deliveries=3)
+        attempts: dict[str, int] = {}
+
+        async def flaky(message):
+            attempts[message.content] = attempts.get(message.content, 0) + 1
+            if message.content == "poison" or attempts[message.content] == 1:
+                raise RuntimeError("boom")
+
+        await bus.subscribe("worker", flaky)
+        await bus.publish(note(1))
+        await bus.publish(AgentMessage(type=MessageType.NOTE, content="poison", target_agent_id="worker"))
+        client = bus._redis_client
+        await wait_for(lambda: attempts.get("m1", 0) >= 2 and attempts.get("poison", 0) >= 3)
+
+        async def dead_count() -> int:
+            return await client.xlen("agent_stream:default:worker:dead")
+
+        for _ in range(200):
+            if await dead_count() == 1:
+                break
+            await asyncio.sleep(0.01)
+        assert await dead_count() == 1
+        assert attempts["m1"] == 2
+        assert attempts["poison"] == 3
+        pending = await client.xpending("agent_stream:default:worker", "default:worker")
+        assert pending["pending"] == 0
+        await bus.disconnect()
+
+    asyncio.run(scenario())
+
+
+def test_streams_are_trimmed_and_publishers_see_backpressure():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        bus = make_bus(server, max_stream_length=100, max_lag=50, backpressure_timeout=0.05)
+        client = bus._redis_client
+        assert await bus.publish_many([note(i, target="archive") for i in range(1000)]) == 1000
+        # MAXLEN ~ trims in whole nodes; the stream stays near the cap rather than growing unbounded.
+        assert await client.xlen("agent_stream:default:archive") < 300
+
+        await client.xgroup_create("agent_stream:default:slow", "slow", id="0", mkstream=True)
+        assert await bus.publish_many([note(i, target="slow") for i in range(60)]) == 60
+        bus._lag_cache.clear()
+        assert await bus.publish(note(61, target="slow")) is False
+        assert await client.xlen("agent_stream:default:slow") == 60
+        history = await bus.get_message_history("slow", limit=5)
+        assert [m.content for m in history] == ["m59", "m58", "m57", "m56", "m55"]
+        await bus.disconnect()
+
+    asyncio.run(scenario())
+
+
+def test_global_broadcast_groups_are_per_tenant_and_can_be_deleted():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        bus = make_bus(server, enable_global_broadcast=True, max_lag=0, backpressure_timeout=5.0)
+        seen: dict[str, list[str]] = {"a": [], "b": []}
+        try:
+            for tenant in seen:
+
+                async def handle(message, tenant=tenant):
+                    seen[tenant].append(message.content)
+
+                await bus.subscribe("worker", handle, tenant_id=tenant)
+            alert = AgentMessage(type=MessageType.NOTE, content="alert", priority=MessagePriority.URGENT)
+            assert await bus.publish(alert, tenant_id="ops")
+            # Same agent id in two tenants: each tenant's group gets the global broadcast.
+            await wait_for(lambda: seen == {"a": ["alert"], "b": ["alert"]})
+
+            # An abandoned group keeps lagging and holds back publishers until it is deleted.
+            await bus.unsubscribe("worker", tenant_id="b")
+            bus._lag_cache.clear()
+            assert await bus.publish(alert, tenant_id="ops")
+            bus._lag_cache.clear()
+            bus.backpressure_timeout = 0.05
+            assert await bus.publish(alert, tenant_id="ops") is False
+            assert await bus.delete_consumer_groups("worker", tenant_id="b") == 3
+            bus.backpressure_timeout = 5.0
+            assert await bus.publish(alert, tenant_id="ops")
+        finally:
+            await bus.disconnect()
+
+    asyncio.run(scenario())
@@ -0,0 +1,204 @@
+"""Tag/dependency invalidation against real cache backends and L1 fan-out over pub/sub."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from platform.cache import enhanced_redis_cache
+from platform.cache.dependency_tracker import DependencyTracker
+from platform.cache.enhanced_redis_cache import EnhancedRedisCache
+from platform.cache.invalidation_bus import RedisInvalidationBus
+from platform.cache.invalidation_engine import InvalidationEngine, TagIndex
+from platform.cache.multi_level_cache import MultiLevelCache
+
+import pytest
+
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def worker(server, **engine_kwargs):
+    client = fakeredis.FakeRedis(server=server)
+    cache = MultiLevelCache(redis_client=client)
+    bus = RedisInvalidationBus(client)
+    engine = InvalidationEngine(
+        dependency_tracker=DependencyTracker(), backends=[cache], bus=bus, tag_index=TagIndex(client), **engine_kwargs
+    )
+    return cache, engine
+
+
+def test_tag_invalidation_deletes_from_memory_and_redis_in_batches(server):
+    cache, engine = worker(server, max_batch_size=7)
+    client = cache.redis_client
+
+    async def scenario():
+        for i in range(50):
+            cache.set("summary", {"video": i}, f"summary-{i}")
+            await engine.tag(cache.cache_key("summary", {"video": i}), {"channel:a" if i % 2 else "channel:b"})
+        return await engine.invalidate_tags({"channel:a"})
+
+    result = asyncio.run(scenario())
+    assert len(result.invalidated_keys) == 25
+    assert not result.errors
+    for i in range(50):
+        key = cache.cache_key("summary", {"video": i})
+        gone = i % 2 == 1
+        assert (key not in cache.memory_cache) is gone
+        assert (client.get(key) is None) is gone
+    assert engine.tag_index.members({"channel:a"}) == set()
+    assert len(engine.tag_index.members({"channel:b"})) == 25
+
+
+def test_dependency_cascade_reaches_enhanced_redis_backend(server, monkeypatch):
+    monkeypatch.setattr(
+        enhanced_redis_cache.redis.Redis,
+        "from_url",
+        lambda url, **kwargs: fakeredis.FakeRedis(server=server, decode_responses=True),
+    )
+    redis_cache = EnhancedRedisCache(url="redis://fake", namespace="llm", pipeline_size=2)
+    tracker = DependencyTracker()
+    engine = InvalidationEngine(dependency_tracker=tracker, backends=[redis_cache])
+
+    async def scenario():
+        for key in ("page:1", "page:2", "page:3", "header"):
+            redis_cache.set(key, {"html": key})
+        await tracker.register_dependencies("page:1", {"header"})
+        await tracker.register_dependencies("page:2", {"page:1"})
+        return await engine.invalidate_key("header", cascade=True)
+
+    result = asyncio.run(scenario())
+    assert result.invalidated_keys == {"header", "page:1", "page:2"}
+    assert redis_cache.get("page:2", track_access=False) is None
+    assert redis_cache.get("page:3", track_access=False) == {"html": "page:3"}
+    assert tracker.get_graph_snapshot() == {}
+
+
+def test_broadcast_evicts_l1_entries_in_other_workers(server):
+    writer_cache, writer = worker(server)
+    reader_cache, reader = worker(server)
+
+    async def scenario():
+        await writer.start()
+        await reader.start()
+        try:
+            writer_cache.set("transcript", {"id": 1}, "text")
+            assert reader_cache.get("transcript", {"id": 1}) == "text"  # promoted into the reader's L1
+            key = reader_cache.cache_key("transcript", {"id": 1})
+            assert key in reader_cache.memory_cache
+            await writer.invalidate_key(key, cascade=False)
+            assert await asyncio.to_thread(wait_for, lambda: key not in reader_cache.memory_cache)
+        finally:
+            await writer.stop()
+            await reader.stop()
+
+    asyncio.run(scenario())
+    assert reader_cache.get("transcript", {"id": 1}) is None
+    assert writer.bus.get_stats()["received_messages"] == 0  # own broadcasts are skipped
+    assert reader.bus.get_stats()["received_keys"] == 1
+
+
+def test_failed_backend_chunk_is_not_reported_or_broadcast(server):
+    class FlakyBackend:
+        def delete_keys(self, keys):
+            if "bad" in keys:
+                raise ConnectionError("redis down")
+
+    bus = RedisInvalidationBus(fakeredis.FakeRedis(server=server))
+    engine = InvalidationEngine(dependency_tracker=DependencyTracker(), backends=[FlakyBackend()], bus=bus)
+    result = asyncio.run(engine.invalidate_key("bad", cascade=False))
+    assert result.invalidated_keys == set()
+    assert result.errors
+    assert bus.get_stats()["published_messages"] == 0
+    assert engine.get_stats()["backends"]["errors"] == 1
+
+
+def test_bus_splits_large_invalidations_and_ignores_garbage(server):
+    sender = RedisInvalidationBus(fakeredis.FakeRedis(server=server), max_keys_per_message=100)
+    receiver = RedisInvalidationBus(fakeredis.FakeRedis(server=server))
+    seen: list[str] = []
+    receiver.add_handler(seen.extend)
+    receiver.start()
+    try:
+        assert sender.publish([f"k{i}" for i in range(250)]) == 3
+        assert wait_for(lambda: len(seen) == 250)
+    finally:
+        receiver.stop()
+    assert receiver.handle_message(b"not json") == 0
+    assert receiver.get_stats()["received_messages"] == 3
+
+
+def test_delete_keys_issues_one_del_per_key_and_l1_is_thread_safe(server):
+    class SingleSlotClient(fakeredis.FakeRedis):
+        """Rejects multi-key DEL like a Redis Cluster node given keys from several slots."""
+
+        def delete(self, *names):
+            if len(names) > 1:
+                raise AssertionError("CROSSSLOT Keys in request don't hash to the same slot")
+            return super().delete(*names)
+
+    cache = MultiLevelCache(redis_client=SingleSlotClient(server=server), max_memory_size=64)
+    for i in range(20):
+        cache.set("op", {"i": i}, i)
+    keys = [cache.cache_key("op", {"i": i}) for i in range(20)]
+    assert cache.delete_keys(keys) == 40
+    assert cache.redis_client.get(keys[0]) is None
+
+    # Evictions from another thread (the bus listener) race with LRU eviction in set().
+    local = MultiLevelCache(max_memory_size=64)
+    stop = threading.Event()
+
+    def evict_forever():
+        while not stop.is_set():
+            local.evict_local([local.cache_key("op", {"i": i}) for i in range(0, 200, 3)])
+
+    evictor = threading.Thread(target=evict_forever)
+    evictor.start()
+    try:
+        for i in range(2000):
+            local.set("op", {"i": i % 200}, i)
+            local.get("op", {"i": (i * 7) % 200})
+    finally:
+        stop.set()
+        evictor.join()
+    assert len(local.memory_cache) <= local.max_memory_size
+    assert set(local.memory_cache) == set(local.memory_access_times)
+
+
+def test_global_engine_binds_the_cache_on_first_use(monkeypatch):
+    from platform.cache import invalidation_engine, multi_level_cache
+
+    created: list[MultiLevelCache] = []
+
+    def fake_get_cache():
+        created.append(MultiLevelCache())
+        return created[-1]
+
+    monkeypatch.setattr(invalidation_engine, "_invalidation_engine", None)
+    monkeypatch.setattr(multi_level_cache, "get_cache", fake_get_cache)
+    engine = invalidation_engine.get_invalidation_engine()
+    assert created == [] and engine.backends == []
+
+    cache_key = "cache:default:op:abc"
+
+    async def scenario():
+        await engine.tag(cache_key, {"t"})
+        return await engine.invalidate_tags({"t"})
+
+    result = asyncio.run(scenario())
+    assert result.invalidated_keys == {cache_key}
+    assert engine.backends == created and len(created) == 1
@@ -0,0 +1,119 @@
+"""Sketch-based access tracking and loader-driven warming in cache_warmer."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import Counter
+from platform.cache import enhanced_redis_cache
+from platform.cache.access_sketch import CountMinSketch, HeavyHitters
+from platform.cache.cache_warmer import AccessPatternTracker, CacheWarmer
+from platform.cache.enhanced_redis_cache import EnhancedRedisCache
+
+import pytest
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def zipf_stream(n: int, keys: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(keys)]
+    return [f"k{i}" for i in rng.choices(range(keys), weights=weights, k=n)]
+
+
+def test_count_min_never_undercounts_and_stays_close_for_heavy_keys():
+    stream = zipf_stream(50_000, 20_000, seed=1)
+    sketch = CountMinSketch(width=2048, depth=4)
+    for key in stream:
+        sketch.add(key)
+    truth = Counter(stream)
+    assert all(sketch.estimate(key) >= count for key, count in truth.items())
+    for key, count in truth.most_common(20):
+        assert sketch.estimate(key) <= count + 0.01 * len(stream)
+
+
+def test_heavy_hitters_track_top_k_with_bounded_memory_and_decay():
+    clock = FakeClock()
+    hitters = HeavyHitters(k=10, decay_factor=0.5, decay_interval=60, clock=clock)
+    stream = zipf_stream(30_000, 50_000, seed=2)
+    for key in stream:
+        hitters.record(key)
+    assert len(hitters) == 10
+    expected = {key for key, _ in Counter(stream).most_common(5)}
+    assert expected <= {key for key, _ in hitters.top()}
+
+    # Traffic moves to a new key; decay lets it overtake the old leaders.
+    for _ in range(10):
+        clock.now += 60
+        for _ in range(2000):
+            hitters.record("new-hot")
+    assert hitters.top(1)[0][0] == "new-hot"
+    assert hitters.estimate("k0") < Counter(stream)["k0"] / 100
+
+
+def test_tracker_keeps_patterns_only_for_hot_keys():
+    tracker = AccessPatternTracker(top_k=5)
+    for key in zipf_stream(5_000, 1_000, seed=3):
+        tracker.record("llm", key)
+    assert len(tracker.patterns) <= 5 + 1
+    top = asyncio.run(tracker.get_top_patterns("llm", limit=3))
+    assert [p.key for p in top] == [key for key, _ in tracker.hot_keys("llm", 3)]
+    assert top[0].heat >= top[1].heat >= top[2].heat
+    assert len(top[0].access_times) <= 32
+
+
+@pytest.fixture
+def redis_cache(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        enhanced_redis_cache.redis.Redis,
+        "from_url",
+        lambda url, **kwargs: fakeredis.FakeRedis(server=server, decode_responses=True),
+    )
+    return EnhancedRedisCache(url="redis://fake", namespace="warm", ttl=3600)
+
+
+def test_warmer_reloads_hot_keys_before_expiry_with_rate_limit(redis_cache):
+    loads: list[str] = []
+
+    def loader(key: str):
+        loads.append(key)
+        return {"value": key}
+
+    warmer = CacheWarmer(
+        redis_cache,
+        tracker=AccessPatternTracker(top_k=20),
+        refresh_ahead_seconds=30,
+        max_warm_rate=0.001,
+        warm_burst=3,
+    )
+    warmer.register_loader(loader, prefix="summary:")
+    redis_cache.set("summary:fresh", {"value": 1}, ttl=3600)
+    redis_cache.set("summary:expiring", {"value": 2}, ttl=5)
+    for _ in range(5):
+        for key in ("summary:fresh", "summary:expiring", "summary:gone", "other:gone"):
+            warmer.get(key)
+    for i in range(4):
+        warmer.get(f"summary:extra{i}")
+
+    warmed = asyncio.run(warmer.warm_hot_keys())
+    assert warmed == 3
+    assert "summary:fresh" not in loads and "other:gone" not in loads
+    assert {"summary:expiring", "summary:gone"} <= set(loads)
+    stats = warmer.get_warming_stats()["warming"]
+    assert stats["rate_limited"] == 3  # hottest keys are warmed first
+    assert redis_cache.ttl_many(["summary:expiring"])["summary:expiring"] > 30
+
+    # A hit on a key that would otherwise be missing counts as a saved miss.
+    before = warmer.hit_rates()
+    assert warmer.get("summary:gone") == {"value": "summary:gone"}
+    after = warmer.hit_rates()
+    assert warmer.get_warming_stats()["warming"]["warmed_hits"] == 1
+    assert after["hit_rate_gain"] > before["hit_rate_gain"] == 0.0
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+
+from platform.cache.crew_templates import CrewTemplateCache, template_key
+from ultimate_discord_intelligence_bot.tenancy.context import TenantContext, with_tenant
+
+
+class _Tool:
+    def __init__(self) -> None:
+        self._shared_context: dict = {}
+
+
+class _Agent:
+    def __init__(self, name: str) -> None:
+        self.role = name
+        self.tools = [_Tool()]
+
+
+def _builder(counter: list[int]):
+    def build() -> dict[str, _Agent]:
+        counter.append(1)
+        return {name: _Agent(name) for name in ("acquisition", "analysis")}
+
+    return build
+
+
+def test_template_key_is_stable_and_config_sensitive():
+    assert template_key("deep", {"a": 1, "b": 2}) == template_key("deep", {"b": 2, "a": 1})
+    assert template_key("deep", {"a": 1}) != template_key("deep", {"a": 2})
+    assert template_key("deep", {"a": 1}) != template_key("standard", {"a": 1})
+
+
+def test_sequential_leases_reuse_agents_and_reset_tool_context():
+    builds: list[int] = []
+    cache = CrewTemplateCache()
+
+    async def scenario():
+        async with cache.lease("deep", {"parallel": True}, _builder(builds)) as first:
+            first["analysis"].tools[0]._shared_context["transcript"] = "request one"
+        async with cache.lease("deep", {"parallel": True}, _builder(builds)) as second:
+            assert second is first
+            assert second["analysis"].tools[0]._shared_context == {}
+        async with cache.lease("deep", {"parallel": False}, _builder(builds)) as other:
+            assert other is not first
+
+    asyncio.run(scenario())
+    assert len(builds) == 2
+    stats = cache.get_stats()[template_key("deep", {"parallel": True})]
+    assert (stats["builds"], stats["leases"], stats["reuses"]) == (1, 2, 1)
+
+
+def test_concurrent_leases_and_tenants_get_separate_agent_sets():
+    builds: list[int] = []
+    cache = CrewTemplateCache()
+
+    async def scenario():
+        async with cache.lease("deep", None, _builder(builds)) as a:
+            async with cache.lease("deep", None, _builder(builds)) as b:
+                assert a is not b
+            with with_tenant(TenantContext("acme", "main")):
+                async with cache.lease("deep", None, _builder(builds)) as c:
+                    assert c is not a and c is not b
+
+    asyncio.run(scenario())
+    assert len(builds) == 3
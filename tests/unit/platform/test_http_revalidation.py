@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+from platform.http import http_utils
+from platform.http.revalidation import RevalidatingCache, parse_cache_control
+
+
+class _Resp:
+    def __init__(self, status_code: int = 200, text: str = "", headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+class _Origin:
+    """Fake origin honouring If-None-Match against a mutable current body."""
+
+    def __init__(self, body: str = "feed-v1", etag: str = '"v1"', cache_control: str | None = None) -> None:
+        self.body = body
+        self.etag = etag
+        self.cache_control = cache_control
+        self.requests: list[dict] = []
+        self.delay = 0.0
+
+    def __call__(self, url, *, params=None, headers=None, timeout_seconds=None, **_):
+        self.requests.append(dict(headers or {}))
+        if self.delay:
+            time.sleep(self.delay)
+        resp_headers = {"ETag": self.etag}
+        if self.cache_control:
+            resp_headers["Cache-Control"] = self.cache_control
+        if (headers or {}).get("If-None-Match") == self.etag:
+            return _Resp(304, "", resp_headers)
+        return _Resp(200, self.body, resp_headers)
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('max-age=60, stale-while-revalidate="30", no-transform') == {
+        "max-age": 60,
+        "stale-while-revalidate": 30,
+        "no-transform": None,
+    }
+
+
+def test_revalidates_with_etag_and_serves_304_from_cache():
+    origin = _Origin()
+    cache = RevalidatingCache(fetch=origin)
+
+    first = cache.get("https://feed")
+    assert first.text == "feed-v1"
+    second = cache.get("https://feed")
+    assert second.text == "feed-v1"
+    assert second.cache_status == "not_modified"
+    assert origin.requests[1]["If-None-Match"] == '"v1"'
+
+    origin.body, origin.etag = "feed-v2", '"v2"'
+    assert cache.get("https://feed").text == "feed-v2"
+    stats = cache.stats()
+    assert (stats["miss"], stats["not_modified"], stats["modified"]) == (1, 1, 1)
+    assert stats["bytes_saved"] == len("feed-v1")
+
+
+def test_max_age_fresh_hits_and_stale_while_revalidate():
+    now = [0.0]
+    origin = _Origin(cache_control="max-age=10, stale-while-revalidate=30")
+    cache = RevalidatingCache(fetch=origin, clock=lambda: now[0])
+
+    cache.get("https://feed")
+    now[0] = 5
+    assert cache.get("https://feed").cache_status == "fresh"
+    assert len(origin.requests) == 1
+
+    now[0] = 20
+    stale = cache.get("https://feed")
+    assert stale.cache_status == "stale"
+    cache.drain(timeout=2)
+    assert len(origin.requests) == 2
+    assert origin.requests[1]["If-None-Match"] == '"v1"'
+
+    now[0] = 25
+    assert cache.get("https://feed").cache_status == "fresh"
+    assert cache.stats()["requests_saved"] == 2
+
+
+def test_persisted_validators_without_entry():
+    origin = _Origin()
+    cache = RevalidatingCache(fetch=origin)
+    resp = cache.get("https://feed", etag='"v1"')
+    assert resp.not_modified and resp.status_code == 304
+    assert resp.etag == '"v1"'
+    assert cache.get("https://other", etag='"old"').text == "feed-v1"
+
+
+def test_concurrent_fetches_collapse_into_one_request():
+    origin = _Origin()
+    origin.delay = 0.2
+    cache = RevalidatingCache(fetch=origin)
+    results: list[str] = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("https://feed").text)) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["feed-v1"] * 5
+    assert len(origin.requests) == 1
+    assert cache.stats()["collapsed"] == 4
+
+
+def test_no_store_is_not_cached():
+    origin = _Origin(cache_control="no-store")
+    cache = RevalidatingCache(fetch=origin)
+    cache.get("https://feed")
+    cache.get("https://feed")
+    assert "If-None-Match" not in origin.requests[1]
+
+
+def test_cached_get_revalidates_expired_entries(monkeypatch):
+    monkeypatch.setattr(
+        http_utils,
+        "get_settings",
+        lambda: SimpleNamespace(enable_http_cache=True, http_cache_ttl_seconds=1, rate_limit_redis_url=None),
+    )
+    now = {"t": 1000.0}
+    monkeypatch.setattr(http_utils.time, "time", lambda: now["t"])
+    http_utils._MEM_HTTP_CACHE.clear()
+    http_utils._MEM_HTTP_VALIDATORS.clear()
+    origin = _Origin()
+    monkeypatch.setattr(http_utils, "resilient_get", origin)
+
+    assert http_utils.cached_get("https://x").text == "feed-v1"
+    now["t"] += 2
+    resp = http_utils.cached_get("https://x")
+    assert (resp.status_code, resp.text) == (200, "feed-v1")
+    assert origin.requests[1]["If-None-Match"] == '"v1"'
+    assert http_utils.cached_get("https://x").text == "feed-v1"
+    assert len(origin.requests) == 2
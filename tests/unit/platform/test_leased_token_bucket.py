@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from platform.security.redis_rate_limit import HierarchicalRateLimiter, LeasedTokenBucket, RateLimitTier
+
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs lupa for EVAL
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def test_lease_serves_most_requests_locally(client) -> None:
+    bucket = LeasedTokenBucket(rate=0.001, capacity=1000, client=client, lease_seconds=60, max_lease=50)
+    # Warm up the observed rate so lease size grows towards max_lease.
+    allowed = sum(bucket.allow("tenant-a") for _ in range(600))
+    stats = bucket.stats()
+    assert allowed == 600
+    assert stats["lease_calls"] < 60
+    assert stats["local_allowed"] == 600
+
+
+def test_global_limit_holds_across_processes(client) -> None:
+    buckets = [
+        LeasedTokenBucket(rate=0.001, capacity=100, client=client, lease_seconds=60, max_lease=10) for _ in range(4)
+    ]
+    allowed = sum(bucket.allow("shared") for _ in range(100) for bucket in buckets)
+    assert allowed == 100
+    assert all(not bucket.allow("shared") for bucket in buckets)
+
+
+def test_refund_returns_unused_tokens(client) -> None:
+    first = LeasedTokenBucket(rate=0.001, capacity=10, client=client, max_lease=10, min_lease=10)
+    assert first.allow("k")
+    first.release()
+    second = LeasedTokenBucket(rate=0.001, capacity=10, client=client, max_lease=10, min_lease=9)
+    assert sum(second.allow("k") for _ in range(20)) == 9
+
+
+def test_backend_failure_falls_back_to_local_bucket() -> None:
+    class Broken:
+        def register_script(self, _script):
+            def _call(**_kwargs):
+                raise ConnectionError("down")
+
+            return _call
+
+    bucket = LeasedTokenBucket(rate=0.001, capacity=3, client=Broken())
+    assert [bucket.allow("k") for _ in range(4)] == [True, True, True, False]
+    assert LeasedTokenBucket(rate=0.001, capacity=3, client=Broken(), fail_open=True).allow("k")
+
+
+def test_hierarchical_limits_tenant_and_route(client) -> None:
+    limiter = HierarchicalRateLimiter(
+        [RateLimitTier("tenant", rate=0.001, capacity=5), RateLimitTier("route", rate=0.001, capacity=2)],
+        client=client,
+    )
+    assert [limiter.allow("t1", "/a") for _ in range(3)] == [True, True, False]
+    assert asyncio.run(limiter.allow_async("t1", "/b"))
+    assert limiter.allow("t2", "/a")
+
+
+def test_tenant_middleware_returns_429(client) -> None:
+    from server.rate_limit import TenantRateLimitMiddleware
+
+    limiter = HierarchicalRateLimiter([RateLimitTier("tenant", rate=0.001, capacity=1)], client=client)
+    sent: list[dict] = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request"}
+
+    middleware = TenantRateLimitMiddleware(app, limiter=limiter)
+    scope = {"type": "http", "path": "/x", "method": "GET", "headers": [(b"x-tenant-id", b"t1")]}
+    asyncio.run(middleware(scope, receive, send))
+    asyncio.run(middleware(scope, receive, send))
+    asyncio.run(middleware({**scope, "path": "/health"}, receive, send))
+    statuses = [m["status"] for m in sent if m["type"] == "http.response.start"]
+    assert statuses == [200, 429, 200]
+
+
+def test_leases_are_bounded_and_amortize_default_burst(client) -> None:
+    bucket = LeasedTokenBucket(rate=10, capacity=10, client=client, max_keys=3)
+    assert bucket.max_lease == 5
+    for key in ("a", "b", "c", "d"):
+        assert bucket.allow(key)
+    assert list(bucket._leases) == ["b", "c", "d"]
+    hot = LeasedTokenBucket(rate=1000, capacity=1000, client=client, lease_seconds=60)
+    assert sum(hot.allow("hot") for _ in range(200)) == 200
+    assert hot.stats()["lease_calls"] < 100
+
+
+def test_rotating_tenant_header_cannot_escape_global_floor(client, monkeypatch) -> None:
+    from server.rate_limit import TenantRateLimitMiddleware, _build_tenant_limiter
+
+    monkeypatch.setenv("RATE_LIMIT_RPS", "0.001")
+    limiter = _build_tenant_limiter("redis://unused", 3)
+    assert [tier.scope for tier in limiter.tiers] == ["global", "tenant"]
+    limiter = HierarchicalRateLimiter(limiter.tiers, client=client)
+    sent: list[dict] = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request"}
+
+    middleware = TenantRateLimitMiddleware(app, limiter=limiter)
+    for i in range(5):
+        scope = {"type": "http", "path": "/x", "method": "GET", "headers": [(b"x-tenant-id", f"t{i}".encode())]}
+        asyncio.run(middleware(scope, receive, send))
+    statuses = [m["status"] for m in sent if m["type"] == "http.response.start"]
+    assert statuses == [200, 200, 200, 429, 429]
@@ -0,0 +1,117 @@
+"""Tests for the quantile sketches behind MetricsCollector histograms."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from platform.observability.metrics import MetricsCollector, SLOMonitor
+from platform.observability.quantile_sketch import QuantileSketch, WindowedQuantileSketch
+from platform.observability.slo import SLO
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+@pytest.mark.parametrize("q", [0.01, 0.5, 0.9, 0.95, 0.99, 0.999])
+def test_quantiles_within_relative_accuracy(q):
+    rng = random.Random(5)
+    values = [rng.lognormvariate(-3, 1.5) for _ in range(50_000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+    assert sketch.quantile(q) == pytest.approx(exact(values, q), rel=0.0101)
+    assert sketch.count == len(values)
+    assert sketch.sum == pytest.approx(sum(values))
+
+
+def test_zero_negative_and_extremes():
+    sketch = QuantileSketch()
+    for value in [-5.0, -1.0, 0.0, 0.0, 2.0, 10.0]:
+        sketch.add(value)
+    assert sketch.quantile(0.0) == -5.0
+    assert sketch.quantile(0.4) == 0.0
+    assert sketch.quantile(1.0) == 10.0
+    assert QuantileSketch().quantile(0.5) == 0.0
+
+
+def test_bin_count_is_bounded_and_high_quantiles_survive_collapse():
+    sketch = QuantileSketch(relative_accuracy=0.01, max_bins=128)
+    values = [10.0**exponent for exponent in range(-8, 9) for _ in range(10)] + [500.0] * 1000
+    for value in values:
+        sketch.add(value)
+    assert sketch.bin_count <= 128
+    assert sketch.quantile(0.99) == pytest.approx(exact(values, 0.99), rel=0.0101)
+
+
+def test_merge_matches_single_sketch():
+    rng = random.Random(9)
+    left, right, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i in range(10_000):
+        value = rng.expovariate(10)
+        (left if i % 2 else right).add(value)
+        combined.add(value)
+    merged = left.copy().merge(right)
+    assert merged.quantiles([0.5, 0.95, 0.99]) == combined.quantiles([0.5, 0.95, 0.99])
+    assert merged.count == combined.count
+    with pytest.raises(ValueError):
+        left.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_windowed_sketch_rotates_out_old_observations():
+    clock = FakeClock()
+    sketch = WindowedQuantileSketch(window_seconds=60, slices=6, clock=clock)
+    for _ in range(100):
+        sketch.add(5.0)
+    clock.now += 30
+    for _ in range(100):
+        sketch.add(0.1)
+    assert sketch.quantile(0.99, window_seconds=10) == pytest.approx(0.1, rel=0.01)
+    assert sketch.quantile(0.99, window_seconds=60) == pytest.approx(5.0, rel=0.01)
+
+    clock.now += 45  # the 5.0 burst is now 75s old
+    assert sketch.quantile(0.99, window_seconds=60) == pytest.approx(0.1, rel=0.01)
+    # Expired slices still count towards all-time totals.
+    assert sketch.quantile(0.99) == pytest.approx(5.0, rel=0.01)
+    assert sketch.count == 200
+
+    clock.now += 3600
+    assert sketch.window().count == 0
+    assert sketch.count == 200
+
+
+def test_collector_histograms_keep_their_api():
+    collector = MetricsCollector()
+    for value in range(1, 101):
+        collector.observe_histogram("latency", value / 100, labels={"route": "a"})
+    labels = {"route": "a"}
+    assert collector.get_histogram_count("latency", labels) == 100
+    assert collector.get_histogram_sum("latency", labels) == pytest.approx(50.5)
+    assert collector.get_histogram_quantile("latency", 0.95, labels) == pytest.approx(0.95, rel=0.01)
+    quantiles = collector.get_histogram_quantiles("latency", labels=labels, window_seconds=60)
+    assert quantiles[0.5] == pytest.approx(0.5, rel=0.01)
+    assert collector.get_histogram_quantile("missing", 0.5) == 0.0
+    collector.reset()
+    assert collector.get_histogram_count("latency", labels) == 0
+
+
+def test_slo_monitor_p95_spans_label_sets():
+    monitor = SLOMonitor([SLO(metric="p95_latency", threshold=0.5)])
+    for i in range(100):
+        monitor.record_request("/a" if i % 2 else "/b", 0.2, 200)
+    monitor.record_request("/a", 3.0, 500)
+    result = monitor.evaluate_slos()
+    assert result["metrics"]["p95_latency"] == pytest.approx(0.2, rel=0.01)
+    assert result["slo_results"]["p95_latency"] is True
+    assert monitor.get_metrics_summary()["histogram_counts"]["request_duration_seconds{endpoint=/a,status=200}"] == 50
@@ -0,0 +1,46 @@
+"""Tests for the slotted StepResult fast path and its copy-free item view."""
+
+from __future__ import annotations
+
+from platform.core.step_result import ErrorCategory, StepResult
+from platform.observability.payload_sanitizer import result_items
+
+from ultimate_discord_intelligence_bot.step_result import StepResult as BotStepResult
+
+
+def test_success_result_is_slotted_and_allocates_lazily():
+    result = StepResult.ok(value=1)
+    assert not hasattr(result, "__dict__")
+    assert result._metadata is None and result._suggested_actions is None
+    assert result.to_dict() == {"value": 1, "status": "success"}
+    assert result._metadata is None
+
+    result.metadata["trace"] = "abc"
+    result.related_errors.append("err_1")
+    assert result.to_dict()["metadata"] == {"trace": "abc"}
+    assert result.to_dict()["related_errors"] == ["err_1"]
+
+
+def test_equality_and_keyword_construction_preserved():
+    failed = StepResult(success=False, error="boom", error_category=ErrorCategory.NETWORK, retryable=True)
+    assert failed == StepResult.fail("boom", error_category=ErrorCategory.NETWORK, retryable=True)
+    assert failed == {"status": "error", "error": "boom"}
+    assert failed != StepResult.ok()
+    assert failed["error_category"] == "network"
+
+
+def test_bot_result_is_slotted_and_keeps_mapping_semantics():
+    result = BotStepResult.ok(transcript="hello")
+    assert not hasattr(result, "__dict__")
+    assert result == BotStepResult.ok(transcript="hello")
+    assert result == {"transcript": "hello", "status": "success"}
+    assert BotStepResult.fail("boom") != result
+    assert BotStepResult.skip(reason="cached")["status"] == "skipped"
+
+
+def test_bot_result_items_do_not_copy_payload():
+    result = BotStepResult.ok(transcript="hello")
+    assert dict(result.to_dict_items())["data"] is result._data
+    assert result.to_dict()["data"] is not result._data
+    assert dict(result_items(result)) == result.to_dict()
+    assert result_items({"plain": "dict"}) is None
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests import RequestException
+
+from domains.intelligence.verification.evidence_fanout import EvidenceCache, FanOutPolicy, normalize_claim
+from domains.intelligence.verification.fact_check_tool import FactCheckTool
+
+
+BACKENDS = ("duckduckgo", "serply", "exa", "perplexity", "wolfram")
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=16)
+    yield pool
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def make_tool(executor, delays=None, items=1, policy=None, calls=None):
+    """Tool whose backends sleep ``delays[name]`` seconds and return ``items`` evidence items."""
+    tool = FactCheckTool(policy=policy or FanOutPolicy(quorum=0), cache=EvidenceCache(), executor=executor)
+    delays = delays or {}
+
+    def backend(name):
+        def search(query):
+            if calls is not None:
+                calls.append((name, query))
+            delay = delays.get(name, 0.0)
+            if isinstance(delay, BaseException):
+                raise delay
+            time.sleep(delay)
+            return [{"title": f"{name}-{i}", "url": f"https://{name}/{i}", "snippet": query} for i in range(items)]
+
+        return search
+
+    for name in BACKENDS:
+        setattr(tool, f"_search_{name}", backend(name))
+    return tool
+
+
+def test_backends_are_queried_concurrently(executor):
+    tool = make_tool(executor, delays=dict.fromkeys(BACKENDS, 0.2))
+    started = time.perf_counter()
+    result = tool.run("Water boils at 100C")
+    elapsed = time.perf_counter() - started
+    assert result.success
+    assert elapsed < 0.6
+    assert result.data["backends_used"] == list(BACKENDS)
+    # Evidence keeps backend order regardless of completion order.
+    assert [item["title"] for item in result.data["evidence"]] == [f"{name}-0" for name in BACKENDS]
+
+
+def test_slow_backend_is_cut_off_by_its_budget(executor):
+    policy = FanOutPolicy(deadline_seconds=5.0, backend_budgets={"wolfram": 0.1}, quorum=0)
+    tool = make_tool(executor, delays={"wolfram": 1.0}, policy=policy)
+    started = time.perf_counter()
+    result = tool.run("Slow claim")
+    assert time.perf_counter() - started < 0.5
+    assert result.success
+    assert result.data["backends_timed_out"] == ["wolfram"]
+    assert result.data["partial"] is True
+    assert result.data["evidence_count"] == 4
+    # Partial results are not cached.
+    assert tool.run("Slow claim").data.get("cached") is None
+
+
+def test_budget_starts_when_a_backend_starts_running():
+    # One worker runs the backends back to back: 5 * 0.1s queued in total,
+    # which would blow every later backend's 0.25s budget if it started at submit.
+    policy = FanOutPolicy(deadline_seconds=5.0, default_budget_seconds=0.25, quorum=0)
+    with ThreadPoolExecutor(max_workers=1) as serial:
+        tool = make_tool(serial, delays=dict.fromkeys(BACKENDS, 0.1), policy=policy)
+        result = tool.run("Saturated pool")
+    assert result.data["backends_timed_out"] == []
+    assert result.data["backends_used"] == list(BACKENDS)
+
+
+def test_deadline_caps_the_whole_claim(executor):
+    policy = FanOutPolicy(deadline_seconds=0.1, default_budget_seconds=10.0, quorum=0)
+    tool = make_tool(executor, delays=dict.fromkeys(BACKENDS, 1.0), policy=policy)
+    started = time.perf_counter()
+    result = tool.run("Everything is slow")
+    assert time.perf_counter() - started < 0.5
+    assert result.success
+    assert result.data["backends_timed_out"] == list(BACKENDS)
+    assert result.data["evidence"] == []
+
+
+def test_returns_early_once_quorum_is_reached(executor):
+    delays = {"duckduckgo": 0.0, "serply": 0.0, "exa": 1.0, "perplexity": 1.0, "wolfram": 1.0}
+    tool = make_tool(executor, delays=delays, items=2, policy=FanOutPolicy(quorum=4))
+    started = time.perf_counter()
+    result = tool.run("Quorum claim")
+    assert time.perf_counter() - started < 0.5
+    assert result.data["evidence_count"] == 4
+    assert result.data["backends_used"] == ["duckduckgo", "serply"]
+    assert result.data["partial"] is False
+
+
+def test_request_exception_is_skipped_and_other_errors_fail(executor):
+    tool = make_tool(executor, delays={"serply": RequestException("rate limited")})
+    result = tool.run("Claim")
+    assert result.success
+    assert result.data["backends_failed"] == ["serply"]
+    assert result.data["evidence_count"] == 4
+
+    tool = make_tool(executor, delays={"exa": ValueError("bad payload")})
+    result = tool.run("Claim")
+    assert not result.success
+    assert result.data["failed_backend"] == "exa"
+
+
+def test_failed_fanouts_are_not_cached(executor):
+    calls: list[tuple[str, str]] = []
+    tool = make_tool(executor, delays=dict.fromkeys(BACKENDS, RequestException("down")), calls=calls)
+    result = tool.run("Outage claim")
+    assert result.success
+    assert result.data["backends_failed"] == list(BACKENDS)
+    assert result.data["evidence"] == []
+    assert tool.run("Outage claim").data.get("cached") is None
+    assert len(calls) == 2 * len(BACKENDS)
+
+    tool = make_tool(executor, delays={"serply": RequestException("rate limited")})
+    tool.run("Claim")
+    assert tool.run("Claim").data.get("cached") is None
+
+
+def test_cache_matches_normalized_claims_per_tenant(executor):
+    calls: list[tuple[str, str]] = []
+    tool = make_tool(executor, calls=calls)
+    assert normalize_claim("  The  Earth is ROUND. ") == "the earth is round"
+
+    first = tool.run("The Earth is round.", tenant="a", workspace="w")
+    again = tool.run("the earth  is ROUND", tenant="a", workspace="w")
+    assert again.data["cached"] is True
+    assert again.data["claim"] == "the earth  is ROUND"
+    assert again.data["evidence"] == first.data["evidence"]
+    assert len(calls) == len(BACKENDS)
+
+    # Mutating a returned result does not leak into the cache.
+    again.data["evidence"][0]["title"] = "edited"
+    first.data["evidence"].clear()
+    assert tool.run("The Earth is round.", tenant="a", workspace="w").data["evidence"][0]["title"] == "duckduckgo-0"
+
+    other = tool.run("The Earth is round.", tenant="b", workspace="w")
+    assert other.data.get("cached") is None
+    assert len(calls) == 2 * len(BACKENDS)
+
+
+def test_run_many_preserves_order_and_deduplicates(executor):
+    calls: list[tuple[str, str]] = []
+    tool = make_tool(executor, delays=dict.fromkeys(BACKENDS, 0.1), calls=calls)
+    claims = [f"claim {i}" for i in range(8)] + ["claim 0", "", "CLAIM 1"]
+    started = time.perf_counter()
+    results = tool.run_many(claims, max_concurrency=4)
+    elapsed = time.perf_counter() - started
+
+    assert [r.data.get("claim") for r in results] == claims
+    assert results[9].skipped
+    assert all(r.success for r in results)
+    # 8 distinct claims, 4 at a time, ~0.1s each: well under the sequential 8 * 5 * 0.1s.
+    assert elapsed < 1.5
+    # "claim 0" repeats verbatim and "CLAIM 1" normalizes onto "claim 1": only 8 claims hit the backends.
+    assert len(calls) == 8 * len(BACKENDS)